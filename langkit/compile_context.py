@@ -283,7 +283,9 @@ class CompileCtx(object):
                  env_hook_subprogram=None,
                  default_unit_provider=None,
                  symbol_canonicalizer=None,
-                 documentations=None):
+                 documentations=None,
+                 compact_node_layout=True,
+                 lexer_backend='quex'):
         """Create a new context for code emission.
 
         :param str lang_name: string (mixed case and underscore: see
@@ -380,6 +382,20 @@ class CompileCtx(object):
         :param dict[str, str] documentations: If provided, supply templates to
             document entities. These will be added to the documentations
             available in code generation: see langkit.documentation.
+
+        :param bool compact_node_layout: If True (which is the default), store
+            the lexical environment associated to each node only in nodes that
+            have an env spec (and in PLE unit roots). Other nodes compute it
+            from their parents on demand, which makes them significantly
+            smaller. If False, store it in all nodes.
+
+        :param str lexer_backend: Name of the backend to use in order to
+            generate the lexer. "quex" (the default) makes Quex generate it
+            in C. "native" compiles the lexer rules into a deterministic
+            finite automaton during code generation and makes the library
+            scan sources with it directly, so that Quex is not required. The
+            native backend supports only a subset of the pattern language:
+            see langkit.lexer_dfa.
         """
         from langkit.python_api import PythonAPISettings
 
@@ -401,10 +417,17 @@ class CompileCtx(object):
 
         self.default_charset = default_charset
         self.default_tab_stop = default_tab_stop
+        self.compact_node_layout = compact_node_layout
+
+        assert lexer_backend in ('quex', 'native'), (
+            'Invalid lexer backend: {}'.format(lexer_backend)
+        )
+        self.lexer_backend = lexer_backend
 
         self.verbosity = verbosity
 
-        self.set_quex_path()
+        if self.lexer_backend == 'quex':
+            self.set_quex_path()
 
         self.compiled = False
         """
@@ -1483,6 +1506,9 @@ class CompileCtx(object):
             MajorStepPass('Compiling the grammar'),
             GlobalPass('check token families',
                        self.lexer.check_token_families),
+            GlobalPass('compile lexer rules to a DFA',
+                       self.lexer.compile_dfa,
+                       disabled=self.lexer_backend != 'native'),
             GlobalPass('check main parsing rule',
                        self.grammar.check_main_rule),
             GlobalPass('warn on unreferenced parsing rules',
@@ -1623,7 +1649,7 @@ class CompileCtx(object):
                 "project_file",
                 lib_name=self.ada_api_settings.lib_name,
                 os_path=os.path,
-                quex_path=os.environ['QUEX_PATH'],
+                quex_path=os.environ.get('QUEX_PATH'),
             )
         )
 
@@ -1685,18 +1711,19 @@ class CompileCtx(object):
                 self.post_process_ada
             )
 
-        with names.lower:
-            # ... and the Quex C interface
-            write_cpp_file(
-                path.join(src_path,
-                          "{}_quex_interface.h".format(lib_name_low)),
-                self.render_template("lexer/quex_interface_header_c"),
-                self.post_process_cpp)
-            write_cpp_file(
-                path.join(src_path,
-                          "{}_quex_interface.c".format(lib_name_low)),
-                self.render_template("lexer/quex_interface_body_c"),
-                self.post_process_cpp)
+        if self.lexer_backend == 'quex':
+            with names.lower:
+                # ... and the Quex C interface
+                write_cpp_file(
+                    path.join(src_path,
+                              "{}_quex_interface.h".format(lib_name_low)),
+                    self.render_template("lexer/quex_interface_header_c"),
+                    self.post_process_cpp)
+                write_cpp_file(
+                    path.join(src_path,
+                              "{}_quex_interface.c".format(lib_name_low)),
+                    self.render_template("lexer/quex_interface_body_c"),
+                    self.post_process_cpp)
 
         imain_project_file = os.path.join(file_root, "src", "mains.gpr")
         write_source_file(
@@ -1766,33 +1793,36 @@ class CompileCtx(object):
             for f in glob(path.join(self.ext('support'), "*.ad*")):
                 copy_file(f, src_path)
 
-        if self.verbosity.info:
-            printcol("Compiling the quex lexer specification", Colors.OKBLUE)
-
-        # Generating the lexer C code with Quex is quite long: do it only when
-        # the Quex specification changed from last build.
-        quex_file = os.path.join(src_path,
-                                 "{}.qx".format(self.lang_name.lower))
-        quex_spec = self.lexer.emit()
-        if (
-            write_source_file(quex_file, quex_spec) and
-            generate_lexer
-        ):
-            quex_py_file = path.join(os.environ["QUEX_PATH"], "quex-exe.py")
-            subprocess.check_call([sys.executable, quex_py_file, "-i",
-                                   quex_file,
-                                   "-o",
-                                   "{}_lexer".format(
-                                       self.lib_name.base_name.lower()),
-                                   "--buffer-element-size", "4",
-                                   "--token-id-offset",  "0x1000",
-                                   "--language", "C",
-                                   "--no-mode-transition-check",
-                                   "--single-mode-analyzer",
-                                   "--token-memory-management-by-user",
-                                   "--token-policy", "single",
-                                   "--token-id-prefix", self.lexer.prefix],
-                                  cwd=src_path)
+        if self.lexer_backend == 'quex':
+            if self.verbosity.info:
+                printcol("Compiling the quex lexer specification",
+                         Colors.OKBLUE)
+
+            # Generating the lexer C code with Quex is quite long: do it only
+            # when the Quex specification changed from last build.
+            quex_file = os.path.join(src_path,
+                                     "{}.qx".format(self.lang_name.lower))
+            quex_spec = self.lexer.emit()
+            if (
+                write_source_file(quex_file, quex_spec) and
+                generate_lexer
+            ):
+                quex_py_file = path.join(os.environ["QUEX_PATH"],
+                                         "quex-exe.py")
+                subprocess.check_call([sys.executable, quex_py_file, "-i",
+                                       quex_file,
+                                       "-o",
+                                       "{}_lexer".format(
+                                           self.lib_name.base_name.lower()),
+                                       "--buffer-element-size", "4",
+                                       "--token-id-offset",  "0x1000",
+                                       "--language", "C",
+                                       "--no-mode-transition-check",
+                                       "--single-mode-analyzer",
+                                       "--token-memory-management-by-user",
+                                       "--token-policy", "single",
+                                       "--token-id-prefix", self.lexer.prefix],
+                                      cwd=src_path)
 
         self.cache.save()
 
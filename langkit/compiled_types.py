@@ -115,6 +115,14 @@ def make_renderer(base_renderer=None):
             'big_integer_type':      CAPIType(capi, 'big_integer').name,
             'diagnostic_type':       CAPIType(capi, 'diagnostic').name,
             'exception_type':        CAPIType(capi, 'exception').name,
+            'memory_category_type':
+                CAPIType(capi, 'memory_category').name,
+            'memory_usage_type':     CAPIType(capi, 'memory_usage').name,
+            'node_descriptor_type':  CAPIType(capi, 'node_descriptor').name,
+            'node_finder_type':      CAPIType(capi, 'node_finder').name,
+            'token_columns_type':    CAPIType(capi, 'token_columns').name,
+            'unparsing_output_type':
+                CAPIType(capi, 'unparsing_output').name,
         })
     return base_renderer.update(template_args)
 
@@ -2381,6 +2389,37 @@ class ASTNodeType(BaseStructType):
         """
         return self._base
 
+    @property
+    @memoized
+    def stores_self_env(self):
+        """
+        Return whether nodes of this type have a component to store the
+        lexical environment they are associated to.
+
+        In compact node layouts, only nodes that have an env spec (and PLE unit
+        roots) need to store it: the environment of other nodes is the one of
+        their parent.
+
+        :rtype: bool
+        """
+        ctx = get_context()
+        return (not ctx.compact_node_layout or
+                not self.is_env_spec_inherited or
+                self == ctx.ple_unit_root or
+                (self.base is not None and self.base.stores_self_env))
+
+    @property
+    def declares_self_env(self):
+        """
+        Return whether the record type for this node type must declare the
+        component that stores the lexical environment, i.e. whether this type
+        stores it while its base type does not.
+
+        :rtype: bool
+        """
+        return self.stores_self_env and not (self.base is not None and
+                                             self.base.stores_self_env)
+
     @property
     @memoized
     def concrete_subclasses(self):
@@ -2401,6 +2440,47 @@ class ASTNodeType(BaseStructType):
 
         return result
 
+    @property
+    @memoized
+    def possible_children_types(self):
+        """
+        Return the set of concrete node types that can appear as direct
+        children of nodes of this type, according to the types of parse fields
+        (or to the element type for lists).
+
+        :rtype: set[ASTNodeType]
+        """
+        if self.is_list_type:
+            child_types = [self.element_type]
+        else:
+            child_types = [
+                f.type for f in self.get_parse_fields(
+                    lambda f: not f.abstract and not f.null
+                )
+            ]
+        return {subcls
+                for typ in child_types
+                for subcls in typ.concrete_subclasses}
+
+    @property
+    @memoized
+    def possible_descendant_types(self):
+        """
+        Return the set of concrete node types that can appear in the subtree
+        of a node of this type (excluding the node itself, unless it can
+        appear in its own children).
+
+        :rtype: set[ASTNodeType]
+        """
+        result = set()
+        queue = [self]
+        while queue:
+            for child_type in queue.pop().possible_children_types:
+                if child_type not in result:
+                    result.add(child_type)
+                    queue.append(child_type)
+        return result
+
     def get_parse_fields(self, predicate=None, include_inherited=True,
                          concrete_order=False):
         """
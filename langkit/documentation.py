@@ -166,6 +166,15 @@ base_langkit_docs = {
         Diagnostic for an analysis unit: cannot open the source file, parsing
         error, ...
     """,
+    'langkit.memory_category_type': """
+        Category of memory for memory usage statistics: trees, tokens and
+        source buffers, lexical environments, memoization tables, lexical
+        environment rebindings and symbols.
+    """,
+    'langkit.memory_usage_type': """
+        Estimation of the memory used for one memory category: number of bytes
+        and number of objects (nodes, tokens, lexical environments, ...).
+    """,
     'langkit.exception_type': """
         Holder for native exceptions-related information.  Memory management
         for this and all the fields is handled by the library: one just has to
@@ -201,6 +210,10 @@ base_langkit_docs = {
         happens when one tries to use a node whose unit has been reparsed, for
         instance.
     """,
+    'langkit.frozen_context_error': """
+        Exception raised when trying to load or reparse an analysis unit in a
+        frozen analysis context.
+    """,
 
     #
     # Analysis primitives
@@ -228,6 +241,16 @@ base_langkit_docs = {
 
         ``Tab_Stop`` is a positive number to describe the effect of tabulation
         characters on the column number in source files.
+        % if lang == 'python':
+
+        ``node_cache`` determines how node wrappers are cached in each analysis
+        unit. With ``'strong'`` (the default), all node wrappers are kept alive
+        until their unit is reparsed. With ``'weak'``, wrappers are kept only
+        as long as user code references them, which limits memory usage when
+        traversing big units. A positive integer N behaves like ``'weak'``, but
+        also keeps alive the N most recently used wrappers. In all modes,
+        there is only one live wrapper for a given node.
+        % endif
     """,
 
     'langkit.context_incref': """
@@ -257,6 +280,70 @@ base_langkit_docs = {
         relations.  If ``Timeout`` is zero, disable the timeout. By default,
         the timeout is ``100 000`` steps.
     """,
+    'langkit.context_set_logic_resolution_strategy': """
+        Set the strategy used to solve logic equations. ``Chronological``, the
+        default, solves sub-relations in order. ``Propagation`` first solves
+        the checks and the bindings that have only one possible value, and
+        then makes choices on the most constrained logic variables first. It
+        is usually much faster for equations with many ``Member`` relations,
+        but it can find solutions in a different order.
+    """,
+    'langkit.context_set_unit_eviction_policy': """
+        Set the unit eviction policy for this context. When ``Max_Units``
+        (resp. ``Max_Memory``) is not zero, each time an analysis unit is
+        loaded, the least recently fetched units are unloaded until the number
+        of loaded units (resp. the estimated number of bytes they use) is back
+        under this limit. Both limits are zero by default, which disables
+        eviction.
+
+        Unloading a unit frees its tree and its tokens, and removes its
+        contributions to lexical environments. The unit itself stays valid:
+        getting it again from the context (for instance with
+        ``${'Get_From_File' if lang == 'ada' else 'get_from_file'}``)
+        transparently parses it and populates its lexical environments again
+        if needed. References to its nodes become stale, though.
+
+        Only units that own neither rebindings nor foreign lexical environment
+        entries can be unloaded. No eviction happens during tree rewriting,
+        lexical environment population or property evaluation: units loaded
+        by properties are accounted for the next time the policy is enforced.
+
+        % if lang == 'python':
+        Units that still have live node wrappers are never unloaded, so node
+        references stay valid as long as they are alive.
+        % elif lang == 'c':
+        Pinned units (see ``${capi.get_name('unit_pin')}``) are never unloaded.
+        % endif
+    """,
+    'langkit.context_evict_units': """
+        Unload least recently used analysis units until the context complies
+        with its unit eviction policy again. This is useful to enforce the
+        policy at times that are convenient for the caller.
+    """,
+    'langkit.context_freeze': """
+        Freeze this context: populate the lexical environments of all the
+        analysis units it contains, then forbid any change to the set of
+        loaded units and to their trees, so that several threads can safely
+        evaluate properties on it.
+
+        While the context is frozen, unit eviction is suspended and loading or
+        reparsing units is an error (``Frozen_Context_Error`` in Ada),
+        including when a property needs a unit that is not loaded yet: load
+        all the units the analysis needs before freezing. Note that this does
+        not make property evaluation parallel: evaluations from different
+        threads, as well as reference count updates on the values they return,
+        are serialized on a global lock, so the runtime caches they use stay
+        consistent. Freezing a context that is already frozen has no effect.
+    """,
+    'langkit.context_unfreeze': """
+        Undo the effect of ``${'Freeze' if lang == 'ada' else 'freeze'}``. The
+        caller must make sure that no other thread uses the context anymore.
+    """,
+    'langkit.context_memory_usage': """
+        Return an estimation of the memory used by this context, by category:
+        the sum of the memory used by all its analysis units, plus lexical
+        environments that belong to no unit and the symbol table.
+    """,
 
     'langkit.get_unit_from_file': """
         Create a new analysis unit for ``Filename`` or return the existing one
@@ -277,6 +364,22 @@ base_langkit_docs = {
         parsing failure, return an analysis unit anyway: errors are described
         as diagnostics of the returned analysis unit.
     """,
+    'langkit.get_units_from_files': """
+        Like ``${'Get_From_File' if lang == 'ada' else 'get_from_file'}``, but
+        for all the given ``Filenames``, and return the corresponding analysis
+        units in the same order.
+
+        Units that need to be (re)parsed are lexed and parsed concurrently by
+        up to ``Workers`` tasks, each with its own parser. The results are
+        then installed in the context sequentially, so this returns only once
+        all units are loaded. While this runs, no other task may use the
+        context.
+        % if lang == 'c':
+
+        ``Filenames`` and ``Units`` must both be arrays of ``Count`` elements.
+        ``Units`` is filled with the resulting units.
+        % endif
+    """,
     'langkit.get_unit_from_buffer': """
         Create a new analysis unit for ``Filename`` or return the existing one
         if any. Whether the analysis unit already exists or not, (re)parse it
@@ -355,6 +458,15 @@ base_langkit_docs = {
         If any failure occurs, such as decoding, lexing or parsing failure,
         diagnostic are emitted to explain what happened.
     """,
+    'langkit.unit_pin': """
+        Add a pin on this unit. Unit eviction never unloads pinned units, so
+        references to their nodes stay valid. Each pin must be removed with
+        ``${capi.get_name('unit_unpin')}`` when it is no longer needed.
+    """,
+    'langkit.unit_unpin': """
+        Remove a pin added on this unit with
+        ``${capi.get_name('unit_pin')}``.
+    """,
     'langkit.unit_root': """
         Return the root node for this unit, or ``${null}`` if there is none.
     """,
@@ -374,6 +486,20 @@ base_langkit_docs = {
     'langkit.unit_text': """
         Return the source buffer associated to this unit.
     """,
+    'langkit.token_columns_type': """
+        Set of caller-allocated buffers (columns) in which to export data for
+        the tokens and trivia of a unit, one item per token/trivia in source
+        order. For each item, the columns contain: its kind, its token and
+        trivia indexes (as in token references), its start offset and end
+        offset (exclusive) in the unit's text, and its start/end line/column
+        numbers. Null columns are ignored.
+    """,
+    'langkit.unit_token_columns': """
+        Export data for the first COUNT tokens/trivia of this unit in COLUMNS.
+        Return the total number of tokens and trivia in this unit, so that
+        calling this with a zero COUNT gives the size of the columns to
+        allocate for a full export.
+    """,
     'langkit.unit_lookup_token': """
         Look for a token in this unit that contains the given source location.
         If this falls before the first token, return the first token. If this
@@ -392,6 +518,16 @@ base_langkit_docs = {
     'langkit.unit_diagnostic_count': """
         Return the number of diagnostics associated to this unit.
     """,
+    'langkit.unit_memory_usage': """
+        Return an estimation of the memory used by this unit, by category.
+        Most figures come from counters maintained when parsing the unit, but
+        measuring lexical environments requires a traversal of the tree once
+        they are populated.
+        % if lang == 'c':
+            ``Result`` must point to an array with one entry per memory
+            category.
+        % endif
+    """,
     'langkit.unit_diagnostic': """
         Get the Nth diagnostic in this unit and store it into *DIAGNOSTIC_P.
         Return zero on failure (when N is too big).
@@ -450,6 +586,120 @@ base_langkit_docs = {
         Return the Nth child for in this node's fields and store it into
         *CHILD_P.  Return zero on failure (when N is too big).
     """,
+    'langkit.node_children': """
+        Store the first COUNT children of this node in the CHILDREN buffer, and
+        their kinds in the KINDS buffer (0 for null children). Return the
+        total number of children for this node, which can be greater than
+        COUNT.
+
+        This makes it possible to fetch all children with only two calls: one
+        to get the number of children, one to get all of them.
+    """,
+    'langkit.node_descriptor_type': """
+        Summary of the information needed to create a wrapper for a node in
+        language bindings: owning context and unit, kind of the node and
+        number of children.
+    """,
+    'langkit.node_descriptor': """
+        Fill DESCRIPTOR with information about this node, so that bindings can
+        get all of it with a single call. Return 0 (and fill DESCRIPTOR with
+        null values) if this node is null, 1 otherwise.
+    """,
+    'langkit.node_to_json': """
+        Return a JSON representation of the subtree rooted at this node.
+
+        Each node is represented as an object with a "kind" entry (its kind
+        name) and, if slocs are requested, a "sloc_range" entry. Token nodes
+        also have a "text" entry, list nodes an "items" entry (array of
+        children) and other nodes a "fields" entry (object that maps field
+        names to children). Null nodes are represented as null.
+        % if lang == 'c':
+
+        The result is an UTF-8 encoded, null-terminated string allocated by
+        this function: its size (excluding the null byte) is stored in
+        ``*LENGTH``, and the caller must free it with
+        ``${capi.get_name('free')}``.
+        % endif
+    """,
+    'langkit.node_to_binary': """
+        Return a compact binary representation of the subtree rooted at this
+        node. This is a sequence of 32-bit little-endian unsigned integers and
+        byte strings. The first integer is 1 if slocs are included, 0
+        otherwise, then nodes are encoded recursively: kind number (0 for null
+        nodes, in which case nothing else follows), then if slocs are
+        requested, start line, start column, end line and end column, then for
+        token nodes the size in bytes of the token text followed by this text
+        encoded in UTF-8, and for other nodes the number of children followed
+        by each child.
+        % if lang == 'c':
+
+        The result is allocated by this function: its size is stored in
+        ``*LENGTH``, and the caller must free it with
+        ``${capi.get_name('free')}``.
+        % endif
+    """,
+    'langkit.node_finder_type': """
+        State for a search of nodes by kind in a subtree. Nodes are yielded in
+        batches, in prefix depth-first order.
+    """,
+    'langkit.create_node_finder': """
+        Create a search for all the nodes in the subtree of ROOT (excluding
+        ROOT itself) whose kind is one of the KINDS_COUNT kinds in the KINDS
+        buffer. The search skips subtrees that the grammar does not allow to
+        contain nodes of these kinds.
+
+        The result must be destroyed with
+        ``${capi.get_name('destroy_node_finder')}``. It is invalidated when the
+        unit that owns ROOT is reparsed or destroyed.
+    """,
+    'langkit.node_finder_next': """
+        Store the next (at most) COUNT nodes that FINDER yields in the RESULTS
+        buffer, and their kinds in the KINDS buffer. Return the number of nodes
+        stored: if it is less than COUNT, the search is over.
+    """,
+    'langkit.destroy_node_finder': """
+        Release all resources allocated for FINDER.
+    """,
+    'langkit.unparsing_output_type': """
+        Growable buffer that receives the result of unparsing, encoded in
+        UTF-8. Its storage is kept when it is cleared, so reusing the same
+        output to unparse several trees does not allocate once it is large
+        enough.
+    """,
+    'langkit.create_unparsing_output': """
+        Create an empty unparsing output. The result must be destroyed with
+        ``${capi.get_name('destroy_unparsing_output')}``.
+    """,
+    'langkit.unparsing_output_clear': """
+        Discard the content of OUTPUT.
+    """,
+    'langkit.unparsing_output_content': """
+        Return the address of the content of OUTPUT and store its size in
+        ``*LENGTH``. This content is not null-terminated, and is valid only
+        until OUTPUT is modified or destroyed.
+    """,
+    'langkit.destroy_unparsing_output': """
+        Release all resources allocated for OUTPUT.
+    """,
+    'langkit.node_unparse': """
+        % if lang == 'python':
+        Turn the subtree rooted at this node into source code that can be
+        re-parsed to yield the same tree (source locations excepted). If
+        OUTPUT is None, return it as a byte string encoded in UTF-8.
+        Otherwise, append it to OUTPUT, which must be either an
+        ``UnparsingOutput`` instance, or a file object (or file descriptor)
+        opened in binary mode. In the latter case, the code is written to the
+        file in chunks as unparsing goes.
+        % else:
+        Turn the subtree rooted at this node into source code that can be
+        re-parsed to yield the same tree (source locations excepted), and
+        append it to OUTPUT, encoded in UTF-8.
+        % endif
+    """,
+    'langkit.node_unparse_to_file': """
+        Likewise, but write the result to the FD file descriptor, in chunks as
+        unparsing goes, so that the whole result is never held in memory.
+    """,
     'langkit.node_is_null': """
         Return whether this node is a null node reference.
     """,
@@ -491,7 +741,23 @@ base_langkit_docs = {
         references.
     """,
     'langkit.symbol_text': """
-        Return the text associated to this symbol.
+        Return the text associated to this symbol. The result references the
+        symbol table of the owning analysis context, so it does not need to be
+        destroyed, but it is valid only as long as this context is alive.
+    """,
+    'langkit.text_to_utf8': """
+        Encode TEXT in UTF-8 into the SIZE bytes of BUFFER. Return the number
+        of bytes that the encoded text requires: if it is greater than SIZE,
+        the content of BUFFER is truncated. Four bytes per character are always
+        enough.
+
+        This allows bindings to get texts in an encoding that is more compact
+        than UTF-32 for mostly ASCII sources.
+    """,
+    'langkit.text_from_utf8': """
+        Decode the SIZE bytes of BUFFER, which must be valid UTF-8, and store
+        the result in TEXT. The result is dynamically allocated: it must be
+        destroyed with ``${capi.get_name('destroy_text')}``.
     """,
     'langkit.create_big_integer': """
         Create a big integer from its string representation (in base 10).
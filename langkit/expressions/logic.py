@@ -9,6 +9,7 @@ except ImportError:
 import funcy
 
 from langkit import names
+from langkit.common import string_repr
 from langkit.compiled_types import Argument, T, no_compiled_type
 from langkit.diagnostics import check_multiple, check_source_language
 from langkit.expressions.base import (
@@ -585,10 +586,15 @@ def solve(self, equation):
 
     :param AbstractExpression equation: The equation to solve.
     """
-    PropertyDef.get()._solves_equation = True
+    p = PropertyDef.get()
+    p._solves_equation = True
+
+    # Pass the name of the property to Solve_Wrapper so that solver statistics
+    # are aggregated per property.
     return CallExpr('Solve_Success', 'Solve_Wrapper', T.Bool,
                     [construct(equation, T.Equation),
-                     construct(Self, T.root_node)],
+                     construct(Self, T.root_node),
+                     string_repr(p.qualname)],
                     abstract_expr=self)
 
 
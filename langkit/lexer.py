@@ -472,6 +472,14 @@ class Lexer(object):
         :type: set[TokenAction]
         """
 
+        self.dfa = None
+        """
+        Automaton that recognizes the tokens of this lexer, when the native
+        lexer backend is used. Computed during compilation.
+
+        :type: langkit.lexer_dfa.LexerDFA|None
+        """
+
     def add_patterns(self, *patterns):
         """
         Add the list of named patterns to the lexer's internal patterns. A
@@ -581,6 +589,17 @@ class Lexer(object):
             lexer=self
         )
 
+    def compile_dfa(self, context):
+        """
+        Pass that compiles the rules of this lexer to a deterministic finite
+        automaton, for the native lexer backend.
+        """
+        from langkit.lexer_dfa import LexerDFA
+
+        self.dfa = LexerDFA(
+            self, {p.name: p.pattern for p in self.__patterns}
+        )
+
     def get_token(self, literal):
         """
         Helper function to get the name of a token.
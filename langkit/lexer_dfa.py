@@ -0,0 +1,802 @@
+from __future__ import absolute_import, division, print_function
+
+"""
+Compilation of lexer rules into a deterministic finite automaton, for the
+native lexer backend.
+
+Instead of going through Quex, the native backend turns the matchers of all
+lexer rules into a single minimized DFA, which the generated library then uses
+to scan decoded source buffers directly. Only the part of the Quex pattern
+language that lexers commonly use is supported:
+
+* characters, escape sequences (``\\n``, ``\\t``, ``\\xHH``, ``\\uHHHH``,
+  ``\\UHHHHHH``, ...) and quoted strings (``"..."``);
+* character sets (``[a-z_]``, ``[^\\n]``) and ``.`` (any character but line
+  feed);
+* grouping, alternation and the ``*``, ``+``, ``?``, ``{N}``, ``{N,}`` and
+  ``{N,M}`` quantifiers;
+* references to lexer patterns (``{name}``) and case insensitive
+  sub-patterns (``\\C{...}``).
+
+Using other constructs is reported as an error when this backend is selected.
+"""
+
+from bisect import bisect_right
+
+from langkit.diagnostics import check_source_language
+from langkit.lexer import (Case, Eof, Failure, Ignore, Literal, NoCase,
+                           NoCaseLit, Pattern)
+
+
+MAX_CODE_POINT = 0x10ffff
+
+
+class CharSet(object):
+    """
+    Set of code points, represented as a sorted tuple of disjoint and
+    non-adjacent (first, last) intervals.
+    """
+
+    _case_pairs = None
+    """
+    List of (code point, other case code point) couples for all cased
+    characters in the Basic Multilingual Plane. Computed on demand.
+
+    :type: list[(int, int)]|None
+    """
+
+    def __init__(self, ranges=()):
+        """
+        :param collections.Iterable[(int, int)] ranges: Intervals of code
+            points to include. They can overlap.
+        """
+        result = []
+        for first, last in sorted(ranges):
+            if result and first <= result[-1][1] + 1:
+                result[-1] = (result[-1][0], max(last, result[-1][1]))
+            else:
+                result.append((first, last))
+        self.ranges = tuple(result)
+        self._firsts = [first for first, _ in self.ranges]
+
+    @classmethod
+    def from_code(cls, code):
+        """
+        Return a set that contains only the given code point.
+
+        :type code: int
+        :rtype: CharSet
+        """
+        return cls([(code, code)])
+
+    def __contains__(self, code):
+        i = bisect_right(self._firsts, code) - 1
+        return i >= 0 and code <= self.ranges[i][1]
+
+    def union(self, other):
+        """
+        :type other: CharSet
+        :rtype: CharSet
+        """
+        return CharSet(self.ranges + other.ranges)
+
+    def negate(self):
+        """
+        Return the complement of this set.
+
+        :rtype: CharSet
+        """
+        result = []
+        next_first = 0
+        for first, last in self.ranges:
+            if first > next_first:
+                result.append((next_first, first - 1))
+            next_first = last + 1
+        if next_first <= MAX_CODE_POINT:
+            result.append((next_first, MAX_CODE_POINT))
+        return CharSet(result)
+
+    def case_insensitive(self):
+        """
+        Return this set plus the other case variants of its characters.
+
+        :rtype: CharSet
+        """
+        if CharSet._case_pairs is None:
+            pairs = []
+            for code in range(0x10000):
+                char = unichr(code)
+                for other in (char.lower(), char.upper()):
+                    if len(other) == 1 and other != char:
+                        pairs.append((code, ord(other)))
+            CharSet._case_pairs = pairs
+
+        return CharSet(self.ranges + tuple(
+            (other, other) for code, other in CharSet._case_pairs
+            if code in self
+        ))
+
+
+def char_set_node(char_set, no_case):
+    """
+    Return a regular expression tree node that matches one character from
+    the given set, ignoring case if ``no_case`` is true.
+
+    :type char_set: CharSet
+    :type no_case: bool
+    """
+    return ('set', char_set.case_insensitive() if no_case else char_set)
+
+
+class PatternParser(object):
+    """
+    Parser for patterns, turning them into regular expression trees.
+
+    Trees are made of tuples:
+
+    * ``('set', char_set)`` matches one character in a CharSet;
+    * ``('seq', [nodes])`` matches a sequence of sub-patterns;
+    * ``('alt', [nodes])`` matches one of several sub-patterns;
+    * ``('rep', node, min, max)`` matches a sub-pattern repeated at least
+      ``min`` times and at most ``max`` times (no limit if ``max`` is None).
+    """
+
+    escapes = {'a': 0x07, 'b': 0x08, 'f': 0x0c, 'n': 0x0a, 'r': 0x0d,
+               't': 0x09, 'v': 0x0b}
+    """
+    Code points for single character escape sequences.
+    """
+
+    hex_escapes = {'x': 2, 'X': 4, 'u': 4, 'U': 6}
+    """
+    Number of hexadecimal digits for each escape sequence that introduces a
+    code point.
+    """
+
+    def __init__(self, named_patterns):
+        """
+        :param dict[str, str] named_patterns: Lexer patterns that can be
+            referenced with the ``{name}`` notation.
+        """
+        self.named_patterns = named_patterns
+        self._named_trees = {}
+        self._references = []
+
+        self.text = None
+        self.pos = 0
+
+    def parse(self, text, no_case=False):
+        """
+        Parse the ``text`` pattern and return the corresponding tree.
+
+        :param str text: Pattern to parse.
+        :param bool no_case: Whether to ignore case.
+        """
+        saved = (self.text, self.pos)
+        self.text, self.pos = text, 0
+        try:
+            result = self._parse_alt(no_case, None)
+            if self.pos < len(self.text):
+                self._error('unexpected "{}"'.format(self.text[self.pos]))
+            return result
+        finally:
+            self.text, self.pos = saved
+
+    def parse_string(self, text, no_case=False):
+        """
+        Return the tree for a literal string, in which only escape sequences
+        are interpreted.
+
+        :param str text: String to match.
+        :param bool no_case: Whether to ignore case.
+        """
+        saved = (self.text, self.pos)
+        self.text, self.pos = text, 0
+        try:
+            items = []
+            while self.pos < len(self.text):
+                items.append(char_set_node(
+                    CharSet.from_code(self._parse_char()), no_case
+                ))
+            return ('seq', items)
+        finally:
+            self.text, self.pos = saved
+
+    def _error(self, message):
+        check_source_language(
+            False,
+            'Invalid pattern for the native lexer backend: {} ({})'.format(
+                repr(self.text), message
+            )
+        )
+
+    def _peek(self, offset=0):
+        i = self.pos + offset
+        return self.text[i] if i < len(self.text) else None
+
+    def _next(self):
+        char = self._peek()
+        if char is None:
+            self._error('unexpected end of pattern')
+        self.pos += 1
+        return char
+
+    def _expect(self, char):
+        if self._peek() != char:
+            self._error('"{}" expected'.format(char))
+        self.pos += 1
+
+    def _parse_alt(self, no_case, closing):
+        items = [self._parse_seq(no_case, closing)]
+        while self._peek() == '|':
+            self.pos += 1
+            items.append(self._parse_seq(no_case, closing))
+        return items[0] if len(items) == 1 else ('alt', items)
+
+    def _parse_seq(self, no_case, closing):
+        items = []
+        while self._peek() not in (None, '|', closing):
+            items.append(self._parse_quantified(no_case))
+        return items[0] if len(items) == 1 else ('seq', items)
+
+    def _parse_quantified(self, no_case):
+        node = self._parse_atom(no_case)
+        while True:
+            char = self._peek()
+            if char == '*':
+                node = ('rep', node, 0, None)
+            elif char == '+':
+                node = ('rep', node, 1, None)
+            elif char == '?':
+                node = ('rep', node, 0, 1)
+            elif char == '{' and (self._peek(1) or '').isdigit():
+                self.pos += 1
+                min_count = self._parse_number()
+                max_count = min_count
+                if self._peek() == ',':
+                    self.pos += 1
+                    max_count = (None if self._peek() == '}'
+                                 else self._parse_number())
+                if max_count is not None and max_count < min_count:
+                    self._error('invalid repetition bounds')
+                self._expect('}')
+                node = ('rep', node, min_count, max_count)
+                continue
+            else:
+                return node
+            self.pos += 1
+
+    def _parse_number(self):
+        start = self.pos
+        while (self._peek() or '').isdigit():
+            self.pos += 1
+        if start == self.pos:
+            self._error('number expected')
+        return int(self.text[start:self.pos])
+
+    def _parse_atom(self, no_case):
+        char = self._next()
+
+        if char == '(':
+            node = self._parse_alt(no_case, ')')
+            self._expect(')')
+            return node
+
+        elif char == '[':
+            if self._peek() == ':':
+                self.pos -= 1
+                self._posix_class_error()
+            return char_set_node(self._parse_set(), no_case)
+
+        elif char == '"':
+            items = []
+            while self._peek() != '"':
+                items.append(char_set_node(
+                    CharSet.from_code(self._parse_char()), no_case
+                ))
+            self.pos += 1
+            return ('seq', items)
+
+        elif char == '.':
+            return ('set', CharSet.from_code(0x0a).negate())
+
+        elif char == '{':
+            end = self.text.find('}', self.pos)
+            if end == -1:
+                self._error('unterminated pattern reference')
+            name = self.text[self.pos:end]
+            self.pos = end + 1
+            return self._reference(name, no_case)
+
+        elif char == '\\' and self._peek() == 'C':
+            self.pos += 1
+            self._expect('{')
+            node = self._parse_alt(True, '}')
+            self._expect('}')
+            return node
+
+        elif char == '\\' and self._peek() in ('A', 'E', 'G', 'I', 'N', 'P',
+                                               'R', 'S'):
+            self._error('"\\{}" is not supported'.format(self._peek()))
+
+        elif char in ('^', '$'):
+            self._error('"{}" is not supported'.format(char))
+
+        elif char in (')', '|', '*', '+', '?', ']'):
+            self._error('unexpected "{}"'.format(char))
+
+        self.pos -= 1
+        return char_set_node(CharSet.from_code(self._parse_char()), no_case)
+
+    def _parse_set(self):
+        negate = self._peek() == '^'
+        if negate:
+            self.pos += 1
+
+        result = CharSet()
+        while self._peek() != ']':
+            if self._peek() == '[' and self._peek(1) == ':':
+                self._posix_class_error()
+            first = self._parse_char()
+            last = first
+            if self._peek() == '-' and self._peek(1) not in (None, ']'):
+                self.pos += 1
+                last = self._parse_char()
+                if last < first:
+                    self._error('invalid character range')
+            result = result.union(CharSet([(first, last)]))
+        self.pos += 1
+
+        return result.negate() if negate else result
+
+    def _posix_class_error(self):
+        end = self.text.find(':]', self.pos)
+        name = (self.text[self.pos:end + 2] if end != -1 else
+                self.text[self.pos:])
+        self._error('"{}" is not supported'.format(name))
+
+    def _parse_char(self):
+        """
+        Parse a character or an escape sequence and return its code point.
+
+        :rtype: int
+        """
+        char = self._next()
+        if char != '\\':
+            return ord(char)
+
+        char = self._next()
+        if char in self.escapes:
+            return self.escapes[char]
+        elif char in self.hex_escapes:
+            digits = self.text[self.pos:self.pos + self.hex_escapes[char]]
+            self.pos += len(digits)
+            try:
+                code = int(digits, 16)
+            except ValueError:
+                code = None
+            if (len(digits) != self.hex_escapes[char]
+                    or code is None or code > MAX_CODE_POINT):
+                self._error('invalid "\\{}" escape sequence'.format(char))
+            return code
+        else:
+            return ord(char)
+
+    def _reference(self, name, no_case):
+        check_source_language(
+            name in self.named_patterns,
+            'Invalid pattern for the native lexer backend: {} (unknown'
+            ' pattern "{}")'.format(repr(self.text), name)
+        )
+        check_source_language(
+            name not in self._references,
+            'Invalid pattern for the native lexer backend: {} (recursive'
+            ' reference to pattern "{}")'.format(repr(self.text), name)
+        )
+
+        key = (name, no_case)
+        if key not in self._named_trees:
+            self._references.append(name)
+            try:
+                self._named_trees[key] = self.parse(self.named_patterns[name],
+                                                    no_case)
+            finally:
+                self._references.pop()
+        return self._named_trees[key]
+
+
+class NFA(object):
+    """
+    Non-deterministic finite automaton, built from regular expression trees
+    with Thompson's construction.
+    """
+
+    def __init__(self):
+        self.epsilons = []
+        """
+        For each state, list of states reachable without consuming input.
+
+        :type: list[list[int]]
+        """
+
+        self.edges = []
+        """
+        For each state, list of (char set, target state) transitions.
+
+        :type: list[list[(CharSet, int)]]
+        """
+
+        self.accepting = {}
+        """
+        Mapping from accepting states to the index of the rule they accept.
+
+        :type: dict[int, int]
+        """
+
+        self.start = self.new_state()
+
+    def new_state(self):
+        self.epsilons.append([])
+        self.edges.append([])
+        return len(self.edges) - 1
+
+    def add_rule(self, tree, rule_index):
+        """
+        Make the automaton also recognize ``tree``, accepting it for the given
+        rule.
+        """
+        start = self.new_state()
+        self.epsilons[self.start].append(start)
+        end = self.build(tree, start)
+        self.accepting[end] = min(self.accepting.get(end, rule_index),
+                                  rule_index)
+
+    def build(self, tree, start):
+        """
+        Add states and transitions to recognize ``tree`` starting from the
+        ``start`` state, and return the state that is reached at the end.
+        """
+        kind = tree[0]
+
+        if kind == 'set':
+            end = self.new_state()
+            self.edges[start].append((tree[1], end))
+            return end
+
+        elif kind == 'seq':
+            current = start
+            for item in tree[1]:
+                current = self.build(item, current)
+            return current
+
+        elif kind == 'alt':
+            end = self.new_state()
+            for item in tree[1]:
+                item_start = self.new_state()
+                self.epsilons[start].append(item_start)
+                self.epsilons[self.build(item, item_start)].append(end)
+            return end
+
+        else:
+            assert kind == 'rep'
+            _, item, min_count, max_count = tree
+
+            current = start
+            for _ in range(min_count):
+                current = self.build(item, current)
+
+            end = self.new_state()
+            if max_count is None:
+                loop = self.new_state()
+                item_start = self.new_state()
+                self.epsilons[current].append(loop)
+                self.epsilons[loop].extend([item_start, end])
+                self.epsilons[self.build(item, item_start)].append(loop)
+            else:
+                for _ in range(max_count - min_count):
+                    self.epsilons[current].append(end)
+                    current = self.build(item, current)
+                self.epsilons[current].append(end)
+            return end
+
+
+class LexerDFA(object):
+    """
+    Minimized DFA that recognizes the tokens of a lexer.
+
+    Code points are first mapped to character classes, then each state has a
+    transition per class. State 0 is the dead state (no token can be matched
+    from there), state 1 is the start state. Class 0 contains all the code
+    points that never lead to a live state.
+    """
+
+    def __init__(self, lexer, named_patterns):
+        """
+        Compile the rules of ``lexer``.
+
+        :param langkit.lexer.Lexer lexer: Lexer whose rules to compile.
+        :param dict[str, str] named_patterns: Patterns that can be referenced
+            in the lexer rules.
+        """
+        self.lexer = lexer
+
+        self.rules = []
+        """
+        Rules that the DFA recognizes. The index of a rule in this list plus
+        one is its rule number in the accepting table.
+
+        :type: list[langkit.lexer.RuleAssoc]
+        """
+
+        nfa = NFA()
+        parser = PatternParser(named_patterns)
+        for rule in lexer.rules:
+            if isinstance(rule.matcher, (Eof, Failure)):
+                continue
+            self.rules.append(rule)
+            nfa.add_rule(self._matcher_tree(parser, rule.matcher),
+                         len(self.rules))
+
+        self._determinize(nfa)
+        self._minimize()
+        self._compute_char_classes()
+
+    @staticmethod
+    def _matcher_tree(parser, matcher):
+        if isinstance(matcher, NoCaseLit):
+            return parser.parse_string(matcher.to_match, no_case=True)
+        elif isinstance(matcher, NoCase):
+            return parser.parse(matcher.to_match, no_case=True)
+        elif isinstance(matcher, Literal):
+            return parser.parse_string(matcher.to_match)
+        elif isinstance(matcher, Pattern):
+            return parser.parse(matcher.pattern)
+        else:
+            check_source_language(
+                False,
+                'The native lexer backend does not support {}'
+                ' matchers'.format(type(matcher).__name__)
+            )
+
+    def _determinize(self, nfa):
+        """
+        Subset construction. Transitions are computed on elementary intervals
+        of code points: the intervals that all char sets in ``nfa`` split the
+        code point space into.
+        """
+        bounds = {0, MAX_CODE_POINT + 1}
+        for edges in nfa.edges:
+            for char_set, _ in edges:
+                for first, last in char_set.ranges:
+                    bounds.update((first, last + 1))
+        self.bounds = sorted(bounds)
+        index = {b: i for i, b in enumerate(self.bounds)}
+
+        # For each NFA state, list of (interval indexes, target) transitions
+        edges = [
+            [([i for first, last in char_set.ranges
+               for i in range(index[first], index[last + 1])], target)
+             for char_set, target in state_edges]
+            for state_edges in nfa.edges
+        ]
+
+        closures = {}
+
+        def closure(state):
+            result = closures.get(state)
+            if result is None:
+                result = set()
+                stack = [state]
+                while stack:
+                    s = stack.pop()
+                    if s not in result:
+                        result.add(s)
+                        stack.extend(nfa.epsilons[s])
+                result = closures[state] = frozenset(result)
+            return result
+
+        # DFA states are numbered from 1, 0 being the dead state
+        start = closure(nfa.start)
+        state_ids = {start: 1}
+        queue = [start]
+        self.transitions = [{}, None]
+        self.accepting = [0, None]
+
+        while queue:
+            nfa_states = queue.pop()
+            state = state_ids[nfa_states]
+
+            labels = [nfa.accepting[s] for s in nfa_states
+                      if s in nfa.accepting]
+            self.accepting[state] = min(labels) if labels else 0
+
+            moves = {}
+            for s in nfa_states:
+                for intervals, target in edges[s]:
+                    for i in intervals:
+                        moves.setdefault(i, set()).update(closure(target))
+
+            transitions = {}
+            for i, targets in moves.items():
+                targets = frozenset(targets)
+                target = state_ids.get(targets)
+                if target is None:
+                    target = state_ids[targets] = len(self.transitions)
+                    self.transitions.append(None)
+                    self.accepting.append(None)
+                    queue.append(targets)
+                transitions[i] = target
+            self.transitions[state] = transitions
+
+        self.intervals_count = len(self.bounds) - 1
+
+    def _minimize(self):
+        """
+        Merge equivalent states, and turn states that cannot lead to an
+        accepting one into the dead state.
+        """
+        states = range(1, len(self.transitions))
+
+        # Find live states: the ones from which an accepting state can be
+        # reached.
+        predecessors = {s: set() for s in states}
+        for s in states:
+            for target in self.transitions[s].values():
+                predecessors[target].add(s)
+        live = set()
+        stack = [s for s in states if self.accepting[s]]
+        while stack:
+            s = stack.pop()
+            if s not in live:
+                live.add(s)
+                stack.extend(predecessors[s])
+
+        # Moore's partition refinement. Blocks start as sets of states that
+        # accept the same rule, and are split until all their states have
+        # transitions to the same blocks.
+        block = {0: 0}
+        for s in states:
+            block[s] = (self.accepting[s] + 1) if s in live else 0
+        blocks_count = len(set(block.values()))
+        while True:
+            signatures = {}
+            new_block = {0: 0}
+            for s in states:
+                if block[s] == 0:
+                    new_block[s] = 0
+                    continue
+                signature = (block[s], tuple(sorted(
+                    (i, block[target])
+                    for i, target in self.transitions[s].items()
+                    if block[target] != 0
+                )))
+                new_block[s] = signatures.setdefault(signature,
+                                                     len(signatures) + 1)
+            block = new_block
+            if len(signatures) + 1 == blocks_count:
+                break
+            blocks_count = len(signatures) + 1
+
+        # Number the resulting states in breadth-first order from the start
+        # state, so that the output is deterministic and the start state is
+        # state 1.
+        block_states = {}
+        for s in states:
+            block_states.setdefault(block[s], s)
+        numbers = {0: 0, block[1]: 1}
+        representatives = [None, 1]
+        i = 1
+        while i < len(representatives):
+            s = representatives[i]
+            for interval in sorted(self.transitions[s]):
+                b = block[self.transitions[s][interval]]
+                if b not in numbers:
+                    numbers[b] = len(representatives)
+                    representatives.append(block_states[b])
+            i += 1
+
+        self.states_count = len(representatives) - 1
+        self.accepting = [0] + [self.accepting[representatives[n]]
+                                for n in range(1, len(representatives))]
+        self.transitions = [None] + [
+            {i: numbers[block[target]]
+             for i, target in self.transitions[representatives[n]].items()
+             if block[target] != 0}
+            for n in range(1, len(representatives))
+        ]
+
+    def _compute_char_classes(self):
+        """
+        Group elementary intervals that have the same transitions in all
+        states into character classes.
+        """
+        states = range(1, self.states_count + 1)
+        classes = {(0, ) * self.states_count: 0}
+        interval_classes = []
+        for i in range(self.intervals_count):
+            column = tuple(self.transitions[s].get(i, 0) for s in states)
+            interval_classes.append(
+                classes.setdefault(column, len(classes))
+            )
+
+        self.classes_count = len(classes)
+        self.table = [None] + [[0] * self.classes_count for _ in states]
+        for s in states:
+            for i, target in self.transitions[s].items():
+                self.table[s][interval_classes[i]] = target
+
+        # Compute the class of each code point, as a list of (first, last,
+        # class) ranges.
+        self.char_ranges = []
+        for i, cls in enumerate(interval_classes):
+            first, last = self.bounds[i], self.bounds[i + 1] - 1
+            if self.char_ranges and self.char_ranges[-1][2] == cls:
+                self.char_ranges[-1] = (self.char_ranges[-1][0], last, cls)
+            else:
+                self.char_ranges.append((first, last, cls))
+
+    def char_class(self, code):
+        """
+        Return the character class for the given code point.
+
+        :type code: int
+        :rtype: int
+        """
+        i = bisect_right([first for first, _, _ in self.char_ranges],
+                         code) - 1
+        return self.char_ranges[i][2]
+
+    @property
+    def latin_1_classes(self):
+        """
+        Character classes for the first 256 code points.
+
+        :rtype: list[int]
+        """
+        return [self.char_class(code) for code in range(256)]
+
+    @property
+    def high_char_ranges(self):
+        """
+        (first, last, class) ranges for code points beyond the first 256
+        ones, excluding class 0.
+
+        :rtype: list[(int, int, int)]
+        """
+        return [(max(first, 256), last, cls)
+                for first, last, cls in self.char_ranges
+                if last >= 256 and cls != 0]
+
+    def rule_kind(self, rule):
+        """
+        Return the kind of action to perform when ``rule`` matches: "ignore",
+        "case" or "token".
+
+        :type rule: langkit.lexer.RuleAssoc
+        :rtype: str
+        """
+        if isinstance(rule.action, Ignore):
+            return 'ignore'
+        elif isinstance(rule.action, Case.CaseAction):
+            return 'case'
+        else:
+            return 'token'
+
+    def match(self, text):
+        """
+        Return the rule number and length of the longest token that starts
+        at the beginning of ``text``, or (0, 0) if there is none. This is a
+        pure Python model of the generated scanner, for debugging purposes.
+
+        :type text: unicode
+        :rtype: (int, int)
+        """
+        state = 1
+        result = (0, 0)
+        for i, char in enumerate(text):
+            state = self.table[state][self.char_class(ord(char))]
+            if state == 0:
+                break
+            if self.accepting[state]:
+                result = (self.accepting[state], i + 1)
+        return result
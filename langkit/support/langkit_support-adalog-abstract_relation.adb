@@ -52,6 +52,7 @@ package body Langkit_Support.Adalog.Abstract_Relation is
          end if;
       end Wait;
 
+      Kind : constant Relation_Kind := Self.Kind;
    begin
       if Debug.Debug then
          Print_Relation (Context.Root_Relation,
@@ -60,7 +61,14 @@ package body Langkit_Support.Adalog.Abstract_Relation is
       end if;
       Wait;
 
+      Context.Stats.Evaluations (Kind) := Context.Stats.Evaluations (Kind) + 1;
+      Context.Depth := Context.Depth + 1;
+      Context.Stats.Max_Depth :=
+         Natural'Max (Context.Stats.Max_Depth, Context.Depth);
+
       return Res : constant Solving_State := Self.Solve_Impl (Context) do
+         Context.Depth := Context.Depth - 1;
+
          if Debug_State = Step_At_First_Unsat and then Res = Unsatisfied then
             Set_Debug_State (Step);
          end if;
@@ -169,13 +177,32 @@ package body Langkit_Support.Adalog.Abstract_Relation is
    -----------
 
    function Solve (Self : Relation; Timeout : Natural := 0) return Boolean is
+      Stats : aliased Solving_Statistics;
+   begin
+      return Solve (Self, Timeout, Stats'Access);
+   end Solve;
+
+   -----------
+   -- Solve --
+   -----------
+
+   function Solve
+     (Self     : Relation;
+      Timeout  : Natural;
+      Stats    : access Solving_Statistics;
+      Strategy : Solving_Strategy := Chronological) return Boolean
+   is
       Context : Solving_Context :=
         (Root_Relation => Self,
-         Timeout       => Timeout);
+         Timeout       => Timeout,
+         Depth         => 0,
+         Stats         => <>,
+         Strategy      => Strategy);
    begin
       declare
          Ret : constant Solving_State := Self.all.Solve (Context);
       begin
+         Stats.all := Context.Stats;
          Trace ("The relation solving resulted in " & Ret'Image);
          case Ret is
             when Progress | No_Progress =>
@@ -188,6 +215,10 @@ package body Langkit_Support.Adalog.Abstract_Relation is
                return False;
          end case;
       end;
+   exception
+      when others =>
+         Stats.all := Context.Stats;
+         raise;
    end Solve;
 
    ----------
@@ -196,6 +227,8 @@ package body Langkit_Support.Adalog.Abstract_Relation is
 
    procedure Tick (Context : in out Solving_Context) is
    begin
+      Context.Stats.Ticks := Context.Stats.Ticks + 1;
+
       if Context.Timeout = 0 then
          return;
       end if;
@@ -206,4 +239,13 @@ package body Langkit_Support.Adalog.Abstract_Relation is
       end if;
    end Tick;
 
+   ---------------------
+   -- Count_Backtrack --
+   ---------------------
+
+   procedure Count_Backtrack (Context : in out Solving_Context) is
+   begin
+      Context.Stats.Backtracks := Context.Stats.Backtracks + 1;
+   end Count_Backtrack;
+
 end Langkit_Support.Adalog.Abstract_Relation;
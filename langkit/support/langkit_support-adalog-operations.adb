@@ -45,6 +45,12 @@ package body Langkit_Support.Adalog.Operations is
    --  Tag the Index'th element in the working queue as completed: it will not
    --  be evaluated anymore.
 
+   procedure Move_Most_Constrained_First
+     (Self : in out Base_Aggregate_Rel'Class; Index : Positive);
+   --  Swap the Index'th element in the working queue with the element in
+   --  Index .. Self.Count whose relation has the smallest branching factor.
+   --  This implements the Propagation solving strategy.
+
    -----------
    -- Reset --
    -----------
@@ -197,6 +203,15 @@ package body Langkit_Support.Adalog.Operations is
          Stalled := False;
       end Tag_Progress;
 
+      Propagate : constant Boolean := Strategy (Context) = Propagation;
+      --  Whether to pick the most constrained sub-relation each time we move
+      --  to a sub-relation we have not evaluated yet.
+
+      Retry : Boolean := False;
+      --  Whether the sub-relation at Self.Next was already satisfied and must
+      --  be evaluated again to get its next solution. It must stay at this
+      --  position in the working queue.
+
       I : Positive;
    begin
       Trace ("In All_Rel:");
@@ -204,6 +219,7 @@ package body Langkit_Support.Adalog.Operations is
       if Self.Next > Self.Count then
          Trace ("In All_Rel: last relation was evaluated: getting back to it");
          Self.Next := Self.Count;
+         Retry := True;
       end if;
 
       while not Stalled loop
@@ -212,6 +228,11 @@ package body Langkit_Support.Adalog.Operations is
          Inner_Loop : while I <= Self.Count loop
             Tick (Context);
 
+            if Propagate and then not Retry then
+               Move_Most_Constrained_First (Self, I);
+            end if;
+            Retry := False;
+
             case Get_From_Queue (Self, I).Solve (Context) is
                when No_Progress =>
                   I := I + 1;
@@ -234,6 +255,7 @@ package body Langkit_Support.Adalog.Operations is
                   end if;
 
                   Tag_Progress;
+                  Count_Backtrack (Context);
                   Trace ("In All_Rel: relation unsatisfied, resetting it and"
                          & " getting back to the previous one");
                   Get_From_Queue (Self, I).Reset;
@@ -244,6 +266,7 @@ package body Langkit_Support.Adalog.Operations is
                   --  previous sub-relation, hence the -2.
                   Set_Completed (Self, I);
                   Self.Next := Self.Next - 2;
+                  Retry := True;
                   exit Inner_Loop;
             end case;
          end loop Inner_Loop;
@@ -367,6 +390,97 @@ package body Langkit_Support.Adalog.Operations is
       end;
    end Logic_All;
 
+   ---------------
+   -- Normalize --
+   ---------------
+
+   function Normalize (Self : Relation) return Relation is
+      Is_Any : constant Boolean := Self.all in Any_Rel'Class;
+      Is_All : constant Boolean := Self.all in All_Rel'Class;
+   begin
+      if not Is_Any and then not Is_All then
+         Inc_Ref (Self);
+         return Self;
+      end if;
+
+      declare
+         Sub_Rels : constant Relation_Array :=
+           Base_Aggregate_Rel'Class (Self.all).Sub_Rels;
+
+         Normalized : Relation_Array (Sub_Rels'Range);
+         --  Normalized sub-relations. We own one share for each of them.
+
+         function Flatten (Rel : Relation) return Relation_Array
+         is
+           (if (if Is_Any
+                then Rel.all in Any_Rel'Class
+                else Rel.all in All_Rel'Class)
+            then Base_Aggregate_Rel'Class (Rel.all).Sub_Rels
+            else (1 => Rel));
+         --  Return the sub-relations of Rel if it is an aggregate of the same
+         --  kind as Self, or just Rel otherwise.
+
+         function Is_Not_Neutral (Rel : Relation) return Boolean
+         is
+           (if Is_Any
+            then Rel.all not in False_Relation.Rel'Class
+            else Rel.all not in True_Relation.Rel'Class);
+
+         function Is_Duplicate (L, R : Relation) return Boolean
+         is (L = R or else L.Is_Same (R.all));
+
+         function Is_Bound (Rel : Relation) return Boolean
+         is (Rel.Is_Fully_Bound);
+
+         function Is_Unbound (Rel : Relation) return Boolean
+         is (not Rel.Is_Fully_Bound);
+
+         function Flatten_Rels is new Rel_Arrays_Utils.Id_Flat_Map_Gen
+           (Flatten);
+         function Remove_Neutral is new Rel_Arrays_Utils.Filter_Gen
+           (Is_Not_Neutral);
+         function Remove_Duplicates is new Rel_Arrays_Utils.Unique_Gen
+           (Is_Duplicate);
+         function Bound_Rels is new Rel_Arrays_Utils.Filter_Gen (Is_Bound);
+         function Unbound_Rels is new Rel_Arrays_Utils.Filter_Gen
+           (Is_Unbound);
+
+         Result : Relation;
+      begin
+         for I in Sub_Rels'Range loop
+            Normalized (I) := Normalize (Sub_Rels (I));
+         end loop;
+
+         declare
+            Rels : constant Relation_Array :=
+              Remove_Duplicates (Remove_Neutral (Flatten_Rels (Normalized)));
+         begin
+            if Is_Any then
+               Result := Logic_Any (Rels);
+
+            elsif (for some Rel of Rels =>
+                      Rel.all in False_Relation.Rel'Class)
+            then
+               Result := False_Rel;
+
+            else
+               --  Keep the relative order of the other sub-relations: this
+               --  order determines the order in which solutions are found.
+
+               Result := Logic_All (Bound_Rels (Rels) & Unbound_Rels (Rels));
+            end if;
+         end;
+
+         --  The constructors above took their own ownership shares for the
+         --  sub-relations they keep, so we can release ours.
+
+         for Rel of Normalized loop
+            Dec_Ref (Rel);
+         end loop;
+         return Result;
+      end;
+   end Normalize;
+
    ------------------------------
    -- Initialize_Working_Queue --
    ------------------------------
@@ -393,4 +507,41 @@ package body Langkit_Support.Adalog.Operations is
       Self.Next := Self.Next + 1;
    end Set_Completed;
 
+   ---------------------------------
+   -- Move_Most_Constrained_First --
+   ---------------------------------
+
+   procedure Move_Most_Constrained_First
+     (Self : in out Base_Aggregate_Rel'Class; Index : Positive)
+   is
+      Best        : Positive := Index;
+      Best_Factor : Natural := Get_From_Queue (Self, Index).Branching_Factor;
+   begin
+      for I in Index + 1 .. Self.Count loop
+
+         --  Nothing can beat a mere check: stop looking
+
+         exit when Best_Factor = 0;
+
+         declare
+            Factor : constant Natural :=
+               Get_From_Queue (Self, I).Branching_Factor;
+         begin
+            if Factor < Best_Factor then
+               Best := I;
+               Best_Factor := Factor;
+            end if;
+         end;
+      end loop;
+
+      if Best /= Index then
+         declare
+            Saved : constant Positive := Self.Working_Queue (Index);
+         begin
+            Self.Working_Queue (Index) := Self.Working_Queue (Best);
+            Self.Working_Queue (Best) := Saved;
+         end;
+      end if;
+   end Move_Most_Constrained_First;
+
 end Langkit_Support.Adalog.Operations;
@@ -37,6 +37,13 @@ package body Langkit_Support.Adalog.Unify_One_Side is
       Eq_Data : Equals_Data) return Unify_Rec;
    --  Helper for the public Create function
 
+   function Domain_Contains
+     (Self : in out Member_T; L : L_Type) return Boolean;
+   --  Return whether L is equal to one of the values in Self's domain
+
+   function Create_Index (Self : Member_T) return Domain_Index_Access;
+   --  Create a hash table for the domain of Self. Self.Hash must not be null.
+
    -----------
    -- Apply --
    -----------
@@ -146,20 +153,16 @@ package body Langkit_Support.Adalog.Unify_One_Side is
 
             Trace ("In Member: left already defined, checking domain");
             Self.Domain_Checked := True;
-            for V of Self.Values.all loop
-               declare
-                  L     : L_Type := Get_Value (Self.Left);
-                  R_Val : L_Type := Convert (Self.R_Data, V);
-                  B     : constant Boolean := Equals (Self.Eq_Data, L, R_Val);
-               begin
-                  L_Dec_Ref (L);
-                  L_Dec_Ref (R_Val);
-                  if B then
-                     Trace ("In Member: left already defined, satisfied");
-                     return Satisfied;
-                  end if;
-               end;
-            end loop;
+            declare
+               L : L_Type := Get_Value (Self.Left);
+               B : constant Boolean := Domain_Contains (Self, L);
+            begin
+               L_Dec_Ref (L);
+               if B then
+                  Trace ("In Member: left already defined, satisfied");
+                  return Satisfied;
+               end if;
+            end;
 
             Trace ("In Member: left already defined, unsatisfied");
             return Unsatisfied;
@@ -191,6 +194,86 @@ package body Langkit_Support.Adalog.Unify_One_Side is
       end if;
    end Solve_Impl;
 
+   ---------------------
+   -- Domain_Contains --
+   ---------------------
+
+   function Domain_Contains
+     (Self : in out Member_T; L : L_Type) return Boolean is
+   begin
+      if Self.Hash = null
+         or else Self.Values.all'Length < Hashed_Domain_Threshold
+      then
+         for V of Self.Values.all loop
+            declare
+               R_Val : L_Type := Convert (Self.R_Data, V);
+               B     : constant Boolean := Equals (Self.Eq_Data, L, R_Val);
+            begin
+               L_Dec_Ref (R_Val);
+               if B then
+                  return True;
+               end if;
+            end;
+         end loop;
+         return False;
+      end if;
+
+      if Self.Index = null then
+         Trace ("In Member: creating the domain hash table");
+         Self.Index := Create_Index (Self);
+      end if;
+
+      declare
+         Index  : Domain_Index renames Self.Index.all;
+         Bucket : Hash_Type := Self.Hash (L) and Index.Last_Bucket;
+      begin
+         while Index.Buckets (Bucket) /= 0 loop
+            if Equals
+              (Self.Eq_Data, L, Index.Values (Index.Buckets (Bucket)))
+            then
+               return True;
+            end if;
+            Bucket := (Bucket + 1) and Index.Last_Bucket;
+         end loop;
+         return False;
+      end;
+   end Domain_Contains;
+
+   ------------------
+   -- Create_Index --
+   ------------------
+
+   function Create_Index (Self : Member_T) return Domain_Index_Access is
+      Size         : constant Positive := Self.Values.all'Length;
+      Bucket_Count : Hash_Type := 1;
+      Next_Value   : Positive := 1;
+   begin
+      --  Keep the load factor under 1/2 so that probe sequences stay short
+
+      while Bucket_Count < 2 * Hash_Type (Size) loop
+         Bucket_Count := 2 * Bucket_Count;
+      end loop;
+
+      return Result : constant Domain_Index_Access :=
+        new Domain_Index (Size, Bucket_Count - 1)
+      do
+         Result.Buckets := (others => 0);
+         for V of Self.Values.all loop
+            declare
+               R_Val  : constant L_Type := Convert (Self.R_Data, V);
+               Bucket : Hash_Type := Self.Hash (R_Val) and Result.Last_Bucket;
+            begin
+               Result.Values (Next_Value) := R_Val;
+               while Result.Buckets (Bucket) /= 0 loop
+                  Bucket := (Bucket + 1) and Result.Last_Bucket;
+               end loop;
+               Result.Buckets (Bucket) := Next_Value;
+               Next_Value := Next_Value + 1;
+            end;
+         end loop;
+      end return;
+   end Create_Index;
+
    -----------
    -- Reset --
    -----------
@@ -243,7 +326,8 @@ package body Langkit_Support.Adalog.Unify_One_Side is
      (R       : Var.Var;
       Vals    : R_Type_Array;
       R_Data  : R_Convert_Data;
-      Eq_Data : Equals_Data) return Relation
+      Eq_Data : Equals_Data;
+      Hash    : Hash_Function := null) return Relation
    is
    begin
       for V of Vals loop
@@ -257,6 +341,8 @@ package body Langkit_Support.Adalog.Unify_One_Side is
          Domain_Checked => False,
          R_Data         => R_Data,
          Eq_Data        => Eq_Data,
+         Hash           => Hash,
+         Index          => null,
          others         => <>);
    end Member;
 
@@ -267,11 +353,20 @@ package body Langkit_Support.Adalog.Unify_One_Side is
    procedure Cleanup (Self : in out Member_T) is
       procedure Unchecked_Free
       is new Ada.Unchecked_Deallocation (R_Type_Array, R_Type_Array_Access);
+      procedure Unchecked_Free
+      is new Ada.Unchecked_Deallocation (Domain_Index, Domain_Index_Access);
    begin
       for V of Self.Values.all loop
          R_Dec_Ref (V);
       end loop;
       Unchecked_Free (Self.Values);
+
+      if Self.Index /= null then
+         for V of Self.Index.Values loop
+            L_Dec_Ref (V);
+         end loop;
+         Unchecked_Free (Self.Index);
+      end if;
    end Cleanup;
 
    ------------------
@@ -298,4 +393,31 @@ package body Langkit_Support.Adalog.Unify_One_Side is
       return To_String (Res);
    end Custom_Image;
 
+   --------------------
+   -- Is_Fully_Bound --
+   --------------------
+
+   overriding function Is_Fully_Bound (Self : Member_T) return Boolean is
+   begin
+      --  If we did not assign Left ourselves, solving Self only checks that
+      --  its value belongs to the domain.
+
+      return Is_Defined (Self.Left) and then not Self.Changed;
+   end Is_Fully_Bound;
+
+   ----------------------
+   -- Branching_Factor --
+   ----------------------
+
+   overriding function Branching_Factor (Self : Member_T) return Natural is
+   begin
+      if Is_Fully_Bound (Self) then
+         return 0;
+      end if;
+
+      --  Self can still try all the values it did not try yet
+
+      return Self.Values.all'Last - Self.Current_Index + 1;
+   end Branching_Factor;
+
 end Langkit_Support.Adalog.Unify_One_Side;
@@ -58,6 +58,15 @@ package body Langkit_Support.Bump_Ptr is
       return new Bump_Ptr_Pool_Type;
    end Create;
 
+   --------------------
+   -- Allocated_Size --
+   --------------------
+
+   function Allocated_Size (Pool : Bump_Ptr_Pool) return Storage_Count is
+   begin
+      return (if Pool = No_Pool then 0 else Pool.Allocated);
+   end Allocated_Size;
+
    ----------
    -- Free --
    ----------
@@ -105,6 +114,7 @@ package body Langkit_Support.Bump_Ptr is
             --  it can keep being used next time.
 
             Append (Pool.Pages, Mem);
+            Pool.Allocated := Pool.Allocated + S;
             return Mem;
          end;
       end if;
@@ -115,6 +125,7 @@ package body Langkit_Support.Bump_Ptr is
       if Page_Size - Pool.Current_Offset < S then
          Pool.Current_Page := System.Memory.Alloc (Page_Size);
          Append (Pool.Pages, Pool.Current_Page);
+         Pool.Allocated := Pool.Allocated + Page_Size;
          Pool.Current_Offset := 0;
       end if;
 
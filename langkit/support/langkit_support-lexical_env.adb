@@ -2016,4 +2016,48 @@ package body Langkit_Support.Lexical_Env is
       end case;
    end Is_Stale;
 
+   ------------------
+   -- Memory_Usage --
+   ------------------
+
+   function Memory_Usage (Self : Lexical_Env) return Byte_Count is
+      Map_Node_Size : constant Byte_Count :=
+        (Symbol_Type'Size
+         + Internal_Map_Node_Vectors.Vector'Size
+         + Standard'Address_Size) / 8;
+      --  Approximate size of a node in the hashed map for Self.Env.Map, not
+      --  counting the vector elements.
+
+      Cache_Node_Size : constant Byte_Count :=
+        (Lookup_Cache_Key'Size
+         + Lookup_Cache_Entry'Size
+         + Standard'Address_Size) / 8;
+      --  Likewise for Self.Env.Lookup_Cache
+
+      Result : Byte_Count;
+   begin
+      if Self.Env = null then
+         return 0;
+      end if;
+
+      Result := Self.Env.all'Size / 8
+                + Byte_Count (Self.Env.Referenced_Envs.Length)
+                  * Referenced_Env'Size / 8;
+
+      if Self.Env.Map /= null then
+         for Elts of Self.Env.Map.all loop
+            Result := Result + Map_Node_Size
+                      + Byte_Count (Elts.Length) * Internal_Map_Node'Size / 8;
+         end loop;
+      end if;
+
+      for Cache_Entry of Self.Env.Lookup_Cache loop
+         Result := Result + Cache_Node_Size
+                   + Byte_Count (Cache_Entry.Elements.Length)
+                     * Lookup_Result_Item'Size / 8;
+      end loop;
+
+      return Result;
+   end Memory_Usage;
+
 end Langkit_Support.Lexical_Env;
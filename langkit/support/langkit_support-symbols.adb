@@ -29,7 +29,13 @@ with System.Storage_Elements; use System.Storage_Elements;
 package body Langkit_Support.Symbols is
 
    procedure Deallocate is new Ada.Unchecked_Deallocation
-     (Sets.Set, Symbol_Table);
+     (Symbol_Table_Record, Symbol_Table);
+
+   function Find_In_Set
+     (ST     : Symbol_Table;
+      T      : Text_Type;
+      Create : Boolean) return Symbol_Type;
+   --  Implementation for Find, ignoring ST's parent table
 
    -----------
    -- Image --
@@ -60,7 +66,16 @@ package body Langkit_Support.Symbols is
 
    function Create_Symbol_Table return Symbol_Table is
    begin
-      return new Sets.Set;
+      return new Symbol_Table_Record;
+   end Create_Symbol_Table;
+
+   -------------------------
+   -- Create_Symbol_Table --
+   -------------------------
+
+   function Create_Symbol_Table (Parent : Symbol_Table) return Symbol_Table is
+   begin
+      return new Symbol_Table_Record'(Parent => Parent, others => <>);
    end Create_Symbol_Table;
 
    ----------
@@ -71,12 +86,39 @@ package body Langkit_Support.Symbols is
      (ST     : Symbol_Table;
       T      : Text_Type;
       Create : Boolean := True)
-      return Symbol_Type
+      return Symbol_Type is
+   begin
+      --  Symbols that the parent table already has take precedence, so that
+      --  they are shared with all the tables that extend it. Never create
+      --  symbols in the parent table: only this table can be modified here.
+
+      if ST.Parent /= null then
+         declare
+            Result : constant Symbol_Type :=
+               Find_In_Set (ST.Parent, T, Create => False);
+         begin
+            if Result /= null then
+               return Result;
+            end if;
+         end;
+      end if;
+
+      return Find_In_Set (ST, T, Create);
+   end Find;
+
+   -----------------
+   -- Find_In_Set --
+   -----------------
+
+   function Find_In_Set
+     (ST     : Symbol_Table;
+      T      : Text_Type;
+      Create : Boolean) return Symbol_Type
    is
       use Sets;
 
       T_Acc  : Symbol_Type := T'Unrestricted_Access;
-      Result : constant Cursor := ST.Find (T_Acc);
+      Result : constant Cursor := ST.Set.Find (T_Acc);
    begin
       --  If we already have such a symbol, return the access we already
       --  internalized. Otherwise, give up if asked to.
@@ -90,9 +132,35 @@ package body Langkit_Support.Symbols is
       --  At this point, we know we have to internalize a new symbol
 
       T_Acc := new Text_Type'(T);
-      ST.Insert (T_Acc);
+      ST.Set.Insert (T_Acc);
+      ST.Text_Bytes :=
+        ST.Text_Bytes + Byte_Count (T'Length) * Wide_Wide_Character'Size / 8;
       return T_Acc;
-   end Find;
+   end Find_In_Set;
+
+   ------------------
+   -- Symbol_Count --
+   ------------------
+
+   function Symbol_Count (ST : Symbol_Table) return Natural is
+   begin
+      return Natural (ST.Set.Length);
+   end Symbol_Count;
+
+   ------------------
+   -- Memory_Usage --
+   ------------------
+
+   function Memory_Usage (ST : Symbol_Table) return Byte_Count is
+      Node_Size : constant Byte_Count :=
+        (Symbol_Type'Size + Standard'Address_Size + 2 * Integer'Size) / 8;
+      --  Approximate size of a node in the hashed set, plus the bounds of the
+      --  symbol text.
+   begin
+      return Byte_Count (ST.Set.Capacity) * Standard'Address_Size / 8
+             + Byte_Count (ST.Set.Length) * Node_Size
+             + ST.Text_Bytes;
+   end Memory_Usage;
 
    -------------
    -- Destroy --
@@ -100,7 +168,7 @@ package body Langkit_Support.Symbols is
 
    procedure Destroy (ST : in out Symbol_Table) is
       use Sets;
-      C : Cursor := ST.First;
+      C : Cursor := ST.Set.First;
    begin
       while Has_Element (C) loop
          declare
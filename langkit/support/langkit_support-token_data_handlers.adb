@@ -153,6 +153,37 @@ package body Langkit_Support.Token_Data_Handlers is
       Initialize (Source, No_Symbol_Table);
    end Move;
 
+   -------------------------
+   -- Internalize_Symbols --
+   -------------------------
+
+   procedure Internalize_Symbols
+     (TDH : in out Token_Data_Handler; Symbols : Symbol_Table)
+   is
+      procedure Internalize (T : in out Stored_Token_Data);
+      --  Replace T's symbol, if any, with the equal one from Symbols
+
+      -----------------
+      -- Internalize --
+      -----------------
+
+      procedure Internalize (T : in out Stored_Token_Data) is
+      begin
+         if T.Symbol /= null then
+            T.Symbol := Find (Symbols, T.Symbol.all);
+         end if;
+      end Internalize;
+
+   begin
+      for I in First_Index (TDH.Tokens) .. Last_Index (TDH.Tokens) loop
+         Internalize (Get_Access (TDH.Tokens, I).all);
+      end loop;
+      for I in First_Index (TDH.Trivias) .. Last_Index (TDH.Trivias) loop
+         Internalize (Get_Access (TDH.Trivias, I).T);
+      end loop;
+      TDH.Symbols := Symbols;
+   end Internalize_Symbols;
+
    --------------------------
    -- Internal_Get_Trivias --
    --------------------------
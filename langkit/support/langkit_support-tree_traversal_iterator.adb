@@ -49,15 +49,18 @@ package body Langkit_Support.Tree_Traversal_Iterator is
 
       Element := It.Node;
 
-      for I in First_Child_Index (It.Node) .. Last_Child_Index (It.Node) loop
-         Child := Get_Child (It.Node, I);
-
-         if Child /= No_Node then
-            It.Stack.Append (I + 1);
-            It.Node := Child;
-            return True;
-         end if;
-      end loop;
+      if not Traverse_Iterator'Class (Iterator).Skip_Children (It.Node) then
+         for I in First_Child_Index (It.Node) .. Last_Child_Index (It.Node)
+         loop
+            Child := Get_Child (It.Node, I);
+
+            if Child /= No_Node then
+               It.Stack.Append (I + 1);
+               It.Node := Child;
+               return True;
+            end if;
+         end loop;
+      end if;
 
       --  We could not find non-null children: look for the next non-null
       --  sibling. If there's none, look for the parent's sibling and so on.
@@ -182,7 +182,16 @@
                               not f.abstract and
                               not f.null))
       ext = ctx.ext('nodes', cls.raw_name, 'components')
+
+      # The root node declares its Self_Env component itself
+      declares_self_env = cls.declares_self_env and not cls.is_root_node
    %>
+   % if declares_self_env:
+      Self_Env : Lexical_Env;
+      --  Hold the environment this node defines, or the parent environment
+      --  otherwise.
+   % endif
+
    % if fields:
       % for f in fields:
          ${f.name} : aliased ${f.type.storage_type_name}
@@ -196,7 +205,7 @@
       % endif
 
       ${exts.include_extension(ext)}
-   % elif emit_null:
+   % elif emit_null and not declares_self_env:
       null;
    % endif
 </%def>
@@ -425,7 +434,7 @@
       ## environment.
       Bound_Env : constant Lexical_Env :=
         (if Self.Parent /= null
-         then Self.Parent.Self_Env
+         then Self.Parent.Get_Self_Env
          else Self.Self_Env);
 
       Initial_Env : Lexical_Env := Bound_Env;
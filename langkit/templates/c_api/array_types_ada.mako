@@ -53,7 +53,12 @@ end ${create};
 procedure ${inc_ref} (A : ${ada_type_name}) is
 begin
    Clear_Last_Exception;
-   Inc_Ref (A);
+   declare
+      Guard : Evaluation_Guard (null);
+      pragma Unreferenced (Guard);
+   begin
+      Inc_Ref (A);
+   end;
 exception
    when Exc : others =>
       Set_Last_Exception (Exc);
@@ -63,6 +68,9 @@ procedure ${dec_ref} (A : ${ada_type_name}) is
 begin
    Clear_Last_Exception;
    declare
+      Guard : Evaluation_Guard (null);
+      pragma Unreferenced (Guard);
+
       A_Var : ${ada_type_name} := A;
    begin
       Dec_Ref (A_Var);
@@ -126,6 +126,12 @@
                  )
             %>
 
+            % if field.is_property:
+               Guard : Evaluation_Guard (Unwrapped_Node.Unit.Context);
+               pragma Unreferenced (Guard);
+               --  Serialize property evaluation in frozen contexts
+            % endif
+
             Typed_Node : constant ${struct.name} :=
                ${struct.name} (Unwrapped_Node);
             Result     : ${field.type.name};
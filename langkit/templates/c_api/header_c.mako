@@ -23,6 +23,7 @@ ${c_doc('langkit.analysis_context_type')}
 typedef struct
 {
    uint64_t serial_number;
+   uint64_t units_version;
 } *${analysis_context_type};
 
 ${c_doc('langkit.analysis_unit_type')}
@@ -129,6 +130,22 @@ typedef struct {
    const char *information;
 } ${exception_type};
 
+${c_doc('langkit.memory_category_type')}
+typedef enum {
+   ${capi.get_name('ast_memory')},
+   ${capi.get_name('token_memory')},
+   ${capi.get_name('lexical_env_memory')},
+   ${capi.get_name('memoization_memory')},
+   ${capi.get_name('rebindings_memory')},
+   ${capi.get_name('symbol_memory')}
+} ${memory_category_type};
+
+${c_doc('langkit.memory_usage_type')}
+typedef struct {
+   uint64_t bytes;
+   int objects;
+} ${memory_usage_type};
+
 % for enum_type in ctx.enum_types:
    typedef enum {
       ${', '.join(v.c_name(capi) for v in enum_type.values)}
@@ -228,6 +245,30 @@ ${capi.get_name("context_discard_errors_in_populate_lexical_env")}(
         ${analysis_context_type} context,
         int discard);
 
+${c_doc('langkit.context_set_unit_eviction_policy')}
+extern void
+${capi.get_name("context_set_unit_eviction_policy")}(
+        ${analysis_context_type} context,
+        unsigned max_units,
+        uint64_t max_memory);
+
+${c_doc('langkit.context_evict_units')}
+extern void
+${capi.get_name("context_evict_units")}(${analysis_context_type} context);
+
+${c_doc('langkit.context_freeze')}
+extern void
+${capi.get_name("context_freeze")}(${analysis_context_type} context);
+
+${c_doc('langkit.context_unfreeze')}
+extern void
+${capi.get_name("context_unfreeze")}(${analysis_context_type} context);
+
+${c_doc('langkit.context_memory_usage')}
+extern void
+${capi.get_name("context_memory_usage")}(${analysis_context_type} context,
+                                         ${memory_usage_type} *result);
+
 ${c_doc('langkit.get_unit_from_file')}
 extern ${analysis_unit_type}
 ${capi.get_name("get_analysis_unit_from_file")}(
@@ -236,6 +277,17 @@ ${capi.get_name("get_analysis_unit_from_file")}(
         const char *charset,
         int reparse);
 
+${c_doc('langkit.get_units_from_files')}
+extern void
+${capi.get_name("get_analysis_units_from_files")}(
+        ${analysis_context_type} context,
+        const char **filenames,
+        int count,
+        const char *charset,
+        int reparse,
+        int workers,
+        ${analysis_unit_type} *units);
+
 ${c_doc('langkit.get_unit_from_buffer')}
 extern ${analysis_unit_type}
 ${capi.get_name("get_analysis_unit_from_buffer")}(
@@ -256,6 +308,14 @@ ${capi.get_name("get_analysis_unit_from_provider")}(
         int reparse);
 % endif
 
+${c_doc('langkit.unit_pin')}
+extern void
+${capi.get_name("unit_pin")}(${analysis_unit_type} unit);
+
+${c_doc('langkit.unit_unpin')}
+extern void
+${capi.get_name("unit_unpin")}(${analysis_unit_type} unit);
+
 ${c_doc('langkit.unit_root')}
 extern void
 ${capi.get_name("unit_root")}(${analysis_unit_type} unit,
@@ -279,6 +339,30 @@ ${c_doc('langkit.unit_trivia_count')}
 extern int
 ${capi.get_name('unit_trivia_count')}(${analysis_unit_type} unit);
 
+${c_doc('langkit.token_columns_type')}
+typedef struct {
+    int *kinds;
+    int *token_indexes;
+    int *trivia_indexes;
+    int *start_offsets;
+    int *end_offsets;
+    int *start_lines;
+    int *start_columns;
+    int *end_lines;
+    int *end_columns;
+} ${token_columns_type};
+
+${c_doc('langkit.unit_token_columns')}
+extern unsigned
+${capi.get_name('unit_token_columns')}(${analysis_unit_type} unit,
+                                       ${token_columns_type} *columns,
+                                       unsigned count);
+
+${c_doc('langkit.unit_text')}
+extern void
+${capi.get_name('unit_text')}(${analysis_unit_type} unit,
+                              ${text_type} *text);
+
 ${c_doc('langkit.unit_filename')}
 extern char *
 ${capi.get_name('unit_filename')}(${analysis_unit_type} unit);
@@ -287,6 +371,11 @@ ${c_doc('langkit.unit_diagnostic_count')}
 extern unsigned
 ${capi.get_name("unit_diagnostic_count")}(${analysis_unit_type} unit);
 
+${c_doc('langkit.unit_memory_usage')}
+extern void
+${capi.get_name("unit_memory_usage")}(${analysis_unit_type} unit,
+                                      ${memory_usage_type} *result);
+
 ${c_doc('langkit.unit_diagnostic')}
 extern int
 ${capi.get_name("unit_diagnostic")}(${analysis_unit_type} unit,
@@ -365,6 +454,87 @@ ${capi.get_name("node_child")}(${entity_type} *node,
                                unsigned n,
                                ${entity_type}* child_p);
 
+${c_doc('langkit.node_children')}
+extern unsigned
+${capi.get_name("node_children")}(${entity_type} *node,
+                                  ${entity_type} *children,
+                                  ${node_kind_type} *kinds,
+                                  unsigned count);
+
+${c_doc('langkit.node_descriptor_type')}
+typedef struct {
+   ${analysis_context_type} context;
+   ${analysis_unit_type} unit;
+   ${node_kind_type} kind;
+   unsigned children_count;
+} ${node_descriptor_type};
+
+${c_doc('langkit.node_descriptor')}
+extern int
+${capi.get_name("node_descriptor")}(${entity_type} *node,
+                                    ${node_descriptor_type} *descriptor);
+
+${c_doc('langkit.node_to_json')}
+extern char *
+${capi.get_name("node_to_json")}(${entity_type} *node,
+                                 int with_slocs,
+                                 size_t *length);
+
+${c_doc('langkit.node_to_binary')}
+extern char *
+${capi.get_name("node_to_binary")}(${entity_type} *node,
+                                   int with_slocs,
+                                   size_t *length);
+
+${c_doc('langkit.node_finder_type')}
+typedef void *${node_finder_type};
+
+${c_doc('langkit.create_node_finder')}
+extern ${node_finder_type}
+${capi.get_name("create_node_finder")}(${entity_type} *root,
+                                       const ${node_kind_type} *kinds,
+                                       unsigned kinds_count);
+
+${c_doc('langkit.node_finder_next')}
+extern unsigned
+${capi.get_name("node_finder_next")}(${node_finder_type} finder,
+                                     ${entity_type} *results,
+                                     ${node_kind_type} *kinds,
+                                     unsigned count);
+
+${c_doc('langkit.destroy_node_finder')}
+extern void
+${capi.get_name("destroy_node_finder")}(${node_finder_type} finder);
+
+${c_doc('langkit.unparsing_output_type')}
+typedef void *${unparsing_output_type};
+
+${c_doc('langkit.create_unparsing_output')}
+extern ${unparsing_output_type}
+${capi.get_name("create_unparsing_output")}(void);
+
+${c_doc('langkit.unparsing_output_clear')}
+extern void
+${capi.get_name("unparsing_output_clear")}(${unparsing_output_type} output);
+
+${c_doc('langkit.unparsing_output_content')}
+extern const char *
+${capi.get_name("unparsing_output_content")}(${unparsing_output_type} output,
+                                             size_t *length);
+
+${c_doc('langkit.destroy_unparsing_output')}
+extern void
+${capi.get_name("destroy_unparsing_output")}(${unparsing_output_type} output);
+
+${c_doc('langkit.node_unparse')}
+extern void
+${capi.get_name("node_unparse")}(${entity_type} *node,
+                                 ${unparsing_output_type} output);
+
+${c_doc('langkit.node_unparse_to_file')}
+extern void
+${capi.get_name("node_unparse_to_file")}(${entity_type} *node, int fd);
+
 ${c_doc('langkit.text_to_locale_string')}
 extern char *
 ${capi.get_name("text_to_locale_string")}(${text_type} *text);
@@ -382,6 +552,18 @@ extern void
 ${capi.get_name("symbol_text")}(${symbol_type} *symbol,
                                     ${text_type} *text);
 
+${c_doc('langkit.text_to_utf8')}
+extern size_t
+${capi.get_name("text_to_utf8")}(${text_type} *text,
+                                 char *buffer,
+                                 size_t size);
+
+${c_doc('langkit.text_from_utf8')}
+extern void
+${capi.get_name("text_from_utf8")}(const char *buffer,
+                                   size_t size,
+                                   ${text_type} *text);
+
 ${c_doc('langkit.create_big_integer')}
 extern ${big_integer_type}
 ${capi.get_name("create_big_integer")}(${text_type} *text);
@@ -12,16 +12,23 @@ with Ada.Strings.Wide_Wide_Unbounded.Aux;
 use Ada.Strings.Wide_Wide_Unbounded.Aux;
 pragma Warnings (On, "is an internal GNAT unit");
 
+with Ada.Strings.Unbounded;
 with System.Memory;
 use type System.Address;
 
+with GNAT.OS_Lib;
+
 with GNATCOLL.Iconv;
 
 with Langkit_Support.Diagnostics; use Langkit_Support.Diagnostics;
 with Langkit_Support.Text;        use Langkit_Support.Text;
+with Langkit_Support.Token_Data_Handlers;
+with Langkit_Support.Vectors;
 
 with ${ada_lib_name}.Analysis;   use ${ada_lib_name}.Analysis;
 with ${ada_lib_name}.Converters; use ${ada_lib_name}.Converters;
+with ${ada_lib_name}.Lexer;
+with ${ada_lib_name}.Unparsing_Implementation;
 
 ${exts.with_clauses(with_clauses)}
 
@@ -59,6 +66,10 @@ package body ${ada_lib_name}.Implementation.C is
        else Value (S));
 
    Last_Exception : ${exception_type}_Ptr := null;
+   pragma Thread_Local_Storage (Last_Exception);
+   --  Exception raised by the last C API call in the current thread, if any.
+   --  This is thread-local so that threads can use frozen contexts at the
+   --  same time.
 
    ----------
    -- Free --
@@ -136,6 +147,11 @@ package body ${ada_lib_name}.Implementation.C is
    is
       Raw_Text : Text_Type (1 .. Natural (Text.Length))
          with Import, Address => Text.Chars;
+
+      Guard : Evaluation_Guard (Context);
+      pragma Unreferenced (Guard);
+      --  Looking up a symbol can add it to the symbol table, which evaluations
+      --  in other tasks may read if Context is frozen.
    begin
       Clear_Last_Exception;
       Symbol.all := Wrap_Symbol (Lookup_Symbol (Context, Raw_Text));
@@ -159,6 +175,62 @@ package body ${ada_lib_name}.Implementation.C is
          Set_Last_Exception (Exc);
    end;
 
+   procedure ${capi.get_name("context_set_unit_eviction_policy")}
+     (Context    : ${analysis_context_type};
+      Max_Units  : unsigned;
+      Max_Memory : Unsigned_64) is
+   begin
+      Clear_Last_Exception;
+      Set_Unit_Eviction_Policy
+        (Context,
+         Natural (Max_Units),
+         Langkit_Support.Types.Byte_Count (Max_Memory));
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+   end;
+
+   procedure ${capi.get_name("context_evict_units")}
+     (Context : ${analysis_context_type}) is
+   begin
+      Clear_Last_Exception;
+      Evict_Units (Context);
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+   end;
+
+   procedure ${capi.get_name("context_freeze")}
+     (Context : ${analysis_context_type}) is
+   begin
+      Clear_Last_Exception;
+      Freeze (Context);
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+   end;
+
+   procedure ${capi.get_name("context_unfreeze")}
+     (Context : ${analysis_context_type}) is
+   begin
+      Clear_Last_Exception;
+      Unfreeze (Context);
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+   end;
+
+   procedure ${capi.get_name("context_memory_usage")}
+     (Context : ${analysis_context_type};
+      Result  : access Memory_Usage_Breakdown) is
+   begin
+      Clear_Last_Exception;
+      Result.all := Memory_Usage (Context);
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+   end;
+
    function ${capi.get_name("get_analysis_unit_from_file")}
      (Context           : ${analysis_context_type};
       Filename, Charset : chars_ptr;
@@ -178,6 +250,45 @@ package body ${ada_lib_name}.Implementation.C is
          return null;
    end;
 
+   procedure ${capi.get_name("get_analysis_units_from_files")}
+     (Context   : ${analysis_context_type};
+      Filenames : System.Address;
+      Count     : int;
+      Charset   : chars_ptr;
+      Reparse   : int;
+      Workers   : int;
+      Units     : System.Address) is
+   begin
+      Clear_Last_Exception;
+
+      declare
+         Length : constant Natural := Natural (Count);
+
+         C_Filenames : array (1 .. Length) of chars_ptr
+            with Import, Address => Filenames;
+         Result      : Internal_Unit_Array (1 .. Length)
+            with Import, Address => Units;
+
+         Ada_Filenames : Filename_Array (1 .. Length);
+      begin
+         for I in C_Filenames'Range loop
+            Ada_Filenames (I) := Ada.Strings.Unbounded.To_Unbounded_String
+              (Value (C_Filenames (I)));
+         end loop;
+
+         Result := Get_From_Files
+           (Context,
+            Ada_Filenames,
+            Value_Or_Empty (Charset),
+            Reparse /= 0,
+            ${Name.from_lower(ctx.main_rule_name)}_Rule,
+            Positive (Workers));
+      end;
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+   end;
+
    function ${capi.get_name("get_analysis_unit_from_buffer")}
      (Context           : ${analysis_context_type};
       Filename, Charset : chars_ptr;
@@ -233,6 +344,34 @@ package body ${ada_lib_name}.Implementation.C is
    end;
    % endif
 
+   procedure ${capi.get_name('unit_pin')} (Unit : ${analysis_unit_type}) is
+   begin
+      Clear_Last_Exception;
+      declare
+         Guard : Evaluation_Guard (null);
+         pragma Unreferenced (Guard);
+      begin
+         Pin_Unit (Unit);
+      end;
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+   end;
+
+   procedure ${capi.get_name('unit_unpin')} (Unit : ${analysis_unit_type}) is
+   begin
+      Clear_Last_Exception;
+      declare
+         Guard : Evaluation_Guard (null);
+         pragma Unreferenced (Guard);
+      begin
+         Unpin_Unit (Unit);
+      end;
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+   end;
+
    procedure ${capi.get_name('unit_root')}
      (Unit     : ${analysis_unit_type};
       Result_P : ${entity_type}_Ptr) is
@@ -301,6 +440,95 @@ package body ${ada_lib_name}.Implementation.C is
          return -1;
    end;
 
+   function ${capi.get_name('unit_token_columns')}
+     (Unit    : ${analysis_unit_type};
+      Columns : access ${token_columns_type};
+      Count   : unsigned) return unsigned
+   is
+      package TDHs renames Langkit_Support.Token_Data_Handlers;
+      use type TDHs.Token_Or_Trivia_Index;
+   begin
+      Clear_Last_Exception;
+
+      declare
+         TDH    : TDHs.Token_Data_Handler renames Unit.TDH;
+         Length : constant Natural :=
+           (if Count > unsigned (Natural'Last)
+            then Natural'Last
+            else Natural (Count));
+
+         type Column_Type is array (1 .. Length) of int;
+
+         procedure Store
+           (Column : System.Address; Index : Positive; Value : int)
+            with Inline;
+         --  If Column is not null, store Value at the given Index in it
+
+         -----------
+         -- Store --
+         -----------
+
+         procedure Store
+           (Column : System.Address; Index : Positive; Value : int)
+         is
+            C : Column_Type with Import, Address => Column;
+         begin
+            if Column /= System.Null_Address then
+               C (Index) := Value;
+            end if;
+         end Store;
+
+         Index : TDHs.Token_Or_Trivia_Index :=
+            TDHs.First_Token_Or_Trivia (TDH);
+         Next  : Natural := 0;
+      begin
+         while Next < Length and then Index /= TDHs.No_Token_Or_Trivia_Index
+         loop
+            Next := Next + 1;
+            declare
+               D : constant TDHs.Stored_Token_Data := TDHs.Data (Index, TDH);
+               R : Source_Location_Range renames D.Sloc_Range;
+            begin
+               Store (Columns.Kinds, Next,
+                      Token_Kind'Enum_Rep (Lexer.To_Token_Kind (D.Kind)));
+               Store (Columns.Token_Indexes, Next, int (Index.Token));
+               Store (Columns.Trivia_Indexes, Next, int (Index.Trivia));
+               Store (Columns.Start_Offsets, Next,
+                      int (D.Source_First - TDH.Source_First));
+               Store (Columns.End_Offsets, Next,
+                      int (D.Source_Last - TDH.Source_First + 1));
+               Store (Columns.Start_Lines, Next, int (R.Start_Line));
+               Store (Columns.Start_Columns, Next, int (R.Start_Column));
+               Store (Columns.End_Lines, Next, int (R.End_Line));
+               Store (Columns.End_Columns, Next, int (R.End_Column));
+            end;
+            Index := TDHs.Next (Index, TDH);
+         end loop;
+
+         return unsigned (Token_Count (Unit) + Trivia_Count (Unit));
+      end;
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end;
+
+   procedure ${capi.get_name('unit_text')}
+     (Unit : ${analysis_unit_type};
+      Text : access ${text_type}) is
+   begin
+      Clear_Last_Exception;
+      Text.all :=
+        (if Unit.TDH.Source_Buffer = null
+         then Wrap (Text_Cst_Access'(null))
+         else Wrap (Text_Cst_Access (Unit.TDH.Source_Buffer),
+                    Unit.TDH.Source_First,
+                    Unit.TDH.Source_Last));
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+   end;
+
    procedure ${capi.get_name('unit_lookup_token')}
      (Unit   : ${analysis_unit_type};
       Sloc   : access ${sloc_type};
@@ -343,6 +571,17 @@ package body ${ada_lib_name}.Implementation.C is
          return 0;
    end;
 
+   procedure ${capi.get_name("unit_memory_usage")}
+     (Unit   : ${analysis_unit_type};
+      Result : access Memory_Usage_Breakdown) is
+   begin
+      Clear_Last_Exception;
+      Result.all := Memory_Usage (Unit);
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+   end;
+
    function ${capi.get_name("unit_diagnostic")}
      (Unit         : ${analysis_unit_type};
       N            : unsigned;
@@ -545,13 +784,94 @@ package body ${ada_lib_name}.Implementation.C is
      (Node : ${entity_type}_Ptr) return unsigned is
    begin
       Clear_Last_Exception;
-      return unsigned (Node.Node.Abstract_Children_Count);
+      return unsigned (Children_Count (Node.Node));
    exception
       when Exc : others =>
          Set_Last_Exception (Exc);
          return 0;
    end;
 
+   function ${capi.get_name('node_descriptor')}
+     (Node       : ${entity_type}_Ptr;
+      Descriptor : access ${node_descriptor_type}) return int is
+   begin
+      Clear_Last_Exception;
+
+      declare
+         N : constant ${root_node_type_name} := Node.Node;
+      begin
+         if N = null then
+            Descriptor.all := (Context        => null,
+                               Unit           => null,
+                               Kind           => 0,
+                               Children_Count => 0);
+            return 0;
+         end if;
+
+         Descriptor.all :=
+           (Context        => N.Unit.Context,
+            Unit           => N.Unit,
+            Kind           => ${node_kind_type} (N.Kind'Enum_Rep),
+            Children_Count => unsigned (Children_Count (N)));
+         return 1;
+      end;
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end;
+
+   function Export_Bytes
+     (Bytes : String; Length : access size_t) return System.Address;
+   --  Copy Bytes to a buffer allocated with System.Memory.Alloc, adding a
+   --  trailing null byte, store the length of Bytes in Length and return the
+   --  buffer.
+
+   ------------------
+   -- Export_Bytes --
+   ------------------
+
+   function Export_Bytes
+     (Bytes : String; Length : access size_t) return System.Address
+   is
+      Result : constant System.Address :=
+         System.Memory.Alloc (System.Memory.size_t (Bytes'Length + 1));
+      Buffer : String (1 .. Bytes'Length + 1) with Import, Address => Result;
+   begin
+      Buffer (1 .. Bytes'Length) := Bytes;
+      Buffer (Buffer'Last) := ASCII.NUL;
+      Length.all := Bytes'Length;
+      return Result;
+   end Export_Bytes;
+
+   function ${capi.get_name('node_to_json')}
+     (Node       : ${entity_type}_Ptr;
+      With_Slocs : int;
+      Length     : access size_t) return System.Address is
+   begin
+      Clear_Last_Exception;
+      return Export_Bytes
+        (To_JSON (Node.Node, With_Slocs /= 0), Length);
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return System.Null_Address;
+   end;
+
+   function ${capi.get_name('node_to_binary')}
+     (Node       : ${entity_type}_Ptr;
+      With_Slocs : int;
+      Length     : access size_t) return System.Address is
+   begin
+      Clear_Last_Exception;
+      return Export_Bytes
+        (To_Binary (Node.Node, With_Slocs /= 0), Length);
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return System.Null_Address;
+   end;
+
    function ${capi.get_name('node_child')}
      (Node    : ${entity_type}_Ptr;
       N       : unsigned;
@@ -580,6 +900,312 @@ package body ${ada_lib_name}.Implementation.C is
          return 0;
    end;
 
+   function ${capi.get_name('node_children')}
+     (Node     : ${entity_type}_Ptr;
+      Children : System.Address;
+      Kinds    : System.Address;
+      Count    : unsigned) return unsigned is
+   begin
+      Clear_Last_Exception;
+
+      declare
+         Length : constant Natural :=
+           (if Count > unsigned (Natural'Last)
+            then Natural'Last
+            else Natural (Count));
+
+         Result_Children : array (1 .. Length) of ${entity_type}
+            with Import, Address => Children;
+         Result_Kinds    : array (1 .. Length) of ${node_kind_type}
+            with Import, Address => Kinds;
+
+         Next : Natural := 0;
+         --  Number of children processed so far
+
+         function Process (Child : ${root_node_type_name}) return Boolean;
+         procedure Process_Children is new Iterate_Children (Process);
+
+         function Process (Child : ${root_node_type_name}) return Boolean is
+         begin
+            Next := Next + 1;
+            Result_Children (Next) := (Child, Node.Info);
+            Result_Kinds (Next) :=
+              (if Child = null
+               then 0
+               else ${node_kind_type}
+                      (${root_node_kind_name}'Enum_Rep (Child.Kind)));
+            return Next < Length;
+         end Process;
+
+      begin
+         if Length > 0 then
+            Process_Children (Node.Node);
+         end if;
+         return unsigned (Children_Count (Node.Node));
+      end;
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end;
+
+   ------------------
+   -- Node finders --
+   ------------------
+
+   type Node_Finder_Frame is record
+      Node       : ${root_node_type_name};
+      --  Node whose children are being visited
+
+      Next_Child : Positive;
+      --  Index of the next child of Node to visit
+   end record;
+
+   package Node_Finder_Frame_Vectors is new Langkit_Support.Vectors
+     (Node_Finder_Frame);
+
+   type Node_Finder_Record is record
+      Kinds : Node_Kind_Set;
+      --  Set of kinds for the nodes to yield
+
+      Info : ${T.entity_info.name};
+      --  Entity info for the root node, to propagate to yielded nodes
+
+      Stack : Node_Finder_Frame_Vectors.Vector;
+      --  Stack of nodes whose children remain to be visited, so that the
+      --  search can resume where the previous batch stopped.
+   end record;
+
+   type Node_Finder_Access is access all Node_Finder_Record;
+
+   procedure Free is new Ada.Unchecked_Deallocation
+     (Node_Finder_Record, Node_Finder_Access);
+
+   function Wrap is new Ada.Unchecked_Conversion
+     (Node_Finder_Access, ${node_finder_type});
+   function Unwrap is new Ada.Unchecked_Conversion
+     (${node_finder_type}, Node_Finder_Access);
+
+   function ${capi.get_name('create_node_finder')}
+     (Root        : ${entity_type}_Ptr;
+      Kinds       : System.Address;
+      Kinds_Count : unsigned) return ${node_finder_type} is
+   begin
+      Clear_Last_Exception;
+
+      declare
+         Kinds_Array : array (1 .. Natural (Kinds_Count)) of ${node_kind_type}
+            with Import, Address => Kinds;
+
+         Result : constant Node_Finder_Access := new Node_Finder_Record'
+           (Kinds  => Empty_Node_Kind_Set,
+            Info   => Root.Info,
+            Stack  => Node_Finder_Frame_Vectors.Empty_Vector);
+      begin
+         for K of Kinds_Array loop
+            Result.Kinds (${root_node_kind_name}'Enum_Val (K)) := True;
+         end loop;
+
+         if Root.Node /= null
+            and then May_Have_Descendants_In (Root.Node.Kind, Result.Kinds)
+         then
+            Result.Stack.Append ((Root.Node, 1));
+         end if;
+         return Wrap (Result);
+      end;
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return ${node_finder_type} (System.Null_Address);
+   end;
+
+   function ${capi.get_name('node_finder_next')}
+     (Finder  : ${node_finder_type};
+      Results : System.Address;
+      Kinds   : System.Address;
+      Count   : unsigned) return unsigned is
+   begin
+      Clear_Last_Exception;
+
+      declare
+         F      : Node_Finder_Record renames Unwrap (Finder).all;
+         Length : constant Natural :=
+           (if Count > unsigned (Natural'Last)
+            then Natural'Last
+            else Natural (Count));
+
+         Result_Nodes : array (1 .. Length) of ${entity_type}
+            with Import, Address => Results;
+         Result_Kinds : array (1 .. Length) of ${node_kind_type}
+            with Import, Address => Kinds;
+
+         Next : Natural := 0;
+         --  Number of nodes stored in the result buffers so far
+      begin
+         while Next < Length and then not F.Stack.Is_Empty loop
+            declare
+               Frame : constant Node_Finder_Frame := F.Stack.Last_Element;
+               Child : ${root_node_type_name};
+            begin
+               if Frame.Next_Child > Children_Count (Frame.Node) then
+                  F.Stack.Pop;
+               else
+                  F.Stack.Set
+                    (F.Stack.Last_Index,
+                     (Frame.Node, Frame.Next_Child + 1));
+                  Child := Implementation.Child (Frame.Node, Frame.Next_Child);
+
+                  if Child /= null then
+                     if F.Kinds (Child.Kind) then
+                        Next := Next + 1;
+                        Result_Nodes (Next) := (Child, F.Info);
+                        Result_Kinds (Next) := ${node_kind_type}
+                          (${root_node_kind_name}'Enum_Rep (Child.Kind));
+                     end if;
+
+                     if May_Have_Descendants_In (Child.Kind, F.Kinds) then
+                        F.Stack.Append ((Child, 1));
+                     end if;
+                  end if;
+               end if;
+            end;
+         end loop;
+         return unsigned (Next);
+      end;
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end;
+
+   procedure ${capi.get_name('destroy_node_finder')}
+     (Finder : ${node_finder_type}) is
+   begin
+      Clear_Last_Exception;
+
+      declare
+         F : Node_Finder_Access := Unwrap (Finder);
+      begin
+         F.Stack.Destroy;
+         Free (F);
+      end;
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+   end;
+
+   ---------------
+   -- Unparsing --
+   ---------------
+
+   package UI renames ${ada_lib_name}.Unparsing_Implementation;
+
+   procedure Free is new Ada.Unchecked_Deallocation
+     (UI.UTF8_Output, UI.UTF8_Output_Access);
+
+   function Wrap is new Ada.Unchecked_Conversion
+     (UI.UTF8_Output_Access, ${unparsing_output_type});
+   function Unwrap is new Ada.Unchecked_Conversion
+     (${unparsing_output_type}, UI.UTF8_Output_Access);
+
+   function ${capi.get_name('create_unparsing_output')}
+      return ${unparsing_output_type} is
+   begin
+      Clear_Last_Exception;
+      return Wrap (new UI.UTF8_Output);
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return ${unparsing_output_type} (System.Null_Address);
+   end;
+
+   procedure ${capi.get_name('unparsing_output_clear')}
+     (Output : ${unparsing_output_type}) is
+   begin
+      Clear_Last_Exception;
+      UI.Clear (Unwrap (Output).all);
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+   end;
+
+   function ${capi.get_name('unparsing_output_content')}
+     (Output : ${unparsing_output_type};
+      Length : access size_t) return System.Address is
+   begin
+      Clear_Last_Exception;
+
+      declare
+         O : UI.UTF8_Output renames Unwrap (Output).all;
+      begin
+         Length.all := size_t (O.Last);
+         return (if O.Bytes = null
+                 then System.Null_Address
+                 else O.Bytes.all'Address);
+      end;
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return System.Null_Address;
+   end;
+
+   procedure ${capi.get_name('destroy_unparsing_output')}
+     (Output : ${unparsing_output_type}) is
+   begin
+      Clear_Last_Exception;
+
+      declare
+         O : UI.UTF8_Output_Access := Unwrap (Output);
+      begin
+         UI.Destroy (O.all);
+         Free (O);
+      end;
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+   end;
+
+   procedure ${capi.get_name('node_unparse')}
+     (Node   : ${entity_type}_Ptr;
+      Output : ${unparsing_output_type}) is
+   begin
+      Clear_Last_Exception;
+      UI.Unparse
+        (Implementation.Abstract_Node (Node.Node), Node.Node.Unit,
+         Preserve_Formatting => False,
+         As_Unit             => False,
+         Output              => Unwrap (Output));
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+   end;
+
+   procedure ${capi.get_name('node_unparse_to_file')}
+     (Node : ${entity_type}_Ptr;
+      FD   : int) is
+   begin
+      Clear_Last_Exception;
+
+      declare
+         Output : aliased UI.UTF8_Output;
+      begin
+         Output.File := GNAT.OS_Lib.File_Descriptor (FD);
+         UI.Unparse
+           (Implementation.Abstract_Node (Node.Node), Node.Node.Unit,
+            Preserve_Formatting => False,
+            As_Unit             => False,
+            Output              => Output'Unchecked_Access);
+         UI.Destroy (Output);
+      exception
+         when others =>
+            UI.Destroy (Output);
+            raise;
+      end;
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+   end;
+
    function ${capi.get_name("text_to_locale_string")}
      (Text : ${text_type}) return System.Address is
    begin
@@ -875,17 +1501,61 @@ package body ${ada_lib_name}.Implementation.C is
    begin
       Clear_Last_Exception;
       declare
-         Sym    : constant Symbol_Type := Unwrap_Symbol (Symbol.all);
-         Result : constant Text_Type :=
-           (if Sym = null then "" else Image (Sym));
+         Sym : constant Symbol_Type := Unwrap_Symbol (Symbol.all);
       begin
-         Text.all := Wrap_Alloc (Result);
+         --  Symbols are stored in the symbol table of their context, which
+         --  outlives the returned text reference: there is no need to copy.
+
+         Text.all := Wrap (Text_Cst_Access (Sym));
       end;
    exception
       when Exc : others =>
          Set_Last_Exception (Exc);
    end;
 
+   function ${capi.get_name('text_to_utf8')}
+     (Text   : access ${text_type};
+      Buffer : System.Address;
+      Size   : size_t) return size_t is
+   begin
+      Clear_Last_Exception;
+
+      declare
+         T : Text_Type (1 .. Natural (Text.Length))
+            with Import, Address => Text.Chars;
+         B : String (1 .. Natural (Size)) with Import, Address => Buffer;
+
+         Result : constant String := To_UTF8 (T);
+         Last   : constant Natural := Natural'Min (B'Last, Result'Length);
+      begin
+         B (1 .. Last) := Result (Result'First .. Result'First + Last - 1);
+         return size_t (Result'Length);
+      end;
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end;
+
+   procedure ${capi.get_name('text_from_utf8')}
+     (Buffer : System.Address;
+      Size   : size_t;
+      Text   : access ${text_type}) is
+   begin
+      Clear_Last_Exception;
+
+      declare
+         S : String (1 .. Natural (Size)) with Import, Address => Buffer;
+      begin
+         Text.all := Wrap_Alloc (From_UTF8 (S));
+      end;
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         Text.all := (Chars => System.Null_Address, Length => 0,
+                      Is_Allocated => 0);
+   end;
+
    function ${capi.get_name("create_big_integer")}
      (Text : access ${text_type}) return ${big_integer_type} is
    begin
@@ -924,6 +1594,9 @@ package body ${ada_lib_name}.Implementation.C is
    begin
       Clear_Last_Exception;
       declare
+         Guard : Evaluation_Guard (null);
+         pragma Unreferenced (Guard);
+
          BI : Big_Integer_Type := Unwrap_Big_Integer (Bigint);
       begin
          Dec_Ref (BI);
@@ -110,6 +110,9 @@ private package ${ada_lib_name}.Implementation.C is
 
    type ${exception_type}_Ptr is access ${exception_type};
 
+   subtype ${memory_usage_type} is Memory_Usage_Entry;
+   ${ada_c_doc('langkit.memory_usage_type', 3)}
+
    type ${bool_type} is new Unsigned_8;
    subtype uint32_t is Unsigned_32;
 
@@ -136,6 +139,24 @@ private package ${ada_lib_name}.Implementation.C is
            External_Name => "${capi.get_name('symbol_text')}";
    ${ada_c_doc('langkit.symbol_text', 3)}
 
+   function ${capi.get_name('text_to_utf8')}
+     (Text   : access ${text_type};
+      Buffer : System.Address;
+      Size   : size_t) return size_t
+      with Export        => True,
+           Convention    => C,
+           External_Name => "${capi.get_name('text_to_utf8')}";
+   ${ada_c_doc('langkit.text_to_utf8', 3)}
+
+   procedure ${capi.get_name('text_from_utf8')}
+     (Buffer : System.Address;
+      Size   : size_t;
+      Text   : access ${text_type})
+      with Export        => True,
+           Convention    => C,
+           External_Name => "${capi.get_name('text_from_utf8')}";
+   ${ada_c_doc('langkit.text_from_utf8', 3)}
+
    function ${capi.get_name("create_big_integer")}
      (Text : access ${text_type}) return ${big_integer_type}
       with Export, Convention => C,
@@ -234,6 +255,45 @@ private package ${ada_lib_name}.Implementation.C is
               'context_discard_errors_in_populate_lexical_env')}";
    ${ada_c_doc('langkit.context_discard_errors_in_populate_lexical_env', 3)}
 
+   procedure ${capi.get_name("context_set_unit_eviction_policy")}
+     (Context    : ${analysis_context_type};
+      Max_Units  : unsigned;
+      Max_Memory : Unsigned_64)
+      with Export        => True,
+           Convention    => C,
+           External_name =>
+              "${capi.get_name('context_set_unit_eviction_policy')}";
+   ${ada_c_doc('langkit.context_set_unit_eviction_policy', 3)}
+
+   procedure ${capi.get_name("context_evict_units")}
+     (Context : ${analysis_context_type})
+      with Export        => True,
+           Convention    => C,
+           External_name => "${capi.get_name('context_evict_units')}";
+   ${ada_c_doc('langkit.context_evict_units', 3)}
+
+   procedure ${capi.get_name("context_freeze")}
+     (Context : ${analysis_context_type})
+      with Export        => True,
+           Convention    => C,
+           External_name => "${capi.get_name('context_freeze')}";
+   ${ada_c_doc('langkit.context_freeze', 3)}
+
+   procedure ${capi.get_name("context_unfreeze")}
+     (Context : ${analysis_context_type})
+      with Export        => True,
+           Convention    => C,
+           External_name => "${capi.get_name('context_unfreeze')}";
+   ${ada_c_doc('langkit.context_unfreeze', 3)}
+
+   procedure ${capi.get_name("context_memory_usage")}
+     (Context : ${analysis_context_type};
+      Result  : access Memory_Usage_Breakdown)
+      with Export        => True,
+           Convention    => C,
+           External_name => "${capi.get_name('context_memory_usage')}";
+   ${ada_c_doc('langkit.context_memory_usage', 3)}
+
    function ${capi.get_name('get_analysis_unit_from_file')}
      (Context           : ${analysis_context_type};
       Filename, Charset : chars_ptr;
@@ -245,6 +305,20 @@ private package ${ada_lib_name}.Implementation.C is
               "${capi.get_name('get_analysis_unit_from_file')}";
    ${ada_c_doc('langkit.get_unit_from_file', 3)}
 
+   procedure ${capi.get_name('get_analysis_units_from_files')}
+     (Context   : ${analysis_context_type};
+      Filenames : System.Address;
+      Count     : int;
+      Charset   : chars_ptr;
+      Reparse   : int;
+      Workers   : int;
+      Units     : System.Address)
+      with Export        => True,
+           Convention    => C,
+           External_name =>
+              "${capi.get_name('get_analysis_units_from_files')}";
+   ${ada_c_doc('langkit.get_units_from_files', 3)}
+
    function ${capi.get_name('get_analysis_unit_from_buffer')}
      (Context           : ${analysis_context_type};
       Filename, Charset : chars_ptr;
@@ -271,6 +345,18 @@ private package ${ada_lib_name}.Implementation.C is
    ${ada_c_doc('langkit.get_unit_from_provider', 6)}
    % endif
 
+   procedure ${capi.get_name('unit_pin')} (Unit : ${analysis_unit_type})
+      with Export        => True,
+           Convention    => C,
+           External_name => "${capi.get_name('unit_pin')}";
+   ${ada_c_doc('langkit.unit_pin', 3)}
+
+   procedure ${capi.get_name('unit_unpin')} (Unit : ${analysis_unit_type})
+      with Export        => True,
+           Convention    => C,
+           External_name => "${capi.get_name('unit_unpin')}";
+   ${ada_c_doc('langkit.unit_unpin', 3)}
+
    procedure ${capi.get_name('unit_root')}
      (Unit     : ${analysis_unit_type};
       Result_P : ${entity_type}_Ptr)
@@ -309,6 +395,32 @@ private package ${ada_lib_name}.Implementation.C is
            External_Name => "${capi.get_name('unit_trivia_count')}";
    ${ada_c_doc('langkit.unit_trivia_count', 3)}
 
+   type ${token_columns_type} is record
+      Kinds, Token_Indexes, Trivia_Indexes : System.Address;
+      Start_Offsets, End_Offsets           : System.Address;
+      Start_Lines, Start_Columns           : System.Address;
+      End_Lines, End_Columns               : System.Address;
+   end record
+      with Convention => C_Struct;
+   ${ada_c_doc('langkit.token_columns_type', 3)}
+
+   function ${capi.get_name('unit_token_columns')}
+     (Unit    : ${analysis_unit_type};
+      Columns : access ${token_columns_type};
+      Count   : unsigned) return unsigned
+      with Export        => True,
+           Convention    => C,
+           External_Name => "${capi.get_name('unit_token_columns')}";
+   ${ada_c_doc('langkit.unit_token_columns', 3)}
+
+   procedure ${capi.get_name('unit_text')}
+     (Unit : ${analysis_unit_type};
+      Text : access ${text_type})
+      with Export        => True,
+           Convention    => C,
+           External_Name => "${capi.get_name('unit_text')}";
+   ${ada_c_doc('langkit.unit_text', 3)}
+
    procedure ${capi.get_name('unit_lookup_token')}
      (Unit   : ${analysis_unit_type};
       Sloc   : access ${sloc_type};
@@ -333,6 +445,14 @@ private package ${ada_lib_name}.Implementation.C is
            External_name => "${capi.get_name('unit_diagnostic_count')}";
    ${ada_c_doc('langkit.unit_diagnostic_count', 3)}
 
+   procedure ${capi.get_name('unit_memory_usage')}
+     (Unit   : ${analysis_unit_type};
+      Result : access Memory_Usage_Breakdown)
+      with Export        => True,
+           Convention    => C,
+           External_name => "${capi.get_name('unit_memory_usage')}";
+   ${ada_c_doc('langkit.unit_memory_usage', 3)}
+
    function ${capi.get_name('unit_diagnostic')}
      (Unit         : ${analysis_unit_type};
       N            : unsigned;
@@ -447,6 +567,132 @@ private package ${ada_lib_name}.Implementation.C is
            External_name => "${capi.get_name('node_child')}";
    ${ada_c_doc('langkit.node_child', 3)}
 
+   function ${capi.get_name('node_children')}
+     (Node     : ${entity_type}_Ptr;
+      Children : System.Address;
+      Kinds    : System.Address;
+      Count    : unsigned) return unsigned
+      with Export        => True,
+           Convention    => C,
+           External_name => "${capi.get_name('node_children')}";
+   ${ada_c_doc('langkit.node_children', 3)}
+
+   type ${node_descriptor_type} is record
+      Context        : ${analysis_context_type};
+      Unit           : ${analysis_unit_type};
+      Kind           : ${node_kind_type};
+      Children_Count : unsigned;
+   end record
+      with Convention => C_Struct;
+   ${ada_c_doc('langkit.node_descriptor_type', 3)}
+
+   function ${capi.get_name('node_descriptor')}
+     (Node       : ${entity_type}_Ptr;
+      Descriptor : access ${node_descriptor_type}) return int
+      with Export        => True,
+           Convention    => C,
+           External_name => "${capi.get_name('node_descriptor')}";
+   ${ada_c_doc('langkit.node_descriptor', 3)}
+
+   function ${capi.get_name('node_to_json')}
+     (Node       : ${entity_type}_Ptr;
+      With_Slocs : int;
+      Length     : access size_t) return System.Address
+      with Export        => True,
+           Convention    => C,
+           External_name => "${capi.get_name('node_to_json')}";
+   ${ada_c_doc('langkit.node_to_json', 3)}
+
+   function ${capi.get_name('node_to_binary')}
+     (Node       : ${entity_type}_Ptr;
+      With_Slocs : int;
+      Length     : access size_t) return System.Address
+      with Export        => True,
+           Convention    => C,
+           External_name => "${capi.get_name('node_to_binary')}";
+   ${ada_c_doc('langkit.node_to_binary', 3)}
+
+   --  Node finders
+
+   type ${node_finder_type} is new System.Address;
+   ${ada_c_doc('langkit.node_finder_type', 3)}
+
+   function ${capi.get_name('create_node_finder')}
+     (Root        : ${entity_type}_Ptr;
+      Kinds       : System.Address;
+      Kinds_Count : unsigned) return ${node_finder_type}
+      with Export        => True,
+           Convention    => C,
+           External_name => "${capi.get_name('create_node_finder')}";
+   ${ada_c_doc('langkit.create_node_finder', 3)}
+
+   function ${capi.get_name('node_finder_next')}
+     (Finder  : ${node_finder_type};
+      Results : System.Address;
+      Kinds   : System.Address;
+      Count   : unsigned) return unsigned
+      with Export        => True,
+           Convention    => C,
+           External_name => "${capi.get_name('node_finder_next')}";
+   ${ada_c_doc('langkit.node_finder_next', 3)}
+
+   procedure ${capi.get_name('destroy_node_finder')}
+     (Finder : ${node_finder_type})
+      with Export        => True,
+           Convention    => C,
+           External_name => "${capi.get_name('destroy_node_finder')}";
+   ${ada_c_doc('langkit.destroy_node_finder', 3)}
+
+   --  Unparsing
+
+   type ${unparsing_output_type} is new System.Address;
+   ${ada_c_doc('langkit.unparsing_output_type', 3)}
+
+   function ${capi.get_name('create_unparsing_output')}
+      return ${unparsing_output_type}
+      with Export        => True,
+           Convention    => C,
+           External_name => "${capi.get_name('create_unparsing_output')}";
+   ${ada_c_doc('langkit.create_unparsing_output', 3)}
+
+   procedure ${capi.get_name('unparsing_output_clear')}
+     (Output : ${unparsing_output_type})
+      with Export        => True,
+           Convention    => C,
+           External_name => "${capi.get_name('unparsing_output_clear')}";
+   ${ada_c_doc('langkit.unparsing_output_clear', 3)}
+
+   function ${capi.get_name('unparsing_output_content')}
+     (Output : ${unparsing_output_type};
+      Length : access size_t) return System.Address
+      with Export        => True,
+           Convention    => C,
+           External_name => "${capi.get_name('unparsing_output_content')}";
+   ${ada_c_doc('langkit.unparsing_output_content', 3)}
+
+   procedure ${capi.get_name('destroy_unparsing_output')}
+     (Output : ${unparsing_output_type})
+      with Export        => True,
+           Convention    => C,
+           External_name => "${capi.get_name('destroy_unparsing_output')}";
+   ${ada_c_doc('langkit.destroy_unparsing_output', 3)}
+
+   procedure ${capi.get_name('node_unparse')}
+     (Node   : ${entity_type}_Ptr;
+      Output : ${unparsing_output_type})
+      with Export        => True,
+           Convention    => C,
+           External_name => "${capi.get_name('node_unparse')}";
+   ${ada_c_doc('langkit.node_unparse', 3)}
+
+   procedure ${capi.get_name('node_unparse_to_file')}
+     (Node : ${entity_type}_Ptr;
+      FD   : int)
+      with Export        => True,
+           Convention    => C,
+           External_name => "${capi.get_name('node_unparse_to_file')}";
+   ${ada_c_doc('langkit.node_unparse_to_file', 3)}
+
    function ${capi.get_name('text_to_locale_string')}
      (Text : ${text_type}) return System.Address
       with Export        => True,
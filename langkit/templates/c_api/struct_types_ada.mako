@@ -40,7 +40,12 @@ procedure ${dec_ref} (R : ${c_type_name}_Ptr)
 procedure ${inc_ref} (R : ${c_type_name}_Ptr) is
 begin
    Clear_Last_Exception;
-   Inc_Ref (R.all);
+   declare
+      Guard : Evaluation_Guard (null);
+      pragma Unreferenced (Guard);
+   begin
+      Inc_Ref (R.all);
+   end;
 exception
    when Exc : others =>
       Set_Last_Exception (Exc);
@@ -49,7 +54,12 @@ end ${inc_ref};
 procedure ${dec_ref} (R : ${c_type_name}_Ptr) is
 begin
    Clear_Last_Exception;
-   Dec_Ref (R.all);
+   declare
+      Guard : Evaluation_Guard (null);
+      pragma Unreferenced (Guard);
+   begin
+      Dec_Ref (R.all);
+   end;
 exception
    when Exc : others =>
       Set_Last_Exception (Exc);
@@ -1,9 +1,40 @@
 ## vim: filetype=makoada
 
+<%
+   # Public properties that the batch mode can evaluate on all nodes: the ones
+   # that can be called without arguments. For each one, also compute the
+   # expression to convert the Node formal to the property's owning type.
+   batch_properties = []
+   batch_property_names = set()
+   for e in ctx.entity_types:
+      n = e.element_type
+      if not n.is_root_node and not n.concrete_subclasses:
+         continue
+      for p in n.get_properties(include_inherited=False):
+         if not p.is_public or p.overriding:
+            continue
+         has_mandatory_args = False
+         for arg in p.arguments:
+            if arg.default_value is None:
+               has_mandatory_args = True
+         if has_mandatory_args:
+            continue
+         batch_properties.append(
+            (n, p, 'Node' if n.is_root_node
+                   else 'Node.As_{}'.format(n.kwless_raw_name))
+         )
+         batch_property_names.add(str(p.name.lower))
+   batch_property_names = sorted(batch_property_names)
+%>
+
 with Ada.Calendar;              use Ada.Calendar;
+with Ada.Characters.Handling;   use Ada.Characters.Handling;
 with Ada.Containers.Hashed_Sets;
 with Ada.Containers.Vectors;
+with Ada.Exceptions;            use Ada.Exceptions;
 with Ada.Strings;               use Ada.Strings;
+with Ada.Strings.Fixed;         use Ada.Strings.Fixed;
+with Ada.Strings.Maps.Constants;
 with Ada.Strings.Unbounded;     use Ada.Strings.Unbounded;
 pragma Warnings (Off, "internal");
 with Ada.Strings.Unbounded.Aux; use Ada.Strings.Unbounded.Aux;
@@ -12,11 +43,20 @@ with Ada.Text_IO;               use Ada.Text_IO;
 with GNAT.Command_Line; use GNAT.Command_Line;
 with GNAT.Strings;
 
+with GNATCOLL.VFS;
+
+with Langkit_Support.Adalog.Abstract_Relation;
+use Langkit_Support.Adalog.Abstract_Relation;
+with Langkit_Support.Diagnostics;
 with Langkit_Support.Slocs; use Langkit_Support.Slocs;
+with Langkit_Support.Symbols;
+with Langkit_Support.Token_Data_Handlers;
+with Langkit_Support.Types; use Langkit_Support.Types;
 
 with ${ada_lib_name}.Analysis;  use ${ada_lib_name}.Analysis;
 with ${ada_lib_name}.Common;    use ${ada_lib_name}.Common;
 with ${ada_lib_name}.Init;      use ${ada_lib_name}.Init;
+with ${ada_lib_name}.Lexer;
 with ${ada_lib_name}.Unparsing; use ${ada_lib_name}.Unparsing;
 
 procedure Parse is
@@ -40,6 +80,14 @@ procedure Parse is
    Do_Unparse  : aliased Boolean;
    Hide_Slocs  : aliased Boolean;
    Check       : aliased Boolean;
+   Mem_Stats   : aliased Boolean;
+   Solver_Stats : aliased Boolean;
+   Propagation_Solver : aliased Boolean;
+   Batch       : aliased Boolean;
+   Jobs        : aliased Integer;
+   Do_PLE      : aliased Boolean;
+   Lexer_Bench : aliased Boolean;
+   Property    : aliased GNAT.Strings.String_Access;
 
    Input_Str : Unbounded_String;
    Lookups   : String_Vectors.Vector;
@@ -50,6 +98,28 @@ procedure Parse is
    procedure Process_Node (Res : ${root_entity.api_name}'Class);
    procedure Parse_Input;
    procedure Process_File (Filename : String; Ctx : Analysis_Context);
+   procedure Print_Memory_Usage
+     (Label : String; Usage : Memory_Usage_Breakdown);
+   procedure Print_Solver_Statistics (Ctx : Analysis_Context);
+
+   function Is_Property_Name (Name : String) return Boolean;
+   --  Return whether Name is the lower case name of a property that the batch
+   --  mode can evaluate.
+
+   function Evaluate_Property
+     (Node : ${root_entity.api_name}'Class; Name : String) return Boolean;
+   --  If the property called Name is available on Node, evaluate it and
+   --  return True. Return False otherwise.
+
+   function Peak_RSS return String;
+   --  Return the peak resident set size of this process in bytes, as a JSON
+   --  value: "null" if it cannot be determined on this platform.
+
+   procedure Run_Batch;
+   --  Benchmark mode: parse all the files in File_List using Jobs worker
+   --  tasks, optionally populate lexical envs and evaluate a property on all
+   --  nodes (both sequentially), and print timings and throughput as a JSON
+   --  object.
 
    --------------
    -- Get_Rule --
@@ -144,6 +214,10 @@ procedure Parse is
          Create_Context (With_Trivia => Do_Print_Trivia);
       Unit : Analysis_Unit;
    begin
+      if Propagation_Solver then
+         Set_Logic_Resolution_Strategy (Ctx, Propagation);
+      end if;
+
       Get_String (Input_Str, Input_Str_Ptr, Input_Str_Length);
       Unit := Get_From_Buffer
         (Context  => Ctx,
@@ -161,6 +235,10 @@ procedure Parse is
       --  Error recovery may make the parser return something even on error:
       --  process it anyway.
       Process_Node (Root (Unit));
+
+      if Solver_Stats then
+         Print_Solver_Statistics (Ctx);
+      end if;
    end Parse_Input;
 
    ------------------
@@ -244,8 +322,504 @@ procedure Parse is
            ("Time elapsed: " & Duration'Image (Time_After - Time_Before));
       end if;
 
+      if Mem_Stats then
+         Print_Memory_Usage ("unit " & Filename, Memory_Usage (Unit));
+      end if;
    end Process_File;
 
+   ------------------------
+   -- Print_Memory_Usage --
+   ------------------------
+
+   procedure Print_Memory_Usage
+     (Label : String; Usage : Memory_Usage_Breakdown)
+   is
+      Total : Byte_Count := 0;
+   begin
+      Put_Line ("");
+      Put_Line ("==== Memory usage for " & Label & " ====");
+      for Category in Usage'Range loop
+         Put_Line
+           (Memory_Category'Image (Category) & ":"
+            & Byte_Count'Image (Usage (Category).Bytes) & " bytes,"
+            & Natural'Image (Usage (Category).Objects) & " objects");
+         Total := Total + Usage (Category).Bytes;
+      end loop;
+      Put_Line ("Total:" & Byte_Count'Image (Total) & " bytes");
+   end Print_Memory_Usage;
+
+   -----------------------------
+   -- Print_Solver_Statistics --
+   -----------------------------
+
+   procedure Print_Solver_Statistics (Ctx : Analysis_Context) is
+      Stats : constant Solver_Statistics_Array := Solver_Statistics (Ctx);
+   begin
+      Put_Line ("");
+      Put_Line ("==== Logic resolution statistics ====");
+      if Stats'Length = 0 then
+         Put_Line ("No logic resolution");
+         return;
+      end if;
+
+      for S of Stats loop
+         Put_Line
+           (To_String (S.Property) & ":"
+            & Natural'Image (S.Resolutions) & " resolutions ("
+            & Natural'Image (S.Satisfied) & " satisfied,"
+            & Natural'Image (S.Unsatisfied) & " unsatisfied,"
+            & Natural'Image (S.Timeouts) & " timeouts,"
+            & Natural'Image (S.Errors) & " errors)");
+         Put_Line
+           ("  ticks:" & Statistics_Counter'Image (S.Totals.Ticks)
+            & " (max" & Statistics_Counter'Image (S.Max_Ticks)
+            & "), backtracks:"
+            & Statistics_Counter'Image (S.Totals.Backtracks)
+            & ", max depth:" & Natural'Image (S.Totals.Max_Depth));
+         Put ("  evaluations:");
+         for K in Relation_Kind loop
+            if S.Totals.Evaluations (K) > 0 then
+               Put (" " & Relation_Kind'Image (K) & "="
+                    & Trim (Statistics_Counter'Image
+                              (S.Totals.Evaluations (K)), Left));
+            end if;
+         end loop;
+         New_Line;
+      end loop;
+   end Print_Solver_Statistics;
+
+   ----------------------
+   -- Is_Property_Name --
+   ----------------------
+
+   function Is_Property_Name (Name : String) return Boolean is
+   % if batch_property_names:
+   begin
+      return ${'\n         or else '.join('Name = "{}"'.format(name)
+                                         for name in batch_property_names)};
+   % else:
+      pragma Unreferenced (Name);
+   begin
+      return False;
+   % endif
+   end Is_Property_Name;
+
+   -----------------------
+   -- Evaluate_Property --
+   -----------------------
+
+   function Evaluate_Property
+     (Node : ${root_entity.api_name}'Class; Name : String) return Boolean is
+   % if not batch_properties:
+      pragma Unreferenced (Node, Name);
+   % endif
+   begin
+   % for n, p, self_expr in batch_properties:
+      % if n.is_root_node:
+      if Name = "${p.name.lower}" then
+      % else:
+      if Name = "${p.name.lower}"
+         and then Node.Kind in ${n.ada_kind_range_name}
+      then
+      % endif
+         declare
+            Result : constant ${p.public_type.api_name} :=
+               ${ada_lib_name}.Analysis.${p.name}
+                 (${self_expr});
+            pragma Unreferenced (Result);
+         begin
+            return True;
+         end;
+      end if;
+   % endfor
+      return False;
+   end Evaluate_Property;
+
+   --------------
+   -- Peak_RSS --
+   --------------
+
+   function Peak_RSS return String is
+      use Ada.Strings.Maps.Constants;
+
+      Prefix : constant String := "VmHWM:";
+      F      : File_Type;
+   begin
+      --  Linux reports the peak resident set size in /proc/self/status, in a
+      --  line such as "VmHWM:     1234 kB".
+
+      Open (F, In_File, "/proc/self/status");
+      while not End_Of_File (F) loop
+         declare
+            Line : constant String := Get_Line (F);
+         begin
+            if Line'Length > Prefix'Length
+               and then Line (Line'First .. Line'First + Prefix'Length - 1)
+                        = Prefix
+            then
+               Close (F);
+               declare
+                  First : constant Natural :=
+                     Index (Line, Decimal_Digit_Set);
+                  Last  : constant Natural :=
+                     Index (Line (First .. Line'Last), Decimal_Digit_Set,
+                            Outside);
+               begin
+                  return Trim
+                    (Long_Long_Integer'Image
+                       (1024 * Long_Long_Integer'Value
+                                 (Line (First .. Last - 1))),
+                     Left);
+               end;
+            end if;
+         end;
+      end loop;
+      Close (F);
+      return "null";
+   exception
+      when Name_Error | Use_Error | Constraint_Error =>
+         if Is_Open (F) then
+            Close (F);
+         end if;
+         return "null";
+   end Peak_RSS;
+
+   ---------------
+   -- Run_Batch --
+   ---------------
+
+   procedure Run_Batch is
+
+      protected type Work_Queue (Count : Natural) is
+         procedure Next (Index : out Natural);
+         --  Assign the next item to process to the caller. Set Index to 0 if
+         --  there is nothing left to do.
+      private
+         Last_Index : Natural := 0;
+      end Work_Queue;
+
+      protected body Work_Queue is
+
+         ----------
+         -- Next --
+         ----------
+
+         procedure Next (Index : out Natural) is
+         begin
+            if Last_Index = Count then
+               Index := 0;
+            else
+               Last_Index := Last_Index + 1;
+               Index := Last_Index;
+            end if;
+         end Next;
+
+      end Work_Queue;
+
+      function Read_File_List return Filename_Array;
+      --  Return the list of non-empty lines in the File_List file
+
+      function Image (N : Natural) return String;
+      function Image (D : Duration) return String;
+      --  Return the JSON representation of N/D
+
+      function Rate (Count : Natural; D : Duration) return String;
+      --  Return the number of items per second to process Count items in D
+
+      -----------
+      -- Image --
+      -----------
+
+      function Image (N : Natural) return String is
+      begin
+         return Trim (Natural'Image (N), Left);
+      end Image;
+
+      -----------
+      -- Image --
+      -----------
+
+      function Image (D : Duration) return String is
+      begin
+         return Trim (Duration'Image (D), Left);
+      end Image;
+
+      ----------
+      -- Rate --
+      ----------
+
+      function Rate (Count : Natural; D : Duration) return String is
+         Seconds : constant Duration := Duration'Max (D, Duration'Small);
+      begin
+         return Trim (Float'Image (Float (Count) / Float (Seconds)), Left);
+      end Rate;
+
+      --------------------
+      -- Read_File_List --
+      --------------------
+
+      function Read_File_List return Filename_Array is
+         Names : String_Vectors.Vector;
+         F     : File_Type;
+      begin
+         Open (F, In_File, File_List.all);
+         while not End_Of_File (F) loop
+            declare
+               Line : constant String := Get_Line (F);
+            begin
+               if Line'Length > 0 then
+                  Names.Append (+Line);
+               end if;
+            end;
+         end loop;
+         Close (F);
+
+         return Result : Filename_Array (1 .. Natural (Names.Length)) do
+            for I in Result'Range loop
+               Result (I) := Names.Element (I - 1);
+            end loop;
+         end return;
+      end Read_File_List;
+
+      Filenames : constant Filename_Array := Read_File_List;
+      Ctx       : constant Analysis_Context :=
+         Create_Context (Charset.all, With_Trivia => Do_Print_Trivia);
+
+      Start : Time;
+
+      Lex_Time, PLE_Time, Properties_Time : Duration := 0.0;
+      Evaluations, Errors                 : Natural := 0;
+
+      procedure Lex_All;
+      --  Standalone lexer benchmark: lex all files with worker tasks, each
+      --  with its own symbol table and token data handler, and discard the
+      --  tokens. This is not a phase of the analysis: the parse phase lexes
+      --  all files again.
+
+      -------------
+      -- Lex_All --
+      -------------
+
+      procedure Lex_All is
+         Queue : Work_Queue (Filenames'Length);
+
+         task type Worker;
+
+         task body Worker is
+            use Langkit_Support.Diagnostics;
+            use Langkit_Support.Symbols;
+            use Langkit_Support.Token_Data_Handlers;
+
+            Symbols     : Symbol_Table := Create_Symbol_Table;
+            TDH         : Token_Data_Handler;
+            Diagnostics : Diagnostics_Vectors.Vector;
+            Index       : Natural;
+         begin
+            Initialize (TDH, Symbols);
+            loop
+               Queue.Next (Index);
+               exit when Index = 0;
+
+               begin
+                  ${ada_lib_name}.Lexer.Extract_Tokens
+                    (Input       =>
+                       (Kind     => File,
+                        Charset  => +Charset.all,
+                        Read_BOM => True,
+                        Filename => GNATCOLL.VFS.Create
+                          (GNATCOLL.VFS."+"
+                             (To_String (Filenames (Index))))),
+                     With_Trivia => Do_Print_Trivia,
+                     TDH         => TDH,
+                     Diagnostics => Diagnostics);
+               exception
+                  when others =>
+                     --  Files that cannot be read or decoded get diagnostics
+                     --  during the parse phase: just skip them here.
+
+                     null;
+               end;
+               Diagnostics.Clear;
+            end loop;
+            Free (TDH);
+            Destroy (Symbols);
+         end Worker;
+
+      begin
+         declare
+            Pool : array (1 .. Natural'Min (Jobs, Filenames'Length))
+               of Worker;
+            pragma Unreferenced (Pool);
+         begin
+            --  Leaving this block waits for all workers to complete
+
+            null;
+         end;
+      end Lex_All;
+
+   begin
+      if Propagation_Solver then
+         Set_Logic_Resolution_Strategy (Ctx, Propagation);
+      end if;
+
+      if Lexer_Bench then
+         Start := Clock;
+         Lex_All;
+         Lex_Time := Clock - Start;
+      end if;
+
+      declare
+         Parse_Start : constant Time := Clock;
+         Units       : constant Analysis_Unit_Array := Get_From_Files
+           (Ctx, Filenames, Rule => Get_Rule, Workers => Jobs);
+         Parse_Time  : constant Duration := Clock - Parse_Start;
+
+         Tokens, Nodes, Diagnostic_Count : Natural := 0;
+
+         function Count_Node
+           (Node : ${root_entity.api_name}'Class) return Visit_Status;
+         --  Increment Nodes and return Into
+
+         procedure Evaluate_All;
+         --  Evaluate Property on all nodes. Property evaluation needs
+         --  exclusive access to the analysis context, so worker tasks would
+         --  only wait for each other: this phase is always sequential.
+
+         ----------------
+         -- Count_Node --
+         ----------------
+
+         function Count_Node
+           (Node : ${root_entity.api_name}'Class) return Visit_Status
+         is
+            pragma Unreferenced (Node);
+         begin
+            Nodes := Nodes + 1;
+            return Into;
+         end Count_Node;
+
+         ------------------
+         -- Evaluate_All --
+         ------------------
+
+         procedure Evaluate_All is
+
+            procedure Unexpected_Error (E : Exception_Occurrence);
+            --  Count E as an error and show it on the standard error stream so
+            --  that it can be investigated.
+
+            function Visit
+              (Node : ${root_entity.api_name}'Class) return Visit_Status;
+            --  Evaluate Property on Node and update counters
+
+            ----------------------
+            -- Unexpected_Error --
+            ----------------------
+
+            procedure Unexpected_Error (E : Exception_Occurrence) is
+            begin
+               Errors := Errors + 1;
+               Put_Line (Standard_Error,
+                         Exception_Name (E) & ": " & Exception_Message (E));
+            end Unexpected_Error;
+
+            -----------
+            -- Visit --
+            -----------
+
+            function Visit
+              (Node : ${root_entity.api_name}'Class) return Visit_Status is
+            begin
+               begin
+                  if Evaluate_Property (Node, Property.all) then
+                     Evaluations := Evaluations + 1;
+                  end if;
+               exception
+                  when Property_Error =>
+                     Evaluations := Evaluations + 1;
+                     Errors := Errors + 1;
+                  when E : others =>
+                     Evaluations := Evaluations + 1;
+                     Unexpected_Error (E);
+               end;
+               return Into;
+            end Visit;
+
+         begin
+            for U of Units loop
+               begin
+                  if not Root (U).Is_Null then
+                     Traverse (Root (U), Visit'Access);
+                  end if;
+               exception
+                  when E : others =>
+                     Unexpected_Error (E);
+               end;
+            end loop;
+         end Evaluate_All;
+
+      begin
+         for U of Units loop
+            Tokens := Tokens + Token_Count (U);
+            Diagnostic_Count := Diagnostic_Count + Diagnostics (U)'Length;
+            if not Root (U).Is_Null then
+               Traverse (Root (U), Count_Node'Access);
+            end if;
+         end loop;
+
+         --  Evaluating properties requires lexical environments, so it
+         --  implies the PLE phase.
+
+         if Do_PLE or else Property.all'Length /= 0 then
+            Start := Clock;
+            for U of Units loop
+               Populate_Lexical_Env (U);
+            end loop;
+            PLE_Time := Clock - Start;
+         end if;
+
+         if Property.all'Length /= 0 then
+            Start := Clock;
+            Evaluate_All;
+            Properties_Time := Clock - Start;
+         end if;
+
+         --  Throughput figures are computed over the parse phase, which
+         --  includes lexing.
+
+         Put_Line ("{");
+         Put_Line ("  ""files"": " & Image (Filenames'Length) & ",");
+         Put_Line ("  ""workers"": " & Image (Jobs) & ",");
+         Put_Line ("  ""tokens"": " & Image (Tokens) & ",");
+         Put_Line ("  ""nodes"": " & Image (Nodes) & ",");
+         Put_Line ("  ""diagnostics"": " & Image (Diagnostic_Count) & ",");
+         Put_Line ("  ""phases"": {");
+         Put_Line ("    ""parse"": " & Image (Parse_Time) & ",");
+         Put_Line ("    ""ple"": " & Image (PLE_Time) & ",");
+         Put_Line ("    ""properties"": " & Image (Properties_Time));
+         Put_Line ("  },");
+         Put_Line ("  ""files_per_second"": "
+                   & Rate (Filenames'Length, Parse_Time) & ",");
+         Put_Line ("  ""tokens_per_second"": "
+                   & Rate (Tokens, Parse_Time) & ",");
+         Put_Line ("  ""nodes_per_second"": "
+                   & Rate (Nodes, Parse_Time) & ",");
+         Put_Line ("  ""property_evaluations"": " & Image (Evaluations) & ",");
+         Put_Line ("  ""property_errors"": " & Image (Errors) & ",");
+         if Lexer_Bench then
+            Put_Line ("  ""lexer_benchmark"": {");
+            Put_Line ("    ""time"": " & Image (Lex_Time) & ",");
+            Put_Line ("    ""tokens_per_second"": "
+                      & Rate (Tokens, Lex_Time));
+            Put_Line ("  },");
+         else
+            Put_Line ("  ""lexer_benchmark"": null,");
+         end if;
+         Put_Line ("  ""peak_rss_bytes"": " & Peak_RSS);
+         Put_Line ("}");
+      end;
+   end Run_Batch;
+
 begin
    Initialize;
 
@@ -286,6 +860,40 @@ begin
    Define_Switch
      (Config, Do_Unparse'Access, "-u", "--unparse",
       Help   => "Unparse the code with the built-in unparser");
+   Define_Switch
+     (Config, Mem_Stats'Access, "--mem-stats",
+      Help   => "Print an estimation of the memory used by analysis units"
+                & " and by the analysis context");
+   Define_Switch
+     (Config, Solver_Stats'Access, "--solver-stats",
+      Help   => "Print statistics about logic resolutions, per property");
+   Define_Switch
+     (Config, Propagation_Solver'Access, "--propagation-solver",
+      Help   => "Use the Propagation strategy to solve logic equations");
+   Define_Switch
+     (Config, Batch'Access, "-B", "--batch",
+      Help   => "Benchmark mode: process the files given with --file-list"
+                & " and print timings, throughput and peak memory usage as"
+                & " JSON instead of trees");
+   Define_Switch
+     (Config, Jobs'Access, "-j:", "--jobs:",
+      Help    => "Number of worker tasks to use to parse files in batch"
+                 & " mode (lexical envs and properties are processed"
+                 & " sequentially)",
+      Initial => 1,
+      Default => 1);
+   Define_Switch
+     (Config, Do_PLE'Access, "--ple",
+      Help   => "In batch mode, populate lexical environments for all units");
+   Define_Switch
+     (Config, Lexer_Bench'Access, "--lexer-bench",
+      Help   => "In batch mode, also run a standalone lexer benchmark before"
+                & " parsing");
+   Define_Switch
+     (Config, Property'Access, "--property:",
+      Help   => "In batch mode, evaluate the given property (lower case"
+                & " name, for instance p_foo) on all nodes that have it;"
+                & " implies --ple");
    begin
       Getopt (Config);
    exception
@@ -293,12 +901,35 @@ begin
          return;
    end;
 
-   if File_List.all'Length /= 0 then
+   if Batch then
+      if File_List.all'Length = 0 then
+         Put_Line ("--batch requires --file-list");
+         return;
+      elsif Jobs < 1 then
+         Put_Line ("Invalid number of jobs: "
+                   & Trim (Integer'Image (Jobs), Left));
+         return;
+      end if;
+
+      Property.all := To_Lower (Property.all);
+      if Property.all'Length /= 0 and then not Is_Property_Name (Property.all)
+      then
+         Put_Line ("Unknown property: " & Property.all);
+         return;
+      end if;
+
+      Run_Batch;
+
+   elsif File_List.all'Length /= 0 then
       declare
          F   : File_Type;
          Ctx : constant Analysis_Context :=
            Create_Context (Charset.all, With_Trivia => Do_Print_Trivia);
       begin
+         if Propagation_Solver then
+            Set_Logic_Resolution_Strategy (Ctx, Propagation);
+         end if;
+
          Open (F, In_File, File_List.all);
          while not End_Of_File (F) loop
             declare
@@ -308,6 +939,13 @@ begin
             end;
          end loop;
          Close (F);
+
+         if Mem_Stats then
+            Print_Memory_Usage ("context", Memory_Usage (Ctx));
+         end if;
+         if Solver_Stats then
+            Print_Solver_Statistics (Ctx);
+         end if;
       end;
 
    elsif Filename.all'Length /= 0 then
@@ -315,8 +953,19 @@ begin
          Ctx : constant Analysis_Context :=
            Create_Context (Charset.all, With_Trivia => Do_Print_Trivia);
       begin
+         if Propagation_Solver then
+            Set_Logic_Resolution_Strategy (Ctx, Propagation);
+         end if;
+
          Register_Lookups;
          Process_File (Filename.all, Ctx);
+
+         if Mem_Stats then
+            Print_Memory_Usage ("context", Memory_Usage (Ctx));
+         end if;
+         if Solver_Stats then
+            Print_Solver_Statistics (Ctx);
+         end if;
       end;
 
    else
@@ -341,5 +990,6 @@ begin
    GNAT.Strings.Free (Charset);
    GNAT.Strings.Free (File_List);
    GNAT.Strings.Free (Filename);
+   GNAT.Strings.Free (Property);
    Free (Config);
 end Parse;
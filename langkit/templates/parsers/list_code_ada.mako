@@ -45,10 +45,13 @@ end loop;
 ## Create the result of this parser: an AST list node, and copy the elements
 ## from our temporary parse list to the result.
 ${parser.res_var} := ${list_type.name}_Alloc.Alloc (Parser.Mem_Pool);
+Parser.Node_Count := Parser.Node_Count + 1;
 ${parser.res_var}.Kind := ${list_type.ada_kind_name};
 ${parser.res_var}.Unit := Parser.Unit;
 ${parser.res_var}.Count := ${parser.tmplist}.Nodes.Length;
+% if list_type.stores_self_env:
 ${parser.res_var}.Self_Env := AST_Envs.Empty_Env;
+% endif
 
 declare
    Vec : ${T.root_node.array.pkg_vector}.Vector renames
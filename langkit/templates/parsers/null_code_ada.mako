@@ -3,6 +3,7 @@
 % if parser.get_type().is_list_type:
    ${parser.res_var} :=
     (${parser.get_type().storage_type_name}_Alloc.Alloc (Parser.Mem_Pool));
+   Parser.Node_Count := Parser.Node_Count + 1;
    ${parser.res_var}.Kind := ${parser.get_type().ada_kind_name};
    ${parser.res_var}.Unit := Parser.Unit;
    ${parser.res_var}.Count := 0;
@@ -11,7 +12,9 @@
    ${parser.res_var}.Token_Start_Index
      := Token_Index'Max (1, ${parser.start_pos} - 1);
    ${parser.res_var}.Token_End_Index := No_Token_Index;
+   % if parser.get_type().stores_self_env:
    ${parser.res_var}.Self_Env := AST_Envs.Empty_Env;
+   % endif
 
 % else:
    ${parser.res_var} := ${parser.get_type().storage_nullexpr};
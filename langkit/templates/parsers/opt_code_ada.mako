@@ -2,6 +2,16 @@
 
 --  Start opt_code
 
+<%def name="init_self_env(static_type, node_type)">
+   ## Reset the environment for the node_type node stored in the result
+   ## variable, whose type is static_type, if it has room for it.
+   % if static_type.stores_self_env:
+      ${parser.res_var}.Self_Env := AST_Envs.Empty_Env;
+   % elif node_type.stores_self_env:
+      Set_Self_Env (${parser.res_var}, AST_Envs.Empty_Env);
+   % endif
+</%def>
+
 ${parser.parser.generate_code()}
 
 <%
@@ -19,15 +29,17 @@ if ${parser.parser.pos_var} = No_Token_Index then
       % else:
          ${parser.res_var} := ${base.name}
            (${alt_false.name}_Alloc.Alloc (Parser.Mem_Pool));
+         Parser.Node_Count := Parser.Node_Count + 1;
          ${parser.res_var}.Kind := ${alt_false.ada_kind_name};
          ${parser.res_var}.Unit := Parser.Unit;
          ${parser.res_var}.Token_Start_Index := ${parser.start_pos};
          ${parser.res_var}.Token_End_Index := No_Token_Index;
-         ${parser.res_var}.Self_Env := AST_Envs.Empty_Env;
+         ${init_self_env(base, alt_false)}
       % endif
     % elif parser_type and parser_type.is_list_type:
         ${parser.parser.res_var} :=
           (${parser_type.storage_type_name}_Alloc.Alloc (Parser.Mem_Pool));
+        Parser.Node_Count := Parser.Node_Count + 1;
         ${parser.res_var}.Kind := ${parser_type.ada_kind_name};
         ${parser.parser.res_var}.Unit := Parser.Unit;
         ${parser.parser.res_var}.Count := 0;
@@ -35,7 +47,7 @@ if ${parser.parser.pos_var} = No_Token_Index then
            Alloc_AST_List_Array.Alloc (Parser.Mem_Pool, 0);
         ${parser.parser.res_var}.Token_Start_Index := ${parser.start_pos} - 1;
         ${parser.parser.res_var}.Token_End_Index := No_Token_Index;
-         ${parser.res_var}.Self_Env := AST_Envs.Empty_Env;
+        ${init_self_env(parser_type, parser_type)}
     % elif parser_type:
         ${parser.parser.res_var} :=
            ${parser_type.storage_nullexpr};
@@ -58,11 +70,12 @@ else
    % else:
       ${parser.res_var} := ${base.name}
         (${alt_true.name}_Alloc.Alloc (Parser.Mem_Pool));
+      Parser.Node_Count := Parser.Node_Count + 1;
       ${parser.res_var}.Kind := ${alt_true.ada_kind_name};
       ${parser.res_var}.Unit := Parser.Unit;
       ${parser.res_var}.Token_Start_Index := ${parser.start_pos};
       ${parser.res_var}.Token_End_Index := No_Token_Index;
-      ${parser.res_var}.Self_Env := AST_Envs.Empty_Env;
+      ${init_self_env(base, alt_true)}
    % endif
 % endif
 
@@ -55,6 +55,9 @@ private package ${ada_lib_name}.Parsers is
       Mem_Pool        : Bump_Ptr_Pool;
       Symbol_Literals : Symbol_Literal_Array_Access;
       Private_Part    : Parser_Private_Part;
+
+      Node_Count : Natural := 0;
+      --  Number of nodes allocated in Mem_Pool since the last call to Reset
    end record;
 
    procedure Init_Parser
@@ -18,6 +18,7 @@ if ${parser.pos_var} /= No_Token_Index then
    ## Create the transform wrapper node
    ${parser.res_var} := ${parser.get_type().name}
      (${parser.get_type().name}_Alloc.Alloc (Parser.Mem_Pool));
+   Parser.Node_Count := Parser.Node_Count + 1;
    ${parser.res_var}.Kind := ${parser.get_type().ada_kind_name};
 
    ## Compute and set the sloc range for this AST node. Reminders:
@@ -30,7 +31,9 @@ if ${parser.pos_var} /= No_Token_Index then
 
    ${parser.res_var}.Unit := Parser.Unit;
    ${parser.res_var}.Token_Start_Index := ${parser.start_pos};
+   % if parser.get_type().stores_self_env:
    ${parser.res_var}.Self_Env := AST_Envs.Empty_Env;
+   % endif
 
    ${parser.res_var}.Token_End_Index :=
      (if ${parser.pos_var} = ${parser.start_pos}
@@ -99,8 +99,21 @@ package body ${ada_lib_name}.Analysis is
    is
       Ctx : constant Analysis_Context := Wrap_Context (Context);
    begin
-      return Unwrap_Unit (Provider.Internal.Get.Get_Unit
-        (Ctx, Name, Kind, Charset, Reparse));
+      --  Unit providers can be called during property evaluation, so prevent
+      --  unit eviction while running them.
+      Context.Eviction_Lock := Context.Eviction_Lock + 1;
+      declare
+         Result : constant Internal_Unit :=
+            Unwrap_Unit (Provider.Internal.Get.Get_Unit
+              (Ctx, Name, Kind, Charset, Reparse));
+      begin
+         Context.Eviction_Lock := Context.Eviction_Lock - 1;
+         return Result;
+      end;
+   exception
+      when others =>
+         Context.Eviction_Lock := Context.Eviction_Lock - 1;
+         raise;
    end Get_Unit;
 
    ----------------
@@ -191,6 +204,29 @@ package body ${ada_lib_name}.Analysis is
                         Reparse, Rule));
    end Get_From_File;
 
+   --------------------
+   -- Get_From_Files --
+   --------------------
+
+   function Get_From_Files
+     (Context   : Analysis_Context'Class;
+      Filenames : Filename_Array;
+      Charset   : String := "";
+      Reparse   : Boolean := False;
+      Rule      : Grammar_Rule := Default_Grammar_Rule;
+      Workers   : Positive := 1) return Analysis_Unit_Array
+   is
+      Units : constant Internal_Unit_Array := Get_From_Files
+        (Unwrap_Context (Context), Filenames, Charset, Reparse, Rule,
+         Workers);
+   begin
+      return Result : Analysis_Unit_Array (Units'Range) do
+         for I in Units'Range loop
+            Result (I) := Wrap_Unit (Units (I));
+         end loop;
+      end return;
+   end Get_From_Files;
+
    ---------------------
    -- Get_From_Buffer --
    ---------------------
@@ -305,6 +341,94 @@ package body ${ada_lib_name}.Analysis is
       Set_Logic_Resolution_Timeout (Unwrap_Context (Context), Timeout);
    end Set_Logic_Resolution_Timeout;
 
+   -----------------------------------
+   -- Set_Logic_Resolution_Strategy --
+   -----------------------------------
+
+   procedure Set_Logic_Resolution_Strategy
+     (Context : Analysis_Context'Class; Strategy : Solving_Strategy) is
+   begin
+      Set_Logic_Resolution_Strategy (Unwrap_Context (Context), Strategy);
+   end Set_Logic_Resolution_Strategy;
+
+   -----------------------
+   -- Solver_Statistics --
+   -----------------------
+
+   function Solver_Statistics
+     (Context : Analysis_Context'Class) return Solver_Statistics_Array is
+   begin
+      return Solver_Statistics (Unwrap_Context (Context));
+   end Solver_Statistics;
+
+   -----------------------------
+   -- Reset_Solver_Statistics --
+   -----------------------------
+
+   procedure Reset_Solver_Statistics (Context : Analysis_Context'Class) is
+   begin
+      Reset_Solver_Statistics (Unwrap_Context (Context));
+   end Reset_Solver_Statistics;
+
+   ------------------------------
+   -- Set_Unit_Eviction_Policy --
+   ------------------------------
+
+   procedure Set_Unit_Eviction_Policy
+     (Context    : Analysis_Context'Class;
+      Max_Units  : Natural;
+      Max_Memory : Byte_Count) is
+   begin
+      Set_Unit_Eviction_Policy
+        (Unwrap_Context (Context), Max_Units, Max_Memory);
+   end Set_Unit_Eviction_Policy;
+
+   -----------------
+   -- Evict_Units --
+   -----------------
+
+   procedure Evict_Units (Context : Analysis_Context'Class) is
+   begin
+      Evict_Units (Unwrap_Context (Context));
+   end Evict_Units;
+
+   ------------
+   -- Freeze --
+   ------------
+
+   procedure Freeze (Context : Analysis_Context'Class) is
+   begin
+      Freeze (Unwrap_Context (Context));
+   end Freeze;
+
+   --------------
+   -- Unfreeze --
+   --------------
+
+   procedure Unfreeze (Context : Analysis_Context'Class) is
+   begin
+      Unfreeze (Unwrap_Context (Context));
+   end Unfreeze;
+
+   ---------------
+   -- Is_Frozen --
+   ---------------
+
+   function Is_Frozen (Context : Analysis_Context'Class) return Boolean is
+   begin
+      return Is_Frozen (Unwrap_Context (Context));
+   end Is_Frozen;
+
+   ------------------
+   -- Memory_Usage --
+   ------------------
+
+   function Memory_Usage
+     (Context : Analysis_Context'Class) return Memory_Usage_Breakdown is
+   begin
+      return Memory_Usage (Unwrap_Context (Context));
+   end Memory_Usage;
+
    --------------------------
    -- Disable_Lookup_Cache --
    --------------------------
@@ -529,6 +653,16 @@ package body ${ada_lib_name}.Analysis is
       PP_Trivia (Unwrap_Unit (Unit));
    end PP_Trivia;
 
+   ------------------
+   -- Memory_Usage --
+   ------------------
+
+   function Memory_Usage
+     (Unit : Analysis_Unit'Class) return Memory_Usage_Breakdown is
+   begin
+      return Memory_Usage (Unwrap_Unit (Unit));
+   end Memory_Usage;
+
    -------------
    -- Is_Null --
    -------------
@@ -861,6 +995,30 @@ package body ${ada_lib_name}.Analysis is
                              Node.Internal.Node.Token_End_Index);
    end Token_Range;
 
+   -------------
+   -- To_JSON --
+   -------------
+
+   function To_JSON
+     (Node       : ${root_entity.api_name}'Class;
+      With_Slocs : Boolean := False) return String is
+   begin
+      Check_Safety_Net (Node.Safety_Net);
+      return Node.Internal.Node.To_JSON (With_Slocs);
+   end To_JSON;
+
+   ---------------
+   -- To_Binary --
+   ---------------
+
+   function To_Binary
+     (Node       : ${root_entity.api_name}'Class;
+      With_Slocs : Boolean := False) return String is
+   begin
+      Check_Safety_Net (Node.Safety_Net);
+      return Node.Internal.Node.To_Binary (With_Slocs);
+   end To_Binary;
+
    -----------
    -- Print --
    -----------
@@ -20,12 +20,15 @@ with GNATCOLL.Refcount;
 % if any(s.exposed and not s.is_entity_type for s in ctx.struct_types):
    private with Langkit_Support.Boxes;
 % endif
+with Langkit_Support.Adalog.Abstract_Relation;
+use Langkit_Support.Adalog.Abstract_Relation;
 with Langkit_Support.Bump_Ptr;    use Langkit_Support.Bump_Ptr;
 with Langkit_Support.Diagnostics; use Langkit_Support.Diagnostics;
 with Langkit_Support.Slocs;       use Langkit_Support.Slocs;
 with Langkit_Support.Text;        use Langkit_Support.Text;
 with Langkit_Support.Token_Data_Handlers;
 use Langkit_Support.Token_Data_Handlers;
+with Langkit_Support.Types;       use Langkit_Support.Types;
 
 with ${ada_lib_name}.Common; use ${ada_lib_name}.Common;
 private with ${ada_lib_name}.Implementation;
@@ -174,6 +177,18 @@ package ${ada_lib_name}.Analysis is
       with Pre => not Reparse or else not Has_Rewriting_Handle (Context);
    ${ada_doc('langkit.get_unit_from_file', 3)}
 
+   type Analysis_Unit_Array is array (Positive range <>) of Analysis_Unit;
+
+   function Get_From_Files
+     (Context   : Analysis_Context'Class;
+      Filenames : Filename_Array;
+      Charset   : String := "";
+      Reparse   : Boolean := False;
+      Rule      : Grammar_Rule := Default_Grammar_Rule;
+      Workers   : Positive := 1) return Analysis_Unit_Array
+      with Pre => not Reparse or else not Has_Rewriting_Handle (Context);
+   ${ada_doc('langkit.get_units_from_files', 3)}
+
    function Get_From_Buffer
      (Context  : Analysis_Context'Class;
       Filename : String;
@@ -226,6 +241,43 @@ package ${ada_lib_name}.Analysis is
      (Context : Analysis_Context'Class; Timeout : Natural);
    ${ada_doc('langkit.context_set_logic_resolution_timeout', 3)}
 
+   procedure Set_Logic_Resolution_Strategy
+     (Context : Analysis_Context'Class; Strategy : Solving_Strategy);
+   ${ada_doc('langkit.context_set_logic_resolution_strategy', 3)}
+
+   function Solver_Statistics
+     (Context : Analysis_Context'Class) return Solver_Statistics_Array;
+   --  Return statistics about the logic resolutions done in ``Context`` since
+   --  its creation or since the last call to ``Reset_Solver_Statistics``,
+   --  aggregated per property. Properties that spent the most solving steps
+   --  come first.
+
+   procedure Reset_Solver_Statistics (Context : Analysis_Context'Class);
+   --  Discard the logic resolution statistics collected in ``Context``
+
+   procedure Set_Unit_Eviction_Policy
+     (Context    : Analysis_Context'Class;
+      Max_Units  : Natural;
+      Max_Memory : Byte_Count);
+   ${ada_doc('langkit.context_set_unit_eviction_policy', 3)}
+
+   procedure Evict_Units (Context : Analysis_Context'Class);
+   ${ada_doc('langkit.context_evict_units', 3)}
+
+   procedure Freeze (Context : Analysis_Context'Class)
+      with Pre => not Has_Rewriting_Handle (Context);
+   ${ada_doc('langkit.context_freeze', 3)}
+
+   procedure Unfreeze (Context : Analysis_Context'Class);
+   ${ada_doc('langkit.context_unfreeze', 3)}
+
+   function Is_Frozen (Context : Analysis_Context'Class) return Boolean;
+   --  Return whether ``Context`` is frozen
+
+   function Memory_Usage
+     (Context : Analysis_Context'Class) return Memory_Usage_Breakdown;
+   ${ada_doc('langkit.context_memory_usage', 3)}
+
    procedure Disable_Lookup_Cache (Disable : Boolean := True);
    --  Debug helper: if ``Disable`` is true, disable the use of caches in
    --  lexical environment lookups. Otherwise, activate it.
@@ -319,6 +371,10 @@ package ${ada_lib_name}.Analysis is
    procedure PP_Trivia (Unit : Analysis_Unit'Class);
    --  Debug helper: output a minimal AST with mixed trivias
 
+   function Memory_Usage
+     (Unit : Analysis_Unit'Class) return Memory_Usage_Breakdown;
+   ${ada_doc('langkit.unit_memory_usage', 3)}
+
    type Child_Record (Kind : Child_Or_Trivia := Child) is record
       case Kind is
          when Child =>
@@ -347,7 +403,8 @@ package ${ada_lib_name}.Analysis is
 
    % for t in ctx.composite_types:
       % if t.is_array_type:
-         % if t.exposed:
+         ## Arrays of analysis units are declared next to Get_From_Files
+         % if t.exposed and not t.element_type.is_analysis_unit_type:
             ${array_types.public_api_decl(t)}
          % endif
       % elif t.is_struct_type:
@@ -544,6 +601,20 @@ package ${ada_lib_name}.Analysis is
      (Node : ${root_entity.api_name}'Class) return Token_Iterator;
    --  Return an iterator on the range of tokens encompassed by Node
 
+   -------------------
+   -- Serialization --
+   -------------------
+
+   function To_JSON
+     (Node       : ${root_entity.api_name}'Class;
+      With_Slocs : Boolean := False) return String;
+   ${ada_doc('langkit.node_to_json', 3)}
+
+   function To_Binary
+     (Node       : ${root_entity.api_name}'Class;
+      With_Slocs : Boolean := False) return String;
+   ${ada_doc('langkit.node_to_binary', 3)}
+
    ${exts.include_extension(ctx.ext('analysis', 'public_decls'))}
 
    -------------------
@@ -1,10 +1,15 @@
 ## vim: filetype=makoada
 
+with Ada.Strings.Unbounded;
+
+with Langkit_Support.Adalog.Abstract_Relation;
+use Langkit_Support.Adalog.Abstract_Relation;
 with Langkit_Support.Slocs;   use Langkit_Support.Slocs;
 with Langkit_Support.Symbols; use Langkit_Support.Symbols;
 with Langkit_Support.Text;    use Langkit_Support.Text;
 with Langkit_Support.Token_Data_Handlers;
 use Langkit_Support.Token_Data_Handlers;
+with Langkit_Support.Types;   use Langkit_Support.Types;
 
 with GNATCOLL.GMP.Integers;
 with GNATCOLL.Traces;
@@ -45,6 +50,61 @@ package ${ada_lib_name}.Common is
    subtype Big_Integer is GNATCOLL.GMP.Integers.Big_Integer;
    --  Shortcut for ``GNATCOLL.GMP.Integers.Big_Integer``
 
+   type Memory_Category is
+     (AST_Memory,
+      Token_Memory,
+      Lexical_Env_Memory,
+      Memoization_Memory,
+      Rebindings_Memory,
+      Symbol_Memory)
+      with Convention => C;
+   ${ada_doc('langkit.memory_category_type', 3)}
+
+   type Memory_Usage_Entry is record
+      Bytes : Byte_Count;
+      --  Estimated number of bytes used
+
+      Objects : Natural;
+      --  Number of objects (nodes, tokens, environments, ...) these bytes
+      --  are used for.
+   end record
+      with Convention => C;
+   ${ada_doc('langkit.memory_usage_type', 3)}
+
+   type Memory_Usage_Breakdown is array (Memory_Category) of Memory_Usage_Entry
+      with Convention => C;
+   --  Memory usage for each category
+
+   No_Memory_Usage : constant Memory_Usage_Breakdown := (others => (0, 0));
+
+   type Solver_Property_Statistics is record
+      Property : Ada.Strings.Unbounded.Unbounded_String;
+      --  Qualified name of the property that solved equations
+
+      Resolutions : Natural := 0;
+      --  Number of equations this property solved
+
+      Satisfied, Unsatisfied, Timeouts, Errors : Natural := 0;
+      --  Number of resolutions that found a solution, that found none, that
+      --  were aborted because they hit the logic resolution timeout, and that
+      --  were aborted because of any other error.
+
+      Totals : Solving_Statistics;
+      --  Statistics for all these resolutions: sum of the counters, maximum
+      --  of the depths.
+
+      Max_Ticks : Statistics_Counter := 0;
+      --  Number of solving steps of the most expensive resolution
+   end record;
+   --  Logic resolution statistics for one property
+
+   type Solver_Statistics_Array is
+      array (Positive range <>) of Solver_Property_Statistics;
+
+   type Filename_Array is
+      array (Positive range <>) of Ada.Strings.Unbounded.Unbounded_String;
+   --  List of source file names
+
    ## Output enumerators so that all concrete AST_Node subclasses get their own
    ## kind. Nothing can be an instance of an abstract subclass, so these do not
    ## need their own kind.
@@ -256,6 +316,9 @@ package ${ada_lib_name}.Common is
    Stale_Reference_Error : exception;
    ${ada_doc('langkit.stale_reference_error', 3)}
 
+   Frozen_Context_Error : exception;
+   ${ada_doc('langkit.frozen_context_error', 3)}
+
    Unknown_Charset : exception;
    --  Raised by lexing functions (``${ada_lib_name}.Lexer``) when the input
    --  charset is not supported.
@@ -10,6 +10,8 @@
 <% root_node_array = T.root_node.array %>
 
 with Ada.Containers;                  use Ada.Containers;
+with Ada.Containers.Generic_Array_Sort;
+with Ada.Containers.Hashed_Sets;
 with Ada.Containers.Vectors;
 with Ada.Exceptions;
 with Ada.Finalization;
@@ -115,6 +117,16 @@ package body ${ada_lib_name}.Implementation is
 
    end Context_Pool;
 
+   Evaluation : Evaluation_Lock;
+   --  Lock that Evaluation_Guard objects hold while some context is frozen.
+   --  This lock is global rather than per-context as reference counting APIs
+   --  get values (arrays, structures, ...) that do not know which context
+   --  they belong to.
+
+   Frozen_Contexts : Natural := 0 with Atomic;
+   --  Number of frozen contexts. This is updated only while holding the
+   --  Evaluation lock.
+
    generic
       type T (<>) is limited private;
       type T_Access is access all T;
@@ -132,12 +144,30 @@ package body ${ada_lib_name}.Implementation is
 
    function Solve_Wrapper
      (R            : Relation;
-      Context_Node : ${root_node_type_name}) return Boolean;
+      Context_Node : ${root_node_type_name};
+      Property     : String) return Boolean;
    --  Wrapper for Langkit_Support.Adalog.Solve; will handle setting the debug
-   --  strings in the equation if in debug mode.
+   --  strings in the equation if in debug mode. Property is the qualified
+   --  name of the calling property: statistics for this resolution are
+   --  recorded under it in the analysis context.
+
+   type Solve_Outcome is (Solved, Not_Solved, Timed_Out, Failed);
+   --  Outcome of a logic resolution, for statistics purposes
+
+   procedure Record_Solver_Statistics
+     (Context  : Internal_Context;
+      Property : String;
+      Stats    : Solving_Statistics;
+      Outcome  : Solve_Outcome);
+   --  Aggregate statistics for a logic resolution done by Property into
+   --  Context.
 
    procedure Destroy (Env : in out Lexical_Env_Access);
 
+   function Estimated_Memory_Usage (Unit : Internal_Unit) return Byte_Count;
+   --  Return an estimation of the memory used by Unit's tree and token data.
+   --  This is used to enforce the Max_Memory unit eviction policy.
+
    function Snaps_At_Start
      (Self : access ${root_node_value_type}'Class) return Boolean;
 
@@ -344,6 +374,13 @@ package body ${ada_lib_name}.Implementation is
 
       Context.Discard_Errors_In_Populate_Lexical_Env := True;
       Context.Logic_Resolution_Timeout := 100_000;
+      Context.Logic_Resolution_Strategy := Chronological;
+      Context.Solver_Stats.Clear;
+      Context.Max_Units := 0;
+      Context.Max_Memory := 0;
+      Context.Access_Clock := 0;
+      Context.Eviction_Lock := 0;
+      Context.Frozen := False;
       Context.In_Populate_Lexical_Env := False;
       Context.Cache_Version := 0;
       Context.Reparse_Cache_Version := 0;
@@ -376,16 +413,18 @@ package body ${ada_lib_name}.Implementation is
       return Unit;
    end Create_Unit;
 
-   --------------
-   -- Get_Unit --
-   --------------
+   ------------------
+   -- Prepare_Unit --
+   ------------------
 
-   function Get_Unit
+   procedure Prepare_Unit
      (Context           : Internal_Context;
       Filename, Charset : String;
       Reparse           : Boolean;
-      Input             : Internal_Lexer_Input;
-      Rule              : Grammar_Rule) return Internal_Unit
+      Rule              : Grammar_Rule;
+      Unit              : out Internal_Unit;
+      Input             : in out Internal_Lexer_Input;
+      Must_Parse        : out Boolean)
    is
       use Units_Maps;
 
@@ -395,12 +434,25 @@ package body ${ada_lib_name}.Implementation is
       Cur     : constant Cursor :=
          Context.Units.Find (Normalized_Filename);
       Created : constant Boolean := Cur = No_Element;
-      Unit    : Internal_Unit;
 
       Actual_Charset : Unbounded_String;
-      Refined_Input  : Internal_Lexer_Input := Input;
 
    begin
+      --  The set of units and their trees must not change in a frozen
+      --  context. Also leave the access clock alone, as several tasks may
+      --  fetch units at the same time.
+
+      if Context.Frozen then
+         if Created or else Reparse or else Element (Cur).Is_Unloaded then
+            raise Frozen_Context_Error with
+              "cannot load or reparse " & Filename & " in a frozen context";
+         end if;
+
+         Unit := Element (Cur);
+         Must_Parse := False;
+         return;
+      end if;
+
       --  Determine which encoding to use. The parameter comes first, then the
       --  unit-specific default, then the context-specific one.
 
@@ -412,19 +464,19 @@ package body ${ada_lib_name}.Implementation is
          Actual_Charset := Context.Charset;
       end if;
 
-      if Refined_Input.Kind = File then
-         Refined_Input.Filename := Normalized_Filename;
+      if Input.Kind = File then
+         Input.Filename := Normalized_Filename;
       end if;
 
-      if Refined_Input.Kind in File | Bytes_Buffer then
-         Refined_Input.Charset := Actual_Charset;
+      if Input.Kind in File | Bytes_Buffer then
+         Input.Charset := Actual_Charset;
 
          --  Unless the caller requested a specific charset for this unit,
          --  allow the lexer to automatically discover the source file encoding
          --  before defaulting to the context-specific one. We do this trying
          --  to match a byte order mark.
 
-         Refined_Input.Read_BOM := Charset'Length = 0;
+         Input.Read_BOM := Charset'Length = 0;
       end if;
 
       --  Create the Internal_Unit if needed
@@ -437,14 +489,75 @@ package body ${ada_lib_name}.Implementation is
       end if;
       Unit.Charset := Actual_Charset;
 
-      --  (Re)parse it if needed
+      Context.Access_Clock := Context.Access_Clock + 1;
+      Unit.Last_Access := Context.Access_Clock;
+
+      --  (Re)parse it if needed. Units that were unloaded by unit eviction
+      --  must be reparsed anyway.
+
+      Must_Parse := Created or else Reparse or else Unit.Is_Unloaded;
+   end Prepare_Unit;
+
+   ----------------------
+   -- Install_Reparsed --
+   ----------------------
+
+   procedure Install_Reparsed
+     (Unit : Internal_Unit; Reparsed : in out Reparsed_Unit)
+   is
+      Context  : constant Internal_Context := Unit.Context;
+      Reloaded : constant Boolean := Unit.Is_Unloaded;
+   begin
+      --  Tokens parsed with a temporary symbol table (see Get_From_Files) must
+      --  only reference symbols from the context's table once installed.
+
+      if Reparsed.TDH.Symbols /= Context.Symbols then
+         Internalize_Symbols (Reparsed.TDH, Context.Symbols);
+      end if;
+
+      Update_After_Reparse (Unit, Reparsed);
+
+      if Reloaded then
+         Unit.Is_Unloaded := False;
+         if Unit.Repopulate_After_Reload then
+            Unit.Repopulate_After_Reload := False;
+            Populate_Lexical_Env (Unit);
+         end if;
+      end if;
+
+      --  Loading a unit is what makes a context grow: this is the right time
+      --  to enforce the eviction policy, if any.
 
-      if Created or else Reparse then
+      if Context.Max_Units /= 0 or else Context.Max_Memory /= 0 then
+         Evict_Units (Context, Keep => (1 => Unit));
+      end if;
+   end Install_Reparsed;
+
+   --------------
+   -- Get_Unit --
+   --------------
+
+   function Get_Unit
+     (Context           : Internal_Context;
+      Filename, Charset : String;
+      Reparse           : Boolean;
+      Input             : Internal_Lexer_Input;
+      Rule              : Grammar_Rule) return Internal_Unit
+   is
+      Unit          : Internal_Unit;
+      Refined_Input : Internal_Lexer_Input := Input;
+      Must_Parse    : Boolean;
+   begin
+      Prepare_Unit
+        (Context, Filename, Charset, Reparse, Rule,
+         Unit, Refined_Input, Must_Parse);
+
+      if Must_Parse then
          declare
             Reparsed : Reparsed_Unit;
          begin
             Do_Parsing (Unit, Refined_Input, Reparsed);
-            Update_After_Reparse (Unit, Reparsed);
+            Install_Reparsed (Unit, Reparsed);
          end;
       end if;
 
@@ -483,6 +596,248 @@ package body ${ada_lib_name}.Implementation is
       return Get_Unit (Context, Filename, Charset, Reparse, Input, Rule);
    end Get_From_File;
 
+   --------------------
+   -- Get_From_Files --
+   --------------------
+
+   function Get_From_Files
+     (Context   : Internal_Context;
+      Filenames : Filename_Array;
+      Charset   : String;
+      Reparse   : Boolean;
+      Rule      : Grammar_Rule;
+      Workers   : Positive) return Internal_Unit_Array
+   is
+      use Ada.Exceptions;
+
+      type Parsing_Job is record
+         Unit     : Internal_Unit;
+         Input    : Internal_Lexer_Input (File);
+         Reparsed : Reparsed_Unit;
+         Symbols  : Symbol_Table := No_Symbol_Table;
+         Done     : Boolean := False;
+      end record;
+      --  Unit to (re)parse, with the input to read and the parsing result. If
+      --  the unit is parsed by a worker task, Symbols is the table, extending
+      --  the context's one, that holds the new symbols of its tokens.
+
+      type Parsing_Job_Array is array (Positive range <>) of Parsing_Job;
+      type Parsing_Job_Array_Access is access Parsing_Job_Array;
+
+      procedure Free is new Ada.Unchecked_Deallocation
+        (Parsing_Job_Array, Parsing_Job_Array_Access);
+
+      package Unit_Sets is new Ada.Containers.Hashed_Sets
+        (Element_Type        => Internal_Unit,
+         Hash                => Hash,
+         Equivalent_Elements => "=");
+
+      Result : Internal_Unit_Array (Filenames'Range);
+
+      Jobs      : Parsing_Job_Array_Access :=
+         new Parsing_Job_Array (1 .. Filenames'Length);
+      Last_Job  : Natural := 0;
+      Scheduled : Unit_Sets.Set;
+
+      Error : Exception_Occurrence;
+      --  First exception raised while parsing, if any
+
+      Worker_Storage_Size : constant := 8 * 1024 * 1024;
+      --  Stack size for worker tasks. Parsers are recursive, so give workers
+      --  the usual stack size of the environment task rather than the smaller
+      --  default for tasks.
+
+      procedure Run_Jobs;
+      --  Parse all units in Jobs using a pool of worker tasks
+
+      procedure Free_Jobs;
+      --  Free Jobs and the temporary symbol tables it references
+
+      --------------
+      -- Run_Jobs --
+      --------------
+
+      procedure Run_Jobs is
+
+         protected Queue is
+            procedure Next (Index : out Natural);
+            --  Assign the next job to parse to the caller. Set Index to 0 if
+            --  there is nothing left to do.
+
+            procedure Set_Error (Exc : Exception_Occurrence);
+            --  Save Exc if it is the first error and stop assigning jobs
+         private
+            Last_Index : Natural := 0;
+            Aborted    : Boolean := False;
+         end Queue;
+
+         task type Worker with Storage_Size => Worker_Storage_Size;
+
+         protected body Queue is
+
+            ----------
+            -- Next --
+            ----------
+
+            procedure Next (Index : out Natural) is
+            begin
+               if Aborted or else Last_Index = Last_Job then
+                  Index := 0;
+               else
+                  Last_Index := Last_Index + 1;
+                  Index := Last_Index;
+               end if;
+            end Next;
+
+            ---------------
+            -- Set_Error --
+            ---------------
+
+            procedure Set_Error (Exc : Exception_Occurrence) is
+            begin
+               if not Aborted then
+                  Save_Occurrence (Error, Exc);
+               end if;
+               Aborted := True;
+            end Set_Error;
+
+         end Queue;
+
+         ------------
+         -- Worker --
+         ------------
+
+         task body Worker is
+            Parser : Parser_Type;
+            Index  : Natural;
+         begin
+            Initialize (Parser);
+            loop
+               Queue.Next (Index);
+               exit when Index = 0;
+
+               declare
+                  J : Parsing_Job renames Jobs (Index);
+               begin
+                  J.Symbols := Create_Symbol_Table (Parent => Context.Symbols);
+                  Do_Parsing (J.Unit, J.Input, J.Reparsed, Parser, J.Symbols);
+                  J.Done := True;
+               end;
+            end loop;
+            Destroy (Parser);
+         exception
+            when Exc : others =>
+               Queue.Set_Error (Exc);
+               Destroy (Parser);
+         end Worker;
+
+         Pool : array (1 .. Natural'Min (Workers, Last_Job)) of Worker;
+         pragma Unreferenced (Pool);
+      begin
+         --  Leaving this procedure waits for all workers to complete
+
+         null;
+      end Run_Jobs;
+
+      ---------------
+      -- Free_Jobs --
+      ---------------
+
+      procedure Free_Jobs is
+      begin
+         for J of Jobs.all loop
+            if J.Symbols /= No_Symbol_Table then
+               Destroy (J.Symbols);
+            end if;
+         end loop;
+         Free (Jobs);
+      end Free_Jobs;
+
+   begin
+      --  First create or look up all units, sequentially, as this updates the
+      --  context. Only the units that actually need parsing get a job, and
+      --  each unit gets at most one job even if it appears several times in
+      --  Filenames.
+
+      for I in Filenames'Range loop
+         declare
+            Filename   : constant String := To_String (Filenames (I));
+            Input      : Internal_Lexer_Input :=
+              (Kind     => File,
+               Charset  => <>,
+               Read_BOM => False,
+               Filename => <>);
+            Must_Parse : Boolean;
+         begin
+            Prepare_Unit
+              (Context, Filename, Charset, Reparse, Rule,
+               Result (I), Input, Must_Parse);
+
+            if Must_Parse and then not Scheduled.Contains (Result (I)) then
+               Scheduled.Insert (Result (I));
+               Last_Job := Last_Job + 1;
+               Jobs (Last_Job).Unit := Result (I);
+               Jobs (Last_Job).Input := Input;
+            end if;
+         end;
+      end loop;
+
+      --  Then parse them. Parsing only reads the context, so it is the only
+      --  step that can run in parallel. Workers do not even create symbols in
+      --  the context's table: each job gets its own table for new symbols,
+      --  and Install_Reparsed moves them to the context's one.
+
+      if Workers = 1 or else Last_Job <= 1 then
+         begin
+            for J of Jobs (1 .. Last_Job) loop
+               Do_Parsing (J.Unit, J.Input, J.Reparsed);
+               J.Done := True;
+            end loop;
+         exception
+            when Exc : others =>
+               Save_Occurrence (Error, Exc);
+         end;
+      else
+         Run_Jobs;
+      end if;
+
+      if Exception_Identity (Error) /= Null_Id then
+         for J of Jobs (1 .. Last_Job) loop
+            if J.Done then
+               Destroy (J.Reparsed);
+            end if;
+         end loop;
+         Free_Jobs;
+         Reraise_Occurrence (Error);
+      end if;
+
+      --  Finally install the parsing results, sequentially again. Installing
+      --  a unit enforces the eviction policy, which could unload units that
+      --  were installed earlier in this batch: suspend eviction until all
+      --  results are installed, then enforce the policy once, keeping all the
+      --  units we return.
+
+      Context.Eviction_Lock := Context.Eviction_Lock + 1;
+      begin
+         for J of Jobs (1 .. Last_Job) loop
+            Install_Reparsed (J.Unit, J.Reparsed);
+         end loop;
+      exception
+         when others =>
+            Context.Eviction_Lock := Context.Eviction_Lock - 1;
+            Free_Jobs;
+            raise;
+      end;
+      Context.Eviction_Lock := Context.Eviction_Lock - 1;
+      Free_Jobs;
+
+      if Context.Max_Units /= 0 or else Context.Max_Memory /= 0 then
+         Evict_Units (Context, Keep => Result);
+      end if;
+
+      return Result;
+   end Get_From_Files;
+
    ---------------------
    -- Get_From_Buffer --
    ---------------------
@@ -608,6 +963,372 @@ package body ${ada_lib_name}.Implementation is
       Context.Logic_Resolution_Timeout := Timeout;
    end Set_Logic_Resolution_Timeout;
 
+   -----------------------------------
+   -- Set_Logic_Resolution_Strategy --
+   -----------------------------------
+
+   procedure Set_Logic_Resolution_Strategy
+     (Context : Internal_Context; Strategy : Solving_Strategy) is
+   begin
+      Context.Logic_Resolution_Strategy := Strategy;
+   end Set_Logic_Resolution_Strategy;
+
+   -----------------------
+   -- Solver_Statistics --
+   -----------------------
+
+   function Solver_Statistics
+     (Context : Internal_Context) return Solver_Statistics_Array
+   is
+      function "<" (L, R : Solver_Property_Statistics) return Boolean
+      is (L.Totals.Ticks > R.Totals.Ticks
+          or else (L.Totals.Ticks = R.Totals.Ticks
+                   and then L.Property < R.Property));
+      --  Sort the most expensive properties first
+
+      procedure Sort is new Ada.Containers.Generic_Array_Sort
+        (Index_Type   => Positive,
+         Element_Type => Solver_Property_Statistics,
+         Array_Type   => Solver_Statistics_Array);
+
+      Result : Solver_Statistics_Array
+        (1 .. Natural (Context.Solver_Stats.Length));
+      I      : Positive := 1;
+   begin
+      for Stats of Context.Solver_Stats loop
+         Result (I) := Stats;
+         I := I + 1;
+      end loop;
+      Sort (Result);
+      return Result;
+   end Solver_Statistics;
+
+   -----------------------------
+   -- Reset_Solver_Statistics --
+   -----------------------------
+
+   procedure Reset_Solver_Statistics (Context : Internal_Context) is
+   begin
+      Context.Solver_Stats.Clear;
+   end Reset_Solver_Statistics;
+
+   ------------------------------
+   -- Set_Unit_Eviction_Policy --
+   ------------------------------
+
+   procedure Set_Unit_Eviction_Policy
+     (Context    : Internal_Context;
+      Max_Units  : Natural;
+      Max_Memory : Byte_Count) is
+   begin
+      Context.Max_Units := Max_Units;
+      Context.Max_Memory := Max_Memory;
+   end Set_Unit_Eviction_Policy;
+
+   -----------------
+   -- Evict_Units --
+   -----------------
+
+   procedure Evict_Units
+     (Context : Internal_Context;
+      Keep    : Internal_Unit_Array := (1 .. 0 => No_Analysis_Unit))
+   is
+      type Unit_Array is array (Positive range <>) of Internal_Unit;
+
+      function Less_Recently_Used (Left, Right : Internal_Unit) return Boolean
+      is (Left.Last_Access < Right.Last_Access);
+
+      procedure Sort is new Ada.Containers.Generic_Array_Sort
+        (Positive, Internal_Unit, Unit_Array, Less_Recently_Used);
+
+      Candidates : Unit_Array (1 .. Natural (Context.Units.Length));
+      Last       : Natural := 0;
+      --  Units that can be evicted are stored in Candidates (1 .. Last)
+
+      Loaded_Count  : Natural := 0;
+      Loaded_Memory : Byte_Count := 0;
+      --  Number of loaded units in Context and estimation of the memory they
+      --  use.
+
+      Kept : Analysis_Unit_Sets.Set;
+      --  Set of units in Keep
+
+      Dummy : Boolean;
+
+      function Over_Budget return Boolean is
+        ((Context.Max_Units /= 0 and then Loaded_Count > Context.Max_Units)
+         or else (Context.Max_Memory /= 0
+                  and then Loaded_Memory > Context.Max_Memory));
+
+   begin
+      --  Unloading a unit destroys its tree: we must not do it while tree
+      --  rewriting, lexical env population, property evaluation (see
+      --  Evaluation_Guard) or a unit provider call is in progress, nor in a
+      --  frozen context.
+
+      if Context.Eviction_Lock /= 0
+         or else Context.Frozen
+         or else Context.In_Populate_Lexical_Env
+         or else Has_Rewriting_Handle (Context)
+      then
+         return;
+      end if;
+
+      for Unit of Context.Units loop
+         if not Unit.Is_Unloaded then
+            Loaded_Count := Loaded_Count + 1;
+            Loaded_Memory := Loaded_Memory + Estimated_Memory_Usage (Unit);
+         end if;
+      end loop;
+
+      if not Over_Budget then
+         return;
+      end if;
+
+      --  Only consider units whose removal cannot leave dangling references
+      --  in other units: units that own rebindings or whose lexical
+      --  environments contain foreign nodes must stay loaded. Other
+      --  cross-unit references (exiled entries, references to lexical
+      --  environments) are handled as for reparsing. Pinned units must stay
+      --  loaded too, as something outside of the context references them.
+
+      for Unit of Keep loop
+         Dummy := Analysis_Unit_Sets.Add (Kept, Unit);
+      end loop;
+
+      for Unit of Context.Units loop
+         if not Analysis_Unit_Sets.Has (Kept, Unit)
+            and then not Unit.Is_Unloaded
+            and then Unit.Pin_Count = 0
+            and then Unit.Rebindings.Length = 0
+            and then Unit.Foreign_Nodes.Length = 0
+         then
+            Last := Last + 1;
+            Candidates (Last) := Unit;
+         end if;
+      end loop;
+      Analysis_Unit_Sets.Destroy (Kept);
+
+      --  Unload least recently used units first, until we are back within
+      --  budget.
+
+      Sort (Candidates (1 .. Last));
+      for Unit of Candidates (1 .. Last) loop
+         exit when not Over_Budget;
+
+         GNATCOLL.Traces.Trace
+           (Main_Trace, "Evicting unit: " & Basename (Unit));
+         Loaded_Count := Loaded_Count - 1;
+         Loaded_Memory := Loaded_Memory - Estimated_Memory_Usage (Unit);
+         Unload_Unit (Unit);
+      end loop;
+   end Evict_Units;
+
+   --------------
+   -- Pin_Unit --
+   --------------
+
+   procedure Pin_Unit (Unit : Internal_Unit) is
+   begin
+      Unit.Pin_Count := Unit.Pin_Count + 1;
+   end Pin_Unit;
+
+   ----------------
+   -- Unpin_Unit --
+   ----------------
+
+   procedure Unpin_Unit (Unit : Internal_Unit) is
+   begin
+      Unit.Pin_Count := Unit.Pin_Count - 1;
+   end Unpin_Unit;
+
+   ------------
+   -- Freeze --
+   ------------
+
+   procedure Freeze (Context : Internal_Context) is
+      type Unit_Array is array (Positive range <>) of Internal_Unit;
+   begin
+      if Context.Frozen then
+         return;
+      end if;
+
+      --  Populating lexical environments may load new units (through unit
+      --  providers), so iterate on a snapshot of the set of loaded units until
+      --  it does not grow anymore.
+
+      loop
+         declare
+            Units : Unit_Array (1 .. Natural (Context.Units.Length));
+            Last  : Natural := 0;
+         begin
+            for Unit of Context.Units loop
+               if not Unit.Is_Env_Populated then
+                  Last := Last + 1;
+                  Units (Last) := Unit;
+               end if;
+            end loop;
+            exit when Last = 0;
+
+            for Unit of Units (1 .. Last) loop
+               Populate_Lexical_Env (Unit);
+            end loop;
+         end;
+      end loop;
+
+      --  Properties reset outdated caches before using them: do it now so
+      --  that evaluations in the frozen context never have to.
+
+      for Unit of Context.Units loop
+         Reset_Caches (Unit);
+      end loop;
+
+      Context.Frozen := True;
+
+      Evaluation.Seize;
+      Frozen_Contexts := Frozen_Contexts + 1;
+      Evaluation.Release;
+   end Freeze;
+
+   --------------
+   -- Unfreeze --
+   --------------
+
+   procedure Unfreeze (Context : Internal_Context) is
+   begin
+      if Context.Frozen then
+         Context.Frozen := False;
+
+         Evaluation.Seize;
+         Frozen_Contexts := Frozen_Contexts - 1;
+         Evaluation.Release;
+      end if;
+   end Unfreeze;
+
+   ---------------
+   -- Is_Frozen --
+   ---------------
+
+   function Is_Frozen (Context : Internal_Context) return Boolean is
+   begin
+      return Context.Frozen;
+   end Is_Frozen;
+
+   ---------------------
+   -- Evaluation_Lock --
+   ---------------------
+
+   protected body Evaluation_Lock is
+
+      -----------
+      -- Seize --
+      -----------
+
+      entry Seize when True is
+         use type Ada.Task_Identification.Task_Id;
+      begin
+         if Depth > 0 and then Holder = Seize'Caller then
+            Depth := Depth + 1;
+         else
+            requeue Wait;
+         end if;
+      end Seize;
+
+      -------------
+      -- Release --
+      -------------
+
+      procedure Release is
+      begin
+         Depth := Depth - 1;
+         if Depth = 0 then
+            Holder := Ada.Task_Identification.Null_Task_Id;
+         end if;
+      end Release;
+
+      ----------
+      -- Wait --
+      ----------
+
+      entry Wait when Depth = 0 is
+      begin
+         Holder := Wait'Caller;
+         Depth := 1;
+      end Wait;
+
+   end Evaluation_Lock;
+
+   ----------------
+   -- Initialize --
+   ----------------
+
+   overriding procedure Initialize (Self : in out Evaluation_Guard) is
+   begin
+      if Self.Context = null then
+         if Frozen_Contexts > 0 then
+            Evaluation.Seize;
+            Self.Locked := True;
+         end if;
+      elsif Self.Context.Frozen then
+         Evaluation.Seize;
+         Self.Locked := True;
+      else
+         Self.Context.Eviction_Lock := Self.Context.Eviction_Lock + 1;
+         Self.Eviction_Locked := True;
+      end if;
+   end Initialize;
+
+   --------------
+   -- Finalize --
+   --------------
+
+   overriding procedure Finalize (Self : in out Evaluation_Guard) is
+   begin
+      if Self.Locked then
+         Self.Locked := False;
+         Evaluation.Release;
+      end if;
+      if Self.Eviction_Locked then
+         Self.Eviction_Locked := False;
+         Self.Context.Eviction_Lock := Self.Context.Eviction_Lock - 1;
+      end if;
+   end Finalize;
+
+   ------------------
+   -- Memory_Usage --
+   ------------------
+
+   function Memory_Usage
+     (Context : Internal_Context) return Memory_Usage_Breakdown
+   is
+      Result : Memory_Usage_Breakdown := No_Memory_Usage;
+   begin
+      for Unit of Context.Units loop
+         declare
+            Unit_Usage : constant Memory_Usage_Breakdown :=
+               Memory_Usage (Unit);
+         begin
+            for Category in Result'Range loop
+               Result (Category).Bytes :=
+                  Result (Category).Bytes + Unit_Usage (Category).Bytes;
+               Result (Category).Objects :=
+                  Result (Category).Objects + Unit_Usage (Category).Objects;
+            end loop;
+         end;
+      end loop;
+
+      Result (Lexical_Env_Memory).Bytes :=
+         Result (Lexical_Env_Memory).Bytes
+         + AST_Envs.Memory_Usage (Context.Root_Scope);
+      Result (Lexical_Env_Memory).Objects :=
+         Result (Lexical_Env_Memory).Objects + 1;
+
+      Result (Symbol_Memory) :=
+        (Bytes   => Memory_Usage (Context.Symbols),
+         Objects => Symbol_Count (Context.Symbols));
+      return Result;
+   end Memory_Usage;
+
    --------------------------
    -- Has_Rewriting_Handle --
    --------------------------
@@ -648,6 +1369,8 @@ package body ${ada_lib_name}.Implementation is
 
    procedure Destroy (Context : in out Internal_Context) is
    begin
+      Unfreeze (Context);
+
       --  If we are asked to free this context, it means that no one else have
       --  references to its analysis units, so it's safe to destroy these.
       for Unit of Context.Units loop
@@ -655,6 +1378,7 @@ package body ${ada_lib_name}.Implementation is
       end loop;
       Context.Units := Units_Maps.Empty_Map;
       Context.Filenames := Virtual_File_Maps.Empty_Map;
+      Context.Solver_Stats.Clear;
 
       Destroy (Context.Templates_Unit);
       AST_Envs.Destroy (Context.Root_Scope);
@@ -708,6 +1432,102 @@ package body ${ada_lib_name}.Implementation is
       null;
    end Reparse;
 
+   --------------------
+   -- Children_Count --
+   --------------------
+
+   function Children_Count
+     (Node : access ${root_node_value_type}'Class) return Natural
+   is
+      C : constant Integer := Kind_To_Node_Children_Count (Node.Kind);
+   begin
+      if C = -1 then
+         return ${generic_list_type_name} (Node).Count;
+      else
+         return C;
+      end if;
+   end Children_Count;
+
+   ----------------------
+   -- Iterate_Children --
+   ----------------------
+
+   procedure Iterate_Children (Node : access ${root_node_value_type}'Class) is
+   begin
+      <%
+         list_kinds = ctx.generic_list_type.concrete_subclasses
+         nodes_with_fields = [
+            (cls, cls.get_parse_fields(lambda f: not f.abstract and
+                                                 not f.null))
+            for cls in ctx.astnode_types
+            if not cls.abstract and not cls.is_list_type
+         ]
+         nodes_with_fields = [(cls, fields)
+                              for cls, fields in nodes_with_fields
+                              if fields]
+      %>
+      case Node.Kind is
+         % if list_kinds:
+         when ${ctx.astnode_kind_set(list_kinds)} =>
+            declare
+               L : constant ${generic_list_type_name} :=
+                  ${generic_list_type_name} (Node);
+            begin
+               for I in 1 .. L.Count loop
+                  if not Process (L.Nodes (I)) then
+                     return;
+                  end if;
+               end loop;
+            end;
+         % endif
+
+         % for cls, fields in nodes_with_fields:
+         when ${cls.ada_kind_name} =>
+            declare
+               N : constant ${cls.name} := ${cls.name} (Node);
+            begin
+               % for f in fields:
+               if not Process (${root_node_type_name} (N.${f.name})) then
+                  return;
+               end if;
+               % endfor
+            end;
+         % endfor
+
+         when others =>
+            --  Nodes of the remaining kinds have no children
+            null;
+      end case;
+   end Iterate_Children;
+
+   <%
+      descendant_kinds = []
+      for n in ctx.astnode_types:
+         if n.abstract:
+            continue
+         kinds = sorted(d.ada_kind_name for d in n.possible_descendant_types)
+         descendant_kinds.append('{} => {}'.format(
+            n.ada_kind_name,
+            '({} => True, others => False)'.format(' | '.join(kinds))
+            if kinds else 'Empty_Node_Kind_Set'
+         ))
+   %>
+   Descendant_Kinds : constant array (${root_node_kind_name}) of Node_Kind_Set
+     := (${',\n         '.join(descendant_kinds)});
+   --  For each node kind, set of kinds for the nodes that can appear in the
+   --  subtree of a node of this kind (excluding the node itself), as allowed
+   --  by the grammar.
+
+   -----------------------------
+   -- May_Have_Descendants_In --
+   -----------------------------
+
+   function May_Have_Descendants_In
+     (Kind : ${root_node_kind_name}; Kinds : Node_Kind_Set) return Boolean is
+   begin
+      return (Descendant_Kinds (Kind) and Kinds) /= Empty_Node_Kind_Set;
+   end May_Have_Descendants_In;
+
    --------------------------
    -- Populate_Lexical_Env --
    --------------------------
@@ -721,17 +1541,32 @@ package body ${ada_lib_name}.Implementation is
       Saved_In_Populate_Lexical_Env : constant Boolean :=
          Unit.Context.In_Populate_Lexical_Env;
 
+      procedure Reset_Envs_Caches (Unit : Internal_Unit);
+      --  Reset the lookup caches of all lexical environments in Unit
+
       procedure Reset_Envs_Caches (Unit : Internal_Unit) is
-         procedure Internal
-           (Node : access ${root_node_value_type}'Class) is
+         procedure Internal (Node : access ${root_node_value_type}'Class);
+         function Process (Child : ${root_node_type_name}) return Boolean;
+         procedure Process_Children is new Iterate_Children (Process);
+
+         function Process (Child : ${root_node_type_name}) return Boolean is
+         begin
+            Internal (Child);
+            return True;
+         end Process;
+
+         procedure Internal (Node : access ${root_node_value_type}'Class) is
          begin
             if Node = null then
                return;
             end if;
-            Reset_Caches (Node.Self_Env);
-            for I in 1 .. Node.Abstract_Children_Count loop
-               Internal (Node.Child (I));
-            end loop;
+
+            --  Nodes that do not store their environment share the one of an
+            --  ancestor: it is enough to process the ancestor.
+            if Node.Parent = null or else Stores_Self_Env (Node.Kind) then
+               Reset_Caches (Node.Get_Self_Env);
+            end if;
+            Process_Children (Node);
          end Internal;
       begin
          Internal (Unit.AST_Root);
@@ -761,10 +1596,21 @@ package body ${ada_lib_name}.Implementation is
             --  one of them.
             if Unit.AST_Root.Kind = ${ctx.ple_unit_root.list.ada_kind_name}
             then
-               for I in 1 .. Unit.AST_Root.Abstract_Children_Count loop
-                  Has_Errors := Populate_Lexical_Env (Unit.AST_Root.Child (I))
-                                or else Has_Errors;
-               end loop;
+               declare
+                  function Process
+                    (Child : ${root_node_type_name}) return Boolean;
+                  procedure Process_Children is new Iterate_Children (Process);
+
+                  function Process
+                    (Child : ${root_node_type_name}) return Boolean is
+                  begin
+                     Has_Errors :=
+                        Populate_Lexical_Env (Child) or else Has_Errors;
+                     return True;
+                  end Process;
+               begin
+                  Process_Children (Unit.AST_Root);
+               end;
 
             --  Otherwise, populate envs only if the root is a PLE unit itself
             elsif Unit.AST_Root.Kind = ${ctx.ple_unit_root.ada_kind_name} then
@@ -913,6 +1759,15 @@ package body ${ada_lib_name}.Implementation is
       Root_Env : constant Lexical_Env := Unit.Context.Root_Scope;
       State    : Dump_Lexical_Env_State := (Root_Env => Root_Env, others => <>);
 
+      procedure Internal (Current : ${root_node_type_name});
+      --  This procedure implements the main recursive logic of dumping the
+      --  environments.
+
+      function Process (Child : ${root_node_type_name}) return Boolean;
+      --  Call Internal on Child and continue the iteration
+
+      procedure Process_Children is new Iterate_Children (Process);
+
       --------------------------
       -- Explore_Parent_Chain --
       --------------------------
@@ -943,8 +1798,8 @@ package body ${ada_lib_name}.Implementation is
          --  we'll only dump environments at the site of their creation, and
          --  not in any subsequent link. We use the Env_Ids map to check which
          --  envs we have already seen or not.
-         if not State.Env_Ids.Contains (Current.Self_Env) then
-            Env := Current.Self_Env;
+         Env := Current.Get_Self_Env;
+         if not State.Env_Ids.Contains (Env) then
             Parent := AST_Envs.Get_Env (Env.Env.Parent);
             Explore_Parent := not State.Env_Ids.Contains (Parent);
 
@@ -956,13 +1811,19 @@ package body ${ada_lib_name}.Implementation is
             end if;
          end if;
 
-         for Child of ${root_node_array.array_type_name}'(Children (Current))
-         loop
-            Internal (Child);
-         end loop;
+         Process_Children (Current);
       end Internal;
-      --  This procedure implements the main recursive logic of dumping the
-      --  environments.
+
+      -------------
+      -- Process --
+      -------------
+
+      function Process (Child : ${root_node_type_name}) return Boolean is
+      begin
+         Internal (Child);
+         return True;
+      end Process;
+
    begin
       Internal (${root_node_type_name} (Node));
    end Dump_Lexical_Env;
@@ -1009,6 +1870,95 @@ package body ${ada_lib_name}.Implementation is
       end loop;
    end PP_Trivia;
 
+   ------------------
+   -- Memory_Usage --
+   ------------------
+
+   function Memory_Usage (Unit : Internal_Unit) return Memory_Usage_Breakdown
+   is
+      TDH : Token_Data_Handler renames Unit.TDH;
+
+      Token_Bytes : Byte_Count :=
+         Byte_Count (TDH.Tokens.Length) * Stored_Token_Data'Size / 8
+         + Byte_Count (TDH.Trivias.Length) * Trivia_Node'Size / 8
+         + Byte_Count (TDH.Tokens_To_Trivias.Length) * Integer'Size / 8;
+
+      Env_Usage : Memory_Usage_Entry := (Bytes => 0, Objects => 0);
+      --  Lexical environments created for the nodes of this unit
+
+      function Visit
+        (Node : access ${root_node_value_type}'Class) return Visit_Status;
+      --  Add the lexical environment that was created for Node, if any, to
+      --  Env_Usage.
+
+      -----------
+      -- Visit --
+      -----------
+
+      function Visit
+        (Node : access ${root_node_value_type}'Class) return Visit_Status is
+      begin
+         if Stores_Self_Env (Node.Kind) then
+            declare
+               Env : constant Lexical_Env := Node.Get_Self_Env;
+            begin
+               --  Only account for primary environments that were created
+               --  for Node: the others belong to other nodes/units.
+               if Env.Env /= null
+                  and then Env.Kind = Primary
+                  and then Env.Env.Node = ${root_node_type_name} (Node)
+               then
+                  Env_Usage.Bytes :=
+                     Env_Usage.Bytes + AST_Envs.Memory_Usage (Env);
+                  Env_Usage.Objects := Env_Usage.Objects + 1;
+               end if;
+            end;
+         end if;
+         return Into;
+      end Visit;
+
+   begin
+      if TDH.Source_Buffer /= null then
+         Token_Bytes := Token_Bytes
+                        + Byte_Count (TDH.Source_Buffer'Length)
+                          * Wide_Wide_Character'Size / 8;
+      end if;
+
+      --  Lexical environments grow as properties fill their lookup caches,
+      --  so they are measured only now, and only if they exist. All other
+      --  figures come from counters or container lengths.
+      --
+      --  AST nodes and the data they reference (lists, ...) are allocated in
+      --  the unit's pool, so the pool size covers them all.
+
+      if Unit.Is_Env_Populated and then Unit.AST_Root /= null then
+         Traverse (Unit.AST_Root, Visit'Access);
+      end if;
+
+      return
+        (AST_Memory         =>
+           (Bytes   => Byte_Count (Allocated_Size (Unit.AST_Mem_Pool)),
+            Objects => Unit.Node_Count),
+         Token_Memory       =>
+           (Bytes   => Token_Bytes,
+            Objects => TDH.Tokens.Length + TDH.Trivias.Length),
+         Lexical_Env_Memory => Env_Usage,
+         Memoization_Memory =>
+         % if ctx.has_memoization:
+           (Bytes   =>
+              Byte_Count (Unit.Memoization_Map.Length)
+              * (Mmz_Key'Size + Mmz_Value'Size + Standard'Address_Size) / 8,
+            Objects => Natural (Unit.Memoization_Map.Length)),
+         % else:
+           (Bytes => 0, Objects => 0),
+         % endif
+         Rebindings_Memory  =>
+           (Bytes   => Byte_Count (Unit.Rebindings.Length)
+                       * AST_Envs.Env_Rebindings_Type'Size / 8,
+            Objects => Unit.Rebindings.Length),
+         Symbol_Memory      => (Bytes => 0, Objects => 0));
+   end Memory_Usage;
+
    -------------
    -- Destroy --
    -------------
@@ -1134,22 +2084,98 @@ package body ${ada_lib_name}.Implementation is
 
    function Solve_Wrapper
      (R            : Relation;
-      Context_Node : ${root_node_type_name}) return Boolean is
+      Context_Node : ${root_node_type_name};
+      Property     : String) return Boolean is
    begin
       if Context_Node /= null and then Langkit_Support.Adalog.Debug.Debug then
          Context_Node.Assign_Names_To_Logic_Vars;
       end if;
 
+      --  Solve a simplified version of R: smaller relation trees take fewer
+      --  solver steps.
+
+      declare
+         Context    : constant Internal_Context := Context_Node.Unit.Context;
+         Normalized : Relation := Normalize (R);
+         Stats      : aliased Solving_Statistics;
+         Result     : Boolean;
       begin
-         return Solve (R, Context_Node.Unit.Context.Logic_Resolution_Timeout);
+         Result := Solve
+           (Normalized,
+            Context.Logic_Resolution_Timeout,
+            Stats'Access,
+            Context.Logic_Resolution_Strategy);
+         Dec_Ref (Normalized);
+         Record_Solver_Statistics
+           (Context, Property, Stats,
+            (if Result then Solved else Not_Solved));
+         return Result;
       exception
          when Langkit_Support.Adalog.Early_Binding_Error =>
+            Dec_Ref (Normalized);
+            Record_Solver_Statistics (Context, Property, Stats, Failed);
             raise Property_Error with "invalid equation for logic resolution";
          when Langkit_Support.Adalog.Timeout_Error =>
+            Dec_Ref (Normalized);
+            Record_Solver_Statistics (Context, Property, Stats, Timed_Out);
             raise Property_Error with "logic resolution timed out";
+         when others =>
+            Dec_Ref (Normalized);
+            Record_Solver_Statistics (Context, Property, Stats, Failed);
+            raise;
       end;
    end Solve_Wrapper;
 
+   ------------------------------
+   -- Record_Solver_Statistics --
+   ------------------------------
+
+   procedure Record_Solver_Statistics
+     (Context  : Internal_Context;
+      Property : String;
+      Stats    : Solving_Statistics;
+      Outcome  : Solve_Outcome)
+   is
+      use Solver_Statistics_Maps;
+
+      Key      : constant Unbounded_String := To_Unbounded_String (Property);
+      Position : Cursor := Context.Solver_Stats.Find (Key);
+      Inserted : Boolean;
+   begin
+      if not Has_Element (Position) then
+         Context.Solver_Stats.Insert
+           (Key, (Property => Key, others => <>), Position, Inserted);
+      end if;
+
+      declare
+         Entry_Stats : Solver_Property_Statistics renames
+            Context.Solver_Stats.Reference (Position).Element.all;
+         Totals      : Solving_Statistics renames Entry_Stats.Totals;
+      begin
+         Entry_Stats.Resolutions := Entry_Stats.Resolutions + 1;
+         case Outcome is
+            when Solved =>
+               Entry_Stats.Satisfied := Entry_Stats.Satisfied + 1;
+            when Not_Solved =>
+               Entry_Stats.Unsatisfied := Entry_Stats.Unsatisfied + 1;
+            when Timed_Out =>
+               Entry_Stats.Timeouts := Entry_Stats.Timeouts + 1;
+            when Failed =>
+               Entry_Stats.Errors := Entry_Stats.Errors + 1;
+         end case;
+
+         Totals.Ticks := Totals.Ticks + Stats.Ticks;
+         Totals.Backtracks := Totals.Backtracks + Stats.Backtracks;
+         for K in Relation_Kind loop
+            Totals.Evaluations (K) :=
+               Totals.Evaluations (K) + Stats.Evaluations (K);
+         end loop;
+         Totals.Max_Depth := Natural'Max (Totals.Max_Depth, Stats.Max_Depth);
+         Entry_Stats.Max_Ticks :=
+            Statistics_Counter'Max (Entry_Stats.Max_Ticks, Stats.Ticks);
+      end;
+   end Record_Solver_Statistics;
+
    % if ctx.has_env_assoc:
       ----------------
       -- Add_To_Env --
@@ -1300,28 +2326,108 @@ package body ${ada_lib_name}.Implementation is
       <%def name="default()"> return Null_Lexical_Env; </%def>
       </%self:case_dispatch>
 
-   end Pre_Env_Actions;
+   end Pre_Env_Actions;
+
+   ----------------------
+   -- Post_Env_Actions --
+   ----------------------
+
+   procedure Post_Env_Actions
+     (Self                : access ${root_node_value_type}'Class;
+      Bound_Env, Root_Env : AST_Envs.Lexical_Env) is
+   begin
+      <%self:case_dispatch
+        pred="${(lambda n: n.env_spec and not n.is_env_spec_inherited)}">
+      <%def name="action(n)">
+         % if n.env_spec.post_actions:
+         ${n.name}_Post_Env_Actions (${n.name} (Self), Bound_Env, Root_Env);
+         % else:
+         null;
+         % endif
+      </%def>
+      <%def name="default()"> null; </%def>
+      </%self:case_dispatch>
+   end Post_Env_Actions;
+
+   <%
+      self_env_holders = [n for n in ctx.astnode_types
+                          if n.declares_self_env]
+   %>
+
+   ---------------------
+   -- Stores_Self_Env --
+   ---------------------
+
+   function Stores_Self_Env (Kind : ${root_node_kind_name}) return Boolean is
+      % if T.root_node.stores_self_env or not self_env_holders:
+         pragma Unreferenced (Kind);
+      % endif
+   begin
+      % if T.root_node.stores_self_env:
+         return True;
+      % elif self_env_holders:
+         return Kind in ${ctx.astnode_kind_set(self_env_holders)};
+      % else:
+         return False;
+      % endif
+   end Stores_Self_Env;
+
+   ------------------
+   -- Get_Self_Env --
+   ------------------
+
+   function Get_Self_Env
+     (Node : access ${root_node_value_type}'Class) return Lexical_Env
+   is
+   % if T.root_node.stores_self_env:
+   begin
+      return Node.Self_Env;
+   % else:
+      Self : ${root_node_type_name} := ${root_node_type_name} (Node);
+   begin
+      --  Nodes that do not store their environment live in the environment
+      --  of their parent: look for the closest one that stores it.
+      while Self /= null loop
+         <%self:case_dispatch pred="${lambda n: n.declares_self_env}">
+         <%def name="action(n)">
+            return ${n.name} (Self).Self_Env;
+         </%def>
+         <%def name="default()"> Self := Self.Parent; </%def>
+         </%self:case_dispatch>
+      end loop;
+
+      --  If none does, Node lives in the environment of the tree root
+      % if ctx.ple_unit_root:
+         return Empty_Env;
+      % else:
+         return (if Node.Unit.Is_Env_Populated
+                 then Node.Unit.Context.Root_Scope
+                 else Empty_Env);
+      % endif
+   % endif
+   end Get_Self_Env;
 
-   ----------------------
-   -- Post_Env_Actions --
-   ----------------------
+   ------------------
+   -- Set_Self_Env --
+   ------------------
 
-   procedure Post_Env_Actions
-     (Self                : access ${root_node_value_type}'Class;
-      Bound_Env, Root_Env : AST_Envs.Lexical_Env) is
+   procedure Set_Self_Env
+     (Node : access ${root_node_value_type}'Class; Env : Lexical_Env)
+   is
+   % if T.root_node.stores_self_env:
    begin
-      <%self:case_dispatch
-        pred="${(lambda n: n.env_spec and not n.is_env_spec_inherited)}">
+      Node.Self_Env := Env;
+   % else:
+      Self : constant ${root_node_type_name} := ${root_node_type_name} (Node);
+   begin
+      <%self:case_dispatch pred="${lambda n: n.declares_self_env}">
       <%def name="action(n)">
-         % if n.env_spec.post_actions:
-         ${n.name}_Post_Env_Actions (${n.name} (Self), Bound_Env, Root_Env);
-         % else:
-         null;
-         % endif
+         ${n.name} (Self).Self_Env := Env;
       </%def>
-      <%def name="default()"> null; </%def>
+      <%def name="default()"> raise Program_Error; </%def>
       </%self:case_dispatch>
-   end Post_Env_Actions;
+   % endif
+   end Set_Self_Env;
 
    ----------------
    -- Get_Symbol --
@@ -1397,16 +2503,26 @@ package body ${ada_lib_name}.Implementation is
    procedure Set_Parents
      (Node, Parent : access ${root_node_value_type}'Class)
    is
+      function Process (Child : ${root_node_type_name}) return Boolean;
+      procedure Process_Children is new Iterate_Children (Process);
+
+      -------------
+      -- Process --
+      -------------
+
+      function Process (Child : ${root_node_type_name}) return Boolean is
+      begin
+         Set_Parents (Child, Node);
+         return True;
+      end Process;
+
    begin
       if Node = null then
          return;
       end if;
 
       Node.Parent := ${root_node_type_name} (Parent);
-
-      for I in 1 .. Node.Abstract_Children_Count loop
-         Set_Parents (Node.Child (I), Node);
-      end loop;
+      Process_Children (Node);
    end Set_Parents;
 
    -------------
@@ -1414,15 +2530,26 @@ package body ${ada_lib_name}.Implementation is
    -------------
 
    procedure Destroy (Node : access ${root_node_value_type}'Class) is
+      function Process (Child : ${root_node_type_name}) return Boolean;
+      procedure Process_Children is new Iterate_Children (Process);
+
+      -------------
+      -- Process --
+      -------------
+
+      function Process (Child : ${root_node_type_name}) return Boolean is
+      begin
+         Destroy (Child);
+         return True;
+      end Process;
+
    begin
       if Node = null then
          return;
       end if;
 
       Node.Reset_Logic_Vars;
-      for I in 1 .. Node.Abstract_Children_Count loop
-         Destroy (Node.Child (I));
-      end loop;
+      Process_Children (Node);
    end Destroy;
 
    -----------
@@ -1451,6 +2578,21 @@ package body ${ada_lib_name}.Implementation is
    is
       Status : Visit_Status := Into;
 
+      function Process (Child : ${root_node_type_name}) return Boolean;
+      procedure Process_Children is new Iterate_Children (Process);
+
+      -------------
+      -- Process --
+      -------------
+
+      function Process (Child : ${root_node_type_name}) return Boolean is
+      begin
+         if Child /= null then
+            Status := Traverse (Child, Visit);
+         end if;
+         return Status = Into;
+      end Process;
+
    begin
       if Node /= null then
          Status := Visit (Node);
@@ -1461,18 +2603,7 @@ package body ${ada_lib_name}.Implementation is
          --  must immediately stop processing the tree.
 
          if Status = Into then
-            for I in 1 .. Node.Abstract_Children_Count loop
-               declare
-                  Cur_Child : constant ${root_node_type_name} :=
-                     Child (Node, I);
-
-               begin
-                  if Cur_Child /= null then
-                     Status := Traverse (Cur_Child, Visit);
-                     exit when Status /= Into;
-                  end if;
-               end;
-            end loop;
+            Process_Children (Node);
          end if;
       end if;
 
@@ -1627,42 +2758,54 @@ package body ${ada_lib_name}.Implementation is
       --  assume that all lookups fall into this node's sloc range.
       pragma Assert (Compare (Sloc_Range (Node), Sloc) = Inside);
 
-      Children : constant ${root_node_array.array_type_name} := Node.Children;
-      Pos      : Relative_Position;
-      Result   : ${root_node_type_name};
-   begin
+      Result : ${root_node_type_name} := Node;
+      --  If we find no children that covers Sloc, Node still covers it (see
+      --  the assertion).
+
+      function Process (Child : ${root_node_type_name}) return Boolean;
       --  Look for a child node that contains Sloc (i.e. return the most
       --  precise result).
 
-      for Child of Children loop
+      procedure Process_Children is new Iterate_Children (Process);
+
+      -------------
+      -- Process --
+      -------------
+
+      function Process (Child : ${root_node_type_name}) return Boolean is
+         Pos         : Relative_Position;
+         Child_Found : ${root_node_type_name};
+      begin
          --  Note that we assume here that child nodes are ordered so that the
          --  first one has a sloc range that is before the sloc range of the
          --  second child node, etc.
 
-         if Child /= null then
-            Lookup_Relative (Child, Sloc, Pos, Result);
-            case Pos is
-               when Before =>
-                   --  If this is the first node, Sloc is before it, so we can
-                   --  stop here.  Otherwise, Sloc is between the previous
-                   --  child node and the next one...  so we can stop here,
-                   --  too.
-                   return Node;
-
-               when Inside =>
-                   return Result;
-
-               when After =>
-                   --  Sloc is after the current child node, so see with the
-                   --  next one.
-                   null;
-            end case;
+         if Child = null then
+            return True;
          end if;
-      end loop;
 
-      --  If we reach this point, we found no children that covers Sloc, but
-      --  Node still covers it (see the assertion).
-      return Node;
+         Lookup_Relative (Child, Sloc, Pos, Child_Found);
+         case Pos is
+            when Before =>
+                --  If this is the first node, Sloc is before it, so we can
+                --  stop here.  Otherwise, Sloc is between the previous child
+                --  node and the next one...  so we can stop here, too.
+                return False;
+
+            when Inside =>
+                Result := Child_Found;
+                return False;
+
+            when After =>
+                --  Sloc is after the current child node, so see with the
+                --  next one.
+                return True;
+         end case;
+      end Process;
+
+   begin
+      Process_Children (Node);
+      return Result;
    end Lookup_Internal;
 
    -------------
@@ -1727,13 +2870,25 @@ package body ${ada_lib_name}.Implementation is
      return ${root_node_array.array_type_name}
    is
       First : constant Integer := ${root_node_array.index_type()}'First;
-      Last  : constant Integer := First + Node.Abstract_Children_Count - 1;
+      Last  : constant Integer := First + Children_Count (Node) - 1;
    begin
       return A : ${root_node_array.array_type_name} (First .. Last)
       do
-         for I in First .. Last loop
-            A (I) := Child (Node, I);
-         end loop;
+         declare
+            Next : Integer := First;
+
+            function Process (Child : ${root_node_type_name}) return Boolean;
+            procedure Process_Children is new Iterate_Children (Process);
+
+            function Process (Child : ${root_node_type_name}) return Boolean is
+            begin
+               A (Next) := Child;
+               Next := Next + 1;
+               return True;
+            end Process;
+         begin
+            Process_Children (Node);
+         end;
       end return;
    end Children;
 
@@ -1797,26 +2952,47 @@ package body ${ada_lib_name}.Implementation is
       is
          Result      : Boolean := False;
          Initial_Env : Lexical_Env;
+         Self_Env    : Lexical_Env := Bound_Env;
+         Has_Env     : Boolean;
+
+         function Process (Child : ${root_node_type_name}) return Boolean;
+         procedure Process_Children is new Iterate_Children (Process);
+
+         -------------
+         -- Process --
+         -------------
+
+         function Process (Child : ${root_node_type_name}) return Boolean is
+         begin
+            Result := Populate_Internal (Child, Self_Env) or else Result;
+            return True;
+         end Process;
+
       begin
          if Node = null then
             return Result;
          end if;
 
          --  By default (i.e. unless env actions add a new env),
-         --  the environment we store in Node is the current one.
-         Node.Self_Env := Bound_Env;
+         --  the environment we store in Node is the current one. Nodes that
+         --  do not store it get it from their parent, which is the same.
+         Has_Env := Stores_Self_Env (Node.Kind);
+         if Has_Env then
+            Node.Set_Self_Env (Bound_Env);
+         end if;
 
          begin
             Initial_Env := Node.Pre_Env_Actions (Bound_Env, Root_Env);
 
             if Initial_Env /= Null_Lexical_Env then
-               Node.Self_Env := Initial_Env;
+               Self_Env := Initial_Env;
+               if Has_Env then
+                  Node.Set_Self_Env (Initial_Env);
+               end if;
             end if;
 
             --  Call recursively on children
-            for C of ${root_node_array.array_type_name}'(Children (Node)) loop
-               Result := Populate_Internal (C, Node.Self_Env) or else Result;
-            end loop;
+            Process_Children (Node);
 
             Node.Post_Env_Actions (Initial_Env, Root_Env);
          exception
@@ -2252,7 +3428,7 @@ package body ${ada_lib_name}.Implementation is
 
    function Last_Child_Index
      (Node : access ${root_node_value_type}'Class) return Natural
-   is (Node.Abstract_Children_Count);
+   is (Children_Count (Node));
 
    ---------------
    -- Get_Child --
@@ -2401,6 +3577,186 @@ package body ${ada_lib_name}.Implementation is
       % endif
    end Print;
 
+   -------------
+   -- To_JSON --
+   -------------
+
+   function To_JSON
+     (Node       : access ${root_node_value_type}'Class;
+      With_Slocs : Boolean) return String
+   is
+      Result : Unbounded_String;
+
+      procedure Append_String_Literal (T : Text_Type);
+      --  Append T to Result as a JSON string literal
+
+      procedure Process (Node : ${root_node_type_name});
+      --  Append the JSON representation of Node to Result
+
+      ---------------------------
+      -- Append_String_Literal --
+      ---------------------------
+
+      procedure Append_String_Literal (T : Text_Type) is
+         Hex : constant String := "0123456789abcdef";
+      begin
+         Append (Result, '"');
+         for C of T loop
+            declare
+               Code : constant Natural := Wide_Wide_Character'Pos (C);
+            begin
+               if C = '"' then
+                  Append (Result, "\""");
+               elsif C = '\' then
+                  Append (Result, "\\");
+               elsif Code < 32 then
+                  Append (Result, "\u00" & Hex (Code / 16 + 1)
+                                  & Hex (Code mod 16 + 1));
+               elsif Code < 128 then
+                  Append (Result, Character'Val (Code));
+               else
+                  Append (Result, To_UTF8 ((1 => C)));
+               end if;
+            end;
+         end loop;
+         Append (Result, '"');
+      end Append_String_Literal;
+
+      -------------
+      -- Process --
+      -------------
+
+      procedure Process (Node : ${root_node_type_name}) is
+      begin
+         if Node = null then
+            Append (Result, "null");
+            return;
+         end if;
+
+         Append (Result, "{""kind"": """ & Node.Kind_Name & """");
+         if With_Slocs then
+            Append (Result,
+                    ", ""sloc_range"": """ & Image (Node.Sloc_Range) & """");
+         end if;
+
+         if Is_Token_Node (Node.Kind) then
+            Append (Result, ", ""text"": ");
+            Append_String_Literal (Node.Text);
+
+         % if ctx.generic_list_type.concrete_subclasses:
+         elsif Node.Kind in ${ctx.generic_list_type.ada_kind_range_name} then
+            Append (Result, ", ""items"": [");
+            for I in 1 .. Children_Count (Node) loop
+               if I > 1 then
+                  Append (Result, ", ");
+               end if;
+               Process (Node.Child (I));
+            end loop;
+            Append (Result, "]");
+         % endif
+
+         else
+            Append (Result, ", ""fields"": {");
+            % if ctx.sorted_parse_fields:
+            declare
+               use ${ada_lib_name}.Introspection;
+               Field_List : constant Field_Reference_Array :=
+                  Fields (Node.Kind);
+            begin
+               for I in Field_List'Range loop
+                  if I > Field_List'First then
+                     Append (Result, ", ");
+                  end if;
+                  Append (Result,
+                          """" & Field_Name (Field_List (I)) & """: ");
+                  Process (Node.Child (I));
+               end loop;
+            end;
+            % endif
+            Append (Result, "}");
+         end if;
+
+         Append (Result, "}");
+      end Process;
+
+   begin
+      Process (${root_node_type_name} (Node));
+      return To_String (Result);
+   end To_JSON;
+
+   ---------------
+   -- To_Binary --
+   ---------------
+
+   function To_Binary
+     (Node       : access ${root_node_value_type}'Class;
+      With_Slocs : Boolean) return String
+   is
+      Result : Unbounded_String;
+
+      procedure Append_Integer (Value : Long_Long_Integer);
+      --  Append Value to Result as a 32-bit little-endian unsigned integer
+
+      procedure Process (Node : ${root_node_type_name});
+      --  Append the binary representation of Node to Result
+
+      --------------------
+      -- Append_Integer --
+      --------------------
+
+      procedure Append_Integer (Value : Long_Long_Integer) is
+         V : Long_Long_Integer := Value;
+      begin
+         for I in 1 .. 4 loop
+            Append (Result, Character'Val (V mod 256));
+            V := V / 256;
+         end loop;
+      end Append_Integer;
+
+      -------------
+      -- Process --
+      -------------
+
+      procedure Process (Node : ${root_node_type_name}) is
+      begin
+         if Node = null then
+            Append_Integer (0);
+            return;
+         end if;
+
+         Append_Integer (${root_node_kind_name}'Enum_Rep (Node.Kind));
+         if With_Slocs then
+            declare
+               SR : constant Source_Location_Range := Node.Sloc_Range;
+            begin
+               Append_Integer (Long_Long_Integer (SR.Start_Line));
+               Append_Integer (Long_Long_Integer (SR.Start_Column));
+               Append_Integer (Long_Long_Integer (SR.End_Line));
+               Append_Integer (Long_Long_Integer (SR.End_Column));
+            end;
+         end if;
+
+         if Is_Token_Node (Node.Kind) then
+            declare
+               Text : constant String := To_UTF8 (Node.Text);
+            begin
+               Append_Integer (Text'Length);
+               Append (Result, Text);
+            end;
+         else
+            Append_Integer (Long_Long_Integer (Children_Count (Node)));
+            for I in 1 .. Children_Count (Node) loop
+               Process (Node.Child (I));
+            end loop;
+         end if;
+      end Process;
+
+   begin
+      Append_Integer (Boolean'Pos (With_Slocs));
+      Process (${root_node_type_name} (Node));
+      return To_String (Result);
+   end To_Binary;
+
    ------------
    -- Parent --
    ------------
@@ -2481,19 +3837,26 @@ package body ${ada_lib_name}.Implementation is
         (Parent : access ${root_node_value_type}'Class)
          return ${root_node_array.array_type_name}
       is
-         Children : constant ${root_node_array.array_type_name} :=
-            Parent.Children;
-         Result   : ${root_node_array.array_type_name} (Children'Range);
-         Next     : Integer := Result'First;
-      begin
-         for I in Children'Range loop
+         Result : ${root_node_array.array_type_name}
+           (1 .. Children_Count (Parent));
+         Next   : Integer := Result'First;
+
+         function Process (Child : ${root_node_type_name}) return Boolean;
+         procedure Process_Children is new Iterate_Children (Process);
+
+         function Process (Child : ${root_node_type_name}) return Boolean is
+         begin
             --  Get rid of null nodes and of nodes with no real existence in
             --  the source code.
-            if Children (I) /= null and then not Children (I).Is_Ghost then
-               Result (Next) := Children (I);
+            if Child /= null and then not Child.Is_Ghost then
+               Result (Next) := Child;
                Next := Next + 1;
             end if;
-         end loop;
+            return True;
+         end Process;
+
+      begin
+         Process_Children (Parent);
          return Result (Result'First .. Next - 1);
       end Filter_Children;
 
@@ -2759,7 +4122,7 @@ package body ${ada_lib_name}.Implementation is
      (Node   : access ${root_node_value_type}'Class;
       E_Info : ${T.entity_info.name} := ${T.entity_info.nullexpr})
       return Lexical_Env
-   is (Rebind_Env (Node.Self_Env, E_Info));
+   is (Rebind_Env (Node.Get_Self_Env, E_Info));
 
    --------------
    -- Node_Env --
@@ -2808,7 +4171,7 @@ package body ${ada_lib_name}.Implementation is
 
          function Get_Parent_Env return Lexical_Env is
             Parent : constant Lexical_Env :=
-               AST_Envs.Get_Env (Node.Self_Env.Env.Parent);
+               AST_Envs.Get_Env (Node.Get_Self_Env.Env.Parent);
          begin
             --  If Node is the root scope or the empty environment, Parent can
             --  be a wrapper around the null node. Turn this into the
@@ -2824,14 +4187,14 @@ package body ${ada_lib_name}.Implementation is
                if Node.Kind in ${' | '.join(sorted_nodes_adding_env)} then
                   return Get_Parent_Env;
                else
-                  return Node.Self_Env;
+                  return Node.Get_Self_Env;
                end if;
             % else:
                return Get_Parent_Env;
             % endif
 
          % else:
-            return Node.Self_Env;
+            return Node.Get_Self_Env;
          % endif
       end Get_Base_Env;
 
@@ -2944,6 +4307,21 @@ package body ${ada_lib_name}.Implementation is
            (Image (Node.Short_Text_Image) & "." & Field);
       end Assign;
 
+      function Process (Child : ${root_node_type_name}) return Boolean;
+      procedure Process_Children is new Iterate_Children (Process);
+
+      -------------
+      -- Process --
+      -------------
+
+      function Process (Child : ${root_node_type_name}) return Boolean is
+      begin
+         if Child /= null then
+            Assign_Names_To_Logic_Vars (Child);
+         end if;
+         return True;
+      end Process;
+
       K : constant ${root_node_kind_name} := Node.Kind;
 
    begin
@@ -2960,11 +4338,7 @@ package body ${ada_lib_name}.Implementation is
               )
       %>
       ${ctx.generate_actions_for_hierarchy('Node', 'K', get_actions)}
-      for Child of ${root_node_array.array_type_name}'(Children (Node)) loop
-         if Child /= null then
-            Assign_Names_To_Logic_Vars (Child);
-         end if;
-      end loop;
+      Process_Children (Node);
    end Assign_Names_To_Logic_Vars;
 
    ----------------
@@ -3054,7 +4428,7 @@ package body ${ada_lib_name}.Implementation is
 
    function Length
      (Node : access ${generic_list_value_type}'Class) return Natural
-   is (Node.Abstract_Children_Count);
+   is (Children_Count (Node));
 
    % if ctx.properties_logging:
 
@@ -3260,20 +4634,9 @@ package body ${ada_lib_name}.Implementation is
    -----------------------------
 
    function Abstract_Children_Count
-     (Node : access ${root_node_value_type}) return Natural
-   is
-      C : Integer := Kind_To_Node_Children_Count (Node.Kind);
+     (Node : access ${root_node_value_type}) return Natural is
    begin
-      if C = -1 then
-         declare
-            N : constant ${root_node_type_name} :=
-               ${root_node_type_name} (Node);
-         begin
-            return ${generic_list_type_name} (N).Count;
-         end;
-      else
-         return C;
-      end if;
+      return Children_Count (Node);
    end Abstract_Children_Count;
 
    -------------------
@@ -3410,7 +4773,12 @@ package body ${ada_lib_name}.Implementation is
             Foreign_Node_Entry_Vectors.Empty_Vector,
          Rebindings        => Env_Rebindings_Vectors.Empty_Vector,
          Cache_Version     => <>,
-         Unit_Version      => <>
+         Unit_Version      => <>,
+         Last_Access       => <>,
+         Is_Unloaded       => False,
+         Repopulate_After_Reload => False,
+         Node_Count        => 0,
+         Pin_Count         => 0
          % if ctx.has_memoization:
          , Memoization_Map => <>
          % endif
@@ -3538,16 +4906,26 @@ package body ${ada_lib_name}.Implementation is
       --------------------------
 
       procedure Deactivate_Refd_Envs
-        (Node : access ${root_node_value_type}'Class) is
+        (Node : access ${root_node_value_type}'Class)
+      is
+         function Process (Child : ${root_node_type_name}) return Boolean;
+         procedure Process_Children is new Iterate_Children (Process);
+
+         function Process (Child : ${root_node_type_name}) return Boolean is
+         begin
+            Deactivate_Refd_Envs (Child);
+            return True;
+         end Process;
+
       begin
          if Node = null then
             return;
          end if;
 
-         Deactivate_Referenced_Envs (Node.Self_Env);
-         for I in 1 .. Node.Abstract_Children_Count loop
-            Deactivate_Refd_Envs (Node.Child (I));
-         end loop;
+         if Node.Parent = null or else Stores_Self_Env (Node.Kind) then
+            Deactivate_Referenced_Envs (Node.Get_Self_Env);
+         end if;
+         Process_Children (Node);
       end Deactivate_Refd_Envs;
 
       -------------------------
@@ -3555,15 +4933,25 @@ package body ${ada_lib_name}.Implementation is
       -------------------------
 
       procedure Recompute_Refd_Envs
-        (Node : access ${root_node_value_type}'Class) is
+        (Node : access ${root_node_value_type}'Class)
+      is
+         function Process (Child : ${root_node_type_name}) return Boolean;
+         procedure Process_Children is new Iterate_Children (Process);
+
+         function Process (Child : ${root_node_type_name}) return Boolean is
+         begin
+            Recompute_Refd_Envs (Child);
+            return True;
+         end Process;
+
       begin
          if Node = null then
             return;
          end if;
-         Recompute_Referenced_Envs (Node.Self_Env);
-         for I in 1 .. Node.Abstract_Children_Count loop
-            Recompute_Refd_Envs (Node.Child (I));
-         end loop;
+         if Node.Parent = null or else Stores_Self_Env (Node.Kind) then
+            Recompute_Referenced_Envs (Node.Get_Self_Env);
+         end if;
+         Process_Children (Node);
       end Recompute_Refd_Envs;
 
    begin
@@ -3685,7 +5073,22 @@ package body ${ada_lib_name}.Implementation is
    procedure Do_Parsing
      (Unit   : Internal_Unit;
       Input  : Internal_Lexer_Input;
-      Result : out Reparsed_Unit)
+      Result : out Reparsed_Unit) is
+   begin
+      Do_Parsing
+        (Unit, Input, Result, Unit.Context.Parser, Unit.Context.Symbols);
+   end Do_Parsing;
+
+   ----------------
+   -- Do_Parsing --
+   ----------------
+
+   procedure Do_Parsing
+     (Unit    : Internal_Unit;
+      Input   : Internal_Lexer_Input;
+      Result  : out Reparsed_Unit;
+      Parser  : in out Parser_Type;
+      Symbols : Symbol_Table)
    is
       Context  : constant Internal_Context := Unit.Context;
       Unit_TDH : constant Token_Data_Handler_Access := Token_Data (Unit);
@@ -3733,9 +5136,10 @@ package body ${ada_lib_name}.Implementation is
       GNATCOLL.Traces.Trace (Main_Trace, "Parsing unit " & Basename (Unit));
 
       Result.AST_Root := null;
+      Result.Node_Count := 0;
 
       Move (Saved_TDH, Unit_TDH.all);
-      Initialize (Unit_TDH.all, Saved_TDH.Symbols);
+      Initialize (Unit_TDH.all, Symbols);
 
       --  This is where lexing occurs, so this is where we get most "setup"
       --  issues: missing input file, bad charset, etc. If we have such an
@@ -3766,7 +5170,7 @@ package body ${ada_lib_name}.Implementation is
          Init_Parser
            (Input, Context.Tab_Stop, Context.With_Trivia, Unit, Unit_TDH,
             Context.Symbol_Literals'Access,
-            Unit.Context.Parser);
+            Parser);
       exception
          when Exc : Name_Error =>
             --  This happens when we cannot open the source file for lexing:
@@ -3800,11 +5204,13 @@ package body ${ada_lib_name}.Implementation is
       --  get.
 
       Result.AST_Mem_Pool := Create;
-      Unit.Context.Parser.Mem_Pool := Result.AST_Mem_Pool;
+      Parser.Mem_Pool := Result.AST_Mem_Pool;
 
       Result.AST_Root := ${root_node_type_name}
-        (Parse (Unit.Context.Parser, Rule => Unit.Rule));
-      Result.Diagnostics.Append (Unit.Context.Parser.Diagnostics);
+        (Parse (Parser, Rule => Unit.Rule));
+      Result.Diagnostics.Append (Parser.Diagnostics);
+      Result.Node_Count := Parser.Node_Count;
+
       Rotate_TDH;
    end Do_Parsing;
 
@@ -3843,6 +5249,7 @@ package body ${ada_lib_name}.Implementation is
          Unit.AST_Root.Destroy;
       end if;
       Unit.AST_Root := Reparsed.AST_Root;
+      Unit.Node_Count := Reparsed.Node_Count;
 
       --  Likewise for memory pools
       Free (Unit.AST_Mem_Pool);
@@ -3852,6 +5259,7 @@ package body ${ada_lib_name}.Implementation is
       --  Increment unit version number to invalidate caches and stale node
       --  reference.
       Unit.Unit_Version := Unit.Unit_Version + 1;
+      Unit.Context.Units_Version := Unit.Context.Units_Version + 1;
 
       --  If Unit had its lexical environments populated, re-populate them
       if not Unit.Is_Env_Populated then
@@ -3910,6 +5318,72 @@ package body ${ada_lib_name}.Implementation is
       end;
    end Update_After_Reparse;
 
+   ----------------------------
+   -- Estimated_Memory_Usage --
+   ----------------------------
+
+   function Estimated_Memory_Usage (Unit : Internal_Unit) return Byte_Count
+   is
+      TDH : Token_Data_Handler renames Unit.TDH;
+   begin
+      if Unit.AST_Root = null and then TDH.Source_Buffer = null then
+         return 0;
+      end if;
+
+      return Byte_Count (Allocated_Size (Unit.AST_Mem_Pool))
+             + Byte_Count (TDH.Source_Buffer'Length)
+               * Wide_Wide_Character'Size / 8
+             + Byte_Count (TDH.Tokens.Length)
+               * Stored_Token_Data'Size / 8
+             + Byte_Count (TDH.Trivias.Length)
+               * Trivia_Node'Size / 8;
+   end Estimated_Memory_Usage;
+
+   -----------------
+   -- Unload_Unit --
+   -----------------
+
+   procedure Unload_Unit (Unit : Internal_Unit) is
+   begin
+      --  As for reparsing, removing a tree can change how any property in the
+      --  whole analysis context behaves, so invalidate all caches.
+      Invalidate_Caches (Unit.Context, Invalidate_Envs => True);
+
+      --  Remove the `symbol -> AST node` associations in foreign lexical
+      --  environments. This browses AST nodes, so we have to do it before
+      --  destroying the tree.
+      Remove_Exiled_Entries (Unit);
+
+      --  Destroyables (lexical environments, ...) refer to the tree, so get
+      --  rid of them as well.
+      Destroy_Unit_Destroyables (Unit);
+
+      % if ctx.has_memoization:
+         Destroy (Unit.Memoization_Map);
+      % endif
+
+      if Unit.AST_Root /= null then
+         Unit.AST_Root.Destroy;
+         Unit.AST_Root := null;
+      end if;
+      Free (Unit.AST_Mem_Pool);
+      Unit.Node_Count := 0;
+
+      Free (Unit.TDH);
+      Initialize (Unit.TDH, Unit.Context.Symbols);
+      Unit.Diagnostics.Clear;
+      Analysis_Unit_Sets.Destroy (Unit.Referenced_Units);
+
+      --  Increment unit version number so that references to the destroyed
+      --  nodes are considered as stale.
+      Unit.Unit_Version := Unit.Unit_Version + 1;
+      Unit.Context.Units_Version := Unit.Context.Units_Version + 1;
+
+      Unit.Repopulate_After_Reload := Unit.Is_Env_Populated;
+      Unit.Is_Env_Populated := False;
+      Unit.Is_Unloaded := True;
+   end Unload_Unit;
+
    -------------------------------
    -- Destroy_Unit_Destroyables --
    -------------------------------
@@ -4015,7 +5489,7 @@ package body ${ada_lib_name}.Implementation is
       declare
          Root_Scope : Lexical_Env renames Unit.Context.Root_Scope;
          Env        : constant Lexical_Env :=
-            Node.Pre_Env_Actions (Node.Self_Env, Root_Scope, True);
+            Node.Pre_Env_Actions (Node.Get_Self_Env, Root_Scope, True);
       begin
          Node.Post_Env_Actions (Env, Root_Scope);
       end;
@@ -14,8 +14,10 @@
 
 with Ada.Containers;        use Ada.Containers;
 with Ada.Containers.Hashed_Maps;
+with Ada.Finalization;
 with Ada.Strings.Unbounded; use Ada.Strings.Unbounded;
 with Ada.Strings.Unbounded.Hash;
+with Ada.Task_Identification;
 with Ada.Unchecked_Deallocation;
 
 with System;
@@ -383,6 +385,36 @@ private package ${ada_lib_name}.Implementation is
    --  want the convenience of Ada arrays, and you don't care about the small
    --  performance hit of creating an array.
 
+   function Children_Count
+     (Node : access ${root_node_value_type}'Class) return Natural
+      with Inline;
+   --  Return the number of children Node has. Unlike Abstract_Children_Count,
+   --  this is not a dispatching call.
+
+   generic
+      with function Process (Child : ${root_node_type_name}) return Boolean;
+   procedure Iterate_Children (Node : access ${root_node_value_type}'Class);
+   --  Call Process on all the children of Node (including null ones), in
+   --  order, until it returns False.
+   --
+   --  This does a single dispatch on Node's kind to access all its children
+   --  and it allocates nothing, so tree walks should use it rather than
+   --  Children or Child.
+
+   type Node_Kind_Set is array (${root_node_kind_name}) of Boolean with Pack;
+   --  Set of node kinds
+
+   Empty_Node_Kind_Set : constant Node_Kind_Set := (others => False);
+   Full_Node_Kind_Set  : constant Node_Kind_Set := (others => True);
+
+   function May_Have_Descendants_In
+     (Kind : ${root_node_kind_name}; Kinds : Node_Kind_Set) return Boolean
+      with Inline;
+   --  Return whether, according to the grammar, the subtree of a node of the
+   --  given Kind (excluding this node) can contain nodes whose kind belongs to
+   --  Kinds. Searches use this to skip subtrees that cannot contain the nodes
+   --  they look for.
+
    function Parents
      (Node         : access ${root_node_value_type}'Class;
       Include_Self : Boolean := True)
@@ -599,18 +631,22 @@ private package ${ada_lib_name}.Implementation is
       --  node relates to and Token_End_Index is No_Token_Index. Otherwise,
       --  both tokens are inclusive, i.e. they both belong to this node.
 
+      % if T.root_node.stores_self_env:
       Self_Env : Lexical_Env;
       --  Hold the environment this node defines, or the parent environment
       --  otherwise.
+      % endif
 
       Kind : ${root_node_kind_name};
       --  Kind for this node. This must reflect the object tag
 
-      ${astnode_types.node_fields(T.root_node, emit_null=False)}
-
       Last_Attempted_Child : Integer := -1;
       --  0-based index for the last child we tried to parse for this node. -1
       --  if parsing for all children was successful.
+      --
+      --  Keep this next to Kind so that both fit in the same word.
+
+      ${astnode_types.node_fields(T.root_node, emit_null=False)}
    end record;
 
    overriding function Abstract_Kind
@@ -629,6 +665,21 @@ private package ${ada_lib_name}.Implementation is
    overriding function Abstract_Rewritten_Node
      (Node : access ${root_node_value_type}) return ${root_node_type_name};
 
+   function Stores_Self_Env (Kind : ${root_node_kind_name}) return Boolean;
+   --  Return whether nodes of the given kind have a component to store the
+   --  lexical environment they are associated to. When they do not, this
+   --  environment is the one of their parent.
+
+   function Get_Self_Env
+     (Node : access ${root_node_value_type}'Class) return Lexical_Env;
+   --  Return the environment Node defines, or the parent environment
+   --  otherwise.
+
+   procedure Set_Self_Env
+     (Node : access ${root_node_value_type}'Class; Env : Lexical_Env)
+      with Pre => Stores_Self_Env (Node.Kind);
+   --  Set the environment that Get_Self_Env returns for Node
+
    function Pre_Env_Actions
      (Self                : access ${root_node_value_type}'Class;
       Bound_Env, Root_Env : Lexical_Env;
@@ -656,6 +707,39 @@ private package ${ada_lib_name}.Implementation is
      (Node : access ${root_node_value_type}'Class) return Text_Type;
    --  Retun the fragment of text from which Node was parsed
 
+   -------------------
+   -- Serialization --
+   -------------------
+
+   function To_JSON
+     (Node       : access ${root_node_value_type}'Class;
+      With_Slocs : Boolean) return String;
+   --  Return an UTF-8 encoded JSON representation of the subtree rooted at
+   --  Node. Each node is represented as an object with a "kind" entry (its
+   --  kind name) and, if With_Slocs, a "sloc_range" entry (its sloc range
+   --  image). Token nodes also have a "text" entry, list nodes an "items"
+   --  entry (array of children) and other nodes a "fields" entry (object that
+   --  maps field names to children). Null nodes are represented as null.
+
+   function To_Binary
+     (Node       : access ${root_node_value_type}'Class;
+      With_Slocs : Boolean) return String;
+   --  Return a compact binary representation of the subtree rooted at Node.
+   --  This is a sequence of 32-bit little-endian unsigned integers and byte
+   --  strings. The first integer is 1 if slocs are included, 0 otherwise,
+   --  then the root node is encoded as follows:
+   --
+   --  * its kind (the C API kind number, 0 for null nodes, in which case
+   --    nothing else follows).
+   --
+   --  * if With_Slocs, its start line, start column, end line and end column.
+   --
+   --  * for token nodes: the size in bytes of the token text, followed by
+   --    this text encoded in UTF-8.
+   --
+   --  * for other nodes: the number of children, followed by the encoding of
+   --    each child (fields come in declaration order).
+
    ------------------------------
    -- Root AST node properties --
    ------------------------------
@@ -897,6 +981,13 @@ private package ${ada_lib_name}.Implementation is
       "="             => GNATCOLL.VFS."=",
       Hash            => Ada.Strings.Unbounded.Hash);
 
+   package Solver_Statistics_Maps is new Ada.Containers.Hashed_Maps
+     (Key_Type        => Unbounded_String,
+      Element_Type    => Solver_Property_Statistics,
+      Equivalent_Keys => "=",
+      Hash            => Ada.Strings.Unbounded.Hash);
+   --  Logic resolution statistics, indexed by property qualified name
+
    function Normalized_Unit_Filename
      (Context : Internal_Context; Filename : String)
       return GNATCOLL.VFS.Virtual_File;
@@ -925,6 +1016,27 @@ private package ${ada_lib_name}.Implementation is
    procedure Destroy is new Ada.Unchecked_Deallocation
      (Internal_Unit_Provider'Class, Internal_Unit_Provider_Access);
 
+   protected type Evaluation_Lock is
+      entry Seize;
+      --  Wait until no other task holds the lock, then hold it. The task that
+      --  holds the lock can seize it again: it must then release it as many
+      --  times.
+
+      procedure Release;
+      --  Undo one call to Seize. Only the task that holds the lock can call
+      --  this.
+
+   private
+      entry Wait;
+      --  Internal entry to wait until the lock is available
+
+      Holder : Ada.Task_Identification.Task_Id :=
+         Ada.Task_Identification.Null_Task_Id;
+      Depth  : Natural := 0;
+   end Evaluation_Lock;
+   --  Reentrant lock used to serialize property evaluations and reference
+   --  count updates while at least one context is frozen.
+
    type Analysis_Context_Type is limited record
       --  Start of ABI area. In order to perform fast checks from foreign
       --  languages, we maintain minimal ABI for analysis context: this allows
@@ -935,6 +1047,11 @@ private package ${ada_lib_name}.Implementation is
       --  Serial number that is incremented each time this context allocation
       --  is re-used.
 
+      Units_Version : Version_Number := 0;
+      --  Version number that is incremented each time a unit in this context
+      --  is reparsed or unloaded, i.e. each time nodes in this context are
+      --  destroyed.
+
       --  End of ABI area
 
       Ref_Count : Natural;
@@ -988,6 +1105,37 @@ private package ${ada_lib_name}.Implementation is
       --  interrupting the resolution because of timeout. See the
       --  Set_Logic_Resolution_Timeout procedure.
 
+      Logic_Resolution_Strategy : Solving_Strategy;
+      --  Strategy to use for the resolution of logic equations. See the
+      --  Set_Logic_Resolution_Strategy procedure.
+
+      Solver_Stats : Solver_Statistics_Maps.Map;
+      --  Statistics about the logic resolutions done in this context,
+      --  aggregated per property. See the Solver_Statistics function.
+
+      Max_Units : Natural;
+      --  If zero, no limit. Otherwise, maximum number of analysis units that
+      --  can stay loaded in this context before the least recently used ones
+      --  get unloaded. See the Set_Unit_Eviction_Policy procedure.
+
+      Max_Memory : Byte_Count;
+      --  If zero, no limit. Otherwise, maximum estimated memory footprint for
+      --  all the analysis units loaded in this context before the least
+      --  recently used ones get unloaded. See the Set_Unit_Eviction_Policy
+      --  procedure.
+
+      Access_Clock : Version_Number;
+      --  Counter incremented each time an analysis unit is fetched from this
+      --  context. Used to timestamp units for least recently used eviction.
+
+      Eviction_Lock : Natural;
+      --  When non-zero, unit eviction is disabled. This is incremented during
+      --  property evaluation (see Evaluation_Guard) and while running unit
+      --  providers, i.e. while AST nodes from any unit can be on the stack.
+
+      Frozen : Boolean;
+      --  Whether this context is frozen. See the Freeze procedure.
+
       Cache_Version : Natural;
       --  Version number used to invalidate memoization caches in a lazy
       --  fashion. If an analysis unit's version number is strictly inferior to
@@ -1087,6 +1235,27 @@ private package ${ada_lib_name}.Implementation is
 
       Cache_Version : Natural := 0;
       --  See the eponym field in Analysis_Context_Type
+
+      Last_Access : Version_Number := 0;
+      --  Value of Context.Access_Clock the last time this unit was fetched
+
+      Is_Unloaded : Boolean := False;
+      --  Whether this unit was unloaded by unit eviction (see Unload_Unit). In
+      --  this case, it has no tree, no tokens and must be reparsed the next
+      --  time it is fetched.
+
+      Repopulate_After_Reload : Boolean := False;
+      --  Whether Is_Env_Populated was set when this unit was unloaded, i.e.
+      --  whether its lexical environments must be populated again when
+      --  reloading it.
+
+      Node_Count : Natural := 0;
+      --  Number of nodes the parser allocated for the tree of this unit, so
+      --  that Memory_Usage does not have to traverse the tree to count them.
+
+      Pin_Count : Natural := 0;
+      --  Number of pins on this unit (see Pin_Unit). Unit eviction leaves
+      --  pinned units alone.
    end record;
 
    procedure Free is new Ada.Unchecked_Deallocation
@@ -1100,6 +1269,7 @@ private package ${ada_lib_name}.Implementation is
       Diagnostics  : Diagnostics_Vectors.Vector;
       AST_Mem_Pool : Bump_Ptr_Pool;
       AST_Root     : ${root_node_type_name};
+      Node_Count   : Natural;
    end record;
    --  Holder for fields affected by an analysis unit reparse. This makes it
    --  possible to separate the "reparsing" and the "replace" steps.
@@ -1152,6 +1322,18 @@ private package ${ada_lib_name}.Implementation is
       with Pre => not Reparse or else not Has_Rewriting_Handle (Context);
    --  Implementation for Analysis.Get_From_File
 
+   type Internal_Unit_Array is array (Positive range <>) of Internal_Unit;
+
+   function Get_From_Files
+     (Context   : Internal_Context;
+      Filenames : Filename_Array;
+      Charset   : String;
+      Reparse   : Boolean;
+      Rule      : Grammar_Rule;
+      Workers   : Positive) return Internal_Unit_Array
+      with Pre => not Reparse or else not Has_Rewriting_Handle (Context);
+   --  Implementation for Analysis.Get_From_Files
+
    function Get_From_Buffer
      (Context  : Internal_Context;
       Filename : String;
@@ -1200,6 +1382,75 @@ private package ${ada_lib_name}.Implementation is
      (Context : Internal_Context; Timeout : Natural);
    --  Implementation for Analysis.Set_Logic_Resolution_Timeout
 
+   procedure Set_Logic_Resolution_Strategy
+     (Context : Internal_Context; Strategy : Solving_Strategy);
+   --  Implementation for Analysis.Set_Logic_Resolution_Strategy
+
+   function Solver_Statistics
+     (Context : Internal_Context) return Solver_Statistics_Array;
+   --  Implementation for Analysis.Solver_Statistics
+
+   procedure Reset_Solver_Statistics (Context : Internal_Context);
+   --  Implementation for Analysis.Reset_Solver_Statistics
+
+   procedure Set_Unit_Eviction_Policy
+     (Context    : Internal_Context;
+      Max_Units  : Natural;
+      Max_Memory : Byte_Count);
+   --  Implementation for Analysis.Set_Unit_Eviction_Policy
+
+   procedure Evict_Units
+     (Context : Internal_Context;
+      Keep    : Internal_Unit_Array := (1 .. 0 => No_Analysis_Unit));
+   --  Implementation for Analysis.Evict_Units. Keep designates units that
+   --  must not be evicted, if any.
+
+   procedure Pin_Unit (Unit : Internal_Unit);
+   --  Add a pin on Unit, preventing unit eviction from unloading it. Language
+   --  bindings use this while they hold references to Unit's nodes.
+
+   procedure Unpin_Unit (Unit : Internal_Unit)
+      with Pre => Unit.Pin_Count > 0;
+   --  Remove a pin that Pin_Unit added on Unit
+
+   procedure Freeze (Context : Internal_Context)
+      with Pre => not Has_Rewriting_Handle (Context);
+   --  Implementation for Analysis.Freeze
+
+   procedure Unfreeze (Context : Internal_Context);
+   --  Implementation for Analysis.Unfreeze
+
+   function Is_Frozen (Context : Internal_Context) return Boolean;
+   --  Implementation for Analysis.Is_Frozen
+
+   type Evaluation_Guard (Context : Internal_Context) is
+      new Ada.Finalization.Limited_Controlled with
+   record
+      Locked : Boolean := False;
+      --  Whether this guard holds the evaluation lock
+
+      Eviction_Locked : Boolean := False;
+      --  Whether this guard incremented Context.Eviction_Lock
+   end record;
+   --  Public APIs declare an object of this type for the duration of each
+   --  property evaluation: if Context is frozen, this holds the evaluation
+   --  lock from the object initialization to its finalization. Otherwise,
+   --  this prevents unit eviction (see Evict_Units) during the evaluation, as
+   --  properties may load units while holding references to nodes.
+   --
+   --  Reference counts are not atomic and property evaluations update them,
+   --  so public APIs that update the reference count of values that
+   --  properties may return (arrays, structures, big integers) also declare
+   --  an object of this type, with a null Context: it then holds the
+   --  evaluation lock as long as any context is frozen.
+
+   overriding procedure Initialize (Self : in out Evaluation_Guard);
+   overriding procedure Finalize (Self : in out Evaluation_Guard);
+
+   function Memory_Usage
+     (Context : Internal_Context) return Memory_Usage_Breakdown;
+   --  Implementation for Analysis.Memory_Usage
+
    function Has_Rewriting_Handle (Context : Internal_Context) return Boolean;
    --  Implementation for Analysis.Has_Rewriting_Handle
 
@@ -1282,6 +1533,9 @@ private package ${ada_lib_name}.Implementation is
    procedure PP_Trivia (Unit : Internal_Unit);
    --  Implementation for Analysis.PP_Trivia
 
+   function Memory_Usage (Unit : Internal_Unit) return Memory_Usage_Breakdown;
+   --  Implementation for Analysis.Memory_Usage
+
    procedure Destroy (Unit : in out Internal_Unit);
    --  TODO???
 
@@ -1322,11 +1576,31 @@ private package ${ada_lib_name}.Implementation is
    --  Parse text for Unit using Input and store the result in Result. This
    --  leaves Unit unchanged.
 
+   procedure Do_Parsing
+     (Unit    : Internal_Unit;
+      Input   : Internal_Lexer_Input;
+      Result  : out Reparsed_Unit;
+      Parser  : in out Parser_Type;
+      Symbols : Symbol_Table);
+   --  Likewise, but use Parser instead of the parser of Unit's context and
+   --  create token symbols in Symbols. This only reads Unit's context, so
+   --  several tasks can run it at the same time for different units, as long
+   --  as each one uses its own parser and its own table extending the
+   --  context's symbol table (see Langkit_Support.Symbols).
+
    procedure Update_After_Reparse
      (Unit : Internal_Unit; Reparsed : in out Reparsed_Unit);
    --  Update Unit's AST from Reparsed and update stale lexical environment
    --  data after the reparsing of Unit.
 
+   procedure Unload_Unit (Unit : Internal_Unit)
+      with Pre => Unit.Rebindings.Length = 0
+                  and then Unit.Foreign_Nodes.Length = 0;
+   --  Free Unit's tree, token data and caches, and remove its contributions
+   --  to other units' lexical environments. Unit stays registered in its
+   --  context, and Get_Unit will reparse it (and re-populate its lexical
+   --  environments if needed) the next time it is fetched.
+
    procedure Destroy_Unit_Destroyables (Unit : Internal_Unit);
    --  Destroy all destroyables objects in Unit and clear this list in Unit
 
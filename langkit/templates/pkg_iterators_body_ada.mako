@@ -23,6 +23,26 @@ package body ${ada_lib_name}.Iterators is
    function To_Array
      (Predicates : Predicate_Vectors.Vector) return ${pred_ref}_Array;
 
+   function Create_Kind_Predicate (Kinds : Kind_Set) return ${pred_ref};
+   --  Return a predicate that accepts only nodes whose kind is in ``Kinds``
+
+   function Is_Kind_Predicate (Predicate : ${pred_ref}) return Boolean
+   is (Predicate.Unchecked_Get.all in Kind_Predicate'Class);
+   --  Return whether ``Predicate`` is a kind predicate
+
+   function Kinds_Of (Predicate : ${pred_ref}) return Kind_Set
+   is (Kind_Predicate (Predicate.Unchecked_Get.all).Kinds);
+   --  Assuming that ``Predicate`` is a kind predicate, return the set of
+   --  kinds it accepts.
+
+   procedure Get_Kind_Filter
+     (Predicate  : ${pred_ref};
+      Kinds      : out Kind_Set;
+      Kinds_Only : out Boolean);
+   --  Compute the set of kinds for nodes that can satisfy ``Predicate``. Set
+   --  ``Kinds_Only`` to whether ``Predicate`` accepts exactly the nodes whose
+   --  kind belongs to this set.
+
    --------------
    -- To_Array --
    --------------
@@ -38,6 +58,44 @@ package body ${ada_lib_name}.Iterators is
       end return;
    end To_Array;
 
+   ---------------------------
+   -- Create_Kind_Predicate --
+   ---------------------------
+
+   function Create_Kind_Predicate (Kinds : Kind_Set) return ${pred_ref} is
+   begin
+      return Result : ${pred_ref} do
+         Result.Set (Kind_Predicate'(${pred_iface} with Kinds => Kinds));
+      end return;
+   end Create_Kind_Predicate;
+
+   ---------------------
+   -- Get_Kind_Filter --
+   ---------------------
+
+   procedure Get_Kind_Filter
+     (Predicate  : ${pred_ref};
+      Kinds      : out Kind_Set;
+      Kinds_Only : out Boolean)
+   is
+      P : ${pred_iface}'Class renames Predicate.Unchecked_Get.all;
+   begin
+      Kinds := Full_Kind_Set;
+      Kinds_Only := False;
+
+      if P in Kind_Predicate'Class then
+         Kinds := Kind_Predicate (P).Kinds;
+         Kinds_Only := True;
+
+      elsif P in For_All_Predicate'Class then
+         for Sub_P of For_All_Predicate (P).Predicates loop
+            if Is_Kind_Predicate (Sub_P) then
+               Kinds := Kinds and Kinds_Of (Sub_P);
+            end if;
+         end loop;
+      end if;
+   end Get_Kind_Filter;
+
    --------------
    -- Traverse --
    --------------
@@ -55,6 +113,10 @@ package body ${ada_lib_name}.Iterators is
 
    function "not" (Predicate : ${pred_ref}) return ${pred_ref} is
    begin
+      if Is_Kind_Predicate (Predicate) then
+         return Create_Kind_Predicate (not Kinds_Of (Predicate));
+      end if;
+
       return Result : ${pred_ref} do
          Result.Set
            (Not_Predicate'(${pred_iface} with Predicate => Predicate));
@@ -84,7 +146,31 @@ package body ${ada_lib_name}.Iterators is
    -------------
 
    function For_All (Predicates : ${pred_ref}_Array) return ${pred_ref} is
-      Preds : Predicate_Vectors.Vector;
+      Preds      : Predicate_Vectors.Vector;
+      Kinds      : Kind_Set := Full_Kind_Set;
+      Kind_Index : Natural := 0;
+      --  Index in Preds of the predicate that stands for all kind predicates,
+      --  or 0 if we have not found any kind predicate yet.
+
+      procedure Append (P : ${pred_ref});
+      --  Append P to Preds, merging kind predicates together
+
+      ------------
+      -- Append --
+      ------------
+
+      procedure Append (P : ${pred_ref}) is
+      begin
+         if Is_Kind_Predicate (P) then
+            Kinds := Kinds and Kinds_Of (P);
+            if Kind_Index /= 0 then
+               return;
+            end if;
+            Kind_Index := Natural (Preds.Length) + 1;
+         end if;
+         Preds.Append (P);
+      end Append;
+
    begin
       --  Flatten sub-predicates that are themselves For_All predicates in
       --  Predicates.
@@ -92,13 +178,22 @@ package body ${ada_lib_name}.Iterators is
          if P.Unchecked_Get.all in For_All_Predicate'Class then
             for Sub_P of For_All_Predicate (P.Unchecked_Get.all).Predicates
             loop
-               Preds.Append (Sub_P);
+               Append (Sub_P);
             end loop;
          else
-            Preds.Append (P);
+            Append (P);
          end if;
       end loop;
 
+      --  Replace kind predicates with a single one that checks the resulting
+      --  set of kinds.
+      if Kind_Index /= 0 then
+         if Preds.Length = 1 then
+            return Create_Kind_Predicate (Kinds);
+         end if;
+         Preds.Replace_Element (Kind_Index, Create_Kind_Predicate (Kinds));
+      end if;
+
       return Result : ${pred_ref} do
          Result.Set (For_All_Predicate'
            (${pred_iface} with
@@ -112,7 +207,31 @@ package body ${ada_lib_name}.Iterators is
    --------------
 
    function For_Some (Predicates : ${pred_ref}_Array) return ${pred_ref} is
-      Preds : Predicate_Vectors.Vector;
+      Preds      : Predicate_Vectors.Vector;
+      Kinds      : Kind_Set := Empty_Kind_Set;
+      Kind_Index : Natural := 0;
+      --  Index in Preds of the predicate that stands for all kind predicates,
+      --  or 0 if we have not found any kind predicate yet.
+
+      procedure Append (P : ${pred_ref});
+      --  Append P to Preds, merging kind predicates together
+
+      ------------
+      -- Append --
+      ------------
+
+      procedure Append (P : ${pred_ref}) is
+      begin
+         if Is_Kind_Predicate (P) then
+            Kinds := Kinds or Kinds_Of (P);
+            if Kind_Index /= 0 then
+               return;
+            end if;
+            Kind_Index := Natural (Preds.Length) + 1;
+         end if;
+         Preds.Append (P);
+      end Append;
+
    begin
       --  Flatten sub-predicates that are themselves For_Some predicates in
       --  Predicates.
@@ -120,13 +239,22 @@ package body ${ada_lib_name}.Iterators is
          if P.Unchecked_Get.all in For_Some_Predicate'Class then
             for Sub_P of For_Some_Predicate (P.Unchecked_Get.all).Predicates
             loop
-               Preds.Append (Sub_P);
+               Append (Sub_P);
             end loop;
          else
-            Preds.Append (P);
+            Append (P);
          end if;
       end loop;
 
+      --  Replace kind predicates with a single one that checks the resulting
+      --  set of kinds.
+      if Kind_Index /= 0 then
+         if Preds.Length = 1 then
+            return Create_Kind_Predicate (Kinds);
+         end if;
+         Preds.Replace_Element (Kind_Index, Create_Kind_Predicate (Kinds));
+      end if;
+
       return Result : ${pred_ref} do
          Result.Set (For_Some_Predicate'
            (${pred_iface} with
@@ -192,10 +320,10 @@ package body ${ada_lib_name}.Iterators is
    -------------
 
    function Kind_Is (Kind : ${root_node_kind_name}) return ${pred_ref} is
+      Kinds : Kind_Set := Empty_Kind_Set;
    begin
-      return Result : ${pred_ref} do
-         Result.Set (Kind_Predicate'(${pred_iface} with Kind => Kind));
-      end return;
+      Kinds (Kind) := True;
+      return Create_Kind_Predicate (Kinds);
    end Kind_Is;
 
    -------------
@@ -226,18 +354,30 @@ package body ${ada_lib_name}.Iterators is
    ----------
 
    function Next
-     (It : in out Find_Iterator; Element : out ${node}) return Boolean
-   is
-      Parent : Traverse_Iterator := Traverse_Iterator (It);
+     (It : in out Find_Iterator; Element : out ${node}) return Boolean is
    begin
-      while Next (Parent, Element) loop
-         if It.Predicate.Unchecked_Get.Evaluate (Element) then
+      --  Use a view conversion (not a copy) so that the traversal dispatches
+      --  to our Skip_Children override.
+
+      while Next (Traverse_Iterator (It), Element) loop
+         if It.Kinds (Kind (Element))
+            and then (It.Kinds_Only
+                      or else It.Predicate.Unchecked_Get.Evaluate (Element))
+         then
             return True;
          end if;
       end loop;
       return False;
    end Next;
 
+   -------------------
+   -- Skip_Children --
+   -------------------
+
+   overriding function Skip_Children
+     (It : Find_Iterator; Node : ${node}) return Boolean
+   is (not Implementation.May_Have_Descendants_In (Kind (Node), It.Kinds));
+
    ----------
    -- Next --
    ----------
@@ -309,6 +449,7 @@ package body ${ada_lib_name}.Iterators is
          --  unsafe. TODO: We might be able to make a safe version of this
          --  using generics. Still would be more verbose though.
          Ret.Predicate := ${pred_ref} (Predicate);
+         Get_Kind_Filter (Ret.Predicate, Ret.Kinds, Ret.Kinds_Only);
       end return;
    end Find;
 
@@ -481,7 +622,7 @@ package body ${ada_lib_name}.Iterators is
    overriding function Evaluate
      (P : in out Kind_Predicate; N : ${node}) return Boolean is
    begin
-      return Kind (N) = P.Kind;
+      return P.Kinds (Kind (N));
    end Evaluate;
 
    --------------
@@ -10,6 +10,7 @@ private with Langkit_Support.Tree_Traversal_Iterator;
 
 with ${ada_lib_name}.Analysis;      use ${ada_lib_name}.Analysis;
 with ${ada_lib_name}.Common;        use ${ada_lib_name}.Common;
+private with ${ada_lib_name}.Implementation;
 with ${ada_lib_name}.Introspection; use ${ada_lib_name}.Introspection;
 
 ${exts.with_clauses(with_clauses)}
@@ -220,15 +221,34 @@ private
    type Traverse_Iterator is
       new Traversal_Iterators.Traverse_Iterator with null record;
 
+   subtype Kind_Set is Implementation.Node_Kind_Set;
+   --  Set of node kinds
+
+   use type Kind_Set;
+
+   Empty_Kind_Set : Kind_Set renames Implementation.Empty_Node_Kind_Set;
+   Full_Kind_Set  : Kind_Set renames Implementation.Full_Node_Kind_Set;
+
    type Find_Iterator is new Traverse_Iterator with record
       Predicate : ${pred_ref};
       --  Predicate used to filter the nodes Traverse_It yields
+
+      Kinds : Kind_Set;
+      --  Set of kinds for nodes that can satisfy Predicate. The iterator does
+      --  not go through subtrees that cannot contain such nodes.
+
+      Kinds_Only : Boolean;
+      --  Whether Predicate accepts exactly the nodes whose kind is in Kinds,
+      --  in which case there is no need to evaluate it.
    end record;
    --  Iterator type for the ``Find`` function
 
    overriding function Next
      (It : in out Find_Iterator; Element : out ${node}) return Boolean;
 
+   overriding function Skip_Children
+     (It : Find_Iterator; Node : ${node}) return Boolean;
+
    type Local_Find_Iterator is new Traverse_Iterator with record
       Predicate : access function (N : ${node}) return Boolean;
       --  Predicate used to filter the nodes Traverse_It yields
@@ -291,9 +311,14 @@ private
      (P : in out Child_With_Predicate; N : ${node}) return Boolean;
 
    type Kind_Predicate is new ${pred_iface} with record
-      Kind : ${root_node_kind_name};
+      Kinds : Kind_Set;
    end record;
-   --  Predicate that returns true for all nodes of some kind
+   --  Predicate that returns true for all nodes whose kind is in Kinds.
+   --
+   --  Kind-based predicates combined with "not", "and", "or", ``For_All`` or
+   --  ``For_Some`` are folded into a single predicate of this type, so that
+   --  evaluating them is just a lookup in a bitset. ``Find`` also uses the
+   --  set of kinds to skip subtrees that cannot contain matching nodes.
 
    overriding function Evaluate
      (P : in out Kind_Predicate; N : ${node}) return Boolean;
@@ -9,9 +9,44 @@
 
    with_symbol_actions = token_actions('WithSymbol')
    with_trivia_actions = token_actions('WithTrivia')
+
+   native = ctx.lexer_backend == 'native'
+
+   if native:
+      dfa = lexer.dfa
+      ignored_rules = [str(i) for i, rule in enumerate(dfa.rules, 1)
+                       if dfa.rule_kind(rule) == 'ignore']
+      trivia_tokens = sorted(t.ada_name for t in lexer.tokens if t.is_trivia)
+
+   def aggregate(items, indent):
+      """
+      Format the given aggregate items, wrapping lines so that they fit in
+      79 columns once the aggregate is closed. Items are never split.
+      """
+      lines = ['']
+      for item in items:
+         item = str(item)
+         if lines[-1] and indent + len(lines[-1]) + len(item) + 2 > 77:
+            lines[-1] += ','
+            lines.append(item)
+         else:
+            lines[-1] += (', ' if lines[-1] else '') + item
+      return ('\n' + ' ' * indent).join(lines)
+
+   def transitions_row(state):
+      prefix = '{} => ('.format(state)
+      items = []
+      for cls, target in enumerate(dfa.table[state]):
+         if target:
+            items.append('{} => {}'.format(cls, target))
+      items.append('others => 0')
+      return '{}{})'.format(prefix, aggregate(items, 6 + len(prefix)))
 %>
 
 with Ada.Unchecked_Conversion;
+% if native:
+with Ada.Unchecked_Deallocation;
+% endif
 
 with Interfaces;   use Interfaces;
 with Interfaces.C; use Interfaces.C;
@@ -54,8 +89,6 @@ package body ${ada_lib_name}.Lexer_Implementation is
       with Convention => C;
    type Interface_Token_Access is access all Quex_Token_Type;
 
-   type Lexer_Type is new System.Address;
-
    procedure Decode_Buffer
      (Buffer, Charset : String;
       Read_BOM        : Boolean;
@@ -97,6 +130,269 @@ package body ${ada_lib_name}.Lexer_Implementation is
       Diagnostics     : in out Diagnostics_Vectors.Vector);
    --  Helper for the Extract_Token procedure
 
+% if native:
+   --  The native lexer backend scans decoded source buffers with a table
+   --  driven DFA, compiled from the lexer rules at code generation time. Code
+   --  points are first mapped to character classes, then the automaton moves
+   --  from states to states for each character class until it reaches the
+   --  dead state. The longest match wins, and when several rules match the
+   --  same text, the first one wins.
+
+   type DFA_State is range 0 .. ${dfa.states_count};
+   --  State in the lexer automaton. 0 is the dead state and 1 is the start
+   --  state.
+
+   type Char_Class is range 0 .. ${dfa.classes_count - 1};
+   --  Class of characters that trigger the same transitions. Characters in
+   --  class 0 always lead to the dead state.
+
+   type Rule_Index is range 0 .. ${len(dfa.rules)};
+   --  Index of a lexer rule, or 0 if no rule matches
+
+   Transitions : constant array (DFA_State range 1 .. DFA_State'Last,
+                                 Char_Class) of DFA_State :=
+     (${',\n      '.join(transitions_row(s)
+                           for s in range(1, dfa.states_count + 1))});
+   --  For each state and character class, state to go to
+
+   Accepting : constant array (DFA_State) of Rule_Index :=
+     (${aggregate(dfa.accepting, 6)});
+   --  For each state, rule that accepts the characters scanned so far, or 0
+   --  if the state is not an accepting one.
+
+   Latin_1_Classes : constant array (0 .. 255) of Char_Class :=
+     (${aggregate(dfa.latin_1_classes, 6)});
+   --  Character class for the first 256 code points
+
+   type Char_Class_Range is record
+      First, Last : Natural;
+      Class       : Char_Class;
+   end record;
+   type Char_Class_Range_Array is
+      array (Positive range <>) of Char_Class_Range;
+
+   High_Classes : constant Char_Class_Range_Array
+   % if dfa.high_char_ranges:
+     := (${aggregate(['{} => (16#{:X}#, 16#{:X}#, {})'.format(i, first, last,
+                                                              cls)
+                      for i, (first, last, cls)
+                      in enumerate(dfa.high_char_ranges, 1)], 9)});
+   % else:
+     (1 .. 0) := (others => (0, 0, 0));
+   % endif
+   --  Sorted ranges of code points beyond the first 256 ones, with their
+   --  character class. Code points that are not in these ranges belong to
+   --  class 0.
+
+   type Lexer_State is record
+      Buffer : Text_Access;
+      --  Decoded buffer to scan
+
+      First : Positive;
+      --  Index in Buffer of the first character to scan
+
+      Last : Natural;
+      --  Index in Buffer of the last character to scan
+
+      Next : Positive;
+      --  Index in Buffer of the first character of the next token
+
+      Prev_Id : Token_Kind;
+      --  Kind of the previous token (excluding trivia)
+   end record;
+   type Lexer_Type is access Lexer_State;
+
+   function Get_Char_Class (C : Wide_Wide_Character) return Char_Class
+      with Inline;
+   --  Return the character class for C
+
+   function Lexer_From_Buffer
+     (Buffer : Text_Access;
+      First  : Positive;
+      Last   : Natural) return Lexer_Type;
+   --  Create a lexer to scan Buffer (First .. Last)
+
+   procedure Free_Lexer (Lexer : in out Lexer_Type);
+   --  Free resources allocated for Lexer
+
+   function Next_Token
+     (Lexer : Lexer_Type; Token : Interface_Token_Access) return int
+      with Inline;
+   --  Scan the next token in Lexer and store it in Token. Return 0 once the
+   --  end of the input buffer is reached (Token is then the termination
+   --  token), 1 otherwise.
+
+   --------------------
+   -- Get_Char_Class --
+   --------------------
+
+   function Get_Char_Class (C : Wide_Wide_Character) return Char_Class is
+      Code        : constant Natural := Wide_Wide_Character'Pos (C);
+      First, Last : Natural;
+      Middle      : Positive;
+   begin
+      if Code < Latin_1_Classes'Length then
+         return Latin_1_Classes (Code);
+      end if;
+
+      --  Look for the range that contains Code with a binary search
+
+      First := High_Classes'First;
+      Last := High_Classes'Last;
+      while First <= Last loop
+         Middle := (First + Last) / 2;
+         declare
+            R : Char_Class_Range renames High_Classes (Middle);
+         begin
+            if Code < R.First then
+               Last := Middle - 1;
+            elsif Code > R.Last then
+               First := Middle + 1;
+            else
+               return R.Class;
+            end if;
+         end;
+      end loop;
+      return 0;
+   end Get_Char_Class;
+
+   -----------------------
+   -- Lexer_From_Buffer --
+   -----------------------
+
+   function Lexer_From_Buffer
+     (Buffer : Text_Access;
+      First  : Positive;
+      Last   : Natural) return Lexer_Type is
+   begin
+      return new Lexer_State'(Buffer  => Buffer,
+                              First   => First,
+                              Last    => Last,
+                              Next    => First,
+                              Prev_Id => ${termination});
+   end Lexer_From_Buffer;
+
+   ----------------
+   -- Free_Lexer --
+   ----------------
+
+   procedure Free_Lexer (Lexer : in out Lexer_Type) is
+      procedure Destroy is new Ada.Unchecked_Deallocation
+        (Lexer_State, Lexer_Type);
+   begin
+      Destroy (Lexer);
+   end Free_Lexer;
+
+   ----------------
+   -- Next_Token --
+   ----------------
+
+   function Next_Token
+     (Lexer : Lexer_Type; Token : Interface_Token_Access) return int
+   is
+      Buffer : Text_Type renames Lexer.Buffer.all;
+      First  : Positive;
+      Last   : Natural;
+      State  : DFA_State;
+      Rule   : Rule_Index;
+      Kind   : Token_Kind;
+   begin
+      loop
+         First := Lexer.Next;
+
+         if First > Lexer.Last then
+            --  Make the termination token start right after the input
+            --  buffer and have an empty text.
+
+            Token.all := (Id          => Token_Kind'Pos (${termination}),
+                          Text        => System.Null_Address,
+                          Text_Length => 0,
+                          Offset      =>
+                             Unsigned_32 (Lexer.Last + 2 - Lexer.First));
+            return 0;
+         end if;
+
+         --  Look for the longest match: run the automaton until it reaches
+         --  the dead state, and remember the last accepting state we went
+         --  through.
+
+         State := 1;
+         Rule := 0;
+         Last := First - 1;
+         for I in First .. Lexer.Last loop
+            State := Transitions (State, Get_Char_Class (Buffer (I)));
+            exit when State = 0;
+            if Accepting (State) /= 0 then
+               Rule := Accepting (State);
+               Last := I;
+            end if;
+         end loop;
+
+         Lexer.Next := Last + 1;
+         % if ignored_rules:
+         exit when Rule not in ${' | '.join(ignored_rules)};
+         % else:
+         exit;
+         % endif
+      end loop;
+
+      case Rule is
+         when 0 =>
+            --  No rule matches: skip one character
+
+            Kind := ${lexer.LexingFailure.ada_name};
+            Last := First;
+
+      % for i, rule in enumerate(dfa.rules, 1):
+         % if dfa.rule_kind(rule) == 'token':
+         when ${i} =>
+            Kind := ${rule.action.ada_name};
+
+         % elif dfa.rule_kind(rule) == 'case':
+         when ${i} =>
+            case Lexer.Prev_Id is
+            % for alt in list(rule.action.alts) + [rule.action.default_alt]:
+               % if alt.prev_token_cond is None:
+               when others =>
+               % else:
+               when ${' | '.join(t.ada_name for t in alt.prev_token_cond)} =>
+               % endif
+                  Kind := ${alt.send.ada_name};
+                  % if rule.action.max_match_len > alt.match_size:
+                  Last := Last - ${rule.action.max_match_len - alt.match_size};
+                  % endif
+            % endfor
+            end case;
+
+         % endif
+      % endfor
+      % if ignored_rules:
+         when others =>
+            --  Ignored rules are handled in the loop above
+
+            raise Program_Error;
+      % endif
+      end case;
+
+      Lexer.Next := Last + 1;
+      % if trivia_tokens:
+      if Kind not in ${' | '.join(trivia_tokens)} then
+         Lexer.Prev_Id := Kind;
+      end if;
+      % else:
+      Lexer.Prev_Id := Kind;
+      % endif
+
+      Token.all := (Id          => Token_Kind'Pos (Kind),
+                    Text        => Buffer (First)'Address,
+                    Text_Length => size_t (Last - First + 1),
+                    Offset      => Unsigned_32 (First - Lexer.First + 1));
+      return 1;
+   end Next_Token;
+
+% else:
+   type Lexer_Type is new System.Address;
+
    function Lexer_From_Buffer (Buffer  : System.Address;
                                Length  : size_t)
                                return Lexer_Type
@@ -115,6 +411,7 @@ package body ${ada_lib_name}.Lexer_Implementation is
            Convention    => C,
            External_Name => "${capi.get_name("next_token")}";
 
+% endif
    generic
       With_Trivia : Boolean;
    procedure Process_All_Tokens
@@ -501,8 +798,12 @@ package body ${ada_lib_name}.Lexer_Implementation is
       Diagnostics    : in out Diagnostics_Vectors.Vector)
    is
       Lexer : Lexer_Type := Lexer_From_Buffer
+      % if native:
+        (Decoded_Buffer, Source_First, Source_Last);
+      % else:
         (Decoded_Buffer.all'Address,
          size_t (Source_Last - Source_First + 1));
+      % endif
    begin
 
       --  In the case we are reparsing an analysis unit, we want to get rid of
@@ -77,6 +77,11 @@ package body ${ada_lib_name}.Rewriting is
    --  Free all resources tied to Handle. This also releases the rewriting
    --  handle singleton in Handle's Context.
 
+   procedure Mark_Modified (Handle : Node_Rewriting_Handle)
+      with Pre => Handle /= No_Node_Rewriting_Handle;
+   --  Record that the node represented by Handle was modified. If it belongs
+   --  to the tree of some unit, that unit will need to be reparsed in Apply.
+
    procedure Tie
      (Handle, Parent : Node_Rewriting_Handle;
       Unit           : Unit_Rewriting_Handle)
@@ -144,8 +149,14 @@ package body ${ada_lib_name}.Rewriting is
       Result : Apply_Result := (Success => True);
 
    begin
-      --  Try to reparse all units that were potentially modified
+      --  Try to reparse all units that were modified. Getting a handle for a
+      --  unit or expanding its nodes does not change its tree, so there is no
+      --  need to reparse the other ones.
       for Unit_Handle of Handle.Units loop
+         if not Unit_Handle.Modified then
+            goto Continue;
+         end if;
+
          declare
             PU    : constant Processed_Unit := new Processed_Unit_Record'
               (Unit     => Unwrap_Unit (Unit_Handle.Unit),
@@ -179,6 +190,8 @@ package body ${ada_lib_name}.Rewriting is
                exit;
             end if;
          end;
+
+         <<Continue>>
       end loop;
 
       --  If all reparsing went fine, actually replace the AST nodes all over
@@ -237,7 +250,8 @@ package body ${ada_lib_name}.Rewriting is
             new Unit_Rewriting_Handle_Type'(Context_Handle => Context_Handle,
                                             Unit           => Unit,
                                             Root           => <>,
-                                            Nodes          => <>);
+                                            Nodes          => <>,
+                                            Modified       => False);
       begin
          Context_Handle.Units.Insert (Filename, Result);
          Result.Root := Handle (Root (Unit));
@@ -460,6 +474,21 @@ package body ${ada_lib_name}.Rewriting is
       Set_Rewriting_Handle (Unwrap_Context (Ctx), Convert (Handle));
    end Free_Handles;
 
+   -------------------
+   -- Mark_Modified --
+   -------------------
+
+   procedure Mark_Modified (Handle : Node_Rewriting_Handle) is
+      Root : Node_Rewriting_Handle := Handle;
+   begin
+      while Root.Parent /= No_Node_Rewriting_Handle loop
+         Root := Root.Parent;
+      end loop;
+      if Root.Root_Of /= No_Unit_Rewriting_Handle then
+         Root.Root_Of.Modified := True;
+      end if;
+   end Mark_Modified;
+
    ---------
    -- Tie --
    ---------
@@ -653,6 +682,8 @@ package body ${ada_lib_name}.Rewriting is
          Child_Slot : Node_Rewriting_Handle renames
             Handle.Children.Vector.Reference (Index);
       begin
+         Mark_Modified (Handle);
+
          --  Untie the child to be replaced if it exists
          Untie (Child_Slot);
 
@@ -687,6 +718,7 @@ package body ${ada_lib_name}.Rewriting is
    begin
       --  Make sure Handle is expanded so we have a Text field to override
       Expand_Children (Handle);
+      Mark_Modified (Handle);
 
       Handle.Children.Text := To_Unbounded_Wide_Wide_String (Text);
    end Set_Text;
@@ -699,6 +731,7 @@ package body ${ada_lib_name}.Rewriting is
      (Handle : Unit_Rewriting_Handle;
       Root   : Node_Rewriting_Handle) is
    begin
+      Handle.Modified := True;
       Untie (Handle.Root);
       Handle.Root := Root;
       Tie (Root, No_Node_Rewriting_Handle, Handle);
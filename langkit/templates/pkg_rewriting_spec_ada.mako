@@ -58,7 +58,8 @@ package ${ada_lib_name}.Rewriting is
 
    function Start_Rewriting
      (Context : Analysis_Context) return Rewriting_Handle
-     with Pre  => Handle (Context) = No_Rewriting_Handle,
+     with Pre  => Handle (Context) = No_Rewriting_Handle
+                  and then not Is_Frozen (Context),
           Post => Handle (Context) /= No_Rewriting_Handle
                   and then Has_With_Trivia (Context)
                   and then Start_Rewriting'Result = Handle (Context)
@@ -102,6 +103,9 @@ package ${ada_lib_name}.Rewriting is
    --  close Handle and return (Success => True). Otherwise, reparsing did not
    --  work, so keep Handle and its Context unchanged and return details about
    --  the error that happened.
+   --
+   --  Only units whose tree was actually modified are reparsed: the others
+   --  are left untouched, so references to their nodes stay valid.
 
    function Unit_Handles
      (Handle : Rewriting_Handle) return Unit_Rewriting_Handle_Array
@@ -426,6 +430,10 @@ private
       Nodes : Node_Maps.Map;
       --  Keep track of rewriting handles we create for base AST nodes that
       --  Unit owns.
+
+      Modified : Boolean;
+      --  Whether the tree of this unit was modified. Apply skips units for
+      --  which this is false.
    end record;
 
    package Node_Vectors is new Ada.Containers.Vectors
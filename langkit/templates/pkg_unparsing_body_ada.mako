@@ -23,4 +23,86 @@ package body ${ada_lib_name}.Unparsing is
          As_Unit             => False);
    end Unparse;
 
+   -------------
+   -- Unparse --
+   -------------
+
+   procedure Unparse
+     (Node   : ${root_entity.api_name}'Class;
+      Output : in out Unparsing_Output)
+   is
+      N : constant ${root_node_type_name} := Unwrap_Node (Node);
+   begin
+      Unparse
+        (${ada_lib_name}.Implementation.Abstract_Node (N),
+         N.Unit,
+         Preserve_Formatting => False,
+         As_Unit             => False,
+         Output              => Output.Data'Unchecked_Access);
+   end Unparse;
+
+   -------------
+   -- Unparse --
+   -------------
+
+   procedure Unparse
+     (Node : ${root_entity.api_name}'Class;
+      File : GNAT.OS_Lib.File_Descriptor)
+   is
+      N      : constant ${root_node_type_name} := Unwrap_Node (Node);
+      Output : aliased UTF8_Output;
+   begin
+      Output.File := File;
+      Unparse
+        (${ada_lib_name}.Implementation.Abstract_Node (N),
+         N.Unit,
+         Preserve_Formatting => False,
+         As_Unit             => False,
+         Output              => Output'Unchecked_Access);
+      Destroy (Output);
+   exception
+      when others =>
+         Destroy (Output);
+         raise;
+   end Unparse;
+
+   -----------
+   -- Clear --
+   -----------
+
+   procedure Clear (Output : in out Unparsing_Output) is
+   begin
+      Clear (Output.Data);
+   end Clear;
+
+   ------------
+   -- Length --
+   ------------
+
+   function Length (Output : Unparsing_Output) return Natural is
+   begin
+      return Output.Data.Last;
+   end Length;
+
+   -------------
+   -- Content --
+   -------------
+
+   function Content (Output : Unparsing_Output) return String is
+   begin
+      if Output.Data.Bytes = null then
+         return "";
+      end if;
+      return Output.Data.Bytes (1 .. Output.Data.Last);
+   end Content;
+
+   --------------
+   -- Finalize --
+   --------------
+
+   overriding procedure Finalize (Output : in out Unparsing_Output) is
+   begin
+      Destroy (Output.Data);
+   end Finalize;
+
 end ${ada_lib_name}.Unparsing;
@@ -5,6 +5,8 @@
 <% concrete_astnodes = [astnode for astnode in ctx.astnode_types
                         if not astnode.abstract] %>
 
+with Ada.IO_Exceptions;
+
 pragma Warnings (Off, "internal");
 with Ada.Strings.Wide_Wide_Unbounded.Aux;
 pragma Warnings (On, "internal");
@@ -103,6 +105,15 @@ package body ${ada_lib_name}.Unparsing_Implementation is
    --  Update Sloc as if it represented a cursor that move right-wards after
    --  inserting Char to a buffer.
 
+   procedure Unparse_To_Buffer
+     (Node                : access Abstract_Node_Type'Class;
+      Unit                : Internal_Unit;
+      Preserve_Formatting : Boolean;
+      As_Unit             : Boolean;
+      Buffer              : in out Unparsing_Buffer);
+   --  Common implementation for the Unparse subprograms: unparse Node to
+   --  Buffer, starting with leading trivia if As_Unit is true.
+
    procedure Unparse_Node
      (Node                : access Abstract_Node_Type'Class;
       Preserve_Formatting : Boolean;
@@ -297,6 +308,81 @@ package body ${ada_lib_name}.Unparsing_Implementation is
                         or else Node.Abstract_Children_Count > 0));
    end Field_Present;
 
+   ------------
+   -- Append --
+   ------------
+
+   procedure Append (Output : in out UTF8_Output; Bytes : String) is
+      Needed : Natural;
+   begin
+      if Output.Bytes /= null
+         and then Output.Last + Bytes'Length > Output.Bytes'Length
+      then
+         Flush (Output);
+      end if;
+
+      --  Grow the storage if it cannot hold Bytes. Double its size so that
+      --  the number of reallocations stays logarithmic in the size of the
+      --  result.
+
+      Needed := Output.Last + Bytes'Length;
+      if Output.Bytes = null then
+         Output.Bytes := new String (1 .. Natural'Max (Needed, 4096));
+
+      elsif Needed > Output.Bytes'Length then
+         declare
+            Old_Bytes : String_Access := Output.Bytes;
+         begin
+            Output.Bytes :=
+               new String (1 .. Natural'Max (Needed, 2 * Old_Bytes'Length));
+            Output.Bytes (1 .. Output.Last) := Old_Bytes (1 .. Output.Last);
+            Free (Old_Bytes);
+         end;
+      end if;
+
+      Output.Bytes (Output.Last + 1 .. Needed) := Bytes;
+      Output.Last := Needed;
+   end Append;
+
+   -----------
+   -- Flush --
+   -----------
+
+   procedure Flush (Output : in out UTF8_Output) is
+      use type GNAT.OS_Lib.File_Descriptor;
+   begin
+      if Output.File = GNAT.OS_Lib.Invalid_FD or else Output.Last = 0 then
+         return;
+      end if;
+
+      if GNAT.OS_Lib.Write
+        (Output.File, Output.Bytes.all'Address, Output.Last) /= Output.Last
+      then
+         raise Ada.IO_Exceptions.Device_Error
+            with "cannot write unparsed text";
+      end if;
+      Output.Last := 0;
+   end Flush;
+
+   -----------
+   -- Clear --
+   -----------
+
+   procedure Clear (Output : in out UTF8_Output) is
+   begin
+      Output.Last := 0;
+   end Clear;
+
+   -------------
+   -- Destroy --
+   -------------
+
+   procedure Destroy (Output : in out UTF8_Output) is
+   begin
+      Free (Output.Bytes);
+      Output.Last := 0;
+   end Destroy;
+
    -----------------
    -- Update_Sloc --
    -----------------
@@ -322,7 +408,12 @@ package body ${ada_lib_name}.Unparsing_Implementation is
      (Buffer : in out Unparsing_Buffer; Char : Wide_Wide_Character) is
    begin
       Update_Sloc (Buffer.Last_Sloc, Char);
-      Append (Buffer.Content, Char);
+      if Buffer.Output = null then
+         Append (Buffer.Content, Char);
+      else
+         Append (Buffer.Output.all, To_UTF8 ((1 => Char)));
+      end if;
+      Buffer.Is_Empty := False;
    end Append;
 
    ------------
@@ -337,7 +428,14 @@ package body ${ada_lib_name}.Unparsing_Implementation is
       for C of Text loop
          Update_Sloc (Buffer.Last_Sloc, C);
       end loop;
-      Append (Buffer.Content, Text);
+      if Buffer.Output = null then
+         Append (Buffer.Content, Text);
+      else
+         Append (Buffer.Output.all, To_UTF8 (Text));
+      end if;
+      if Text'Length > 0 then
+         Buffer.Is_Empty := False;
+      end if;
       Buffer.Last_Token := Kind;
    end Append;
 
@@ -349,7 +447,7 @@ package body ${ada_lib_name}.Unparsing_Implementation is
      (Buffer     : in out Unparsing_Buffer;
       Next_Token : Token_Kind) is
    begin
-      if Length (Buffer.Content) = 0 then
+      if Buffer.Is_Empty then
          null;
 
       elsif Token_Newline_Table (Buffer.Last_Token) then
@@ -363,6 +461,32 @@ package body ${ada_lib_name}.Unparsing_Implementation is
       end if;
    end Apply_Spacing_Rules;
 
+   -----------------------
+   -- Unparse_To_Buffer --
+   -----------------------
+
+   procedure Unparse_To_Buffer
+     (Node                : access Abstract_Node_Type'Class;
+      Unit                : Internal_Unit;
+      Preserve_Formatting : Boolean;
+      As_Unit             : Boolean;
+      Buffer              : in out Unparsing_Buffer) is
+   begin
+      --  Unparse Node, and the leading trivia if we are unparsing the unit as
+      --  a whole.
+      if As_Unit then
+         declare
+            First : constant Token_Reference := First_Token (Unit);
+         begin
+            if Is_Trivia (First) then
+               Append_Tokens (Buffer, First, Last_Trivia (First),
+                              With_Trailing_Trivia => False);
+            end if;
+         end;
+      end if;
+      Unparse_Node (Node, Preserve_Formatting, Buffer);
+   end Unparse_To_Buffer;
+
    -------------
    -- Unparse --
    -------------
@@ -400,20 +524,7 @@ package body ${ada_lib_name}.Unparsing_Implementation is
       Length        : Natural;
       --  Buffer internals, to avoid costly buffer copies
    begin
-
-      --  Unparse Node, and the leading trivia if we are unparsing the unit as
-      --  a whole.
-      if As_Unit then
-         declare
-            First : constant Token_Reference := First_Token (Unit);
-         begin
-            if Is_Trivia (First) then
-               Append_Tokens (Buffer, First, Last_Trivia (First),
-                              With_Trailing_Trivia => False);
-            end if;
-         end;
-      end if;
-      Unparse_Node (Node, Preserve_Formatting, Buffer);
+      Unparse_To_Buffer (Node, Unit, Preserve_Formatting, As_Unit, Buffer);
 
       Get_Wide_Wide_String (Buffer.Content, Buffer_Access, Length);
 
@@ -472,6 +583,24 @@ package body ${ada_lib_name}.Unparsing_Implementation is
    -- Unparse --
    -------------
 
+   procedure Unparse
+     (Node                : access Abstract_Node_Type'Class;
+      Unit                : Internal_Unit;
+      Preserve_Formatting : Boolean;
+      As_Unit             : Boolean;
+      Output              : UTF8_Output_Access)
+   is
+      Buffer : Unparsing_Buffer;
+   begin
+      Buffer.Output := Output;
+      Unparse_To_Buffer (Node, Unit, Preserve_Formatting, As_Unit, Buffer);
+      Flush (Output.all);
+   end Unparse;
+
+   -------------
+   -- Unparse --
+   -------------
+
    function Unparse
      (Node                : access Abstract_Node_Type'Class;
       Preserve_Formatting : Boolean) return Text_Type
@@ -508,6 +637,21 @@ package body ${ada_lib_name}.Unparsing_Implementation is
          then Node.Abstract_Rewritten_Node
          else null);
    begin
+      --  Bare nodes cannot be modified by tree rewriting, so when preserving
+      --  formatting, unparsing them recursively just yields their original
+      --  source excerpt: copy it directly instead. Ghost nodes own no token,
+      --  so let the general case handle them.
+
+      if Rewritten_Node /= null
+         and then Node.all in ${root_node_value_type}'Class
+         and then not Rewritten_Node.Is_Ghost
+      then
+         Append_Tokens (Result,
+                        Token_Start (Rewritten_Node),
+                        Token_End (Rewritten_Node));
+         return;
+      end if;
+
       case Unparser.Kind is
          when Regular =>
             Unparse_Regular_Node (Node, Unparser, Rewritten_Node, Result);
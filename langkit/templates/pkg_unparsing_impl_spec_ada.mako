@@ -3,6 +3,8 @@
 with Ada.Strings.Unbounded;           use Ada.Strings.Unbounded;
 with Ada.Strings.Wide_Wide_Unbounded; use Ada.Strings.Wide_Wide_Unbounded;
 
+with GNAT.OS_Lib;
+
 with Langkit_Support.Slocs; use Langkit_Support.Slocs;
 with Langkit_Support.Text;  use Langkit_Support.Text;
 
@@ -11,15 +13,53 @@ with ${ada_lib_name}.Implementation; use ${ada_lib_name}.Implementation;
 
 private package ${ada_lib_name}.Unparsing_Implementation is
 
+   type UTF8_Output is limited record
+      Bytes : String_Access;
+      --  Storage for the UTF-8 encoded text. It is grown when needed, but
+      --  never shrunk, so that reusing the same output for several unparsing
+      --  operations stops allocating once it is large enough.
+
+      Last : Natural := 0;
+      --  Index in Bytes of the last byte of encoded text
+
+      File : GNAT.OS_Lib.File_Descriptor := GNAT.OS_Lib.Invalid_FD;
+      --  If valid, Bytes is only a staging area for this file: its content is
+      --  written to File each time it gets full.
+   end record;
+   --  Destination for the UTF-8 encoded result of unparsing
+
+   type UTF8_Output_Access is access all UTF8_Output;
+
+   procedure Append (Output : in out UTF8_Output; Bytes : String);
+   --  Append Bytes to Output, growing its storage or flushing it to
+   --  Output.File if needed.
+
+   procedure Flush (Output : in out UTF8_Output);
+   --  If Output.File is valid, write the content of Output to it and clear
+   --  Output. Do nothing otherwise.
+
+   procedure Clear (Output : in out UTF8_Output);
+   --  Discard the content of Output, keeping its storage for later use
+
+   procedure Destroy (Output : in out UTF8_Output);
+   --  Free the storage of Output
+
    type Unparsing_Buffer is limited record
       Content : Unbounded_Wide_Wide_String;
       --  Append-only text buffer for the unparsed tree
 
+      Output : UTF8_Output_Access;
+      --  If not null, the unparsed tree is encoded in UTF-8 and appended to
+      --  Output rather than to Content.
+
+      Is_Empty : Boolean := True;
+      --  Whether nothing has been unparsed yet
+
       Last_Sloc : Source_Location := (1, 1);
       --  Source location of the next character to append to Content
 
       Last_Token : Token_Kind;
-      --  If Content is not emply, kind of the last token/trivia that was
+      --  If Is_Empty is false, kind of the last token/trivia that was
       --  unparsed. Undefined otherwise.
    end record;
 
@@ -64,6 +104,16 @@ private package ${ada_lib_name}.Unparsing_Implementation is
    --  Likewise, but return a string access. Callers must deallocate the result
    --  when done with it.
 
+   procedure Unparse
+     (Node                : access Abstract_Node_Type'Class;
+      Unit                : Internal_Unit;
+      Preserve_Formatting : Boolean;
+      As_Unit             : Boolean;
+      Output              : UTF8_Output_Access);
+   --  Likewise, but append the result to Output, encoded in UTF-8 whatever
+   --  the encoding of Unit. This streams the result: no intermediate copy of
+   --  the whole text is built.
+
    function Unparse
      (Node                : access Abstract_Node_Type'Class;
       Preserve_Formatting : Boolean) return Text_Type;
@@ -1,6 +1,11 @@
 ## vim: filetype=makoada
 
+private with Ada.Finalization;
+
+with GNAT.OS_Lib;
+
 with ${ada_lib_name}.Analysis; use ${ada_lib_name}.Analysis;
+private with ${ada_lib_name}.Unparsing_Implementation;
 
 package ${ada_lib_name}.Unparsing is
 
@@ -9,4 +14,40 @@ package ${ada_lib_name}.Unparsing is
    --  tree (source locations excepted). The encoding used is the same as the
    --  one that was used to parse Node's analysis unit.
 
+   type Unparsing_Output is limited private;
+   --  Growable buffer to receive the result of unparsing, encoded in UTF-8.
+   --  Its storage is kept when it is cleared, so reusing the same output to
+   --  unparse several trees does not allocate once it is large enough.
+
+   procedure Unparse
+     (Node   : ${root_entity.api_name}'Class;
+      Output : in out Unparsing_Output);
+   --  Likewise, but append the result to Output, encoded in UTF-8 whatever the
+   --  encoding of Node's analysis unit.
+
+   procedure Unparse
+     (Node : ${root_entity.api_name}'Class;
+      File : GNAT.OS_Lib.File_Descriptor);
+   --  Likewise, but write the result, encoded in UTF-8, to File. The text is
+   --  written in chunks as unparsing goes, so the whole result is never held
+   --  in memory.
+
+   procedure Clear (Output : in out Unparsing_Output);
+   --  Discard the content of Output
+
+   function Length (Output : Unparsing_Output) return Natural;
+   --  Return the number of bytes in Output
+
+   function Content (Output : Unparsing_Output) return String;
+   --  Return the content of Output
+
+private
+
+   type Unparsing_Output is new Ada.Finalization.Limited_Controlled
+   with record
+      Data : aliased Unparsing_Implementation.UTF8_Output;
+   end record;
+
+   overriding procedure Finalize (Output : in out Unparsing_Output);
+
 end ${ada_lib_name}.Unparsing;
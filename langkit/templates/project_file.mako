@@ -24,8 +24,7 @@ library project ${lib_name} is
    for Library_Name use "${capi.shared_object_basename}";
    for Library_Kind use Library_Kind_Param;
    for Interfaces use
-     ("${lib_name.lower()}.ads",
-      "${lib_name.lower()}-analysis.adb",
+     ("${lib_name.lower()}-analysis.adb",
       "${lib_name.lower()}-analysis.ads",
       "${lib_name.lower()}-c.ads",
       "${lib_name.lower()}-c.adb",
@@ -62,13 +61,16 @@ library project ${lib_name} is
       % if ctx.generate_gdb_hook:
       "gdb.c",
       % endif
+      % if ctx.lexer_backend == 'quex':
       "${lib_name.lower()}_quex_interface.c",
       "${lib_name.lower()}_quex_interface.h",
       "${lib_name.lower()}_lexer.c",
       "${lib_name.lower()}_lexer-configuration.h",
       "${lib_name.lower()}_lexer.h",
       "${lib_name.lower()}_lexer-token.h",
-      "${lib_name.lower()}_lexer-token_ids.h");
+      "${lib_name.lower()}_lexer-token_ids.h",
+      % endif
+      "${lib_name.lower()}.ads");
 
    <% source_dirs = ['../../include/{}'.format(lib_name.lower()),
                      ctx.extensions_src_dir] %>
@@ -110,10 +112,14 @@ library project ${lib_name} is
          when others => null;
       end case;
 
+      % if ctx.lexer_backend == 'quex':
       Common_C_Cargs :=
         ("-I${quex_path}",
          "-DQUEX_OPTION_ASSERTS_DISABLED",
          "-DQUEX_OPTION_ASSERTS_WARNING_MESSAGE_DISABLED");
+      % else:
+      Common_C_Cargs := ();
+      % endif
 
       case Build_Mode is
          when "dev" =>
@@ -124,11 +130,13 @@ library project ${lib_name} is
             for Default_Switches ("C") use
                Common_C_Cargs & ("-g3", "-O0", "-DDEBUG=1");
 
+            % if ctx.lexer_backend == 'quex':
             for Switches ("${lib_name.lower()}_lexer.c") use
                Common_C_Cargs & ("-g0", "-O0");
             --  This file is *huge* and the debugging information for it harms
             --  Valgrind runs. We almost never have to debug this file so
             --  this is acceptable.
+            % endif
 
          when "prod" =>
             --  Debug information is useful even with optimization for
@@ -142,12 +150,14 @@ library project ${lib_name} is
 
             for Default_Switches ("C") use Common_C_Cargs & ("-Ofast");
 
+            % if ctx.lexer_backend == 'quex':
             for Switches ("${lib_name.lower()}_lexer.c") use Common_C_Cargs
               & ("-O1", "-fno-ree", "-fdisable-rtl-cprop_hardreg",
                  "-fdisable-rtl-sched2", "-mno-stv");
             --  Deactivate because of memory usage, see P726-024. This
             --  limits the memory usage peaks of GCC 6 based compilers
             --  and should prevent OOM on 32-bit platforms.
+            % endif
 
             ## TODO: This extension point is added to change the flags of
             ## Libadalang specific extension files. It is a temporary
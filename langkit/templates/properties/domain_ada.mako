@@ -22,6 +22,11 @@ begin
       end;
    end loop;
 
-   ${expr.result_var.name} :=
-     Bind_Default_Default.Impl.Member (${expr.logic_var_expr.render_expr()}, A);
+   ## Domains can be large (all the overloads of a name, for instance): let
+   ## Member use a hash table to check that an already bound variable belongs
+   ## to them. Hash_Entity is consistent with Eq_Default, as it hashes a
+   ## subset of the components that Equivalent compares.
+   ${expr.result_var.name} := Bind_Default_Default.Impl.Member
+     (${expr.logic_var_expr.render_expr()}, A,
+      Hash => Hash_Entity'Access);
 end;
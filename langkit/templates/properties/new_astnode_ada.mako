@@ -11,8 +11,11 @@ Register_Destroyable (Self.Unit, ${root_node_type_name} (${result}));
 ${result}.Parent := ${root_node_type_name} (Self);
 ${result}.Unit := Self.Unit;
 
-## The node's env is the same as the parent
-${result}.Self_Env := Self.Self_Env;
+## The node's env is the same as the parent. Nodes that do not store it
+## already get it from their parent.
+% if expr.static_type.stores_self_env:
+${result}.Self_Env := Self.Get_Self_Env;
+% endif
 
 ## Keep the token start/end null, as expected for a synthetized node
 
@@ -35,6 +35,10 @@
       Check_Safety_Net (${self_arg}.Safety_Net);
 
       declare
+         Guard : Evaluation_Guard (${context_expr});
+         pragma Unreferenced (Guard);
+         ## Serialize property evaluation in frozen contexts
+
          ## Convert property arguments to internal types
          % for arg in property.arguments:
             Internal_Arg_${arg.name} :
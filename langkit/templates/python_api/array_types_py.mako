@@ -17,6 +17,18 @@ class _BaseArray(object):
     Whether items for this arrays are ref-counted.
     """
 
+    lazy = False
+    """
+    Whether to wrap arrays as ``LazyArray`` instances rather than lists. See
+    ``set_lazy_arrays``.
+    """
+
+    items_reference_nodes = False
+    """
+    Whether items for this array may reference nodes or tokens, which become
+    invalid when their unit is reparsed.
+    """
+
     __slots__ = ('c_value', 'length', 'items')
 
     def __init__(self, c_value):
@@ -41,31 +53,43 @@ class _BaseArray(object):
         self.clear()
 
     @classmethod
-    def wrap(cls, c_value):
+    def wrap(cls, c_value, unit=None):
+        """
+        Wrap the given array into a list, or into a ``LazyArray`` if lazy
+        arrays are enabled. ``unit`` is the unit that owns the node on which
+        the property that returned this array was evaluated: lazy arrays
+        require it, so they are created only when it is provided.
+        """
         helper = cls(c_value)
-
-        result = []
-        for i in range(helper.length):
-            # In ctypes, accessing an array element does not copy it, which
-            # means the the array must live at least as long as the accessed
-            # element. We cannot guarantee that, so we must copy the element so
-            # that it is independent of the array it comes from.
-            #
-            # The try/except block tries to do a copy if "item" is indeed a
-            # buffer to be copied, and will fail if it's a mere integer, which
-            # does not need the buffer copy anyway, hence the "pass".
-            item = helper.items[i]
-            try:
-                item = cls.c_element_type.from_buffer_copy(item)
-            except TypeError:
-                pass
-            result.append(helper.wrap_item(item))
-
-        return result
+        if cls.lazy and unit is not None:
+            return LazyArray(helper, unit)
+        else:
+            return [helper._get(i) for i in range(helper.length)]
+
+    def _get(self, index):
+        """
+        Return the wrapped item at the given index in this array.
+
+        :type index: int
+        """
+        # In ctypes, accessing an array element does not copy it, which means
+        # the the array must live at least as long as the accessed element. We
+        # cannot guarantee that, so we must copy the element so that it is
+        # independent of the array it comes from.
+        #
+        # The try/except block tries to do a copy if "item" is indeed a buffer
+        # to be copied, and will fail if it's a mere integer, which does not
+        # need the buffer copy anyway, hence the "pass".
+        item = self.items[index]
+        try:
+            item = self.c_element_type.from_buffer_copy(item)
+        except TypeError:
+            pass
+        return self.wrap_item(item)
 
     @classmethod
     def unwrap(cls, value, context=None):
-        if not isinstance(value, list):
+        if not isinstance(value, (list, LazyArray)):
             _raise_type_error('list', value)
 
         # Create a holder for the result
@@ -88,6 +112,91 @@ class _BaseArray(object):
 
         return result
 
+
+class LazyArray(collections.Sequence):
+    """
+    Read-only sequence for arrays that properties return, which wraps items
+    only when they are accessed. This avoids creating wrappers for all items
+    upfront when only some of them are used. The underlying array is kept
+    alive as long as this sequence is.
+
+    Once a unit of the owning analysis context has been reparsed, accessing
+    items that were not wrapped yet raises a ``StaleReferenceError`` if they
+    may reference nodes.
+
+    Property results are returned as lists unless lazy arrays are enabled with
+    ``set_lazy_arrays``.
+    """
+
+    __slots__ = ('_array', '_items', '_context', '_units_version')
+
+    _not_wrapped = object()
+
+    def __init__(self, array, unit):
+        """
+        This constructor is an implementation detail, and is not meant to be
+        used directly.
+        """
+        self._array = array
+        self._items = [self._not_wrapped] * array.length
+
+        # Keep the owning context alive and remember the version of its units
+        # so that we can detect that nodes in the array have been destroyed.
+        self._context = unit._context_link
+        self._units_version = self._context._units_version
+
+    def __len__(self):
+        return len(self._items)
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            return [self[i] for i in range(*key.indices(len(self)))]
+
+        result = self._items[key]
+        if result is self._not_wrapped:
+            if (self._array.items_reference_nodes
+                    and self._context._units_version != self._units_version):
+                raise StaleReferenceError()
+            index = key if key >= 0 else key + len(self)
+            result = self._array._get(index)
+            self._items[index] = result
+        return result
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def __eq__(self, other):
+        if isinstance(other, (list, LazyArray)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __ne__(self, other):
+        result = self.__eq__(other)
+        return result if result is NotImplemented else not result
+
+    def to_list(self):
+        """
+        Return a list that contains all the items in this array.
+
+        :rtype: list
+        """
+        return list(self)
+
+    def __repr__(self):
+        return '<LazyArray {}>'.format(list(self))
+
+
+def set_lazy_arrays(enabled=True):
+    """
+    Determine how arrays that properties return are converted to Python
+    values: as lists (the default) or as ``LazyArray`` instances, which wrap
+    their items only when they are accessed.
+
+    :type enabled: bool
+    """
+    _BaseArray.lazy = bool(enabled)
+
 </%def>
 
 <%def name="decl(cls)">
@@ -95,6 +204,10 @@ class _BaseArray(object):
 <%
     element_type = cls.element_type
     c_element_type = pyapi.c_type(element_type)
+    items_reference_nodes = (element_type.is_ast_node
+                             or element_type.is_struct_type
+                             or element_type.is_array_type
+                             or element_type.is_token_type)
 %>
 
 class ${cls.py_converter}(_BaseArray):
@@ -107,6 +220,7 @@ class ${cls.py_converter}(_BaseArray):
 
     __slots__ = _BaseArray.__slots__
     items_refcounted = ${cls.element_type.is_refcounted}
+    items_reference_nodes = ${items_reference_nodes}
 
     @staticmethod
     def wrap_item(item):
@@ -123,7 +237,7 @@ class ${cls.py_converter}(_BaseArray):
     ## instances.
     % if cls.is_string_type:
     @classmethod
-    def wrap(cls, c_value):
+    def wrap(cls, c_value, unit=None):
         # Reinterpret this array of uint32_t values as the equivalent array of
         # characters, then decode it using the appropriate UTF-32 encoding.
         chars = ctypes.cast(ctypes.pointer(c_value.contents.items),
@@ -35,25 +35,18 @@
         ## Evaluate the C value for field evaluation, and then the Python
         ## wrapper.
         c_result = self._eval_field(${', '.join(eval_args)})
+        % if field.public_type.is_array_type:
+        result = ${pyapi.array_wrapper(field.public_type)}.wrap(
+            c_result, self._unit
+        )
+        % else:
         result = ${pyapi.wrap_value('c_result', field.public_type)}
         % endif
+        % endif
 
 </%def>
 
 <%def name="subclass_decls(cls)">
-    <%
-        # Parent class for "cls", or None if "cls" is actually the root AST
-        # node (if we called .base on it, it would return ASTNodeType).
-        parent_cls = cls.base if T.root_node != cls else None
-
-        # Python expression that yield a tuple that contains the names for all
-        # fields that "cls" inherits.
-        parent_fields = (
-            '{}._field_names'.format(pyapi.type_public_name(parent_cls))
-            if parent_cls else '()'
-        )
-    %>
-
     % for field in cls.fields_with_accessors():
     <%
         arg_list = ['self'] + [
@@ -73,10 +66,12 @@
         return result
     % endfor
 
-    _field_names = ${parent_fields} + (
+    ## Children fetched through the C API come in the order of this list,
+    ## which is sorted by serial number. Inheriting the parent's names first
+    ## would not always yield the same order.
+    _field_names = (
         % for field in cls.get_parse_fields( \
-            predicate=lambda f: not f.abstract and not f.null, \
-            include_inherited=False \
+            predicate=lambda f: not f.abstract and not f.null \
         ):
         "${field.name.lower}",
         % endfor
@@ -102,6 +102,31 @@ def _import_func(name, argtypes, restype, exc_wrap=True):
     return wrapper if exc_wrap else func
 
 
+_c_symbol_prefix = '${capi.symbol_prefix + '_' if capi.symbol_prefix else ''}'
+
+
+def _lazy_import_func(name, argtypes, restype, exc_wrap=True):
+    """
+    Like _import_func, but defer the lookup of "name" in the C library to the
+    first call of the binding, so that importing this module does not pay for
+    resolving C functions that are never used.
+
+    The returned stub must be assigned to the global whose name is "name"
+    without the C symbol prefix, with a leading underscore: for instance
+    "_unit_root" for "${capi.get_name('unit_root')}". On its first call, the
+    stub replaces itself with the actual binding, so later calls do not go
+    through it.
+    """
+    global_name = '_' + name[len(_c_symbol_prefix):]
+
+    def stub(*args, **kwargs):
+        func = _import_func(name, argtypes, restype, exc_wrap)
+        globals()[global_name] = func
+        return func(*args, **kwargs)
+
+    return stub
+
+
 class _Exception(ctypes.Structure):
     _fields_ = [("is_fatal", ctypes.c_int),
                 ("information", ctypes.c_char_p)]
@@ -110,6 +135,40 @@ class _Exception(ctypes.Structure):
         return NativeException(self.information)
 
 
+class MemoryUsage(collections.namedtuple('MemoryUsage', 'bytes objects')):
+    ${py_doc('langkit.memory_usage_type', 4)}
+    __slots__ = ()
+
+
+class _MemoryUsage(ctypes.Structure):
+    _fields_ = [('bytes', ctypes.c_uint64),
+                ('objects', ctypes.c_int)]
+
+    # Names for memory categories, in the same order as in the C API
+    _categories = ('ast', 'tokens', 'lexical_envs', 'memoization',
+                   'rebindings', 'symbols')
+
+    _breakdown_type = None
+    """
+    Array type for the C API to store one entry per memory category.
+    """
+
+    @classmethod
+    def _get(cls, c_func, c_value):
+        """
+        Call the ``c_func`` C API memory usage function on ``c_value`` and
+        return a dict that maps memory category names to ``MemoryUsage``
+        instances.
+        """
+        result = cls._breakdown_type()
+        c_func(c_value, result)
+        return {name: MemoryUsage(entry.bytes, entry.objects)
+                for name, entry in zip(cls._categories, result)}
+
+
+_MemoryUsage._breakdown_type = _MemoryUsage * len(_MemoryUsage._categories)
+
+
 def _raise_type_error(expected_type_name, actual_value):
     raise TypeError('{} instance expected, got {} instead'.format(
         expected_type_name, type(actual_value)
@@ -166,7 +225,10 @@ class _text(ctypes.Structure):
     buffer, so the string will be deallocated when ``self`` is destroyed.
 
     ``_unwrap`` takes a string/unicode object and returns a ``_text`` instance,
-    while ``_wrap`` retuns an unicode instance.
+    while ``_wrap`` retuns an unicode instance. Both transfer the text in UTF-8
+    (see the text_to_utf8/text_from_utf8 C API functions): encoding/decoding
+    UTF-8 is much faster in Python than UTF-32, and it is usually four times
+    more compact.
     """
     # The chars field really is a uint32_t* but considering it as a char* here
     # is more convenient for conversion in this binding layer. On the other
@@ -178,34 +240,24 @@ class _text(ctypes.Structure):
 
     encoding = 'utf-32le' if sys.byteorder == 'little' else 'utf-32be'
 
-    # Instances can hold buffers that they own. In this case, the buffer must
-    # be deallocated when the instance is destroyed. Thus instances will hold
-    # a "text_buffer" attribute that will be automatically destroyed.
-    text_buffer = None
-
     @classmethod
     def _unwrap(cls, value):
-        value = cls.cast(value)
-
-        text = value.encode(cls.encoding)
-        text_buffer = ctypes.create_string_buffer(text)
-        text_buffer_ptr = ctypes.cast(
-            ctypes.pointer(text_buffer),
-            ctypes.POINTER(ctypes.c_char)
-        )
-        result = _text(text_buffer_ptr, len(value))
-        result.text_buffer = text_buffer
+        text = cls.cast(value).encode('utf-8')
+        result = _text()
+        _text_from_utf8(text, len(text), ctypes.byref(result))
         return result
 
     def _wrap(self):
-        if self.length > 0:
-            # self.length tells how much UTF-32 chars there are in self.chars
-            # but self.chars is a char* so we have to fetch 4 times more bytes
-            # than characters.
-            return self.chars[:4 * self.length].decode(self.encoding)
-        else:
+        if self.length == 0:
             return None
 
+        # Four bytes per character are always enough to hold UTF-8. Decode the
+        # encoded text directly from this buffer, without any intermediate
+        # copy.
+        buf = ctypes.create_string_buffer(4 * self.length)
+        size = _text_to_utf8(ctypes.byref(self), buf, len(buf))
+        return unicode(buffer(buf, 0, size), 'utf-8')
+
     @classmethod
     def cast(cls, value):
         """
@@ -393,7 +445,7 @@ class AnalysisContext(object):
     ${py_doc('langkit.analysis_context_type', 4)}
 
     __slots__ = ('_c_value', '_unit_provider', '_serial_number', '_unit_cache',
-                 '__weakref__')
+                 '_node_cache_mode', '__weakref__')
 
     _context_cache = weakref.WeakValueDictionary()
     """
@@ -412,6 +464,7 @@ class AnalysisContext(object):
                  unit_provider=None,
                  with_trivia=True,
                  tab_stop=${ctx.default_tab_stop},
+                 node_cache='strong',
                  _c_value=None):
         ${py_doc('langkit.create_context', 8)}
 
@@ -419,6 +472,15 @@ class AnalysisContext(object):
         # construction, so that the destructor can run later on.
         self._c_value = None
 
+        if node_cache not in ('strong', 'weak') and not (
+            isinstance(node_cache, (int, long))
+            and not isinstance(node_cache, bool)
+            and node_cache > 0
+        ):
+            raise ValueError("Invalid node_cache ('strong', 'weak' or positive"
+                             " integer expected)")
+        self._node_cache_mode = node_cache
+
         if _c_value is None:
             if not isinstance(tab_stop, int) or tab_stop < 1:
                 raise ValueError(
@@ -462,6 +524,17 @@ class AnalysisContext(object):
                                                charset or '', reparse)
         return AnalysisUnit._wrap(c_value)
 
+    def get_from_files(self, filenames, charset=None, reparse=False,
+                       workers=1):
+        ${py_doc('langkit.get_units_from_files', 8)}
+        count = len(filenames)
+        c_filenames = (ctypes.c_char_p * count)(*filenames)
+        c_units = (AnalysisUnit._c_type * count)()
+        _get_analysis_units_from_files(self._c_value, c_filenames, count,
+                                       charset or '', reparse, workers,
+                                       c_units)
+        return [AnalysisUnit._wrap(c_value) for c_value in c_units]
+
     def get_from_buffer(self, filename, buffer, charset=None, reparse=False):
         ${py_doc('langkit.get_unit_from_buffer', 8)}
         c_value = _get_analysis_unit_from_buffer(self._c_value, filename,
@@ -485,10 +558,38 @@ class AnalysisContext(object):
 
     def discard_errors_in_populate_lexical_env(self, discard):
         ${py_doc('langkit.context_discard_errors_in_populate_lexical_env', 8)}
-        _discard_errors_in_populate_lexical_env(self._c_value, bool(discard))
+        _context_discard_errors_in_populate_lexical_env(self._c_value,
+                                                        bool(discard))
+
+    def set_unit_eviction_policy(self, max_units=0, max_memory=0):
+        ${py_doc('langkit.context_set_unit_eviction_policy', 8)}
+        if not isinstance(max_units, (int, long)) or max_units < 0:
+            raise ValueError('Invalid max_units (natural integer expected)')
+        if not isinstance(max_memory, (int, long)) or max_memory < 0:
+            raise ValueError('Invalid max_memory (natural integer expected)')
+        _context_set_unit_eviction_policy(self._c_value, max_units,
+                                          max_memory)
+
+    def evict_units(self):
+        ${py_doc('langkit.context_evict_units', 8)}
+        _context_evict_units(self._c_value)
+
+    def freeze(self):
+        ${py_doc('langkit.context_freeze', 8)}
+        _context_freeze(self._c_value)
+
+    def unfreeze(self):
+        ${py_doc('langkit.context_unfreeze', 8)}
+        _context_unfreeze(self._c_value)
+
+    @property
+    def memory_usage(self):
+        ${py_doc('langkit.context_memory_usage', 8)}
+        return _MemoryUsage._get(_context_memory_usage, self._c_value)
 
     class _c_struct(ctypes.Structure):
-        _fields_ = [('serial_number', ctypes.c_uint64)]
+        _fields_ = [('serial_number', ctypes.c_uint64),
+                    ('units_version', ctypes.c_uint64)]
     _c_type = _hashable_c_pointer(_c_struct)
 
     @classmethod
@@ -498,6 +599,10 @@ class AnalysisContext(object):
         except KeyError:
             return cls(_c_value=c_value)
 
+    @property
+    def _units_version(self):
+        return self._c_value.contents.units_version
+
     def _check_unit_cache(self):
         """
         If this context has been re-used, invalidate its unit cache.
@@ -507,12 +612,69 @@ class AnalysisContext(object):
             self._unit_cache = {}
             self._serial_number = serial_number
 
+    def _create_node_cache(self):
+        """
+        Return a new empty cache for node wrappers, according to the node
+        cache mode of this context.
+
+        :rtype: dict[T, ${root_astnode_name}]
+        """
+        mode = self._node_cache_mode
+        if mode == 'strong':
+            return {}
+        elif mode == 'weak':
+            return weakref.WeakValueDictionary()
+        else:
+            return _BoundedNodeCache(mode)
+
+    @property
+    def _cache_node_children(self):
+        """
+        Whether node wrappers can keep strong references to their children.
+        This is true only for strong node caches, as otherwise a single
+        reference to the root node would keep alive all wrappers in the tree.
+
+        :rtype: bool
+        """
+        return self._node_cache_mode == 'strong'
+
+
+class _BoundedNodeCache(weakref.WeakValueDictionary):
+    """
+    Node wrapper cache that holds weak references to wrappers, but that also
+    keeps strong references to the N most recently used ones.
+    """
+
+    def __init__(self, size):
+        weakref.WeakValueDictionary.__init__(self)
+        self._size = size
+        self._recent = collections.OrderedDict()
+
+    def _touch(self, key, value):
+        """
+        Make ``value`` the most recently used wrapper, evicting the least
+        recently used one if there are too many.
+        """
+        self._recent.pop(key, None)
+        self._recent[key] = value
+        if len(self._recent) > self._size:
+            self._recent.popitem(last=False)
+
+    def __getitem__(self, key):
+        result = weakref.WeakValueDictionary.__getitem__(self, key)
+        self._touch(key, result)
+        return result
+
+    def __setitem__(self, key, value):
+        weakref.WeakValueDictionary.__setitem__(self, key, value)
+        self._touch(key, value)
+
 
 class AnalysisUnit(object):
     ${py_doc('langkit.analysis_unit_type', 4)}
 
     __slots__ = ('_c_value', '_context_link', '_cache_version_number',
-                 '_node_cache')
+                 '_node_cache', '_live_wrappers')
 
     class DiagnosticsList(object):
         """List of analysis unit diagnostics."""
@@ -581,14 +743,24 @@ class AnalysisUnit(object):
         :type: int
         """
 
-        self._node_cache = {}
+        self._node_cache = context._create_node_cache()
         """
-        Cache for all node wrappers in this unit. Indexed by couples:
-        (c_value, metadata, rebindings).
+        Cache for node wrappers in this unit. Indexed by triples:
+        (c_value, metadata, rebindings). Depending on the context's node cache
+        mode, this may hold only weak references to wrappers.
 
         :type: dict[T, ${root_astnode_name}]
         """
 
+        self._live_wrappers = set()
+        """
+        Weak references to the node wrappers for this unit that are still
+        alive. This unit is pinned, so that unit eviction leaves it alone, as
+        long as this set is not empty.
+
+        :type: set[weakref.ref]
+        """
+
         self._check_node_cache()
 
     def __eq__(self, other):
@@ -650,6 +822,22 @@ class AnalysisUnit(object):
         ${py_doc('langkit.unit_trivia_count', 8)}
         return _unit_trivia_count(self._c_value)
 
+    @property
+    def text(self):
+        ${py_doc('langkit.unit_text', 8)}
+        result = _text()
+        _unit_text(self._c_value, ctypes.byref(result))
+        return result._wrap()
+
+    def token_columns(self):
+        """
+        Export all the tokens and trivia in this unit as columns, in a single
+        call to the native library.
+
+        :rtype: TokenColumns
+        """
+        return TokenColumns(self)
+
     def lookup_token(self, sloc):
         ${py_doc('langkit.unit_lookup_token', 8)}
         unit = AnalysisUnit._unwrap(self)
@@ -675,6 +863,11 @@ class AnalysisUnit(object):
         """Diagnostics for this unit."""
         return self.DiagnosticsList(self)
 
+    @property
+    def memory_usage(self):
+        ${py_doc('langkit.unit_memory_usage', 8)}
+        return _MemoryUsage._get(_unit_memory_usage, self._c_value)
+
     def __repr__(self):
         return '<AnalysisUnit {}>'.format(repr(
             os.path.basename(self.filename)
@@ -685,13 +878,18 @@ class AnalysisUnit(object):
     _c_type = _hashable_c_pointer(_c_struct)
 
     @classmethod
-    def _wrap(cls, c_value):
+    def _wrap(cls, c_value, context=None):
+        """
+        Wrap the ``c_value`` analysis unit. If the caller already knows the
+        owning context, it can pass it as ``context`` to avoid a C API call.
+        """
         if not c_value:
             return None
 
         # Invalidate the unit cache if needed, then look for an existing
         # wrapper for this unit.
-        context = cls._context(c_value)
+        if context is None:
+            context = cls._context(c_value)
         context._check_unit_cache()
 
         try:
@@ -719,11 +917,41 @@ class AnalysisUnit(object):
 
     def _check_node_cache(self):
         """
-        If this unit has been reparsed, invalidate its node cache.
+        If this unit has been reparsed, invalidate its node cache. Existing
+        wrappers are now stale, so they no longer need to pin this unit.
         """
         if self._cache_version_number != self._unit_version:
-            self._node_cache = {}
+            self._node_cache = self._context_link._create_node_cache()
             self._cache_version_number = self._unit_version
+            if self._live_wrappers:
+                self._live_wrappers.clear()
+                _unit_unpin(self._c_value)
+
+    def _track_wrapper(self, node):
+        """
+        Keep this unit pinned as long as ``node``, a new wrapper for one of its
+        nodes, is alive. Only the first live wrapper requires a C API call.
+        """
+        if not self._live_wrappers:
+            _unit_pin(self._c_value)
+        self._live_wrappers.add(weakref.ref(node, self._release_wrapper))
+
+    def _release_wrapper(self, ref):
+        """
+        Callback for weak references to node wrappers: unpin this unit once
+        the last wrapper it tracks is gone.
+        """
+        if ref in self._live_wrappers:
+            self._live_wrappers.remove(ref)
+            if not self._live_wrappers:
+                _unit_unpin(self._c_value)
+
+
+class _NodeDescriptor(ctypes.Structure):
+    _fields_ = [('context', AnalysisContext._c_type),
+                ('unit', AnalysisUnit._c_type),
+                ('kind', ctypes.c_int),
+                ('children_count', ctypes.c_uint)]
 
 
 class Sloc(object):
@@ -980,6 +1208,76 @@ class Token(ctypes.Structure):
         return (self._token_data, self._token_index, self._trivia_index)
 
 
+class _TokenColumns(ctypes.Structure):
+    _fields_ = [(name, ctypes.POINTER(ctypes.c_int))
+                for name in ('kinds', 'token_indexes', 'trivia_indexes',
+                             'start_offsets', 'end_offsets',
+                             'start_lines', 'start_columns',
+                             'end_lines', 'end_columns')]
+
+
+class TokenColumns(object):
+    """
+    Columnar snapshot of all the tokens and trivia in an analysis unit, in
+    source order.
+
+    Each column (``kinds``, ``token_indexes``, ``trivia_indexes``,
+    ``start_offsets``, ``end_offsets``, ``start_lines``, ``start_columns``,
+    ``end_lines`` and ``end_columns``) is a ctypes array of C ints with one
+    item per token/trivia. These arrays support the buffer protocol, so they
+    can be turned into ``memoryview`` or NumPy arrays (``numpy.frombuffer``)
+    without copying. Offsets are 0-based indexes in ``text``, end offsets
+    being exclusive.
+    """
+
+    _column_names = tuple(name for name, _ in _TokenColumns._fields_)
+
+    def __init__(self, unit):
+        """
+        This constructor is an implementation detail, and is not meant to be
+        used directly. Use ``AnalysisUnit.token_columns`` instead.
+        """
+        self.unit = unit
+        self.text = unit.text or u''
+
+        # First get the number of tokens/trivia to export, then allocate the
+        # columns and fill them with a single call.
+        c_columns = _TokenColumns()
+        count = _unit_token_columns(unit._c_value, ctypes.byref(c_columns), 0)
+        self._count = count
+        for name in self._column_names:
+            column = (ctypes.c_int * count)()
+            setattr(self, name, column)
+            setattr(c_columns, name,
+                    ctypes.cast(column, ctypes.POINTER(ctypes.c_int)))
+        _unit_token_columns(unit._c_value, ctypes.byref(c_columns), count)
+
+    def __len__(self):
+        return self._count
+
+    def token_text(self, index):
+        """
+        Return the text for the token/trivia at the given index.
+
+        :type index: int
+        :rtype: unicode
+        """
+        return self.text[self.start_offsets[index]:self.end_offsets[index]]
+
+    def kind_name(self, index):
+        """
+        Return the name of the kind for the token/trivia at the given index.
+
+        :type index: int
+        :rtype: str
+        """
+        return _unwrap_str(_token_kind_name(self.kinds[index]))
+
+    def __repr__(self):
+        return '<TokenColumns for {} ({} items)>'.format(self.unit,
+                                                           self._count)
+
+
 ## TODO: if this is needed some day, also bind create_unit_provider to allow
 ## Python users to create their own unit providers.
 class UnitProvider(object):
@@ -1000,17 +1298,51 @@ ${exts.include_extension(
 )}
 
 
+class UnparsingOutput(object):
+    ${py_doc('langkit.unparsing_output_type', 4)}
+
+    def __init__(self):
+        self._c_value = _create_unparsing_output()
+
+    def __del__(self):
+        _destroy_unparsing_output(self._c_value)
+
+    def __len__(self):
+        length = ctypes.c_size_t()
+        _unparsing_output_content(self._c_value, ctypes.byref(length))
+        return length.value
+
+    def clear(self):
+        """
+        Discard the content of this output.
+        """
+        _unparsing_output_clear(self._c_value)
+
+    @property
+    def content(self):
+        """
+        Byte string for the UTF-8 encoded text in this output.
+        """
+        length = ctypes.c_size_t()
+        address = _unparsing_output_content(self._c_value,
+                                            ctypes.byref(length))
+        return (ctypes.string_at(address, length.value)
+                if length.value else b'')
+
+
 class ${root_astnode_name}(object):
     ${py_doc(T.root_node, 4)}
 
     is_list_type = False
     __slots__ = ('_unprotected_c_value', '_node_c_value', '_metadata',
-                 '_rebindings', '_unprotected_getitem_cache', '_unit',
-                 '_unit_version')
+                 '_rebindings', '_unprotected_children_cache',
+                 '_unprotected_children_count', '_unit', '_unit_version',
+                 '__weakref__')
 
     ${astnode_types.subclass_decls(T.root_node)}
 
-    def __init__(self, c_value, node_c_value, metadata, rebindings):
+    def __init__(self, c_value, node_c_value, metadata, rebindings,
+                 unit=None, children_count=None):
         """
         This constructor is an implementation detail, and is not meant to be
         used directly. For now, the creation of AST nodes can happen only as
@@ -1026,16 +1358,23 @@ class ${root_astnode_name}(object):
         self._rebindings = rebindings
         self._metadata = metadata
 
-        self._unprotected_getitem_cache = {}
+        self._unprotected_children_cache = None
+        """
+        Cache for the list of children, computed the first time it is needed.
+
+        :type: None|list[${root_astnode_name}]
+        """
+
+        self._unprotected_children_count = children_count
         """
-        Cache for the __getitem__ override.
+        Number of children for this node, if known at wrapping time.
 
-        :type: dict[int, ${root_astnode_name}]
+        :type: None|int
         """
 
         # Information to check before accessing node data that it is still
         # valid.
-        self._unit = self._fetch_unit(c_value)
+        self._unit = unit if unit is not None else self._fetch_unit(c_value)
         self._unit_version = self._unit._unit_version
 
     def _check_stale_reference(self):
@@ -1051,9 +1390,35 @@ class ${root_astnode_name}(object):
         return self._unprotected_c_value
 
     @property
-    def _getitem_cache(self):
+    def _children(self):
+        """
+        Return the list of children for this node (None for null children).
+
+        The first time this is called, all children are fetched with a single
+        call to the C API, and then cached if the context's node cache mode
+        allows it.
+
+        :rtype: list[${root_astnode_name}]
+        """
         self._check_stale_reference()
-        return self._unprotected_getitem_cache
+        result = self._unprotected_children_cache
+        if result is None:
+            node = self._unprotected_c_value
+            count = len(self)
+            c_children = (${c_entity} * count)()
+            c_kinds = (ctypes.c_int * count)()
+            _node_children(ctypes.byref(node), c_children, c_kinds, count)
+
+            # All children belong to the same unit as self, and we already
+            # know their kinds: give this information to _wrap so that it
+            # does not have to query it again.
+            unit = self._unit
+            wrap = ${root_astnode_name}._wrap
+            result = [wrap(c_child, unit, kind) if kind else None
+                      for c_child, kind in zip(c_children, c_kinds)]
+            if unit._context_link._cache_node_children:
+                self._unprotected_children_cache = result
+        return result
 
     @property
     def _id_tuple(self):
@@ -1131,7 +1496,11 @@ class ${root_astnode_name}(object):
     def __len__(self):
         """Return the number of ${root_astnode_name} children this node has."""
         node = self._unwrap(self)
-        return _node_children_count(ctypes.byref(node))
+        result = self._unprotected_children_count
+        if result is None:
+            result = _node_children_count(ctypes.byref(node))
+            self._unprotected_children_count = result
+        return result
 
     def __getitem__(self, key):
         """
@@ -1145,21 +1514,17 @@ class ${root_astnode_name}(object):
                    ' (got {})').format(type(key))
             raise TypeError(msg)
 
-        if key < 0:
-            key += len(self)
-
-        if key in self._getitem_cache:
-            return self._getitem_cache[key]
-
-        node = self._unwrap(self)
-        result = ${c_entity}()
-        success = _node_child(ctypes.byref(node), key, ctypes.byref(result))
-        if not success:
+        try:
+            return self._children[key]
+        except IndexError:
             raise IndexError('child index out of range')
-        else:
-            result = ${root_astnode_name}._wrap(result)
-            self._getitem_cache[key] = result
-            return result
+
+    def __iter__(self):
+        """
+        Iterate through all the children this node has (None for null
+        children).
+        """
+        return iter(self._children)
 
     def iter_fields(self):
         """
@@ -1170,11 +1535,15 @@ class ${root_astnode_name}(object):
         "item_{n}" with "n" being the index.
         """
         if self.is_list_type:
-            for i, value in enumerate(self):
+            for i, value in enumerate(self._children):
                 yield ('item_{}'.format(i), value)
         else:
-            for field_name in self._field_names:
-                yield (field_name, getattr(self, '{}'.format(field_name)))
+            # Children come in the same order as parse fields (see
+            # _field_names), so there is no need to call field accessors.
+            children = self._children
+            assert len(children) == len(self._field_names)
+            for field_name, value in zip(self._field_names, children):
+                yield (field_name, value)
 
     def dump_str(self):
         """
@@ -1209,7 +1578,7 @@ class ${root_astnode_name}(object):
         ), file=file)
         indent = indent + '|'
         if self.is_list_type:
-            for i, value in enumerate(self):
+            for i, value in enumerate(self._children):
                 print_node("item_{}".format(i), value)
         else:
             for name, value in self.iter_fields():
@@ -1267,15 +1636,15 @@ class ${root_astnode_name}(object):
             key that has the specified value, then the child is kept.
         :type kwargs: dict[str, Any]
         """
-        # Create a "pred" function to use as the node filter during the
-        # traversal.
+        # Searches by node types are handled natively: just determine the set
+        # of node kinds to look for. Otherwise, create a "pred" function to use
+        # as the node filter during the traversal.
         if isinstance(ast_type_or_pred, type):
-            sought_type = ast_type_or_pred
-            pred = lambda node: isinstance(node, sought_type)
+            sought_types = (ast_type_or_pred, )
         elif isinstance(ast_type_or_pred, collections.Sequence):
-            sought_types = ast_type_or_pred
-            pred = lambda node: isinstance(node, tuple(sought_types))
+            sought_types = tuple(ast_type_or_pred)
         else:
+            sought_types = None
             pred = ast_type_or_pred
 
         def match(left, right):
@@ -1291,19 +1660,64 @@ class ${root_astnode_name}(object):
                 return left == right
 
         def helper(node):
-            for child in node:
-                if child is not None:
-                    if pred(child):
-                        if not kwargs:
-                            yield child
-                        elif all([match(getattr(child, key, None), val)
-                                  for key, val in kwargs.items()]):
-                            yield child
-                    for c in helper(child):
-                        if c is not None:
-                            yield c
-
-        return helper(self)
+            # Prefix depth-first traversal using an explicit stack of
+            # iterators on children lists, so that the cost of yielding a node
+            # does not depend on its depth in the tree.
+            stack = [iter(node._children)]
+            while stack:
+                child = next(stack[-1], _end_of_children)
+                if child is _end_of_children:
+                    stack.pop()
+                    continue
+                elif child is None:
+                    continue
+
+                if pred(child):
+                    yield child
+                stack.append(iter(child._children))
+
+        _end_of_children = object()
+
+        result = (helper(self)
+                  if sought_types is None else
+                  self._find_kinds(_kinds_for_types(sought_types)))
+        if kwargs:
+            result = (node for node in result
+                      if all([match(getattr(node, key, None), val)
+                              for key, val in kwargs.items()]))
+        return result
+
+    def _find_kinds(self, kinds):
+        """
+        Return an iterator that yields all the nodes in the subtree of self
+        (self excluded), in prefix depth-first order, whose kind is in
+        ``kinds``.
+
+        The search runs in the C API, which returns matching nodes in batches.
+
+        :param list[int] kinds: Node kinds, as C API constants.
+        """
+        node = self._unwrap(self)
+        c_kinds = (ctypes.c_int * len(kinds))(*kinds)
+        finder = _create_node_finder(ctypes.byref(node), c_kinds, len(kinds))
+        unit = self._unit
+        wrap = ${root_astnode_name}._wrap
+        try:
+            while True:
+                # Use fresh buffers for each batch, as wrappers keep
+                # references to their C values.
+                self._check_stale_reference()
+                c_results = (${c_entity} * _node_finder_batch_size)()
+                c_result_kinds = (ctypes.c_int * _node_finder_batch_size)()
+                count = _node_finder_next(finder, c_results, c_result_kinds,
+                                          _node_finder_batch_size)
+                for i in range(count):
+                    self._check_stale_reference()
+                    yield wrap(c_results[i], unit, c_result_kinds[i])
+                if count < _node_finder_batch_size:
+                    break
+        finally:
+            _destroy_node_finder(finder)
 
     def __repr__(self):
         return self.short_image
@@ -1332,7 +1746,7 @@ class ${root_astnode_name}(object):
         portion of the AST corresponding to this node.
         """
         if self.is_list_type:
-            return [i.to_data() for i in self if i is not None]
+            return [i.to_data() for i in self._children if i is not None]
         else:
             return {n: v.to_data()
                     for n, v in self.iter_fields()
@@ -1344,6 +1758,45 @@ class ${root_astnode_name}(object):
         """
         return json.dumps(self.to_data())
 
+    def to_detailed_json(self, with_slocs=False):
+        ${py_doc('langkit.node_to_json', 8)}
+        return self._serialize(_node_to_json, with_slocs)
+
+    def to_binary(self, with_slocs=False):
+        ${py_doc('langkit.node_to_binary', 8)}
+        return self._serialize(_node_to_binary, with_slocs)
+
+    def unparse(self, output=None):
+        ${py_doc('langkit.node_unparse', 8)}
+        node = self._unwrap(self)
+        if output is None:
+            output = UnparsingOutput()
+            _node_unparse(ctypes.byref(node), output._c_value)
+            return output.content
+        elif isinstance(output, UnparsingOutput):
+            _node_unparse(ctypes.byref(node), output._c_value)
+        elif isinstance(output, int):
+            _node_unparse_to_file(ctypes.byref(node), output)
+        else:
+            # Make sure what was previously written to the file object is
+            # written to the file descriptor before the unparsed code.
+            output.flush()
+            _node_unparse_to_file(ctypes.byref(node), output.fileno())
+
+    def _serialize(self, c_func, with_slocs):
+        """
+        Internal helper to call one of the native subtree serializers on this
+        node and return the result as a byte string.
+        """
+        node = self._unwrap(self)
+        length = ctypes.c_size_t()
+        c_result = c_func(ctypes.byref(node), bool(with_slocs),
+                          ctypes.byref(length))
+        try:
+            return c_result[:length.value]
+        finally:
+            _free(c_result)
+
     def is_a(self, *types):
         """
         Shortcut for isinstance(self, types).
@@ -1365,10 +1818,15 @@ class ${root_astnode_name}(object):
     _node_c_type = _hashable_c_pointer()
 
     @classmethod
-    def _wrap(cls, c_value):
+    def _wrap(cls, c_value, unit=None, kind=None):
         """
         Internal helper to wrap a low-level entity value into an instance of
         the the appropriate high-level Python wrapper subclass.
+
+        If the caller already knows the unit that owns this node and/or its
+        kind, it can pass them as ``unit``/``kind`` to avoid C API calls.
+        Otherwise, all the information needed to create the wrapper is
+        fetched with a single C API call.
         """
         node_c_value = c_value.node
         if not node_c_value:
@@ -1377,9 +1835,19 @@ class ${root_astnode_name}(object):
         rebindings = c_value.info.rebindings
         metadata = c_value.info.md
 
+        children_count = None
+        if unit is None or kind is None:
+            desc = _NodeDescriptor()
+            _node_descriptor(ctypes.byref(c_value), ctypes.byref(desc))
+            if unit is None:
+                unit = AnalysisUnit._wrap(
+                    desc.unit, AnalysisContext._wrap(desc.context)
+                )
+            kind = desc.kind
+            children_count = desc.children_count
+
         # Look for an already existing wrapper for this node
         cache_key = (node_c_value, metadata, rebindings)
-        unit = cls._fetch_unit(c_value)
         unit._check_node_cache()
         try:
             return unit._node_cache[cache_key]
@@ -1387,10 +1855,10 @@ class ${root_astnode_name}(object):
             pass
 
         # Pick the right subclass to materialize this node in Python
-        kind = _node_kind(ctypes.byref(c_value))
         result = _kind_to_astnode_cls[kind](c_value, node_c_value, metadata,
-                                            rebindings)
+                                            rebindings, unit, children_count)
         unit._node_cache[cache_key] = result
+        unit._track_wrapper(result)
         return result
 
     @classmethod
@@ -1536,6 +2004,8 @@ _initialize = _import_func(
 )
 _initialize()
 
+# Bindings that finalizers use are resolved eagerly, as finalizers can run
+# during interpreter shutdown, when resolving them would no longer work.
 _free = _import_func(
     '${capi.get_name("free")}',
     [ctypes.c_void_p], None
@@ -1545,17 +2015,28 @@ _destroy_text = _import_func(
     '${capi.get_name("destroy_text")}', [ctypes.POINTER(_text)], None
 )
 
-_symbol_text = _import_func(
+_symbol_text = _lazy_import_func(
     '${capi.get_name("symbol_text")}',
     [ctypes.POINTER(_symbol_type), ctypes.POINTER(_text)], None
 )
 
+_text_to_utf8 = _lazy_import_func(
+    '${capi.get_name("text_to_utf8")}',
+    [ctypes.POINTER(_text), ctypes.c_char_p, ctypes.c_size_t],
+    ctypes.c_size_t
+)
+
+_text_from_utf8 = _lazy_import_func(
+    '${capi.get_name("text_from_utf8")}',
+    [ctypes.c_char_p, ctypes.c_size_t, ctypes.POINTER(_text)], None
+)
+
 # Analysis primitives
-_create_analysis_context = _import_func(
+_create_analysis_context = _lazy_import_func(
     '${capi.get_name("create_analysis_context")}',
     [ctypes.c_char_p, _unit_provider, ctypes.c_int], AnalysisContext._c_type
 )
-_context_incref = _import_func(
+_context_incref = _lazy_import_func(
     '${capi.get_name("context_incref")}',
     [AnalysisContext._c_type], AnalysisContext._c_type
 )
@@ -1563,17 +2044,37 @@ _context_decref = _import_func(
     '${capi.get_name("context_decref")}',
     [AnalysisContext._c_type], None
 )
-_context_symbol = _import_func(
+_context_symbol = _lazy_import_func(
     '${capi.get_name("context_symbol")}',
     [AnalysisContext._c_type,
      ctypes.POINTER(_text),
      ctypes.POINTER(_symbol_type)], ctypes.c_int
 )
-_discard_errors_in_populate_lexical_env = _import_func(
+_context_discard_errors_in_populate_lexical_env = _lazy_import_func(
    '${capi.get_name("context_discard_errors_in_populate_lexical_env")}',
    [AnalysisContext._c_type, ctypes.c_int], None
 )
-_get_analysis_unit_from_file = _import_func(
+_context_set_unit_eviction_policy = _lazy_import_func(
+   '${capi.get_name("context_set_unit_eviction_policy")}',
+   [AnalysisContext._c_type, ctypes.c_uint, ctypes.c_uint64], None
+)
+_context_evict_units = _lazy_import_func(
+   '${capi.get_name("context_evict_units")}',
+   [AnalysisContext._c_type], None
+)
+_context_freeze = _lazy_import_func(
+   '${capi.get_name("context_freeze")}',
+   [AnalysisContext._c_type], None
+)
+_context_unfreeze = _lazy_import_func(
+   '${capi.get_name("context_unfreeze")}',
+   [AnalysisContext._c_type], None
+)
+_context_memory_usage = _lazy_import_func(
+   '${capi.get_name("context_memory_usage")}',
+   [AnalysisContext._c_type, ctypes.POINTER(_MemoryUsage)], None
+)
+_get_analysis_unit_from_file = _lazy_import_func(
     '${capi.get_name("get_analysis_unit_from_file")}',
     [AnalysisContext._c_type,  # context
      ctypes.c_char_p,          # filename
@@ -1581,7 +2082,18 @@ _get_analysis_unit_from_file = _import_func(
      ctypes.c_int],            # reparse
     AnalysisUnit._c_type
 )
-_get_analysis_unit_from_buffer = _import_func(
+_get_analysis_units_from_files = _lazy_import_func(
+    '${capi.get_name("get_analysis_units_from_files")}',
+    [AnalysisContext._c_type,  # context
+     ctypes.c_void_p,          # filenames
+     ctypes.c_int,             # count
+     ctypes.c_char_p,          # charset
+     ctypes.c_int,             # reparse
+     ctypes.c_int,             # workers
+     ctypes.c_void_p],         # units
+    None
+)
+_get_analysis_unit_from_buffer = _lazy_import_func(
     '${capi.get_name("get_analysis_unit_from_buffer")}',
     [AnalysisContext._c_type,  # context
      ctypes.c_char_p,          # filename
@@ -1591,7 +2103,7 @@ _get_analysis_unit_from_buffer = _import_func(
     AnalysisUnit._c_type
 )
 % if ctx.default_unit_provider:
-_get_analysis_unit_from_provider = _import_func(
+_get_analysis_unit_from_provider = _lazy_import_func(
     '${capi.get_name("get_analysis_unit_from_provider")}',
     [AnalysisContext._c_type,  # context
      ctypes.POINTER(_text),    # name
@@ -1601,57 +2113,78 @@ _get_analysis_unit_from_provider = _import_func(
     AnalysisUnit._c_type
 )
 % endif
-_unit_root = _import_func(
+_unit_pin = _lazy_import_func(
+    '${capi.get_name("unit_pin")}',
+    [AnalysisUnit._c_type], None
+)
+_unit_unpin = _lazy_import_func(
+    '${capi.get_name("unit_unpin")}',
+    [AnalysisUnit._c_type], None
+)
+_unit_root = _lazy_import_func(
     '${capi.get_name("unit_root")}',
     [AnalysisUnit._c_type, ctypes.POINTER(${c_entity})], None
 )
-_unit_first_token = _import_func(
+_unit_first_token = _lazy_import_func(
     "${capi.get_name('unit_first_token')}",
     [AnalysisUnit._c_type, ctypes.POINTER(Token)], None
 )
-_unit_last_token = _import_func(
+_unit_last_token = _lazy_import_func(
     "${capi.get_name('unit_last_token')}",
     [AnalysisUnit._c_type, ctypes.POINTER(Token)], None
 )
-_unit_token_count = _import_func(
+_unit_token_count = _lazy_import_func(
     "${capi.get_name('unit_token_count')}",
     [AnalysisUnit._c_type], ctypes.c_int
 )
-_unit_trivia_count = _import_func(
+_unit_trivia_count = _lazy_import_func(
     "${capi.get_name('unit_trivia_count')}",
     [AnalysisUnit._c_type], ctypes.c_int
 )
-_unit_lookup_token = _import_func(
+_unit_token_columns = _lazy_import_func(
+    "${capi.get_name('unit_token_columns')}",
+    [AnalysisUnit._c_type, ctypes.POINTER(_TokenColumns), ctypes.c_uint],
+    ctypes.c_uint
+)
+_unit_text = _lazy_import_func(
+    "${capi.get_name('unit_text')}",
+    [AnalysisUnit._c_type, ctypes.POINTER(_text)], None
+)
+_unit_lookup_token = _lazy_import_func(
     "${capi.get_name('unit_lookup_token')}",
     [AnalysisUnit._c_type,
      ctypes.POINTER(Sloc._c_type),
      ctypes.POINTER(Token)],
     None
 )
-_unit_filename = _import_func(
+_unit_filename = _lazy_import_func(
     "${capi.get_name('unit_filename')}",
     [AnalysisUnit._c_type], ctypes.POINTER(ctypes.c_char)
 )
-_unit_diagnostic_count = _import_func(
+_unit_diagnostic_count = _lazy_import_func(
     '${capi.get_name("unit_diagnostic_count")}',
     [AnalysisUnit._c_type], ctypes.c_uint
 )
-_unit_diagnostic = _import_func(
+_unit_memory_usage = _lazy_import_func(
+    '${capi.get_name("unit_memory_usage")}',
+    [AnalysisUnit._c_type, ctypes.POINTER(_MemoryUsage)], None
+)
+_unit_diagnostic = _lazy_import_func(
     '${capi.get_name("unit_diagnostic")}',
     [AnalysisUnit._c_type, ctypes.c_uint, ctypes.POINTER(Diagnostic._c_type)],
     ctypes.c_int
 )
-_unit_context = _import_func(
+_unit_context = _lazy_import_func(
     '${capi.get_name("unit_context")}',
     [AnalysisUnit._c_type], AnalysisContext._c_type
 )
-_unit_reparse_from_file = _import_func(
+_unit_reparse_from_file = _lazy_import_func(
     '${capi.get_name("unit_reparse_from_file")}',
     [AnalysisUnit._c_type,    # unit
      ctypes.c_char_p],        # charset
     ctypes.c_int
 )
-_unit_reparse_from_buffer = _import_func(
+_unit_reparse_from_buffer = _lazy_import_func(
     '${capi.get_name("unit_reparse_from_buffer")}',
     [AnalysisUnit._c_type, # unit
      ctypes.c_char_p,      # charset
@@ -1659,55 +2192,115 @@ _unit_reparse_from_buffer = _import_func(
      ctypes.c_size_t],     # buffer_size
     None
 )
-_unit_populate_lexical_env = _import_func(
+_unit_populate_lexical_env = _lazy_import_func(
     '${capi.get_name("unit_populate_lexical_env")}',
     [AnalysisUnit._c_type], ctypes.c_int
 )
 
 # General AST node primitives
-_node_kind = _import_func(
-    '${capi.get_name("node_kind")}',
-    [ctypes.POINTER(${c_entity})], ctypes.c_int
-)
-_kind_name = _import_func(
+_kind_name = _lazy_import_func(
     '${capi.get_name("kind_name")}',
     [ctypes.c_int], _text
 )
-_node_unit = _import_func(
+_node_unit = _lazy_import_func(
     '${capi.get_name("node_unit")}',
     [ctypes.POINTER(${c_entity})], AnalysisUnit._c_type
 )
-_node_is_token_node = _import_func(
+_node_is_token_node = _lazy_import_func(
     '${capi.get_name("node_is_token_node")}',
     [ctypes.POINTER(${c_entity})], ctypes.c_int
 )
-_node_short_image = _import_func(
+_node_short_image = _lazy_import_func(
     '${capi.get_name("node_short_image")}',
     [ctypes.POINTER(${c_entity})], _text
 )
-_node_sloc_range = _import_func(
+_node_sloc_range = _lazy_import_func(
     '${capi.get_name("node_sloc_range")}',
     [ctypes.POINTER(${c_entity}), ctypes.POINTER(SlocRange._c_type)], None
 )
-_lookup_in_node = _import_func(
+_lookup_in_node = _lazy_import_func(
     '${capi.get_name("lookup_in_node")}',
     [ctypes.POINTER(${c_entity}),
      ctypes.POINTER(Sloc._c_type),
      ctypes.POINTER(${c_entity})], None
 )
-_node_children_count = _import_func(
+_node_descriptor = _lazy_import_func(
+    '${capi.get_name("node_descriptor")}',
+    [ctypes.POINTER(${c_entity}), ctypes.POINTER(_NodeDescriptor)],
+    ctypes.c_int
+)
+_node_to_json = _lazy_import_func(
+    '${capi.get_name("node_to_json")}',
+    [ctypes.POINTER(${c_entity}),
+     ctypes.c_int,
+     ctypes.POINTER(ctypes.c_size_t)],
+    ctypes.POINTER(ctypes.c_char)
+)
+_node_to_binary = _lazy_import_func(
+    '${capi.get_name("node_to_binary")}',
+    [ctypes.POINTER(${c_entity}),
+     ctypes.c_int,
+     ctypes.POINTER(ctypes.c_size_t)],
+    ctypes.POINTER(ctypes.c_char)
+)
+_node_children_count = _lazy_import_func(
     '${capi.get_name("node_children_count")}',
     [ctypes.POINTER(${c_entity})], ctypes.c_uint
 )
-_node_child = _import_func(
-    '${capi.get_name("node_child")}',
-    [ctypes.POINTER(${c_entity}), ctypes.c_uint, ctypes.POINTER(${c_entity})],
-    ctypes.c_int
+_node_children = _lazy_import_func(
+    '${capi.get_name("node_children")}',
+    [ctypes.POINTER(${c_entity}),
+     ctypes.POINTER(${c_entity}),
+     ctypes.POINTER(ctypes.c_int),
+     ctypes.c_uint],
+    ctypes.c_uint
+)
+_create_node_finder = _lazy_import_func(
+    '${capi.get_name("create_node_finder")}',
+    [ctypes.POINTER(${c_entity}), ctypes.POINTER(ctypes.c_int), ctypes.c_uint],
+    ctypes.c_void_p
+)
+_node_finder_next = _lazy_import_func(
+    '${capi.get_name("node_finder_next")}',
+    [ctypes.c_void_p,
+     ctypes.POINTER(${c_entity}),
+     ctypes.POINTER(ctypes.c_int),
+     ctypes.c_uint],
+    ctypes.c_uint
+)
+_destroy_node_finder = _import_func(
+    '${capi.get_name("destroy_node_finder")}',
+    [ctypes.c_void_p], None
+)
+_node_finder_batch_size = 256
+_create_unparsing_output = _lazy_import_func(
+    '${capi.get_name("create_unparsing_output")}',
+    [], ctypes.c_void_p
+)
+_unparsing_output_clear = _lazy_import_func(
+    '${capi.get_name("unparsing_output_clear")}',
+    [ctypes.c_void_p], None
+)
+_unparsing_output_content = _lazy_import_func(
+    '${capi.get_name("unparsing_output_content")}',
+    [ctypes.c_void_p, ctypes.POINTER(ctypes.c_size_t)], ctypes.c_void_p
+)
+_destroy_unparsing_output = _import_func(
+    '${capi.get_name("destroy_unparsing_output")}',
+    [ctypes.c_void_p], None
+)
+_node_unparse = _lazy_import_func(
+    '${capi.get_name("node_unparse")}',
+    [ctypes.POINTER(${c_entity}), ctypes.c_void_p], None
+)
+_node_unparse_to_file = _lazy_import_func(
+    '${capi.get_name("node_unparse_to_file")}',
+    [ctypes.POINTER(${c_entity}), ctypes.c_int], None
 )
 
 % for astnode in ctx.astnode_types:
     % for field in astnode.fields_with_accessors():
-_${field.accessor_basename.lower} = _import_func(
+_${field.accessor_basename.lower} = _lazy_import_func(
     '${capi.get_name(field.accessor_basename)}',
     [ctypes.POINTER(${c_entity}),
      % for arg in field.arguments:
@@ -1734,29 +2327,29 @@ ${exts.include_extension(
 )}
 
 # Misc
-_token_kind_name = _import_func(
+_token_kind_name = _lazy_import_func(
    "${capi.get_name('token_kind_name')}",
    [ctypes.c_int], ctypes.POINTER(ctypes.c_char)
 )
-_token_next = _import_func(
+_token_next = _lazy_import_func(
     "${capi.get_name('token_next')}",
     [ctypes.POINTER(Token), ctypes.POINTER(Token)], None
 )
-_token_is_equivalent = _import_func(
+_token_is_equivalent = _lazy_import_func(
     "${capi.get_name('token_is_equivalent')}",
     [ctypes.POINTER(Token), ctypes.POINTER(Token)], ctypes.c_int
 )
-_token_previous = _import_func(
+_token_previous = _lazy_import_func(
     "${capi.get_name('token_previous')}",
     [ctypes.POINTER(Token), ctypes.POINTER(Token)], None
 )
-_token_range_text = _import_func(
+_token_range_text = _lazy_import_func(
     "${capi.get_name('token_range_text')}",
     [ctypes.POINTER(Token), ctypes.POINTER(Token), ctypes.POINTER(_text)],
     ctypes.c_int
 )
 % if T.entity.exposed:
-_entity_image = _import_func(
+_entity_image = _lazy_import_func(
     "${capi.get_name('entity_image')}",
     [ctypes.POINTER(${c_entity})], _text
 )
@@ -1786,6 +2379,26 @@ _kind_to_astnode_cls = {
 }
 
 
+_types_to_kinds_cache = {}
+
+
+def _kinds_for_types(types):
+    """
+    Return the list of node kinds (as C API constants) for nodes that are
+    instances of at least one of the given classes.
+
+    :param tuple[type] types: Classes for the nodes to look for.
+    :rtype: list[int]
+    """
+    try:
+        return _types_to_kinds_cache[types]
+    except KeyError:
+        result = sorted(kind for kind, cls in _kind_to_astnode_cls.items()
+                        if issubclass(cls, types))
+        _types_to_kinds_cache[types] = result
+        return result
+
+
 def _field_address(struct, field_name):
     """
     Get the address of a structure field from a structure value.
@@ -40,7 +40,7 @@ end Gen;
 
 
 def prepare_context(grammar, lexer=None, warning_set=default_warning_set,
-                    symbol_canonicalizer=None):
+                    symbol_canonicalizer=None, lexer_backend='quex'):
     """
     Create a compile context and prepare the build directory for code
     generation.
@@ -55,6 +55,9 @@ def prepare_context(grammar, lexer=None, warning_set=default_warning_set,
 
     :param langkit.compile_context.LibraryEntity|None symbol_canonicalizer:
         Symbol canoncalizes to use for this context, if any.
+
+    :param str lexer_backend: Name of the backend to use in order to generate
+        the lexer.
     """
 
     if lexer is None:
@@ -68,7 +71,8 @@ def prepare_context(grammar, lexer=None, warning_set=default_warning_set,
 
     # Try to emit code
     ctx = CompileCtx(lang_name='Foo', lexer=lexer, grammar=grammar,
-                     symbol_canonicalizer=symbol_canonicalizer)
+                     symbol_canonicalizer=symbol_canonicalizer,
+                     lexer_backend=lexer_backend)
     ctx.warnings = warning_set
     ctx.pretty_print = pretty_print
 
@@ -126,7 +130,8 @@ def build(grammar, lexer=None, warning_set=default_warning_set):
 
 def build_and_run(grammar, py_script=None, ada_main=None, lexer=None,
                   warning_set=default_warning_set,
-                  generate_unparser=False, symbol_canonicalizer=None):
+                  generate_unparser=False, symbol_canonicalizer=None,
+                  lexer_backend='quex'):
     """
     Compile and emit code for `ctx` and build the generated library. Then,
     execute the provided scripts/programs, if any.
@@ -145,6 +150,8 @@ def build_and_run(grammar, py_script=None, ada_main=None, lexer=None,
     :param bool generate_unparser: Whether to generate unparser.
     :param langkit.compile_context.LibraryEntity|None symbol_canonicalizer:
         Symbol canoncalizes to use for this context, if any.
+    :param str lexer_backend: Name of the backend to use in order to generate
+        the lexer.
     """
 
     if lexer is None:
@@ -152,7 +159,8 @@ def build_and_run(grammar, py_script=None, ada_main=None, lexer=None,
         lexer = foo_lexer
 
     ctx = prepare_context(grammar, lexer, warning_set,
-                          symbol_canonicalizer=symbol_canonicalizer)
+                          symbol_canonicalizer=symbol_canonicalizer,
+                          lexer_backend=lexer_backend)
 
     class Manage(ManageScript):
         def create_context(self, args):
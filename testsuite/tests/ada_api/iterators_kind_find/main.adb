@@ -0,0 +1,61 @@
+with Ada.Text_IO; use Ada.Text_IO;
+
+with Libfoolang.Analysis;  use Libfoolang.Analysis;
+with Libfoolang.Common;    use Libfoolang.Common;
+with Libfoolang.Iterators; use Libfoolang.Iterators;
+
+procedure Main is
+   LF : Character renames ASCII.LF;
+
+   Ctx : constant Analysis_Context := Create_Context;
+   U   : constant Analysis_Unit := Get_From_Buffer
+     (Ctx, "main.txt",
+      Buffer => "a {" & LF
+                & "   var b = 1;" & LF
+                & "   c {" & LF
+                & "      var d = 2;" & LF
+                & "   }" & LF
+                & "}" & LF
+                & "var e = 3;" & LF);
+
+   procedure Test (Label : String; Predicate : Foo_Node_Predicate);
+   --  Print all nodes that Find yields for Predicate
+
+   ----------
+   -- Test --
+   ----------
+
+   procedure Test (Label : String; Predicate : Foo_Node_Predicate) is
+      It   : Traverse_Iterator'Class := Find (U.Root, Predicate);
+      Node : Foo_Node;
+   begin
+      Put_Line ("== " & Label & " ==");
+      while It.Next (Node) loop
+         Put_Line (Node.Short_Image);
+      end loop;
+      New_Line;
+   end Test;
+
+begin
+   if U.Has_Diagnostics then
+      for D of U.Diagnostics loop
+         Put_Line (Format_GNU_Diagnostic (U, D));
+      end loop;
+      return;
+   end if;
+
+   Test ("Scope", Kind_Is (Foo_Scope));
+   Test ("Var or Num", Kind_Is (Foo_Var) or Kind_Is (Foo_Num));
+   Test ("not (Scope or Id or list)",
+         not For_Some ((Kind_Is (Foo_Scope),
+                        Kind_Is (Foo_Id),
+                        Kind_Is (Foo_Item_List))));
+   Test ("Var and text",
+         Kind_Is (Foo_Var) and Text_Is ("var d = 2;"));
+   Test ("Num and not Var", Kind_Is (Foo_Num) and not Kind_Is (Foo_Var));
+
+   Put_Line ("First Num: "
+             & Find_First (U.Root, Kind_Is (Foo_Num)).Short_Image);
+
+   Put_Line ("main.adb: Done.");
+end Main;
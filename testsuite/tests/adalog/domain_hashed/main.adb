@@ -0,0 +1,39 @@
+with Ada.Containers; use Ada.Containers;
+with Ada.Text_IO;    use Ada.Text_IO;
+
+with Langkit_Support.Adalog.Abstract_Relation;
+use Langkit_Support.Adalog.Abstract_Relation;
+with Langkit_Support.Adalog.Main_Support;
+use Langkit_Support.Adalog.Main_Support;
+
+--  Test that Member relations with large domains correctly check the value of
+--  an already defined logic variable when using a hash table.
+
+procedure Main is
+   use Eq_Int; use Eq_Int.Raw_Impl; use Eq_Int.Refs;
+
+   type Int_Array is array (Positive range <>) of Integer;
+
+   function Hash (I : Integer) return Hash_Type is (Hash_Type'Mod (I));
+
+   X    : Eq_Int.Refs.Raw_Var := Eq_Int.Refs.Create;
+   Vals : Raw_Member_Array (1 .. 100);
+begin
+   for I in Vals'Range loop
+      Vals (I) := 3 * I;
+   end loop;
+
+   for V of Int_Array'(1, 3, 42, 300, 301, -3) loop
+      declare
+         R : constant Relation :=
+           +Member (X, Vals, Hash => Hash'Unrestricted_Access);
+      begin
+         Set_Value (X, V);
+         Put_Line ("X =" & V'Img & ": " & Solve (R)'Img);
+         Reset (X);
+      end;
+   end loop;
+
+   Free (X);
+   Release_Relations;
+end Main;
@@ -0,0 +1,59 @@
+with Ada.Text_IO; use Ada.Text_IO;
+
+with Langkit_Support.Adalog.Abstract_Relation;
+use Langkit_Support.Adalog.Abstract_Relation;
+with Langkit_Support.Adalog.Main_Support;
+use Langkit_Support.Adalog.Main_Support;
+with Langkit_Support.Adalog.Operations;
+use Langkit_Support.Adalog.Operations;
+
+--  Test that relation normalization simplifies relations without changing
+--  their solutions.
+
+procedure Main is
+   use Eq_Int; use Eq_Int.Raw_Impl; use Eq_Int.Refs;
+
+   X : Eq_Int.Refs.Raw_Var := Eq_Int.Refs.Create;
+   Y : Eq_Int.Refs.Raw_Var := Eq_Int.Refs.Create;
+   Z : Eq_Int.Refs.Raw_Var := Eq_Int.Refs.Create;
+
+   Inner : constant Relation :=
+     +Logic_All ((+Member (X, (1, 2, 3)), +Equals (X, Y)));
+
+   R : constant Relation :=
+     +Logic_All
+       ((+Logic_Any ((Inner, Inner)),
+         +Equals (Y, 2),
+         +Member (Z, (3, 4)),
+         +Equals (Y, 2)));
+
+   Normalized : Relation;
+begin
+   X.Dbg_Name := new String'("X");
+   Y.Dbg_Name := new String'("Y");
+   Z.Dbg_Name := new String'("Z");
+   Set_Value (Z, 4);
+
+   Put_Line ("Original:");
+   Print_Relation (R);
+   New_Line;
+
+   Normalized := Normalize (R);
+   Put_Line ("Normalized:");
+   Print_Relation (Normalized);
+   New_Line;
+
+   while Solve (Normalized) loop
+      Put_Line ("Solution: { X =" & Get_Value (X)'Img
+                & "; Y =" & Get_Value (Y)'Img & " }");
+   end loop;
+
+   Dec_Ref (Normalized);
+   Destroy (X.all);
+   Destroy (Y.all);
+   Destroy (Z.all);
+   Free (X);
+   Free (Y);
+   Free (Z);
+   Release_Relations;
+end Main;
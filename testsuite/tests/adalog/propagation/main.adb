@@ -0,0 +1,59 @@
+with Ada.Text_IO; use Ada.Text_IO;
+
+with Langkit_Support.Adalog.Abstract_Relation;
+use Langkit_Support.Adalog.Abstract_Relation;
+with Langkit_Support.Adalog.Main_Support;
+use Langkit_Support.Adalog.Main_Support;
+with Langkit_Support.Adalog.Operations;
+use Langkit_Support.Adalog.Operations;
+
+--  Test that the Propagation solving strategy finds the same solutions as the
+--  Chronological one, with fewer backtracks.
+
+procedure Main is
+   use Eq_Int; use Eq_Int.Raw_Impl; use Eq_Int.Refs;
+
+   X : Eq_Int.Refs.Raw_Var := Eq_Int.Refs.Create;
+   Y : Eq_Int.Refs.Raw_Var := Eq_Int.Refs.Create;
+
+   procedure Run (Strategy : Solving_Strategy);
+   --  Print all the solutions for our equation, using Strategy
+
+   ---------
+   -- Run --
+   ---------
+
+   procedure Run (Strategy : Solving_Strategy) is
+      R : constant Relation :=
+        +Logic_All
+          ((+Member (X, (1, 2, 3, 4, 5)),
+            +Equals (X, Y),
+            +Equals (Y, 3)));
+
+      Stats      : aliased Solving_Statistics;
+      Backtracks : Statistics_Counter := 0;
+   begin
+      Put_Line ("== " & Strategy'Image & " ==");
+      while Solve (R, 0, Stats'Access, Strategy) loop
+         Backtracks := Backtracks + Stats.Backtracks;
+         Put_Line ("Solution: { X =" & Get_Value (X)'Img
+                   & "; Y =" & Get_Value (Y)'Img & " }");
+      end loop;
+      Backtracks := Backtracks + Stats.Backtracks;
+      Put_Line ("Backtracks:" & Backtracks'Img);
+      New_Line;
+   end Run;
+
+begin
+   X.Dbg_Name := new String'("X");
+   Y.Dbg_Name := new String'("Y");
+
+   Run (Chronological);
+   Run (Propagation);
+
+   Destroy (X.all);
+   Destroy (Y.all);
+   Free (X);
+   Free (Y);
+   Release_Relations;
+end Main;
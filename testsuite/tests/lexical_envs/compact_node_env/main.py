@@ -0,0 +1,23 @@
+from __future__ import absolute_import, division, print_function
+
+print('main.py: Running...')
+
+
+import sys
+
+import libfoolang
+
+
+ctx = libfoolang.AnalysisContext()
+u = ctx.get_from_buffer('foo', 'a { b { } c { d { } } }')
+
+if u.diagnostics:
+    for d in u.diagnostics:
+        print('{}'.format(d))
+    sys.exit(1)
+
+u.populate_lexical_env()
+for n in u.root.findall(lambda n: n.is_a(libfoolang.Scope, libfoolang.Id)):
+    print('{} -> {}'.format(n, n.p_env_owner))
+
+print('main.py: Done.')
@@ -0,0 +1,42 @@
+"""
+Check that nodes with no env spec, which do not store their lexical
+environment in compact node layouts, still get the environment of their
+closest ancestor.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+from langkit.dsl import ASTNode, Field
+from langkit.envs import EnvSpec, add_env
+from langkit.expressions import Self, langkit_property
+from langkit.parsers import Grammar, List
+
+from lexer_example import Token
+from utils import build_and_run
+
+
+class FooNode(ASTNode):
+
+    @langkit_property(public=True)
+    def env_owner():
+        return Self.children_env.env_node.as_bare_entity
+
+
+class Scope(FooNode):
+    name = Field()
+    scopes = Field()
+
+    env_spec = EnvSpec(add_env())
+
+
+class Id(FooNode):
+    token_node = True
+
+
+G = Grammar('main_rule')
+G.add_rules(
+    main_rule=List(G.scope, empty_valid=True),
+    scope=Scope(Id(Token.Identifier), '{', G.main_rule, '}'),
+)
+build_and_run(G, 'main.py')
+print('Done')
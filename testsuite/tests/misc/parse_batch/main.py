@@ -0,0 +1,63 @@
+from __future__ import absolute_import, division, print_function
+
+import json
+import subprocess
+
+import libfoolang
+
+
+print('main.py: Running...')
+
+filenames = ['a.txt', 'b.txt', 'missing.txt']
+with open('files.txt', 'w') as f:
+    for filename in filenames:
+        print(filename, file=f)
+
+# The token count depends on how the lexer handles termination and unreadable
+# files: take the reference from the Python API, which uses the same library.
+ctx = libfoolang.AnalysisContext()
+expected_tokens = sum(ctx.get_from_file(filename).token_count
+                      for filename in filenames)
+
+
+def run(*args):
+    argv = ['parse', '--batch', '-F', 'files.txt'] + list(args)
+    print('== {} =='.format(' '.join(argv[1:])))
+    output = subprocess.check_output(argv)
+    try:
+        report = json.loads(output)
+    except ValueError:
+        print(output.rstrip())
+        return
+
+    # Timings, throughput and memory usage vary from one run to another: only
+    # check their presence and types.
+    for key in ('files', 'workers', 'nodes', 'diagnostics',
+                'property_evaluations', 'property_errors'):
+        print('{}: {}'.format(key, report[key]))
+    print('tokens match the Python API: {}'.format(
+        report['tokens'] == expected_tokens
+    ))
+    print('phases: {}'.format(sorted(report['phases'])))
+    print('rates: {}'.format(all(
+        isinstance(report[key], float)
+        for key in ('files_per_second', 'tokens_per_second',
+                    'nodes_per_second')
+    )))
+    lexer_bench = report['lexer_benchmark']
+    print('lexer_benchmark: {}'.format(
+        None if lexer_bench is None else sorted(lexer_bench)
+    ))
+    peak_rss = report['peak_rss_bytes']
+    print('peak_rss_bytes: {}'.format(
+        peak_rss is None or isinstance(peak_rss, (int, long))
+    ))
+    print('')
+
+
+run()
+run('-j', '2', '--ple')
+run('-j', '2', '--property', 'p_check', '--lexer-bench')
+run('--property', 'p_unknown')
+
+print('main.py: Done.')
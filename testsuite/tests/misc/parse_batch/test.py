@@ -0,0 +1,39 @@
+"""
+Test the batch mode of the "parse" program: parallel parsing, the lexical envs
+and property phases, the standalone lexer benchmark and the JSON report.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+from langkit.dsl import ASTNode, T
+from langkit.expressions import If, PropertyError, Self, langkit_property
+from langkit.parsers import Grammar, List, Or
+
+from lexer_example import Token
+from utils import build_and_run
+
+
+class FooNode(ASTNode):
+
+    @langkit_property(public=True)
+    def check():
+        return If(Self.is_a(T.Name),
+                  PropertyError(T.Bool, 'Names are rejected'),
+                  True)
+
+
+class Example(FooNode):
+    pass
+
+
+class Name(FooNode):
+    token_node = True
+
+
+foo_grammar = Grammar('main_rule')
+foo_grammar.add_rules(
+    main_rule=List(Or(Example('example'), Name(Token.Identifier)),
+                   empty_valid=True),
+)
+build_and_run(foo_grammar, 'main.py')
+print('Done')
@@ -0,0 +1,47 @@
+with Ada.Text_IO; use Ada.Text_IO;
+
+with Langkit_Support.Text;     use Langkit_Support.Text;
+with Libfoolang.Analysis;      use Libfoolang.Analysis;
+with Libfoolang.Common;        use Libfoolang.Common;
+with Libfoolang.Introspection; use Libfoolang.Introspection;
+with Libfoolang.Rewriting;     use Libfoolang.Rewriting;
+
+with Process_Apply;
+
+procedure Unchanged_Units is
+   Buffer_A : constant String := "def a = 1" & ASCII.LF;
+   Buffer_B : constant String :=
+      "# Comment" & ASCII.LF & "def b = (2 +  3)" & ASCII.LF;
+
+   Ctx    : constant Analysis_Context := Create_Context;
+   Unit_A : constant Analysis_Unit :=
+      Get_From_Buffer (Ctx, "a.txt", Buffer => Buffer_A);
+   Unit_B : constant Analysis_Unit :=
+      Get_From_Buffer (Ctx, "b.txt", Buffer => Buffer_B);
+
+   Def_B : constant Foo_Node := Root (Unit_B).Child (1);
+
+   RH : Rewriting_Handle := Start_Rewriting (Ctx);
+
+   DA : constant Node_Rewriting_Handle := Handle (Root (Unit_A).Child (1));
+   DB : constant Node_Rewriting_Handle := Handle (Def_B);
+begin
+   --  Only modify the tree of a.txt. Getting handles for the nodes of b.txt
+   --  and expanding them must not make Apply reparse b.txt.
+
+   Set_Child (DA, Index (Kind (DA), Def_F_Expr),
+              Create_Token_Node (RH, Foo_Literal, "11"));
+   Put_Line ("b.txt def has" & Natural'Image (Children_Count (DB))
+             & " children");
+
+   Put_Line ("Applying the diff...");
+   Process_Apply (RH);
+
+   Put_Line ("a.txt: " & Image (Text (Root (Unit_A)), With_Quotes => True));
+   Put_Line ("b.txt: " & Image (Text (Root (Unit_B)), With_Quotes => True));
+
+   --  As b.txt was not reparsed, references to its nodes are still valid
+   Put_Line ("b.txt def: " & Def_B.Image);
+
+   Put_Line ("unchanged_units.adb: Done.");
+end Unchanged_Units;
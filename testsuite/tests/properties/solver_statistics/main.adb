@@ -0,0 +1,86 @@
+with Ada.Strings.Unbounded; use Ada.Strings.Unbounded;
+with Ada.Text_IO;           use Ada.Text_IO;
+
+with Libfoolang.Analysis; use Libfoolang.Analysis;
+with Libfoolang.Common;   use Libfoolang.Common;
+
+procedure Main is
+   Ctx : constant Analysis_Context := Create_Context;
+   U   : constant Analysis_Unit := Get_From_Buffer
+     (Ctx, "foo.txt", Buffer => "example");
+   N   : constant Example := Root (U).As_Example;
+
+   procedure Print_Statistics;
+   --  Print solver statistics for all properties in Ctx
+
+   ----------------------
+   -- Print_Statistics --
+   ----------------------
+
+   procedure Print_Statistics is
+      Stats : constant Solver_Statistics_Array := Solver_Statistics (Ctx);
+
+      procedure Print (Property : String);
+      --  Print statistics for Property, if any
+
+      -----------
+      -- Print --
+      -----------
+
+      procedure Print (Property : String) is
+      begin
+         for S of Stats loop
+            if To_String (S.Property) = Property then
+               Put_Line
+                 ("   " & Property & ":"
+                  & Natural'Image (S.Resolutions) & " resolutions,"
+                  & Natural'Image (S.Satisfied) & " satisfied,"
+                  & Natural'Image (S.Unsatisfied) & " unsatisfied,"
+                  & Natural'Image (S.Timeouts) & " timeouts,"
+                  & Natural'Image (S.Errors) & " errors");
+            end if;
+         end loop;
+      end Print;
+
+   begin
+      if Stats'Length = 0 then
+         Put_Line ("   No logic resolution");
+         return;
+      end if;
+
+      --  Statistics come sorted by decreasing number of solving steps: print
+      --  them in a fixed order instead, so that the output does not depend on
+      --  solver internals.
+
+      Print ("Example.solve_true");
+      Print ("Example.solve_false");
+      Print ("Example.solve_error");
+   end Print_Statistics;
+
+begin
+   Put_Line ("Before any resolution:");
+   Print_Statistics;
+
+   Put_Line ("solve_true: " & Boolean'Image (N.P_Solve_True));
+   Put_Line ("solve_true: " & Boolean'Image (N.P_Solve_True));
+   Put_Line ("solve_false: " & Boolean'Image (N.P_Solve_False));
+   begin
+      Put_Line ("solve_error: " & Boolean'Image (N.P_Solve_Error));
+   exception
+      when Property_Error =>
+         Put_Line ("solve_error: Property_Error");
+   end;
+
+   Put_Line ("After resolutions:");
+   Print_Statistics;
+
+   Reset_Solver_Statistics (Ctx);
+   Put_Line ("After reset:");
+   Print_Statistics;
+
+   Put_Line ("solve_false: " & Boolean'Image (N.P_Solve_False));
+   Put_Line ("After one more resolution:");
+   Print_Statistics;
+
+   Put_Line ("main.adb: Done.");
+end Main;
@@ -0,0 +1,46 @@
+"""
+Test that logic resolutions are recorded in the solver statistics of the
+analysis context, per property and per outcome, and that these statistics can
+be reset.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+from langkit.dsl import ASTNode, T, UserField
+from langkit.expressions import (
+    LogicFalse, LogicTrue, Predicate, Self, langkit_property
+)
+from langkit.parsers import Grammar
+
+from utils import build_and_run
+
+
+class FooNode(ASTNode):
+    pass
+
+
+class Example(FooNode):
+    var = UserField(T.LogicVar, public=False)
+
+    @langkit_property()
+    def pred():
+        return False
+
+    @langkit_property(public=True)
+    def solve_true():
+        return LogicTrue().solve
+
+    @langkit_property(public=True)
+    def solve_false():
+        return LogicFalse().solve
+
+    @langkit_property(public=True)
+    def solve_error():
+        # Var is never bound, so this raises an Early_Binding_Error
+        return Predicate(Example.pred, Self.var).solve
+
+
+G = Grammar('main_rule')
+G.add_rules(main_rule=Example('example'))
+build_and_run(G, ada_main='main.adb')
+print('Done')
@@ -0,0 +1,54 @@
+from __future__ import absolute_import, division, print_function
+
+import sys
+
+import libfoolang
+
+
+print('main.py: Starting...')
+
+ctx = libfoolang.AnalysisContext()
+
+
+def parse(buffer):
+    u = ctx.get_from_buffer('foo.txt', buffer)
+    if u.diagnostics:
+        for d in u.diagnostics:
+            print(d)
+        sys.exit(1)
+    return u
+
+
+unit = parse('a { var b = 1; c { var d = 2; } } var e = 3;')
+root = unit.root
+
+for label, types in [
+    ('Scope', libfoolang.Scope),
+    ('Item', libfoolang.Item),
+    ('[Var, Num]', [libfoolang.Var, libfoolang.Num]),
+]:
+    result = root.findall(types)
+    print('{}: {}'.format(label, result))
+
+    # Check that the native search is consistent with a predicate-based one
+    types = tuple(types) if isinstance(types, list) else types
+    assert result == root.findall(lambda n: isinstance(n, types))
+
+all_nodes = root.findall(libfoolang.FooNode)
+assert all_nodes == root.findall(lambda n: True)
+print('FooNode: {} nodes'.format(len(all_nodes)))
+
+id_c = root.findall(libfoolang.Id)[2]
+print('Item with f_name={}: {}'.format(
+    id_c, root.findall(libfoolang.Item, f_name=id_c)))
+print('find(Num): {}'.format(root.find(libfoolang.Num)))
+print('find(Scope) in Var: {}'.format(
+    root.find(libfoolang.Var).find(libfoolang.Scope)))
+
+# Check that searches spanning several batches yield all nodes
+unit = parse(' '.join('var v{} = {};'.format(i, i) for i in range(1000)))
+print('Vars: {}'.format(len(unit.root.findall(libfoolang.Var))))
+print('Ids and Nums: {}'.format(
+    len(unit.root.findall([libfoolang.Id, libfoolang.Num]))))
+
+print('main.py: Done.')
@@ -0,0 +1,51 @@
+"""
+Test that node type-based searches in the Python API (which run natively in
+the C API) yield the same nodes as predicate-based ones.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+from langkit.dsl import ASTNode, Field, abstract
+from langkit.parsers import Grammar, List, Or
+
+from lexer_example import Token
+from utils import build_and_run
+
+
+class FooNode(ASTNode):
+    pass
+
+
+@abstract
+class Item(FooNode):
+    pass
+
+
+class Scope(Item):
+    name = Field()
+    items = Field()
+
+
+class Var(Item):
+    name = Field()
+    value = Field()
+
+
+class Id(FooNode):
+    token_node = True
+
+
+class Num(FooNode):
+    token_node = True
+
+
+G = Grammar('main_rule')
+G.add_rules(
+    main_rule=List(G.item, empty_valid=True),
+    item=Or(G.scope, G.var),
+    scope=Scope(G.id, '{', G.main_rule, '}'),
+    var=Var('var', G.id, '=', Num(Token.Number), ';'),
+    id=Id(Token.Identifier),
+)
+build_and_run(G, 'main.py')
+print('Done')
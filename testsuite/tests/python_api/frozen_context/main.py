@@ -0,0 +1,65 @@
+from __future__ import absolute_import, division, print_function
+
+print('main.py: Running...')
+
+
+import threading
+
+import libfoolang
+
+
+ctx = libfoolang.AnalysisContext()
+units = [ctx.get_from_buffer('{}.txt'.format(i), 'example')
+         for i in range(4)]
+
+print('Freezing the context...')
+ctx.freeze()
+ctx.freeze()
+
+errors = []
+
+
+def check(unit):
+    try:
+        for i in range(1000):
+            assert unit.root.p_compute(i) == i + 1
+
+            # Memoized arrays are shared between threads: their reference
+            # counts change both during evaluation and when Python frees
+            # them.
+            assert unit.root.p_pair(i % 10) == [i % 10, i % 10 + 1]
+    except Exception as exc:
+        errors.append(exc)
+
+
+threads = [threading.Thread(target=check, args=(u, )) for u in units]
+for t in threads:
+    t.start()
+for t in threads:
+    t.join()
+print('Errors in threads: {}'.format(errors))
+
+print('Fetching a loaded unit...')
+print('  Same unit: {}'.format(ctx.get_from_file('0.txt') == units[0]))
+
+for label, action in [
+    ('Loading a new unit', lambda: ctx.get_from_file('new.txt')),
+    ('Reparsing a unit', lambda: ctx.get_from_buffer('0.txt', 'example')),
+]:
+    print('{}...'.format(label))
+    try:
+        action()
+    except libfoolang.NativeException as exc:
+        print('  Got an error: {}'.format(
+            'FROZEN_CONTEXT_ERROR' in str(exc)
+        ))
+    else:
+        print('  No error')
+
+print('Unfreezing the context...')
+ctx.unfreeze()
+print('  Reparsed unit root: {}'.format(
+    ctx.get_from_buffer('0.txt', 'example').root
+))
+
+print('main.py: Done.')
@@ -0,0 +1,34 @@
+"""
+Test that properties can be evaluated from several threads once the analysis
+context is frozen, including when their results are shared memoized arrays,
+and that frozen contexts reject unit (re)loading.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+from langkit.dsl import ASTNode, Int
+from langkit.expressions import ArrayLiteral, langkit_property
+from langkit.parsers import Grammar
+
+from utils import build_and_run
+
+
+class FooNode(ASTNode):
+    pass
+
+
+class Example(FooNode):
+
+    @langkit_property(public=True, memoized=True, return_type=Int)
+    def compute(i=Int):
+        return i + 1
+
+    @langkit_property(public=True, memoized=True, return_type=Int.array)
+    def pair(i=Int):
+        return ArrayLiteral([i, i + 1])
+
+
+foo_grammar = Grammar('main_rule')
+foo_grammar.add_rules(main_rule=Example('example'))
+build_and_run(foo_grammar, 'main.py')
+print('Done')
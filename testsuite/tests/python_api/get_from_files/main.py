@@ -0,0 +1,45 @@
+from __future__ import absolute_import, division, print_function
+
+import os.path
+
+import libfoolang
+
+
+print('main.py: Running...')
+
+
+def dump(units):
+    for u in units:
+        blocks = (len(u.root.findall(libfoolang.Block))
+                  if u.root is not None else 0)
+        print('  {}: {} ({} blocks, {} diagnostics)'.format(
+            os.path.basename(u.filename), u.root, blocks, len(u.diagnostics)
+        ))
+
+
+filenames = ['a.txt', 'b.txt', 'a.txt', 'missing.txt']
+
+for workers in (1, 4):
+    print('With {} worker(s):'.format(workers))
+    ctx = libfoolang.AnalysisContext()
+    units = ctx.get_from_files(filenames, workers=workers)
+    dump(units)
+    print('  Same unit for duplicate filenames: {}'.format(
+        units[0] == units[2]
+    ))
+    print('  Same unit as get_from_file: {}'.format(
+        units[1] == ctx.get_from_file('b.txt')
+    ))
+
+print('Reparsing:')
+units = ctx.get_from_files(filenames[:2], reparse=True, workers=2)
+dump(units)
+
+# Units loaded in a batch must not evict each other
+print('With an eviction policy:')
+ctx = libfoolang.AnalysisContext()
+ctx.set_unit_eviction_policy(max_units=1)
+for workers in (1, 2):
+    dump(ctx.get_from_files(filenames[:2], reparse=True, workers=workers))
+
+print('main.py: Done.')
@@ -0,0 +1,38 @@
+"""
+Test loading several analysis units at once with concurrent parsing, on
+sources that have different sizes and nesting depths.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+from langkit.dsl import ASTNode, Field
+from langkit.parsers import Grammar, List
+
+from lexer_example import Token
+from utils import build_and_run
+
+
+class FooNode(ASTNode):
+    pass
+
+
+class Block(FooNode):
+    name = Field()
+    body = Field()
+
+
+class Name(FooNode):
+    token_node = True
+
+
+foo_grammar = Grammar('main_rule')
+foo_grammar.add_rules(
+    main_rule=List(foo_grammar.block, empty_valid=True),
+    block=Block('def', foo_grammar.name,
+                '{', List(foo_grammar.block, empty_valid=True), '}'),
+    name=Name(Token.Identifier),
+)
+
+build_and_run(foo_grammar, 'main.py')
+
+print('Done')
@@ -0,0 +1,66 @@
+from __future__ import absolute_import, division, print_function
+
+import sys
+
+import libfoolang
+
+
+print('main.py: Running...')
+
+ctx = libfoolang.AnalysisContext()
+u = ctx.get_from_buffer('foo.txt', 'def a = 1, 2, 3, 4, 5 def b = 6')
+if u.diagnostics:
+    for d in u.diagnostics:
+        print(d)
+    sys.exit(1)
+
+decl = u.root[0]
+print('Default: {}'.format(type(decl.p_value_nodes).__name__))
+
+libfoolang.set_lazy_arrays()
+items = decl.p_value_nodes
+print('Lazy: {}'.format(type(items).__name__))
+print('len(items) = {}'.format(len(items)))
+print('bool(items) = {}'.format(bool(items)))
+print('items[0] = {}'.format(items[0]))
+print('items[-1] = {}'.format(items[-1]))
+print('items[1:4:2] = {}'.format(items[1:4:2]))
+print('list(items) = {}'.format(list(items)))
+print('items.to_list() == list(items): {}'.format(
+    items.to_list() == list(items)))
+print('items == decl.p_value_nodes: {}'.format(items == decl.p_value_nodes))
+assert items[0] is items[0]
+assert items[2] == decl.f_values[2]
+
+try:
+    items[5]
+except IndexError:
+    print('items[5]: IndexError')
+
+empty = u.root[1].p_value_nodes[1:]
+print('empty slice = {}'.format(empty))
+
+# Lazy arrays can be passed back to properties
+print('decl.p_count(decl.p_value_nodes) = {}'.format(
+    decl.p_count(decl.p_value_nodes)))
+
+indexes = decl.p_value_indexes
+print('indexes = {}'.format(indexes))
+
+# Items that were not wrapped before a reparse reference destroyed nodes, but
+# items that were already wrapped and items that do not reference nodes are
+# still available.
+nodes = decl.p_value_nodes
+wrapped = nodes[1]
+u.reparse('def a = 1')
+try:
+    nodes[0]
+except libfoolang.StaleReferenceError:
+    print('nodes[0] after reparse: StaleReferenceError')
+assert nodes[1] is wrapped
+print('indexes[4] after reparse: {}'.format(indexes[4]))
+
+libfoolang.set_lazy_arrays(False)
+print('Disabled: {}'.format(type(u.root[0].p_value_nodes).__name__))
+
+print('main.py: Done.')
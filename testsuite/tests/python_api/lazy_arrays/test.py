@@ -0,0 +1,50 @@
+"""
+Test lazy wrappers for arrays that properties return in the Python API, both
+for arrays of nodes, which become stale when their unit is reparsed, and for
+arrays of integers, which do not.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+from langkit.dsl import ASTNode, Field, T
+from langkit.expressions import Entity, Property, Self, langkit_property
+from langkit.parsers import Grammar, List
+
+from lexer_example import Token
+from utils import build_and_run
+
+
+class FooNode(ASTNode):
+
+    @langkit_property(public=True)
+    def count(seq=T.Num.entity.array):
+        return seq.length
+
+
+class Decl(FooNode):
+    name = Field()
+    values = Field()
+
+    value_nodes = Property(Entity.values.map(lambda v: v), public=True)
+    value_indexes = Property(Self.values.map(lambda i, _: i), public=True)
+
+
+class Name(FooNode):
+    token_node = True
+
+
+class Num(FooNode):
+    token_node = True
+
+
+foo_grammar = Grammar('main_rule')
+foo_grammar.add_rules(
+    main_rule=List(foo_grammar.decl),
+    decl=Decl('def', foo_grammar.name, '=',
+              List(foo_grammar.num, sep=',')),
+    name=Name(Token.Identifier),
+    num=Num(Token.Number),
+)
+
+build_and_run(foo_grammar, 'main.py')
+print('Done')
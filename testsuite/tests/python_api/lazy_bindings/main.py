@@ -0,0 +1,43 @@
+from __future__ import absolute_import, division, print_function
+
+import sys
+
+import libfoolang
+
+
+print('main.py: Starting...')
+
+
+def is_resolved(name):
+    return getattr(libfoolang, name).__name__ != 'stub'
+
+
+names = ('_unit_root', '_decl_f_name', '_unit_filename')
+
+
+def show():
+    for name in names:
+        status = 'resolved' if is_resolved(name) else 'not resolved'
+        print('   {}: {}'.format(name, status))
+
+
+print('After import:')
+show()
+
+ctx = libfoolang.AnalysisContext()
+unit = ctx.get_from_buffer('foo.txt', 'def a')
+if unit.diagnostics:
+    for d in unit.diagnostics:
+        print(d)
+    sys.exit(1)
+
+print('root: {}'.format(unit.root))
+print('root again: {}'.format(unit.root))
+print('After root access:')
+show()
+
+print('name: {}'.format(unit.root.f_name))
+print('After field access:')
+show()
+
+print('main.py: Done.')
@@ -0,0 +1,30 @@
+"""
+Test that the Python API resolves C functions, including field accessors,
+lazily, on their first call.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+from langkit.dsl import ASTNode, Field
+from langkit.parsers import Grammar
+
+from lexer_example import Token
+from utils import build_and_run
+
+
+class FooNode(ASTNode):
+    pass
+
+
+class Decl(FooNode):
+    name = Field()
+
+
+class Name(FooNode):
+    token_node = True
+
+
+g = Grammar('main_rule')
+g.add_rules(main_rule=Decl('def', Name(Token.Identifier)))
+build_and_run(g, 'main.py')
+print('Done')
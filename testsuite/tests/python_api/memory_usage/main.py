@@ -0,0 +1,31 @@
+from __future__ import absolute_import, division, print_function
+
+import libfoolang
+
+
+def describe(label, usage):
+    print('{}:'.format(label))
+    for category in sorted(usage):
+        entry = usage[category]
+        assert isinstance(entry, libfoolang.MemoryUsage)
+        assert entry.bytes >= 0
+        print('   {}: {} objects'.format(category, entry.objects))
+
+
+ctx = libfoolang.AnalysisContext()
+u1 = ctx.get_from_buffer('foo.txt', b'example example (example)')
+u2 = ctx.get_from_buffer('bar.txt', b'example')
+
+describe('foo.txt', u1.memory_usage)
+describe('bar.txt', u2.memory_usage)
+assert u1.memory_usage['ast'].bytes > 0
+assert u1.memory_usage['tokens'].bytes > u2.memory_usage['tokens'].bytes
+
+ctx_usage = ctx.memory_usage
+for category in ('ast', 'tokens', 'memoization', 'rebindings'):
+    assert ctx_usage[category] == tuple(
+        u1.memory_usage[category][i] + u2.memory_usage[category][i]
+        for i in range(2)
+    ), category
+
+print('main.py: Done.')
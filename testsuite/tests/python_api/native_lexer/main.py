@@ -0,0 +1,27 @@
+# -*- coding: utf-8 -*-
+
+from __future__ import absolute_import, division, print_function
+
+import libfoolang
+
+
+print('main.py: Running...')
+
+ctx = libfoolang.AnalysisContext()
+
+for filename, buffer in [
+    ('keywords.txt', b'def define = 12 # c\ndef_ b'),
+    ('failure.txt', b'def a ? = 1'),
+    ('unicode.txt', u'def a # \xe9t\xe9\ndef b'.encode('utf-8')),
+    ('empty.txt', b''),
+]:
+    print('== {} =='.format(filename))
+    unit = ctx.get_from_buffer(filename, buffer, charset='utf-8')
+    for d in unit.diagnostics:
+        print(d)
+    for tok in unit.iter_tokens():
+        print('{} {} {}'.format(tok.kind, repr(tok.text or u''),
+                                tok.sloc_range))
+    print('')
+
+print('main.py: Done')
@@ -0,0 +1,40 @@
+"""
+Test that the native lexer backend scans sources the same way the Quex one
+does: longest match first, rule order for ties, trivia and lexing failures.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+from langkit.dsl import ASTNode, Field
+from langkit.parsers import Grammar, List, Opt
+
+from lexer_example import Token
+from utils import build_and_run
+
+
+class FooNode(ASTNode):
+    pass
+
+
+class Decl(FooNode):
+    name = Field()
+    value = Field()
+
+
+class Name(FooNode):
+    token_node = True
+
+
+class Num(FooNode):
+    token_node = True
+
+
+g = Grammar('main_rule')
+g.add_rules(
+    main_rule=List(g.decl),
+    decl=Decl('def', g.name, Opt('=', g.num)),
+    name=Name(Token.Identifier),
+    num=Num(Token.Number),
+)
+build_and_run(g, 'main.py', lexer_backend='native')
+print('Done')
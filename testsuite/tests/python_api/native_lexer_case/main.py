@@ -0,0 +1,24 @@
+from __future__ import absolute_import, division, print_function
+
+import libfoolang
+
+
+print('main.py: Running...')
+
+ctx = libfoolang.AnalysisContext()
+
+for filename, buffer in [
+    ('char.txt', b"'a' 'b'"),
+    ('attribute.txt', b"f'a'"),
+    ('trivia.txt', b"f 'a'"),
+]:
+    print('== {} =='.format(filename))
+    unit = ctx.get_from_buffer(filename, buffer)
+    for d in unit.diagnostics:
+        print(d)
+    for tok in unit.iter_tokens():
+        print('{} {} {}'.format(tok.kind, repr(tok.text or u''),
+                                tok.sloc_range))
+    print('')
+
+print('main.py: Done')
@@ -0,0 +1,67 @@
+"""
+Test that the native lexer backend handles Case rules: the sent token depends
+on the previous non-trivia token, and shorter alternatives retract the end of
+the match.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+from langkit.dsl import ASTNode
+from langkit.lexer import (
+    Alt, Case, Eof, Lexer, LexerToken, Literal, Pattern, WithSymbol, WithText,
+    WithTrivia
+)
+from langkit.parsers import Grammar, List, Or
+
+from utils import build_and_run
+
+
+class Token(LexerToken):
+    Tick = WithText()
+    Char = WithText()
+    Identifier = WithSymbol()
+    Whitespace = WithTrivia()
+
+
+foo_lexer = Lexer(Token)
+foo_lexer.add_rules(
+    (Pattern(r'[ \n\r\t]+'), Token.Whitespace),
+    (Eof(), Token.Termination),
+    (Pattern('[a-z]+'), Token.Identifier),
+
+    # Like in Ada: "f'a'" is an attribute reference, "('a')" is a character
+    # literal.
+    Case(Pattern("'.'"),
+         Alt(prev_token_cond=(Token.Identifier, ),
+             send=Token.Tick,
+             match_size=1),
+         Alt(send=Token.Char, match_size=3)),
+    (Literal("'"), Token.Tick),
+)
+
+
+class FooNode(ASTNode):
+    pass
+
+
+class Name(FooNode):
+    token_node = True
+
+
+class CharLit(FooNode):
+    token_node = True
+
+
+class Tick(FooNode):
+    token_node = True
+
+
+g = Grammar('main_rule')
+g.add_rules(
+    main_rule=List(Or(Name(Token.Identifier),
+                      CharLit(Token.Char),
+                      Tick(Token.Tick)),
+                   empty_valid=True),
+)
+build_and_run(g, 'main.py', lexer=foo_lexer, lexer_backend='native')
+print('Done')
@@ -0,0 +1,64 @@
+from __future__ import absolute_import, division, print_function
+
+import gc
+import sys
+import weakref
+
+import libfoolang
+
+
+print('main.py: Starting...')
+
+src = ' '.join('var a{} = {}, {};'.format(i, i, i + 1) for i in range(20))
+
+
+def check(node_cache):
+    print('== node_cache={} =='.format(repr(node_cache)))
+    ctx = libfoolang.AnalysisContext(node_cache=node_cache)
+    unit = ctx.get_from_buffer('foo.txt', src)
+    if unit.diagnostics:
+        for d in unit.diagnostics:
+            print(d)
+        sys.exit(1)
+
+    root = unit.root
+
+    # Identity must be preserved for live wrappers in all modes
+    first = root[0]
+    assert root[0] is first
+    assert first.f_name.parent is first
+    assert unit.root is root
+
+    # Create wrappers for all nodes, keep weak references to them and then
+    # drop all strong ones, except for the root node and the first VarDecl.
+    refs = [weakref.ref(n) for n in root.findall(lambda _: True)]
+    gc.collect()
+    alive = sum(1 for r in refs if r() is not None)
+    print('{} wrappers created, {} still alive'.format(len(refs), alive))
+
+    assert root[0] is first
+    print('first decl: {}'.format(first))
+
+    if isinstance(node_cache, int):
+        # Fetching the same wrapper again and again must not push the other
+        # recently used wrappers out of the cache.
+        refs = [weakref.ref(root[i]) for i in range(node_cache)]
+        for _ in range(2 * node_cache):
+            root[0]
+        gc.collect()
+        alive = sum(1 for r in refs if r() is not None)
+        print('{} recent wrappers, {} still alive'.format(len(refs), alive))
+
+
+for node_cache in ('strong', 'weak', 5):
+    check(node_cache)
+
+for node_cache in ('foo', 0, -1, True):
+    try:
+        libfoolang.AnalysisContext(node_cache=node_cache)
+    except ValueError as exc:
+        print('node_cache={}: ValueError: {}'.format(repr(node_cache), exc))
+    else:
+        print('node_cache={}: no error'.format(repr(node_cache)))
+
+print('main.py: Done.')
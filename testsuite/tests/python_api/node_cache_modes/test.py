@@ -0,0 +1,40 @@
+"""
+Test the node wrapper cache modes that analysis contexts provide in the
+Python API, on a tree that contains lists nested in other nodes.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+from langkit.dsl import ASTNode, Field
+from langkit.parsers import Grammar, List
+
+from lexer_example import Token
+from utils import build_and_run
+
+
+class FooNode(ASTNode):
+    pass
+
+
+class VarDecl(FooNode):
+    name = Field()
+    values = Field()
+
+
+class Name(FooNode):
+    token_node = True
+
+
+class Num(FooNode):
+    token_node = True
+
+
+g = Grammar('main_rule')
+g.add_rules(
+    main_rule=List(g.var_decl),
+    var_decl=VarDecl('var', g.name, '=', List(g.num, sep=','), ';'),
+    name=Name(Token.Identifier),
+    num=Num(Token.Number),
+)
+build_and_run(g, 'main.py')
+print('Done')
@@ -0,0 +1,46 @@
+from __future__ import absolute_import, division, print_function
+
+import sys
+
+import libfoolang
+
+
+print('main.py: Starting...')
+
+ctx = libfoolang.AnalysisContext()
+unit = ctx.get_from_buffer('foo.txt', 'var a = 1 var b def f(x, y)')
+if unit.diagnostics:
+    for d in unit.diagnostics:
+        print(d)
+    sys.exit(1)
+
+root = unit.root
+print('root.children: {}'.format(root.children))
+print('len(root): {}'.format(len(root)))
+
+for decl in root:
+    print('{}: {}'.format(decl, list(decl.iter_fields())))
+
+    # Bulk-fetched children must be the same wrappers as the ones field
+    # accessors return, inherited fields first.
+    fields = list(decl.iter_fields())
+    assert fields[0][0] == 'f_name'
+    for i, (name, value) in enumerate(fields):
+        assert decl[i] is getattr(decl, name) is value
+    assert decl[-1] is fields[-1][1]
+
+print('findall(Name): {}'.format(root.findall(libfoolang.Name)))
+print('findall(is_token_node): {}'.format(
+    root.findall(lambda n: n.is_token_node)))
+print('find(Num): {}'.format(root.find(libfoolang.Num)))
+
+print('Reparsing...')
+unit.reparse('var a')
+try:
+    root.children
+except libfoolang.StaleReferenceError:
+    print('   StaleReferenceError raised!')
+else:
+    print('   No error raised...')
+
+print('main.py: Done.')
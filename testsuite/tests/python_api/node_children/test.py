@@ -0,0 +1,50 @@
+"""
+Test that the Python API retrieves node children in bulk consistently with
+field accessors, including for fields inherited from abstract nodes.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+from langkit.dsl import ASTNode, Field, abstract
+from langkit.parsers import Grammar, List, Opt, Or
+
+from lexer_example import Token
+from utils import build_and_run
+
+
+class FooNode(ASTNode):
+    pass
+
+
+@abstract
+class Decl(FooNode):
+    name = Field()
+
+
+class VarDecl(Decl):
+    value = Field()
+
+
+class FunDecl(Decl):
+    params = Field()
+
+
+class Name(FooNode):
+    token_node = True
+
+
+class Num(FooNode):
+    token_node = True
+
+
+g = Grammar('main_rule')
+g.add_rules(
+    main_rule=List(g.decl),
+    decl=Or(g.var_decl, g.fun_decl),
+    var_decl=VarDecl('var', g.name, Opt('=', g.num)),
+    fun_decl=FunDecl('def', g.name, '(', List(g.name, sep=','), ')'),
+    name=Name(Token.Identifier),
+    num=Num(Token.Number),
+)
+build_and_run(g, 'main.py')
+print('Done')
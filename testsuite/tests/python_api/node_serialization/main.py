@@ -0,0 +1,74 @@
+from __future__ import absolute_import, division, print_function
+
+import json
+import struct
+import sys
+
+import libfoolang
+
+
+print('main.py: Starting...')
+
+ctx = libfoolang.AnalysisContext()
+unit = ctx.get_from_buffer('foo.txt', 'def a(1, 2) = 3\ndef b(4)')
+if unit.diagnostics:
+    for d in unit.diagnostics:
+        print(d)
+    sys.exit(1)
+
+root = unit.root
+
+print('to_data(): {}'.format(json.dumps(root.to_data(), sort_keys=True)))
+print('to_json() matches to_data(): {}'.format(
+    json.loads(root.to_json()) == root.to_data()))
+print('')
+print('to_detailed_json():')
+print(root.to_detailed_json())
+print('')
+print('to_detailed_json(with_slocs=True):')
+print(json.dumps(json.loads(root.to_detailed_json(with_slocs=True)),
+                 sort_keys=True))
+print('')
+print('decl.to_detailed_json(): {}'.format(root[1].to_detailed_json()))
+print('')
+
+
+def decode(data):
+    """
+    Decode the output of the binary serializer into nested tuples.
+    """
+    offset = [0]
+
+    def read_int():
+        result, = struct.unpack_from('<I', data, offset[0])
+        offset[0] += 4
+        return result
+
+    def read_node():
+        kind = read_int()
+        if kind == 0:
+            return None
+        cls = libfoolang._kind_to_astnode_cls[kind]
+        slocs = tuple(read_int() for _ in range(4)) if with_slocs else ()
+        if issubclass(cls, (libfoolang.Name, libfoolang.Num)):
+            size = read_int()
+            text = data[offset[0]:offset[0] + size].decode('utf-8')
+            offset[0] += size
+            return (cls.__name__, ) + slocs + (text, )
+        else:
+            return (cls.__name__, ) + slocs + tuple(
+                read_node() for _ in range(read_int())
+            )
+
+    with_slocs = bool(read_int())
+    result = read_node()
+    assert offset[0] == len(data)
+    return result
+
+
+for with_slocs in (False, True):
+    print('to_binary(with_slocs={}):'.format(with_slocs))
+    print(decode(root.to_binary(with_slocs=with_slocs)))
+    print('')
+
+print('main.py: Done.')
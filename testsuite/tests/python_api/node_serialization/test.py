@@ -0,0 +1,43 @@
+"""
+Test the native JSON and binary subtree serializers through the Python
+API, on trees that contain null fields and list nodes, both at the root and in
+fields.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+from langkit.dsl import ASTNode, Field
+from langkit.parsers import Grammar, List, Opt
+
+from lexer_example import Token
+from utils import build_and_run
+
+
+class FooNode(ASTNode):
+    pass
+
+
+class Decl(FooNode):
+    name = Field()
+    args = Field()
+    value = Field()
+
+
+class Name(FooNode):
+    token_node = True
+
+
+class Num(FooNode):
+    token_node = True
+
+
+g = Grammar('main_rule')
+g.add_rules(
+    main_rule=List(g.decl),
+    decl=Decl('def', g.name, '(', List(g.num, sep=','), ')',
+              Opt('=', g.num)),
+    name=Name(Token.Identifier),
+    num=Num(Token.Number),
+)
+build_and_run(g, 'main.py')
+print('Done')
@@ -0,0 +1,48 @@
+from __future__ import absolute_import, division, print_function
+
+import sys
+
+import libfoolang
+
+
+print('main.py: Starting...')
+
+ctx = libfoolang.AnalysisContext()
+unit = ctx.get_from_buffer('foo.txt', 'def a = f(1, g(2)) def b = 3')
+if unit.diagnostics:
+    for d in unit.diagnostics:
+        print(d)
+    sys.exit(1)
+
+root = unit.root
+print('root: {} ({} children)'.format(root, len(root)))
+print('root.unit: {}'.format(root.unit))
+
+for decl in root:
+    print('{}: {} children'.format(decl, len(decl)))
+    assert decl.parent is root
+
+# Nodes reached through different paths must share the same wrappers
+nodes = root.findall(lambda _: True)
+for node in nodes:
+    assert node.unit is unit
+    assert any(c is node for c in node.parent.children)
+    assert node.parent_chain[-1] is root
+    for child in node.children:
+        assert child is None or child.parent is node
+    assert any(n is node
+               for n in root.lookup(node.sloc_range.start).parent_chain)
+print('{} nodes checked'.format(len(nodes)))
+print('lookup(1:14): {}'.format(root.lookup(libfoolang.Sloc(1, 14))))
+
+print('Reparsing...')
+unit.reparse('def a = 1')
+try:
+    len(root)
+except libfoolang.StaleReferenceError:
+    print('   StaleReferenceError raised!')
+else:
+    print('   No error raised...')
+print('new root: {} ({} children)'.format(unit.root, len(unit.root)))
+
+print('main.py: Done.')
@@ -0,0 +1,51 @@
+"""
+Test that node wrappers created from a single descriptor call are consistent
+with the ones created when walking the tree, on nested nodes and lists.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+from langkit.dsl import ASTNode, Field, abstract
+from langkit.parsers import Grammar, List, Or
+
+from lexer_example import Token
+from utils import build_and_run
+
+
+class FooNode(ASTNode):
+    pass
+
+
+class Decl(FooNode):
+    name = Field()
+    value = Field()
+
+
+@abstract
+class Expr(FooNode):
+    pass
+
+
+class Call(Expr):
+    name = Field()
+    args = Field()
+
+
+class Name(Expr):
+    token_node = True
+
+
+class Num(Expr):
+    token_node = True
+
+
+g = Grammar('main_rule')
+g.add_rules(
+    main_rule=List(g.decl),
+    decl=Decl('def', g.name, '=', g.expr),
+    expr=Or(Call(g.name, '(', List(g.expr, sep=','), ')'), g.name, g.num),
+    name=Name(Token.Identifier),
+    num=Num(Token.Number),
+)
+build_and_run(g, 'main.py')
+print('Done')
@@ -0,0 +1,56 @@
+from __future__ import absolute_import, division, print_function
+
+import ctypes
+import sys
+
+import libfoolang
+
+
+print('main.py: Starting...')
+
+short_comment = u'# h\xe9h\xe9 \u20ac \u4e2d'
+long_comment = u'# ' + u'abc\xe9\u20ac\u4e2d' * 256
+decls = [u'def a = 1, {}\n2'.format(short_comment),
+         u'def b = {}\n3, 4'.format(long_comment)]
+src = u'\n'.join(decls)
+
+ctx = libfoolang.AnalysisContext()
+unit = ctx.get_from_buffer('foo.txt', src.encode('utf-8'), charset='utf-8')
+if unit.diagnostics:
+    for d in unit.diagnostics:
+        print(d)
+    sys.exit(1)
+
+# Texts coming from the C API
+assert unit.text == src
+comments = [t.text for t in unit.iter_tokens() if t.kind == 'Comment']
+assert comments == [short_comment, long_comment]
+print('Token texts: {}'.format(
+    [(len(c), c == src_c)
+     for c, src_c in zip(comments, [short_comment, long_comment])]
+))
+assert [d.text for d in unit.root] == decls
+print('Node texts: {}'.format([len(d.text) for d in unit.root]))
+print('Short node text: {}'.format(repr(unit.root[0].text)))
+
+# Texts going to the C API and back, through the UTF-8 entry points
+for text in (u'', u'abc', short_comment, long_comment):
+    c_text = libfoolang._text._unwrap(text)
+    result = c_text._wrap() or u''
+    print('Round trip for {} chars: {}'.format(len(text), result == text))
+
+# Characters outside of the BMP take four bytes in UTF-8
+text = u'a\U0001f600b'
+c_text = libfoolang._text._unwrap(text)
+print('Round trip outside of the BMP: {} (length: {})'.format(
+    c_text._wrap() == text, c_text.length
+))
+
+# text_to_utf8 returns the size that the whole text needs even when the buffer
+# is too small to hold it.
+c_text = libfoolang._text._unwrap(short_comment)
+buf = ctypes.create_string_buffer(4)
+size = libfoolang._text_to_utf8(ctypes.byref(c_text), buf, len(buf))
+print('UTF-8 size: {}, truncated: {}'.format(size, repr(buf.raw)))
+
+print('main.py: Done.')
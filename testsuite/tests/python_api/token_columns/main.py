@@ -0,0 +1,49 @@
+from __future__ import absolute_import, division, print_function
+
+import sys
+
+import libfoolang
+
+
+print('main.py: Starting...')
+
+ctx = libfoolang.AnalysisContext()
+unit = ctx.get_from_buffer('foo.txt', 'var a = 1 + b; # c\nvar b =\n  2;')
+if unit.diagnostics:
+    for d in unit.diagnostics:
+        print(d)
+    sys.exit(1)
+
+print('unit.text: {}'.format(repr(unit.text)))
+
+columns = unit.token_columns()
+print('{}'.format(columns))
+print('len(columns): {}'.format(len(columns)))
+
+for i in range(len(columns)):
+    print('{}: {} {} {}:{}-{}:{} [{}, {})'.format(
+        i, columns.kind_name(i), repr(columns.token_text(i)),
+        columns.start_lines[i], columns.start_columns[i],
+        columns.end_lines[i], columns.end_columns[i],
+        columns.start_offsets[i], columns.end_offsets[i]
+    ))
+
+# The columns must describe the same sequence as token iteration
+tokens = list(unit.iter_tokens())
+assert len(tokens) == len(columns)
+for i, tok in enumerate(tokens):
+    assert columns.kind_name(i) == tok.kind
+    assert columns.token_text(i) == (tok.text or u'')
+    assert columns.token_indexes[i] == tok._token_index
+    assert columns.trivia_indexes[i] == tok._trivia_index
+    sloc_range = tok.sloc_range
+    assert (columns.start_lines[i], columns.start_columns[i]) == (
+        sloc_range.start.line, sloc_range.start.column)
+    assert (columns.end_lines[i], columns.end_columns[i]) == (
+        sloc_range.end.line, sloc_range.end.column)
+
+# Columns are exposed through the buffer protocol, without copies
+view = memoryview(columns.start_offsets)
+print('memoryview: {} items of {} bytes'.format(len(view), view.itemsize))
+
+print('main.py: Done.')
@@ -0,0 +1,53 @@
+"""
+Test that the columnar token export in the Python API is consistent with
+token-by-token iteration, on sources with various token kinds, trivia and
+tokens that span several lines.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+from langkit.dsl import ASTNode, Field, abstract
+from langkit.parsers import Grammar, List, Or
+
+from lexer_example import Token
+from utils import build_and_run
+
+
+class FooNode(ASTNode):
+    pass
+
+
+class VarDecl(FooNode):
+    name = Field()
+    value = Field()
+
+
+@abstract
+class Expr(FooNode):
+    pass
+
+
+class Addition(Expr):
+    lhs = Field()
+    rhs = Field()
+
+
+class Name(Expr):
+    token_node = True
+
+
+class Num(Expr):
+    token_node = True
+
+
+g = Grammar('main_rule')
+g.add_rules(
+    main_rule=List(g.var_decl),
+    var_decl=VarDecl('var', g.name, '=', g.expr, ';'),
+    expr=Or(Addition(g.atom, '+', g.expr), g.atom),
+    atom=Or(g.name, g.num),
+    name=Name(Token.Identifier),
+    num=Num(Token.Number),
+)
+build_and_run(g, 'main.py')
+print('Done')
@@ -0,0 +1,55 @@
+from __future__ import absolute_import, division, print_function
+
+import libfoolang
+
+
+filenames = ['{}.txt'.format(name) for name in ('a', 'b', 'c')]
+for i, filename in enumerate(filenames):
+    with open(filename, 'w') as f:
+        f.write('example ' * (i + 1))
+
+
+def loaded_units():
+    return [u.filename.split('/')[-1]
+            for u in units
+            if u.root is not None]
+
+
+# With the default strong node cache, wrapped nodes stay alive (and thus their
+# units stay loaded) until their unit is reparsed. Use a weak cache so that
+# only the node references we keep prevent eviction.
+ctx = libfoolang.AnalysisContext(node_cache='weak')
+ctx.set_unit_eviction_policy(max_units=2)
+
+print('Loading all units...')
+units = [ctx.get_from_file(filename) for filename in filenames]
+print('Loaded units: {}'.format(loaded_units()))
+
+print('Fetching a.txt again...')
+a = ctx.get_from_file('a.txt')
+assert a is units[0]
+print('a.txt has {} children'.format(len(a.root)))
+print('Loaded units: {}'.format(loaded_units()))
+
+print('Keeping a reference to a node from b.txt...')
+b_root = ctx.get_from_file('b.txt').root
+print('Loaded units: {}'.format(loaded_units()))
+
+print('Fetching c.txt and a.txt again...')
+ctx.get_from_file('c.txt')
+ctx.get_from_file('a.txt')
+print('Loaded units: {}'.format(loaded_units()))
+print('Text of the node from b.txt: {}'.format(repr(b_root.text)))
+
+print('Releasing the reference and fetching c.txt again...')
+del b_root
+ctx.get_from_file('c.txt')
+print('Loaded units: {}'.format(loaded_units()))
+
+print('Disabling eviction...')
+ctx.set_unit_eviction_policy()
+for filename in filenames:
+    ctx.get_from_file(filename)
+print('Loaded units: {}'.format(loaded_units()))
+
+print('main.py: Done.')
@@ -0,0 +1,29 @@
+"""
+Test that analysis contexts can unload least recently used units when they
+have an eviction policy, that unloaded units are transparently reparsed when
+they are fetched again, and that units with live node wrappers are not
+unloaded.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+from langkit.dsl import ASTNode, Field
+from langkit.parsers import Grammar, List, Opt
+
+from utils import build_and_run
+
+
+class FooNode(ASTNode):
+    pass
+
+
+class Example(FooNode):
+    examples = Field()
+
+
+g = Grammar('main_rule')
+g.add_rules(main_rule=g.example_list,
+            example_list=List(g.example),
+            example=Example('example', Opt('(', g.example_list, ')')))
+build_and_run(g, 'main.py')
+print('Done')
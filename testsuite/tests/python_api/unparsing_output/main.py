@@ -0,0 +1,45 @@
+from __future__ import absolute_import, division, print_function
+
+import os
+import tempfile
+
+import libfoolang
+
+
+print('main.py: Running...')
+
+ctx = libfoolang.AnalysisContext()
+u1 = ctx.get_from_buffer('a.txt', b'def a = 1\ndef  b=2')
+u2 = ctx.get_from_buffer('b.txt', b'def c = 3')
+for u in (u1, u2):
+    for d in u.diagnostics:
+        print('{}: {}'.format(u.filename, d))
+
+print('Unparsing to a byte string:')
+print('  {!r}'.format(u1.root.unparse()))
+print('')
+
+print('Unparsing to an output:')
+out = libfoolang.UnparsingOutput()
+u1.root.unparse(out)
+print('  {!r} ({} bytes)'.format(out.content, len(out)))
+u2.root.unparse(out)
+print('  {!r} ({} bytes)'.format(out.content, len(out)))
+out.clear()
+print('  {!r} ({} bytes)'.format(out.content, len(out)))
+u2.root.unparse(out)
+print('  {!r} ({} bytes)'.format(out.content, len(out)))
+print('')
+
+print('Unparsing to a file:')
+fd, path = tempfile.mkstemp()
+with os.fdopen(fd, 'wb') as f:
+    f.write(b'# Header\n')
+    u1.root.unparse(f)
+    u2.root.unparse(f.fileno())
+with open(path, 'rb') as f:
+    print('  {!r}'.format(f.read()))
+os.remove(path)
+print('')
+
+print('main.py: Done')
@@ -0,0 +1,38 @@
+"""
+Test that the unparser can append UTF-8 encoded code to reusable unparsing
+outputs, and stream it to files.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+from langkit.dsl import ASTNode, Field
+from langkit.parsers import Grammar, List
+
+from lexer_example import Token
+from utils import build_and_run
+
+
+class FooNode(ASTNode):
+    pass
+
+
+class Name(FooNode):
+    token_node = True
+
+
+class Literal(FooNode):
+    token_node = True
+
+
+class Def(FooNode):
+    name = Field()
+    expr = Field()
+
+
+foo_grammar = Grammar('main_rule')
+foo_grammar.add_rules(
+    main_rule=List(foo_grammar.def_rule),
+    def_rule=Def('def', Name(Token.Identifier), '=', Literal(Token.Number)),
+)
+build_and_run(foo_grammar, 'main.py', generate_unparser=True)
+print('Done')